@@ -0,0 +1,84 @@
+"""
+Data generators shared by the benchmarks
+
+All data are simulated with fixed seeds so that timings are comparable
+between commits.
+"""
+
+import numpy as np
+import pandas as pd
+
+SEED = 20240917
+
+
+def rng(offset=0):
+    return np.random.default_rng(SEED + offset)
+
+
+def regression_data(nobs, k_vars):
+    """Linear regression data with a constant in the first column"""
+    gen = rng()
+    exog = np.column_stack([np.ones(nobs), gen.standard_normal((nobs, k_vars - 1))])
+    params = np.linspace(-0.5, 0.5, k_vars)
+    endog = exog @ params + gen.standard_normal(nobs)
+    return endog, exog
+
+
+def count_data(nobs, k_vars):
+    """Poisson counts with a log-linear mean"""
+    gen = rng(1)
+    exog = np.column_stack([np.ones(nobs), gen.standard_normal((nobs, k_vars - 1))])
+    params = np.linspace(-0.2, 0.2, k_vars)
+    endog = gen.poisson(np.exp(exog @ params))
+    return endog, exog
+
+
+def binary_data(nobs, k_vars):
+    """Binary outcome of a logit model"""
+    gen = rng(2)
+    exog = np.column_stack([np.ones(nobs), gen.standard_normal((nobs, k_vars - 1))])
+    params = np.linspace(-0.5, 0.5, k_vars)
+    prob = 1 / (1 + np.exp(-exog @ params))
+    endog = (gen.uniform(size=nobs) < prob).astype(float)
+    return endog, exog
+
+
+def multinomial_data(nobs, k_vars, k_cat):
+    """Categorical outcome with k_cat levels"""
+    gen = rng(3)
+    exog = np.column_stack([np.ones(nobs), gen.standard_normal((nobs, k_vars - 1))])
+    params = gen.standard_normal((k_vars, k_cat)) * 0.3
+    linpred = exog @ params
+    prob = np.exp(linpred - linpred.max(1, keepdims=True))
+    cumprob = np.cumsum(prob / prob.sum(1, keepdims=True), axis=1)
+    endog = (gen.uniform(size=(nobs, 1)) > cumprob).sum(1)
+    return endog, exog
+
+
+def grouped_data(nobs, n_groups):
+    """Data frame with a categorical group variable and a response"""
+    gen = rng(4)
+    groups = gen.integers(0, n_groups, size=nobs)
+    effects = gen.standard_normal(n_groups)
+    x = gen.standard_normal(nobs)
+    y = 1 + 0.5 * x + effects[groups] + gen.standard_normal(nobs)
+    return pd.DataFrame({"y": y, "x": x, "g": groups.astype(str)})
+
+
+def arma_series(nobs):
+    """ARMA(1, 1) series"""
+    gen = rng(5)
+    eps = gen.standard_normal(nobs + 100)
+    y = np.empty_like(eps)
+    y[0] = eps[0]
+    for t in range(1, eps.shape[0]):
+        y[t] = 0.6 * y[t - 1] + eps[t] + 0.3 * eps[t - 1]
+    return y[100:]
+
+
+def seasonal_series(nobs, period):
+    """Series with trend, seasonal component and noise"""
+    gen = rng(6)
+    time = np.arange(nobs)
+    seasonal = np.sin(2 * np.pi * time / period)
+    return 0.01 * time + seasonal + 0.3 * gen.standard_normal(nobs)
@@ -0,0 +1,54 @@
+"""Benchmarks of discrete choice and count models"""
+
+from statsmodels.discrete.discrete_model import (
+    Logit,
+    MNLogit,
+    NegativeBinomial,
+    Poisson,
+    Probit,
+)
+
+from .common import binary_data, count_data, multinomial_data
+
+
+class BinaryFit:
+    params = [[1_000, 100_000], [5, 20], ["Logit", "Probit"]]
+    param_names = ["nobs", "k_vars", "model"]
+
+    def setup(self, nobs, k_vars, model):
+        self.endog, self.exog = binary_data(nobs, k_vars)
+        self.model = {"Logit": Logit, "Probit": Probit}[model]
+
+    def time_fit(self, nobs, k_vars, model):
+        self.model(self.endog, self.exog).fit(disp=0)
+
+    def peakmem_fit(self, nobs, k_vars, model):
+        self.model(self.endog, self.exog).fit(disp=0)
+
+
+class CountFit:
+    params = [[1_000, 50_000], [5, 20]]
+    param_names = ["nobs", "k_vars"]
+
+    def setup(self, nobs, k_vars):
+        self.endog, self.exog = count_data(nobs, k_vars)
+
+    def time_poisson(self, nobs, k_vars):
+        Poisson(self.endog, self.exog).fit(disp=0)
+
+    def time_negative_binomial(self, nobs, k_vars):
+        NegativeBinomial(self.endog, self.exog).fit(disp=0, maxiter=100)
+
+    def peakmem_negative_binomial(self, nobs, k_vars):
+        NegativeBinomial(self.endog, self.exog).fit(disp=0, maxiter=100)
+
+
+class MNLogitFit:
+    params = [[1_000, 20_000], [3, 6]]
+    param_names = ["nobs", "k_cat"]
+
+    def setup(self, nobs, k_cat):
+        self.endog, self.exog = multinomial_data(nobs, 5, k_cat)
+
+    def time_fit(self, nobs, k_cat):
+        MNLogit(self.endog, self.exog).fit(disp=0)
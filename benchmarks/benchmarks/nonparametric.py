@@ -0,0 +1,33 @@
+"""Benchmarks of nonparametric smoothers and density estimation"""
+
+from statsmodels.nonparametric.kde import KDEUnivariate
+from statsmodels.nonparametric.smoothers_lowess import lowess
+
+from .common import rng
+
+
+class Lowess:
+    params = [[1_000, 20_000], [0.1, 0.5], [0, 3]]
+    param_names = ["nobs", "frac", "it"]
+
+    def setup(self, nobs, frac, it):
+        gen = rng(8)
+        self.x = gen.uniform(0, 10, size=nobs)
+        self.y = 1 + 0.5 * self.x * (10 - self.x) / 25 + gen.standard_normal(nobs)
+
+    def time_lowess(self, nobs, frac, it):
+        lowess(self.y, self.x, frac=frac, it=it)
+
+    def peakmem_lowess(self, nobs, frac, it):
+        lowess(self.y, self.x, frac=frac, it=it)
+
+
+class KDE:
+    params = [[1_000, 100_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        self.x = rng(9).standard_normal(nobs)
+
+    def time_fit_fft(self, nobs):
+        KDEUnivariate(self.x).fit()
@@ -0,0 +1,67 @@
+"""Benchmarks of linear regression and GLM"""
+
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.regression.linear_model import OLS, WLS
+
+from .common import count_data, regression_data
+
+
+class OLSFit:
+    params = [[1_000, 100_000], [5, 50]]
+    param_names = ["nobs", "k_vars"]
+
+    def setup(self, nobs, k_vars):
+        self.endog, self.exog = regression_data(nobs, k_vars)
+        self.res = OLS(self.endog, self.exog).fit()
+
+    def time_fit(self, nobs, k_vars):
+        OLS(self.endog, self.exog).fit()
+
+    def peakmem_fit(self, nobs, k_vars):
+        OLS(self.endog, self.exog).fit()
+
+    def time_fit_hc3(self, nobs, k_vars):
+        OLS(self.endog, self.exog).fit(cov_type="HC3")
+
+    def time_summary(self, nobs, k_vars):
+        self.res.summary()
+
+    def time_get_prediction(self, nobs, k_vars):
+        self.res.get_prediction(self.exog).summary_frame()
+
+    def peakmem_get_prediction(self, nobs, k_vars):
+        self.res.get_prediction(self.exog).summary_frame()
+
+
+class WLSFit:
+    params = [[1_000, 100_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        self.endog, self.exog = regression_data(nobs, 10)
+        self.weights = 1 + self.exog[:, 1] ** 2
+
+    def time_fit(self, nobs):
+        WLS(self.endog, self.exog, weights=self.weights).fit()
+
+
+class GLMFit:
+    params = [[1_000, 100_000], [5, 50], ["Gaussian", "Poisson"]]
+    param_names = ["nobs", "k_vars", "family"]
+
+    def setup(self, nobs, k_vars, family):
+        if family == "Poisson":
+            self.endog, self.exog = count_data(nobs, k_vars)
+        else:
+            self.endog, self.exog = regression_data(nobs, k_vars)
+        self.family = getattr(families, family)()
+
+    def time_fit_irls(self, nobs, k_vars, family):
+        GLM(self.endog, self.exog, family=self.family).fit()
+
+    def peakmem_fit_irls(self, nobs, k_vars, family):
+        GLM(self.endog, self.exog, family=self.family).fit()
+
+    def time_fit_newton(self, nobs, k_vars, family):
+        GLM(self.endog, self.exog, family=self.family).fit(method="newton")
@@ -0,0 +1,206 @@
+"""Benchmarks of the state space Kalman filter and smoother"""
+
+import numpy as np
+
+from statsmodels.tsa.statespace.dynamic_factor import DynamicFactor
+from statsmodels.tsa.statespace.dynamic_factor_mq import DynamicFactorMQ
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.structural import UnobservedComponents
+
+from .common import arma_series, rng
+
+
+class SARIMAXFilter:
+    params = [[500, 10_000], [(1, 0, 1), (2, 1, 2)]]
+    param_names = ["nobs", "order"]
+
+    def setup(self, nobs, order):
+        self.endog = arma_series(nobs)
+        self.model = SARIMAX(self.endog, order=order)
+        self.params = self.model.start_params
+
+    def time_loglike(self, nobs, order):
+        self.model.loglike(self.params)
+
+    def time_filter(self, nobs, order):
+        self.model.filter(self.params)
+
+    def time_smooth(self, nobs, order):
+        self.model.smooth(self.params)
+
+    def peakmem_smooth(self, nobs, order):
+        self.model.smooth(self.params)
+
+
+class SARIMAXFit:
+    params = [[200, 2_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        self.endog = arma_series(nobs)
+
+    def time_fit(self, nobs):
+        SARIMAX(self.endog, order=(1, 0, 1)).fit(disp=False)
+
+
+class DynamicFactorFilter:
+    params = [[200, 2_000], [4, 16]]
+    param_names = ["nobs", "k_endog"]
+
+    def setup(self, nobs, k_endog):
+        gen = rng(7)
+        factor = np.cumsum(gen.standard_normal(nobs)) * 0.1
+        loadings = np.linspace(0.5, 1.5, k_endog)
+        endog = factor[:, None] * loadings + gen.standard_normal((nobs, k_endog))
+        self.model = DynamicFactor(endog, k_factors=1, factor_order=1)
+        self.params = self.model.start_params
+
+    def time_loglike(self, nobs, k_endog):
+        self.model.loglike(self.params)
+
+    def time_smooth(self, nobs, k_endog):
+        self.model.smooth(self.params)
+
+    def peakmem_smooth(self, nobs, k_endog):
+        self.model.smooth(self.params)
+
+
+class FilterMethod:
+    """Conventional against square-root covariance recursions"""
+
+    params = [["conventional", "square_root"], ["sarimax", "seasonal"]]
+    param_names = ["filter_method", "model"]
+
+    def setup(self, filter_method, model):
+        endog = np.cumsum(arma_series(5_000))
+        if model == "sarimax":
+            self.model = SARIMAX(endog, order=(2, 1, 2))
+            self.params = [0.5, 0.1, 0.2, 0.1, 1.0]
+        else:
+            self.model = UnobservedComponents(
+                endog, "local linear trend", seasonal=12
+            )
+            self.params = [1.0, 0.5, 0.1, 0.01]
+        self.model.ssm.filter_square_root = filter_method == "square_root"
+
+    def time_loglike(self, filter_method, model):
+        self.model.loglike(self.params)
+
+    def time_smooth(self, filter_method, model):
+        self.model.smooth(self.params)
+
+
+class SparseTransition:
+    """Dense against sparse transition matrix products"""
+
+    params = [[False, True], [12, 52]]
+    param_names = ["sparse_transition", "seasonal"]
+
+    def setup(self, sparse_transition, seasonal):
+        endog = np.cumsum(arma_series(2_000))
+        self.model = UnobservedComponents(endog, "llevel", seasonal=seasonal)
+        self.model.ssm.sparse_transition = sparse_transition
+        self.model.ssm.sparse_transition_min_states = 1
+        self.params = [1.0, 0.5, 0.1]
+
+    def time_loglike(self, sparse_transition, seasonal):
+        self.model.loglike(self.params)
+
+    def time_smooth(self, sparse_transition, seasonal):
+        self.model.smooth(self.params)
+
+
+class SimulationSmoother:
+    """One draw per call against many draws in a single call"""
+
+    params = [["kfs", "cfa"], [1, 100]]
+    param_names = ["method", "nsimulations"]
+
+    def setup(self, method, nsimulations):
+        gen = rng(11)
+        endog = np.cumsum(gen.standard_normal((500, 3)), axis=0)
+        self.model = DynamicFactor(np.diff(endog, axis=0), k_factors=1,
+                                   factor_order=1)
+        self.model.update(self.model.start_params)
+        self.sim = self.model.simulation_smoother(method=method, rng=gen)
+
+    def time_simulate_loop(self, method, nsimulations):
+        for _ in range(nsimulations):
+            self.sim.simulate()
+
+    def time_simulate_batch(self, method, nsimulations):
+        self.sim.simulate(nsimulations=nsimulations)
+
+
+class ResultsUpdate:
+    """Adding one observation to existing results"""
+
+    params = [[1_000, 10_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        self.endog = np.cumsum(arma_series(nobs + 1))
+        self.model = SARIMAX(self.endog[:-1], order=(2, 1, 1))
+        self.params = [0.5, 0.1, 0.2, 1.0]
+
+    def time_append(self, nobs):
+        res = self.model.smooth(self.params)
+        res.append(self.endog[-1:])
+
+    def time_update(self, nobs):
+        res = self.model.smooth(self.params)
+        res.update(self.endog[-1:])
+
+
+class LoglikeMany:
+    """Loglikelihood at many parameter vectors, in a loop against batched"""
+
+    params = [[1, 4]]
+    param_names = ["n_jobs"]
+
+    def setup(self, n_jobs):
+        self.model = SARIMAX(np.cumsum(arma_series(1_000)), order=(2, 1, 1))
+        gen = rng(13)
+        self.params = [0.5, 0.1, 0.2, 1.0] + 0.05 * gen.standard_normal((200, 4))
+
+    def time_loglike_loop(self, n_jobs):
+        for params in self.params:
+            self.model.loglike(params)
+
+    def time_loglike_many(self, n_jobs):
+        self.model.loglike_many(self.params, n_jobs=n_jobs)
+
+
+class SmootherMemory:
+    """Smoother output storage under the smoother memory options"""
+
+    params = [[0, 2, 7]]
+    param_names = ["smoother_conserve_memory"]
+
+    def setup(self, smoother_conserve_memory):
+        gen = rng(17)
+        endog = np.cumsum(gen.standard_normal((5_000, 4)), axis=0)
+        self.model = DynamicFactor(np.diff(endog, axis=0), k_factors=2,
+                                   factor_order=10)
+        self.params = self.model.start_params
+
+    def peakmem_smooth(self, smoother_conserve_memory):
+        self.model.smooth(self.params,
+                          smoother_conserve_memory=smoother_conserve_memory)
+
+
+class DynamicFactorMQFit:
+    """Plain against SQUAREM-accelerated EM iterations"""
+
+    params = [[None, "squarem"]]
+    param_names = ["em_acceleration"]
+
+    def setup(self, em_acceleration):
+        gen = rng(19)
+        factor = np.cumsum(gen.standard_normal(240)) * 0.2
+        loadings = np.linspace(-1, 1, 10)
+        self.endog = factor[:, None] * loadings + gen.standard_normal((240, 10))
+
+    def time_fit(self, em_acceleration):
+        DynamicFactorMQ(self.endog, factor_orders=2).fit(
+            tolerance=1e-8, em_acceleration=em_acceleration)
@@ -0,0 +1,74 @@
+"""Benchmarks of hypothesis tests and multiple testing"""
+
+import numpy as np
+
+from statsmodels.formula.api import ols
+from statsmodels.regression.linear_model import OLS
+from statsmodels.stats.anova import anova_lm
+from statsmodels.stats.diagnostic import acorr_ljungbox, het_breuschpagan, het_white
+from statsmodels.stats.multitest import multipletests
+from statsmodels.stats.weightstats import ttest_ind
+
+from .common import arma_series, grouped_data, regression_data, rng
+
+
+class MultipleTests:
+    params = [[1_000, 1_000_000], ["bonferroni", "holm", "fdr_bh"]]
+    param_names = ["n_tests", "method"]
+
+    def setup(self, n_tests, method):
+        self.pvalues = rng(10).uniform(size=n_tests)
+
+    def time_multipletests(self, n_tests, method):
+        multipletests(self.pvalues, method=method)
+
+
+class TTests:
+    params = [[1_000, 1_000_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        gen = rng(11)
+        self.x1 = gen.standard_normal(nobs)
+        self.x2 = gen.standard_normal(nobs) + 0.1
+
+    def time_ttest_ind(self, nobs):
+        ttest_ind(self.x1, self.x2)
+
+
+class Diagnostics:
+    params = [[1_000, 100_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        endog, exog = regression_data(nobs, 5)
+        self.exog = exog
+        self.resid = OLS(endog, exog).fit().resid
+        self.series = arma_series(nobs)
+
+    def time_het_breuschpagan(self, nobs):
+        het_breuschpagan(self.resid, self.exog)
+
+    def time_het_white(self, nobs):
+        het_white(self.resid, self.exog)
+
+    def time_acorr_ljungbox(self, nobs):
+        acorr_ljungbox(self.series, lags=np.arange(1, 21))
+
+
+class Anova:
+    params = [[1_000, 100_000], [10, 200]]
+    param_names = ["nobs", "n_groups"]
+
+    def setup(self, nobs, n_groups):
+        self.data = grouped_data(nobs, n_groups)
+        self.res = ols("y ~ x + C(g)", self.data).fit()
+
+    def time_formula_fit(self, nobs, n_groups):
+        ols("y ~ x + C(g)", self.data).fit()
+
+    def peakmem_formula_fit(self, nobs, n_groups):
+        ols("y ~ x + C(g)", self.data).fit()
+
+    def time_anova_lm(self, nobs, n_groups):
+        anova_lm(self.res, typ=2)
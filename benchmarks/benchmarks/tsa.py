@@ -0,0 +1,58 @@
+"""Benchmarks of time series decomposition and tools"""
+
+from statsmodels.tsa.regime_switching.markov_autoregression import (
+    MarkovAutoregression,
+)
+from statsmodels.tsa.seasonal import STL
+from statsmodels.tsa.stattools import acf, adfuller, pacf
+
+from .common import arma_series, seasonal_series
+
+
+class STLFit:
+    params = [[1_000, 100_000], [12, 52], [False, True]]
+    param_names = ["nobs", "period", "robust"]
+
+    def setup(self, nobs, period, robust):
+        self.endog = seasonal_series(nobs, period)
+
+    def time_fit(self, nobs, period, robust):
+        STL(self.endog, period=period, robust=robust).fit()
+
+    def peakmem_fit(self, nobs, period, robust):
+        STL(self.endog, period=period, robust=robust).fit()
+
+
+class StatTools:
+    params = [[1_000, 100_000]]
+    param_names = ["nobs"]
+
+    def setup(self, nobs):
+        self.endog = arma_series(nobs)
+
+    def time_acf(self, nobs):
+        acf(self.endog, nlags=40, fft=True)
+
+    def time_pacf(self, nobs):
+        pacf(self.endog, nlags=20)
+
+    def time_adfuller(self, nobs):
+        adfuller(self.endog, maxlag=12, result_object=True)
+
+
+class MarkovSwitchingSearch:
+    """Random start parameter search with the batched Hamilton filter"""
+
+    params = [[1, 4]]
+    param_names = ["n_jobs"]
+
+    def setup(self, n_jobs):
+        self.model = MarkovAutoregression(
+            arma_series(500), k_regimes=2, order=2, switching_ar=False
+        )
+
+    def time_loglike_many(self, n_jobs):
+        self.model.loglike_many([self.model.start_params] * 200, n_jobs=n_jobs)
+
+    def time_search(self, n_jobs):
+        self.model._start_params_search(20, rng=0, n_jobs=n_jobs)
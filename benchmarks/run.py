@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+"""
+Run the statsmodels benchmarks without asv
+
+The benchmarks in the ``benchmarks`` package follow the asv conventions:
+classes with ``params`` and ``param_names``, a ``setup`` method and
+``time_*`` and ``peakmem_*`` methods. They can be run with asv using
+``asv.conf.json`` in this directory, or with this script which needs
+nothing beyond statsmodels and its dependencies.
+
+``time_*`` benchmarks report the median wall time of a call over several
+repeats. ``peakmem_*`` benchmarks report the peak memory allocated during a
+call as traced by ``tracemalloc``, which includes numpy arrays.
+
+usage
+
+python benchmarks/run.py
+python benchmarks/run.py --bench "regression|discrete" --quick
+python benchmarks/run.py --output new.json --compare old.json --factor 1.2
+
+Results are written as JSON together with the commit and the versions of
+the dependencies. With ``--compare`` the results are compared to a previous
+output file and the script exits with a non-zero status if any benchmark is
+slower, or uses more memory, by more than ``--factor``.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PREFIXES = ("time_", "peakmem_")
+
+
+def discover():
+    """Yield (name, class) of all benchmark classes"""
+    sys.path.insert(0, HERE)
+    package = importlib.import_module("benchmarks")
+    for info in sorted(pkgutil.iter_modules(package.__path__), key=lambda m: m.name):
+        if info.name == "common":
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            if any(attr.startswith(PREFIXES) for attr in dir(cls)):
+                yield f"{info.name}.{cls_name}", cls
+
+
+def param_grid(cls, quick):
+    params = getattr(cls, "params", [])
+    names = getattr(cls, "param_names", [])
+    if not params:
+        return [()], []
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    if quick:
+        params = [values[:1] for values in params]
+    return list(itertools.product(*params)), list(names)
+
+
+def time_call(func, args, repeat, min_time):
+    # warm up, and find the number of calls per sample
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    number = max(1, int(min_time / elapsed)) if elapsed > 0 else 1000
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "value": statistics.median(samples),
+        "unit": "seconds",
+        "min": min(samples),
+        "max": max(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def peakmem_call(func, args):
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"value": peak - baseline, "unit": "bytes"}
+
+
+def run(pattern, quick, repeat, min_time, verbose):
+    results = []
+    regex = re.compile(pattern) if pattern else None
+    for name, cls in discover():
+        methods = sorted(attr for attr in dir(cls) if attr.startswith(PREFIXES))
+        methods = [m for m in methods if regex is None or regex.search(f"{name}.{m}")]
+        if not methods:
+            continue
+        grid, names = param_grid(cls, quick)
+        for values in grid:
+            bench = cls()
+            try:
+                if hasattr(bench, "setup"):
+                    bench.setup(*values)
+            except NotImplementedError:
+                # asv convention to skip a parameter combination
+                continue
+            for method in methods:
+                func = getattr(bench, method)
+                if method.startswith("time_"):
+                    res = time_call(func, values, repeat, min_time)
+                else:
+                    res = peakmem_call(func, values)
+                res["name"] = f"{name}.{method}"
+                res["params"] = {
+                    pname: repr(val) for pname, val in zip(names, values, strict=True)
+                }
+                results.append(res)
+                if verbose:
+                    print(format_result(res), file=sys.stderr)
+            if hasattr(bench, "teardown"):
+                bench.teardown(*values)
+    return results
+
+
+def format_value(value, unit):
+    if unit == "bytes":
+        for scale, suffix in [(2**30, "GiB"), (2**20, "MiB"), (2**10, "KiB")]:
+            if value >= scale:
+                return f"{value / scale:.3g}{suffix}"
+        return f"{value}B"
+    for scale, suffix in [(1, "s"), (1e-3, "ms"), (1e-6, "us")]:
+        if value >= scale:
+            return f"{value / scale:.3g}{suffix}"
+    return f"{value / 1e-9:.3g}ns"
+
+
+def format_result(res):
+    params = ", ".join(f"{k}={v}" for k, v in res["params"].items())
+    return f"{res['name']}({params}): {format_value(res['value'], res['unit'])}"
+
+
+def key(res):
+    return res["name"], tuple(sorted(res["params"].items()))
+
+
+def compare(baseline, results, factor):
+    """Print the ratios to the baseline, return the regressions"""
+    old = {key(res): res for res in baseline["results"]}
+    regressions = []
+    for res in results:
+        prev = old.get(key(res))
+        if prev is None or prev["value"] <= 0:
+            continue
+        ratio = res["value"] / prev["value"]
+        flag = ""
+        if ratio > factor:
+            flag = "  REGRESSION"
+            regressions.append(res)
+        elif ratio < 1 / factor:
+            flag = "  improved"
+        print(
+            f"{ratio:7.2f}  {format_value(prev['value'], prev['unit']):>9s} -> "
+            f"{format_value(res['value'], res['unit']):>9s}  "
+            f"{format_result(res).split(': ')[0]}{flag}"
+        )
+    return regressions
+
+
+def environment():
+    versions = {}
+    for mod in ["statsmodels", "numpy", "scipy", "pandas", "patsy", "formulaic"]:
+        try:
+            versions[mod] = importlib.import_module(mod).__version__
+        except ImportError:
+            versions[mod] = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=HERE,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": versions,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--bench", "-b", default=None, help="Regular expression to select benchmarks"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only run the first value of each parameter",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Minimum duration of each timing sample (s)",
+    )
+    parser.add_argument("--output", "-o", default=None, help="JSON output file")
+    parser.add_argument("--compare", default=None, help="JSON file of a previous run")
+    parser.add_argument("--factor", type=float, default=1.1)
+    parser.add_argument("--quiet", "-q", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.bench, args.quick, args.repeat, args.min_time, not args.quiet)
+    output = {"environment": environment(), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(output, fh, indent=2)
+    elif not args.compare:
+        print(json.dumps(output, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(baseline, results, args.factor)
+        if regressions:
+            print(f"{len(regressions)} benchmarks regressed by more than {args.factor}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
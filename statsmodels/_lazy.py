@@ -0,0 +1,96 @@
+"""
+Lazy loading of the attributes of api modules
+
+The api modules collect many classes and functions from across statsmodels.
+Importing all of them eagerly is slow, so api modules describe their imports
+with ``attach`` and each attribute is imported on first access using module
+level ``__getattr__`` (PEP 562).
+
+This module must not import numpy, scipy, pandas or any statsmodels module.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+__all__ = ["attach"]
+
+
+def _parse(imports):
+    attrs = {}
+    for module, names in imports.items():
+        for name in names:
+            source, _, alias = name.partition(" as ")
+            source = source.strip()
+            alias = alias.strip() or source
+            if alias in attrs:
+                raise ValueError(f"{alias} is imported more than once")
+            attrs[alias] = (module, source)
+    return attrs
+
+
+def _load(package, module, source):
+    mod = importlib.import_module(module, package)
+    first, *rest = source.split(".")
+    try:
+        value = getattr(mod, first)
+    except AttributeError:
+        # same as ``from module import first`` if first is a submodule
+        value = importlib.import_module(f"{mod.__name__}.{first}")
+    for part in rest:
+        value = getattr(value, part)
+    return value
+
+
+def attach(module_name, imports):
+    """
+    Create module level ``__getattr__`` and ``__dir__`` for lazy imports
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module that provides the attributes, ``__name__``.
+    imports : dict[str, list[str]]
+        Maps the module to import from, relative to the package of
+        `module_name` if it starts with a dot as in a relative import
+        statement in the module, to the names to import from
+        it. Names can be given as ``"name as alias"`` and can be dotted
+        attribute paths, e.g., ``"OLS.from_formula as ols"``, so that each
+        entry mirrors a ``from module import name as alias`` statement.
+
+    Returns
+    -------
+    __getattr__ : callable
+        Imports the requested attribute, caches it in the module namespace
+        and returns it.
+    __dir__ : callable
+        Lists the module namespace together with the lazy attributes.
+
+    Examples
+    --------
+    In ``statsmodels/tsa/api.py``
+
+    >>> __getattr__, __dir__ = attach(
+    ...     __name__, {".stattools": ["acf", "pacf"], ".": ["vector_ar as var"]}
+    ... )
+    """
+    attrs = _parse(imports)
+    # the package itself for __init__ modules, the parent package otherwise
+    package = sys.modules[module_name].__package__
+
+    def __getattr__(name):
+        try:
+            module, source = attrs[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        value = _load(package, module, source)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(attrs))
+
+    return __getattr__, __dir__
@@ -0,0 +1,407 @@
+"""
+Bootstrap of parameter estimates by refitting models on resampled data
+
+The refits of a bootstrap are independent, so they run concurrently in
+threads. Every replication draws from its own ``SeedSequence`` spawned from a
+common root, so the bootstrap draws do not depend on the number of workers or
+on the order in which replications finish.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from statsmodels.tools.parallel import _n_workers
+
+__all__ = ["BootstrapResults", "bootstrap_params"]
+
+SCHEMES = ("pairs", "residual", "wild", "block", "cluster")
+
+
+def _seed_sequence(rng):
+    if isinstance(rng, np.random.SeedSequence):
+        return rng
+    if isinstance(rng, np.random.Generator):
+        return np.random.SeedSequence(rng.integers(0, 2**63, size=4))
+    if isinstance(rng, np.random.RandomState):
+        return np.random.SeedSequence(rng.randint(0, 2**31, size=4))
+    return np.random.SeedSequence(rng)
+
+
+def _take_rows(value, idx, nobs):
+    """Resample the nobs-length init keyword `value`, if it is one"""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        value = value.to_numpy()
+    if not isinstance(value, np.ndarray) or value.ndim == 0:
+        return value
+    if value.shape[0] != nobs:
+        return value
+    if value.ndim == 2 and value.shape == (nobs, nobs):
+        # e.g. sigma in GLS
+        return value[np.ix_(idx, idx)]
+    return value[idx]
+
+
+def _group_rows(groups, nobs):
+    groups = np.asarray(groups)
+    if groups.shape[0] != nobs:
+        raise ValueError("groups must have one entry per observation")
+    _, inverse = np.unique(groups, return_inverse=True, axis=0)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind="stable")
+    splits = np.flatnonzero(np.diff(inverse[order])) + 1
+    return np.split(order, splits), inverse
+
+
+class _Resampler:
+    """
+    Refit a model on resampled data
+
+    Holds the data of the original model and creates the model instances
+    of the replications.
+    """
+
+    def __init__(self, results, scheme, groups, block_size, fit_kwds):
+        model = results.model
+        self.model = model
+        self.scheme = scheme
+        self.endog = np.asarray(model.endog)
+        self.exog = None if model.exog is None else np.asarray(model.exog)
+        self.nobs = self.endog.shape[0]
+        self.init_kwds = model._get_init_kwds()
+        # avoid missing value handling of resampled data
+        if "missing" in self.init_kwds:
+            self.init_kwds["missing"] = "none"
+        self.params = np.asarray(results.params)
+
+        fit_kwds = {} if fit_kwds is None else dict(fit_kwds)
+        accepted = inspect.signature(model.fit).parameters
+        mle_settings = getattr(results, "mle_settings", None)
+        if "method" in accepted and "method" not in fit_kwds and mle_settings:
+            fit_kwds["method"] = mle_settings["optimizer"]
+        if "start_params" in accepted:
+            # warm start from the point estimate
+            fit_kwds.setdefault("start_params", self.params)
+        if "disp" in accepted:
+            fit_kwds.setdefault("disp", 0)
+        self.fit_kwds = fit_kwds
+
+        if scheme in ("residual", "wild"):
+            if self.endog.ndim != 1:
+                raise ValueError(f"scheme='{scheme}' requires a 1-d endog")
+            self.fitted = np.asarray(model.predict(self.params), dtype=float)
+            resid = self.endog - self.fitted
+            if scheme == "residual":
+                resid = resid - resid.mean()
+            self.resid = resid
+
+        self.clusters = self.inverse = None
+        if groups is not None:
+            self.clusters, self.inverse = _group_rows(groups, self.nobs)
+        elif scheme == "cluster":
+            raise ValueError("groups is required when scheme='cluster'")
+
+        if block_size is None:
+            block_size = int(np.ceil(self.nobs ** (1 / 3)))
+        block_size = int(block_size)
+        if not 1 <= block_size <= self.nobs:
+            raise ValueError("block_size must be between 1 and nobs")
+        self.block_size = block_size
+
+    def _fit(self, endog, idx=None):
+        kwds = self.init_kwds
+        exog = self.exog
+        if idx is not None:
+            kwds = {k: _take_rows(v, idx, self.nobs) for k, v in kwds.items()}
+            exog = None if exog is None else exog[idx]
+        mod = self.model.__class__(endog, exog, **kwds)
+        for attr in getattr(self.model, "cloneattr", []):
+            setattr(mod, attr, getattr(self.model, attr))
+        res = mod.fit(**self.fit_kwds)
+        converged = True
+        retvals = getattr(res, "mle_retvals", None)
+        if retvals is not None:
+            converged = bool(retvals.get("converged", True))
+        return np.asarray(res.params), converged
+
+    def draw(self, seed):
+        """Parameter estimate of a single bootstrap replication"""
+        rng = np.random.default_rng(seed)
+        nobs = self.nobs
+        if self.scheme == "pairs":
+            idx = rng.integers(nobs, size=nobs)
+            return self._fit(self.endog[idx], idx)
+        elif self.scheme == "block":
+            # moving block bootstrap
+            size = self.block_size
+            nblocks = -(-nobs // size)
+            starts = rng.integers(nobs - size + 1, size=nblocks)
+            idx = (starts[:, None] + np.arange(size)).ravel()[:nobs]
+            return self._fit(self.endog[idx], idx)
+        elif self.scheme == "cluster":
+            chosen = rng.integers(len(self.clusters), size=len(self.clusters))
+            idx = np.concatenate([self.clusters[i] for i in chosen])
+            return self._fit(self.endog[idx], idx)
+        elif self.scheme == "residual":
+            idx = rng.integers(nobs, size=nobs)
+            return self._fit(self.fitted + self.resid[idx])
+        # wild bootstrap with Rademacher weights, per cluster if groups given
+        if self.inverse is None:
+            weights = rng.choice([-1.0, 1.0], size=nobs)
+        else:
+            weights = rng.choice([-1.0, 1.0], size=len(self.clusters))
+            weights = weights[self.inverse]
+        return self._fit(self.fitted + self.resid * weights)
+
+    def jackknife_sets(self):
+        """Rows kept in each jackknife refit"""
+        if self.clusters is not None and self.scheme in ("cluster", "wild"):
+            omit = self.clusters
+        elif self.scheme == "block":
+            size = self.block_size
+            omit = [
+                np.arange(start, min(start + size, self.nobs))
+                for start in range(0, self.nobs, size)
+            ]
+        else:
+            omit = [np.array([i]) for i in range(self.nobs)]
+        keep = np.ones(self.nobs, dtype=bool)
+        for rows in omit:
+            keep[rows] = False
+            yield np.flatnonzero(keep)
+            keep[rows] = True
+
+    def leave_out(self, idx):
+        return self._fit(self.endog[idx], idx)
+
+
+def _run(func, args, n_jobs):
+    n_jobs = _n_workers(n_jobs)
+    if n_jobs == 1:
+        return [func(arg) for arg in args]
+    with ThreadPoolExecutor(n_jobs) as executor:
+        return list(executor.map(func, args))
+
+
+class BootstrapResults:
+    """
+    Results of a bootstrap of the parameter estimates
+
+    Parameters
+    ----------
+    params : ndarray
+        The point estimate of the original sample.
+    bootstrap_params : ndarray
+        The estimates of the replications, (nrep, k_params). Rows of
+        replications that failed are nan.
+    converged : ndarray
+        Boolean flag of each replication, False if the optimizer of the
+        replication did not converge or the fit failed.
+    scheme : str
+        The resampling scheme.
+    param_names : list[str], optional
+        The names of the parameters.
+    """
+
+    def __init__(
+        self,
+        params,
+        bootstrap_params,
+        converged,
+        scheme,
+        param_names=None,
+        _resampler=None,
+        _n_jobs=1,
+    ):
+        self.params = params
+        self.bootstrap_params = bootstrap_params
+        self.converged = converged
+        self.scheme = scheme
+        self.param_names = param_names
+        self.nrep = bootstrap_params.shape[0]
+        self._resampler = _resampler
+        self._n_jobs = _n_jobs
+        self._jackknife = None
+
+    @property
+    def mean(self):
+        """Mean of the bootstrap estimates"""
+        return np.nanmean(self.bootstrap_params, axis=0)
+
+    @property
+    def bse(self):
+        """Bootstrap standard errors of the parameter estimates"""
+        return np.nanstd(self.bootstrap_params, axis=0, ddof=1)
+
+    @property
+    def bias(self):
+        """Bootstrap estimate of the bias of the parameter estimates"""
+        return self.mean - self.params
+
+    def cov_params(self):
+        """
+        Bootstrap covariance of the parameter estimates
+
+        Returns
+        -------
+        ndarray
+            The covariance matrix computed from the replications that did
+            not fail.
+        """
+        valid = np.isfinite(self.bootstrap_params).all(1)
+        return np.atleast_2d(np.cov(self.bootstrap_params[valid], rowvar=False))
+
+    def jackknife_params(self):
+        """
+        Leave-one-out estimates used for the BCa acceleration
+
+        Observations are left out one at a time, clusters for the cluster
+        scheme and the wild cluster bootstrap, and non-overlapping blocks for
+        the block scheme.
+
+        Returns
+        -------
+        ndarray
+            The estimates, one row for each left out set.
+        """
+        if self._jackknife is None:
+            if self._resampler is None:
+                raise ValueError("the data of the bootstrap is not available")
+            resampler = self._resampler
+            out = _run(
+                resampler.leave_out,
+                list(resampler.jackknife_sets()),
+                self._n_jobs,
+            )
+            self._jackknife = np.array([params for params, _ in out])
+        return self._jackknife
+
+    def conf_int(self, alpha=0.05, method="percentile"):
+        """
+        Bootstrap confidence intervals of the parameters
+
+        Parameters
+        ----------
+        alpha : float, optional
+            The significance level of the intervals, the coverage is
+            ``1 - alpha``.
+        method : {"percentile", "bca"}, optional
+            The percentile interval or the bias-corrected and accelerated
+            interval. "bca" refits the model on jackknife samples to estimate
+            the acceleration, see ``jackknife_params``.
+
+        Returns
+        -------
+        ndarray
+            Array with lower and upper limits in the columns, one row for
+            each parameter. Replications that failed are ignored.
+        """
+        boot = self.bootstrap_params.reshape(self.nrep, -1)
+        boot = boot[np.isfinite(boot).all(1)]
+        if method == "percentile":
+            lower = np.quantile(boot, alpha / 2, axis=0)
+            upper = np.quantile(boot, 1 - alpha / 2, axis=0)
+            return np.column_stack([lower, upper])
+        if method != "bca":
+            raise ValueError("method must be 'percentile' or 'bca'")
+
+        point = np.ravel(self.params)
+        prop = ((boot < point).sum(0) + 0.5 * (boot == point).sum(0)) / len(boot)
+        z0 = stats.norm.ppf(prop)
+        jack = self.jackknife_params().reshape(-1, point.shape[0])
+        dev = jack.mean(0) - jack
+        denom = 6 * (dev**2).sum(0) ** 1.5
+        with np.errstate(invalid="ignore", divide="ignore"):
+            accel = np.where(denom > 0, (dev**3).sum(0) / denom, 0.0)
+        limits = []
+        for q in (alpha / 2, 1 - alpha / 2):
+            zq = z0 + stats.norm.ppf(q)
+            prob = stats.norm.cdf(z0 + zq / (1 - accel * zq))
+            limits.append(
+                [np.quantile(boot[:, i], prob[i]) for i in range(boot.shape[1])]
+            )
+        return np.column_stack(limits)
+
+    def summary_frame(self, alpha=0.05, method="percentile"):
+        """
+        Summary of the bootstrap as a DataFrame
+
+        Parameters
+        ----------
+        alpha : float, optional
+            The significance level of the confidence intervals.
+        method : {"percentile", "bca"}, optional
+            The method of the confidence intervals, see ``conf_int``.
+
+        Returns
+        -------
+        DataFrame
+            The point estimate, bootstrap mean, bias, standard error and
+            confidence interval of each parameter.
+        """
+        ci = self.conf_int(alpha=alpha, method=method)
+        return pd.DataFrame(
+            {
+                "params": np.ravel(self.params),
+                "mean": np.ravel(self.mean),
+                "bias": np.ravel(self.bias),
+                "bse": np.ravel(self.bse),
+                "ci_lower": ci[:, 0],
+                "ci_upper": ci[:, 1],
+            },
+            index=self.param_names,
+        )
+
+
+def bootstrap_params(
+    results,
+    nrep=999,
+    scheme="pairs",
+    n_jobs=1,
+    rng=None,
+    groups=None,
+    block_size=None,
+    fit_kwds=None,
+):
+    """
+    Bootstrap the parameter estimates of a results instance
+
+    See ``LikelihoodModelResults.bootstrap_params`` for the description of
+    the parameters.
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"scheme must be one of {', '.join(SCHEMES)}")
+    nrep = int(nrep)
+    if nrep < 1:
+        raise ValueError("nrep must be a positive integer")
+    resampler = _Resampler(results, scheme, groups, block_size, fit_kwds)
+    seeds = _seed_sequence(rng).spawn(nrep)
+
+    def draw(seed):
+        try:
+            return resampler.draw(seed)
+        except np.linalg.LinAlgError:
+            return None
+
+    out = _run(draw, seeds, n_jobs)
+    params = resampler.params
+    boot = np.full((nrep,) + params.shape, np.nan)
+    converged = np.zeros(nrep, dtype=bool)
+    for i, value in enumerate(out):
+        if value is not None and value[0].shape == params.shape:
+            boot[i], converged[i] = value
+    param_names = getattr(results.model.data, "param_names", None)
+    return BootstrapResults(
+        params,
+        boot,
+        converged,
+        scheme,
+        param_names=param_names if params.ndim == 1 else None,
+        _resampler=resampler,
+        _n_jobs=n_jobs,
+    )
@@ -0,0 +1,234 @@
+"""
+Instrumentation of model fits
+
+A ``FitProfile`` records where the time of a fit goes: wall time of the fit
+phases, the number of loglike, score and hessian evaluations and the value
+of the objective function after each iteration of the optimizer.
+
+Profiles are created by ``LikelihoodModel.fit(..., profile=True)`` and are
+available as ``results.fit_profile``. Iterations and a summary of the profile
+are also logged to the ``statsmodels.fit`` logger, at level DEBUG and INFO.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import logging
+import threading
+import time
+
+import numpy as np
+
+__all__ = ["FitProfile", "logger"]
+
+logger = logging.getLogger("statsmodels.fit")
+
+
+class FitProfile:
+    """
+    Timings, evaluation counts and objective trace of a fit
+
+    Parameters
+    ----------
+    name : str, optional
+        Description of the fit, e.g., the name of the model and the
+        optimizer, used in log messages.
+
+    Attributes
+    ----------
+    timings : dict[str, float]
+        Wall time in seconds of each phase. Phases recorded by
+        ``LikelihoodModel.fit`` are "data" (data handling when the model was
+        created), "setup", "optimize", "covariance" and "results".
+    counts : dict[str, int]
+        Number of loglike, score and hessian evaluations requested by the
+        optimizer and the covariance computation.
+    objective : list[float]
+        Value of the objective function minimized by the optimizer after
+        each iteration. For likelihood models this is the negative loglike
+        divided by nobs.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self.timings = {}
+        self.counts = {"loglike": 0, "score": 0, "hessian": 0}
+        self.objective = []
+        self._lock = threading.Lock()
+        # per thread state for the evaluation at the last params
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r})\n{self.summary()}"
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"], state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def total_time(self):
+        """Total wall time of all recorded phases"""
+        return sum(self.timings.values())
+
+    @property
+    def iterations(self):
+        """Number of iterations recorded"""
+        return len(self.objective)
+
+    def add_time(self, name, seconds):
+        """
+        Add wall time to a phase
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase.
+        seconds : float
+            The time to add.
+        """
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+        logger.debug("%s: %s took %.6fs", self.name, name, seconds)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager that records the wall time of a phase
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase. Time is accumulated if the phase is
+            entered more than once.
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def counted(self, name, func):
+        """
+        Wrap a function so that its calls are counted
+
+        Parameters
+        ----------
+        name : str
+            The key in ``counts``.
+        func : callable
+            The function to wrap.
+
+        Returns
+        -------
+        callable
+            The wrapped function.
+        """
+        self.counts.setdefault(name, 0)
+
+        def wrapper(*args, **kwargs):
+            if not getattr(self._local, "tracing", False):
+                with self._lock:
+                    self.counts[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def trace_objective(self, objective):
+        """
+        Wrap the objective function to remember the last evaluation
+
+        Parameters
+        ----------
+        objective : callable
+            The objective function, called as ``objective(params, *args)``.
+
+        Returns
+        -------
+        callable
+            The wrapped objective function.
+        """
+
+        def wrapper(params, *args):
+            value = objective(params, *args)
+            self._local.last = (np.array(params, copy=True), value)
+            return value
+
+        return wrapper
+
+    def trace_callback(self, callback, objective, fargs=()):
+        """
+        Wrap an optimizer callback to record the objective at each iterate
+
+        Parameters
+        ----------
+        callback : callable or None
+            The user callback, called as ``callback(xk)``.
+        objective : callable
+            The objective function as passed to ``trace_objective``. It is
+            evaluated at the iterate if the optimizer has not evaluated it
+            there already. These evaluations are not counted.
+        fargs : tuple, optional
+            Extra arguments of the objective function.
+
+        Returns
+        -------
+        callable
+            The callback that records the objective value and calls
+            `callback`.
+        """
+
+        def wrapper(xk, *args, **kwargs):
+            last = getattr(self._local, "last", None)
+            if last is not None and np.array_equal(last[0], xk):
+                value = last[1]
+            else:
+                self._local.tracing = True
+                try:
+                    value = objective(xk, *fargs)
+                finally:
+                    self._local.tracing = False
+            value = float(np.squeeze(value))
+            with self._lock:
+                self.objective.append(value)
+                iteration = len(self.objective)
+            logger.debug("%s: iteration %d, objective %.10g", self.name, iteration, value)
+            if callback is not None:
+                return callback(xk, *args, **kwargs)
+
+        return wrapper
+
+    def summary(self):
+        """
+        Summary of the profile
+
+        Returns
+        -------
+        str
+            The phase timings, evaluation counts and the number of
+            iterations with the last objective value.
+        """
+        lines = []
+        total = self.total_time
+        for name, seconds in self.timings.items():
+            share = 100 * seconds / total if total > 0 else 0.0
+            lines.append(f"{name:<12s}{seconds:12.6f}s {share:6.1f}%")
+        lines.append(f"{'total':<12s}{total:12.6f}s")
+        counts = ", ".join(f"{key}: {val}" for key, val in self.counts.items())
+        lines.append(f"evaluations: {counts}")
+        if self.objective:
+            lines.append(
+                f"iterations: {self.iterations}, "
+                f"final objective: {self.objective[-1]:.10g}"
+            )
+        return "\n".join(lines)
+
+    def log_summary(self, level=logging.INFO):
+        """Write the summary to the ``statsmodels.fit`` logger"""
+        if logger.isEnabledFor(level):
+            logger.log(level, "%s\n%s", self.name, self.summary())
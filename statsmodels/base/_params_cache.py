@@ -0,0 +1,128 @@
+"""
+Memoization of quantities that are evaluated at a parameter vector
+
+During estimation optimizers call ``loglike``, ``score`` and ``hessian``
+separately but often at the same parameters. Models can share intermediate
+results, for example the linear predictor or expensive special functions,
+between these calls by looking them up in a ``ParamsCache``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+__all__ = ["CacheInfo", "ParamsCache"]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParamsCache:
+    """
+    LRU cache of named quantities keyed by a parameter vector
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of distinct parameter vectors for which quantities are
+        stored. The least recently used parameter vector, together with all
+        quantities computed at it, is evicted when the limit is reached.
+
+    Notes
+    -----
+    Parameter vectors are compared by dtype, shape and exact byte content, so
+    that complex-step and finite-difference evaluations never collide with
+    the evaluation at the original parameters.
+
+    Cached values are shared between callers and must not be modified in
+    place. Lookups are thread safe, but a value may be computed more than
+    once if several threads request it at the same time.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        maxsize = int(maxsize)
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(params):
+        params = np.asarray(params)
+        return params.dtype.str, params.shape, params.tobytes()
+
+    def get(self, params, name, func, *args):
+        """
+        Return the quantity `name` at `params`, computing it if needed
+
+        Parameters
+        ----------
+        params : array_like
+            The parameter vector at which the quantity is evaluated.
+        name : str
+            The name of the quantity. Different quantities computed at the
+            same parameters are stored under different names.
+        func : callable
+            Function called as ``func(params, *args)`` on a cache miss.
+        *args
+            Extra arguments passed to `func`. Calls with extra arguments are
+            not cached since they may change the returned value.
+
+        Returns
+        -------
+        value
+            The cached or newly computed value.
+        """
+        if args:
+            return func(params, *args)
+        key = self._key(params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if name in entry:
+                    self.hits += 1
+                    return entry[name]
+            self.misses += 1
+        value = func(params)
+        with self._lock:
+            # func may itself have used the cache and evicted or added entries
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {}
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            entry[name] = value
+        return value
+
+    def clear(self):
+        """Remove all cached values and reset the hit and miss counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Cache statistics
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple with the number of hits and misses, the maximum
+            number of parameter vectors stored and the current number stored.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
@@ -10,6 +10,116 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+# number of elements in a block of exog rows used for prediction variances
+_CHUNK_ELEMENTS = 2**18
+
+
+def _var_linear_predict(self, exog, column=None):
+    """
+    Variance of the linear prediction ``exog @ params``
+
+    The diagonal of ``exog @ cov_params @ exog.T`` is computed in blocks of
+    rows so that memory use does not grow with the number of predictions
+    beyond the returned array.
+
+    The quadratic form uses cov_params directly instead of a Cholesky factor.
+    Both need the same number of operations per row, but the factor loses
+    precision if cov_params is ill-conditioned, e.g., with badly scaled
+    exog.
+
+    Parameters
+    ----------
+    self : Results
+        The results instance.
+    exog : ndarray
+        2-d array of explanatory variables, one row for each prediction.
+    column : array_like, optional
+        Selects the rows and columns of cov_params that correspond to the
+        columns of exog.
+
+    Returns
+    -------
+    ndarray
+        The variance of the linear prediction for each row of exog.
+    """
+    if column is None:
+        covb = self.cov_params()
+    else:
+        covb = self.cov_params(column=column)
+    covb = np.atleast_2d(covb)
+    nobs, k_vars = exog.shape
+    var_pred = np.empty(nobs, dtype=np.result_type(exog.dtype, covb.dtype))
+    step = max(_CHUNK_ELEMENTS // max(k_vars, 1), 1)
+    for start in range(0, nobs, step):
+        block = exog[start : start + step]
+        var_pred[start : start + step] = np.einsum("ij,ij->i", block @ covb, block)
+    return var_pred
+
+
+def _take_chunk(value, sl, nobs):
+    """Rows `sl` of `value` if it has one row per prediction"""
+    if value is None or np.ndim(value) == 0:
+        return value
+    if len(value) != nobs:
+        return value
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value.iloc[sl]
+    return value[sl]
+
+
+def iter_prediction(self, exog, chunksize=100000, row_labels=None, **kwargs):
+    """
+    Compute prediction results in blocks of rows
+
+    Parameters
+    ----------
+    self : Results
+        The results instance, it must have a ``get_prediction`` method.
+    exog : array_like
+        The values for which you want to predict.
+    chunksize : int, optional
+        The number of rows of exog in each block.
+    row_labels : array_like, optional
+        Labels of the rows of exog.
+    **kwargs
+        Keyword arguments of ``get_prediction``. Arrays with one entry per
+        row of exog, e.g., weights, offset or exposure, are split into
+        blocks together with exog.
+
+    Returns
+    -------
+    generator
+        Generator that yields the results of ``get_prediction`` for each
+        block of rows.
+    """
+    chunksize = int(chunksize)
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    if kwargs.get("average", False):
+        raise ValueError("average is not supported with prediction in blocks")
+    if exog is None:
+        raise ValueError("exog is required")
+    if isinstance(exog, dict):
+        exog = pd.DataFrame(exog)
+    if not hasattr(exog, "iloc"):
+        exog = np.asarray(exog)
+        if exog.ndim == 1 and np.size(self.params) > 1:
+            # a single row of exog
+            exog = exog[None, :]
+    return _iter_prediction(self, exog, chunksize, row_labels, kwargs)
+
+
+def _iter_prediction(self, exog, chunksize, row_labels, kwargs):
+    nobs = len(exog)
+    for start in range(0, nobs, chunksize):
+        sl = slice(start, start + chunksize)
+        block = {key: _take_chunk(val, sl, nobs) for key, val in kwargs.items()}
+        yield self.get_prediction(
+            exog=_take_chunk(exog, sl, nobs),
+            row_labels=_take_chunk(row_labels, sl, nobs),
+            **block,
+        )
+
 
 # this is similar to ContrastResults after t_test, partially copied, adjusted
 class PredictionResultsBase:
@@ -490,10 +600,8 @@ def get_prediction_glm(
 
     predicted_mean = self.model.predict(self.params, exog, **pred_kwds)
 
-    covb = self.cov_params()
-
     link_deriv = self.model.family.link.inverse_deriv(linpred.predicted_mean)
-    var_pred_mean = link_deriv**2 * (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred_mean = link_deriv**2 * _var_linear_predict(self, exog)
     var_resid = self.scale  # self.mse_resid / weights
 
     # TODO: check that we have correct scale, Refactor scale #???
@@ -568,8 +676,7 @@ def get_prediction_linear(
     else:
         index = None
     # get linear prediction and standard errors
-    covb = self.cov_params(column=index)
-    var_pred = (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred = _var_linear_predict(self, exog, column=index)
     pred_kwds_linear = pred_kwds.copy()
     pred_kwds_linear["which"] = "linear"
     predicted = self.model.predict(self.params, exog, **pred_kwds_linear)
@@ -643,8 +750,7 @@ def get_prediction_monotonic(
     func_deriv = link.inverse_deriv
 
     # get linear prediction and standard errors
-    covb = self.cov_params(column=index)
-    linpred_var = (exog * np.dot(covb, exog.T).T).sum(1)
+    linpred_var = _var_linear_predict(self, exog, column=index)
     pred_kwds_linear = pred_kwds.copy()
     pred_kwds_linear["which"] = "linear"
     linpred = self.model.predict(self.params, exog, **pred_kwds_linear)
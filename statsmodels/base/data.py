@@ -5,9 +5,10 @@ results, and doing data cleaning
 
 from __future__ import annotations
 
-from statsmodels.compat.python import lmap
-
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
+import os
+import pickle
 
 import numpy as np
 from pandas import DataFrame, MultiIndex, Series, isnull
@@ -16,23 +17,155 @@ from statsmodels.tools._decorators import cache_readonly, cache_writable
 import statsmodels.tools.data as data_util
 from statsmodels.tools.sm_exceptions import MissingDataError
 
+# Number of array elements processed at once when scanning large design
+# matrices, bounds the size of temporary arrays
+_CHUNK_ELEMENTS = 2**20
+
+
+def _chunk_rows(x):
+    """Number of rows of x processed per chunk, or None if x is small"""
+    nrows = x.shape[0]
+    ncols = int(np.prod(x.shape[1:], dtype=int)) if x.ndim > 1 else 1
+    chunk = max(_CHUNK_ELEMENTS // max(ncols, 1), 2 * (ncols + 1))
+    return chunk if nrows > chunk else None
+
+
+def _column_min_max(x):
+    """
+    Column minimum and maximum of a 2d array
+
+    Large arrays are scanned in blocks of rows so that each block is read
+    once for both statistics. NaNs propagate to the result.
+    """
+    chunk = _chunk_rows(x)
+    if chunk is None:
+        return np.min(x, axis=0), np.max(x, axis=0)
+    mins = []
+    maxs = []
+    for start in range(0, x.shape[0], chunk):
+        block = x[start : start + chunk]
+        mins.append(block.min(axis=0))
+        maxs.append(block.max(axis=0))
+    return np.min(mins, axis=0), np.max(maxs, axis=0)
+
+
+def _rank_with_ones(x):
+    """
+    Rank of x and of x augmented by a column of ones
+
+    Large arrays are reduced block by block to the triangular factor of a
+    QR decomposition of the augmented array, so that neither the augmented
+    array nor a full SVD workspace is materialized. The rank tolerance is
+    the same as the default of ``np.linalg.matrix_rank``.
+    """
+    nobs, k = x.shape
+    chunk = _chunk_rows(x)
+    if chunk is None:
+        augmented = np.column_stack((np.ones(nobs), x))
+        return np.linalg.matrix_rank(x), np.linalg.matrix_rank(augmented)
+
+    # the column of ones is last so that r[:k, :k] is the factor of x
+    r = np.zeros((0, k + 1))
+    for start in range(0, nobs, chunk):
+        block = x[start : start + chunk]
+        block = np.column_stack((block, np.ones(block.shape[0])))
+        r = np.linalg.qr(np.vstack((r, block)), mode="r")
+
+    def rank(sv, shape):
+        if sv.size == 0 or sv.max() == 0:
+            return 0
+        tol = sv.max() * max(shape) * np.finfo(sv.dtype).eps
+        return int((sv > tol).sum())
+
+    sv_orig = np.linalg.svd(r[:k, :k], compute_uv=False)
+    sv_augm = np.linalg.svd(r, compute_uv=False)
+    return rank(sv_orig, (nobs, k)), rank(sv_augm, (nobs, k + 1))
+
 
 def _asarray_2dcolumns(x):
     if np.asarray(x).ndim > 1 and np.asarray(x).squeeze().ndim == 1:
         return
 
 
-def _asarray_2d_null_rows(x):
+def _scan_workers(ntasks, nelements):
+    """Number of threads used to scan nelements split into ntasks tasks"""
+    if ntasks < 2 or nelements <= _CHUNK_ELEMENTS:
+        return 1
+    return max(min(ntasks, os.cpu_count() or 1, 8), 1)
+
+
+def _array_null_rows(x):
     """
-    Makes sure input is an array and is 2d. Makes sure output is 2d. True
-    indicates a null in the rows of 2d x.
+    Boolean array that is True for the rows of x that contain a null value
+
+    Large arrays are scanned in blocks of rows, in parallel threads if
+    several cores are available, so that the temporary null indicator is
+    never larger than a block. Integer and boolean arrays cannot contain
+    nulls and are not scanned.
     """
-    # Have to have the asarrays because isnull does not account for array_like
-    # input
     x = np.asarray(x)
+    nrows = x.shape[0]
     if x.ndim == 1:
         x = x[:, None]
-    return np.any(isnull(x), axis=1)[:, None]
+    elif x.ndim > 2:
+        x = x.reshape(nrows, -1)
+    if x.dtype.kind in "biu":
+        return np.zeros(nrows, dtype=bool)
+    isnull_func = np.isnan if x.dtype.kind in "fc" else isnull
+
+    out = np.empty(nrows, dtype=bool)
+
+    def scan(rows):
+        np.any(isnull_func(x[rows]), axis=1, out=out[rows])
+
+    chunk = _chunk_rows(x)
+    if chunk is None:
+        scan(slice(None))
+        return out
+    blocks = [slice(start, start + chunk) for start in range(0, nrows, chunk)]
+    n_workers = _scan_workers(len(blocks), x.size)
+    if n_workers == 1:
+        for rows in blocks:
+            scan(rows)
+    else:
+        with ThreadPoolExecutor(n_workers) as executor:
+            # blocks write to disjoint parts of out
+            list(executor.map(scan, blocks))
+    return out
+
+
+def _frame_null_rows(x):
+    """
+    Boolean array that is True for the rows of a DataFrame with a null value
+
+    Columns are scanned one at a time, so that neither a null indicator
+    frame nor a copy of a frame with several blocks is created.
+    """
+    columns = [x.iloc[:, i] for i in range(x.shape[1])]
+    n_workers = _scan_workers(len(columns), x.size)
+
+    def scan(cols):
+        out = np.zeros(x.shape[0], dtype=bool)
+        for col in cols:
+            out |= _array_null_rows(col.to_numpy())
+        return out
+
+    if n_workers == 1:
+        return scan(columns)
+    groups = [columns[i::n_workers] for i in range(n_workers)]
+    with ThreadPoolExecutor(n_workers) as executor:
+        return reduce(np.logical_or, executor.map(scan, groups))
+
+
+def _null_rows(x):
+    """
+    Boolean array that is True for the rows of x that contain a null value
+    """
+    if isinstance(x, DataFrame):
+        return _frame_null_rows(x)
+    if isinstance(x, Series):
+        x = x.to_numpy()
+    return _array_null_rows(x)
 
 
 def _nan_rows(*arrs):
@@ -40,18 +173,40 @@ def _nan_rows(*arrs):
     Returns a boolean array which is True where any of the rows in any
     of the _2d_ arrays in arrs are NaNs. Inputs can be any mixture of Series,
     DataFrames or array_like.
+
+    Each array is read once, see ``_array_null_rows`` and
+    ``_frame_null_rows``.
     """
-    if len(arrs) == 1:
-        arrs += ([[False]],)
-
-    def _nan_row_maybe_two_inputs(x, y):
-        # check for dtype bc dataframe has dtypes
-        x_is_boolean_array = hasattr(x, "dtype") and x.dtype == bool and x
-        return np.logical_or(
-            _asarray_2d_null_rows(x), (x_is_boolean_array | _asarray_2d_null_rows(y))
-        )
+    nan_mask = None
+    for x in arrs:
+        rows = _null_rows(x)
+        if nan_mask is None:
+            nan_mask = rows
+        elif rows.shape != nan_mask.shape:
+            raise ValueError(
+                "Arrays with different numbers of rows cannot be checked "
+                "jointly for missing values."
+            )
+        else:
+            nan_mask |= rows
+    return nan_mask
 
-    return reduce(_nan_row_maybe_two_inputs, arrs).squeeze()
+
+def _row_selector(keep):
+    """
+    Compact selector of the rows flagged in the boolean array keep
+
+    Returns a slice if the rows to keep are contiguous, which is common when
+    only leading or trailing observations are missing, e.g., after lagging
+    or differencing. Arrays are then dropped by taking views instead of
+    copies. Otherwise the integer positions of the rows are returned.
+    """
+    rows = np.flatnonzero(keep)
+    if rows.size == 0:
+        return slice(0, 0)
+    if rows[-1] - rows[0] + 1 == rows.size:
+        return slice(int(rows[0]), int(rows[-1]) + 1)
+    return rows
 
 
 class ModelData:
@@ -94,17 +249,36 @@ class ModelData:
     def __getstate__(self):
         from copy import copy
 
+        from statsmodels.formula._manager import dumps_model_spec
+
         d = copy(self.__dict__)
+        # the cache can be rebuilt from the model_spec
+        d.pop("compiled_formula", None)
         if "model_spec" in d:
-            del d["model_spec"]
+            model_spec = d.pop("model_spec")
+            try:
+                d["pickled_model_spec"] = dumps_model_spec(model_spec)
+            except pickle.PicklingError:
+                # rebuilt from the formula and data when unpickled
+                pass
             d["restore_model_spec"] = True
         return d
 
     def __setstate__(self, d):
-        if "restore_model_spec" in d:
-            # NOTE: there may be a more performant way to do this
+        pickled_model_spec = d.pop("pickled_model_spec", None)
+        if pickled_model_spec is not None:
+            from statsmodels.formula._manager import loads_model_spec
 
+            try:
+                self.model_spec = loads_model_spec(pickled_model_spec)
+            except Exception:
+                # e.g., an incompatible version of the formula engine
+                pass
+            else:
+                del d["restore_model_spec"]
+        if "restore_model_spec" in d:
             from statsmodels.formula._manager import FormulaManager
+
             mgr = FormulaManager()
             exc = []
             try:
@@ -134,10 +308,10 @@ class ModelData:
         else:
             # detect where the constant is
             check_implicit = False
-            exog_max = np.max(self.exog, axis=0)
+            # single pass over exog, nans and infs propagate to the extrema
+            exog_min, exog_max = _column_min_max(self.exog)
             if not np.isfinite(exog_max).all():
                 raise MissingDataError("exog contains inf or nans")
-            exog_min = np.min(self.exog, axis=0)
             const_idx = np.where(exog_max == exog_min)[0].squeeze()
             self.k_constant = const_idx.size
 
@@ -177,11 +351,7 @@ class ModelData:
             if check_implicit and not hasconst:
                 # look for implicit constant
                 # Compute rank of augmented matrix
-                augmented_exog = np.column_stack(
-                    (np.ones(self.exog.shape[0]), self.exog)
-                )
-                rank_augm = np.linalg.matrix_rank(augmented_exog)
-                rank_orig = np.linalg.matrix_rank(self.exog)
+                rank_orig, rank_augm = _rank_with_ones(self.exog)
                 self.k_constant = int(rank_orig == rank_augm)
                 self.const_idx = None
             elif hasconst:
@@ -197,6 +367,13 @@ class ModelData:
     def _drop_nans_2d(cls, x, nan_mask):
         return x[nan_mask][:, nan_mask]
 
+    @classmethod
+    def _drop_rows(cls, arrays, keep, two_dim=False):
+        # select the rows to keep in all arrays with a single compact index
+        rows = _row_selector(keep)
+        drop = cls._drop_nans_2d if two_dim else cls._drop_nans
+        return [drop(x, rows) for x in arrays]
+
     @classmethod
     def handle_missing(cls, endog, exog, missing, **kwargs):
         """
@@ -222,9 +399,9 @@ class ModelData:
         combined : dict
             Dictionary with keys endog, exog and the keys of kwargs, with
             missing rows dropped if `missing` is "drop".
-        missing_idx : list of str
-            The row indices that contained missing values and were
-            dropped, or an empty list if there was no missing data.
+        missing_idx : ndarray or list
+            The integer positions of the rows that contained missing values
+            and were dropped, or an empty list if there was no missing data.
         """
         none_array_names = []
 
@@ -284,7 +461,7 @@ class ModelData:
                 updated_row_mask = combined_nans[~nan_mask]
                 nan_mask |= combined_nans  # for updating extra arrays only
             if combined_2d:
-                combined_2d_nans = _nan_rows(combined_2d)
+                combined_2d_nans = _nan_rows(*combined_2d)
                 if combined_2d_nans.shape[0] != nan_mask.shape[0]:
                     raise ValueError(
                         "Shape mismatch between endog/exog "
@@ -299,7 +476,7 @@ class ModelData:
         else:
             nan_mask = _nan_rows(*combined)
             if combined_2d:
-                nan_mask = _nan_rows(*(nan_mask[:, None],) + combined_2d)
+                nan_mask |= _nan_rows(*combined_2d)
 
         if not np.any(nan_mask):  # no missing do not do anything
             combined = dict(zip(combined_names, combined, strict=True))
@@ -319,36 +496,30 @@ class ModelData:
             raise MissingDataError("NaNs were encountered in the data")
 
         elif missing == "drop":
-            nan_mask = ~nan_mask
-
-            def drop_nans(x):
-                return cls._drop_nans(x, nan_mask)
-
-            def drop_nans_2d(x):
-                return cls._drop_nans_2d(x, nan_mask)
-
-            combined = dict(zip(combined_names, lmap(drop_nans, combined), strict=True))
+            keep = ~nan_mask
+            combined = dict(
+                zip(combined_names, cls._drop_rows(combined, keep), strict=True)
+            )
 
             if missing_idx is not None:
                 if updated_row_mask is not None:
-                    updated_row_mask = ~updated_row_mask
                     # update endog/exog with this new information
-                    endog = cls._drop_nans(endog, updated_row_mask)
-                    if exog is not None:
-                        exog = cls._drop_nans(exog, updated_row_mask)
+                    if exog is None:
+                        (endog,) = cls._drop_rows((endog,), ~updated_row_mask)
+                    else:
+                        endog, exog = cls._drop_rows((endog, exog), ~updated_row_mask)
 
                 combined.update({"endog": endog})
                 if exog is not None:
                     combined.update({"exog": exog})
 
             if combined_2d:
-                combined.update(
-                    dict(zip(combined_2d_names, lmap(drop_nans_2d, combined_2d), strict=True))
-                )
+                combined_2d = cls._drop_rows(combined_2d, keep, two_dim=True)
+                combined.update(dict(zip(combined_2d_names, combined_2d, strict=True)))
             if none_array_names:
                 combined.update({k: kwargs.get(k, None) for k in none_array_names})
 
-            return combined, np.where(~nan_mask)[0].tolist()
+            return combined, np.flatnonzero(nan_mask).tolist()
         else:
             raise ValueError(f"missing option {missing} not understood")
 
@@ -559,14 +730,15 @@ class PandasData(ModelData):
     @classmethod
     def _drop_nans(cls, x, nan_mask):
         if isinstance(x, (Series, DataFrame)):
-            return x.loc[nan_mask]
+            # positional selection avoids aligning on the index
+            return x.iloc[nan_mask]
         else:  # extra arguments could be plain ndarrays
             return super()._drop_nans(x, nan_mask)
 
     @classmethod
     def _drop_nans_2d(cls, x, nan_mask):
         if isinstance(x, (Series, DataFrame)):
-            return x.loc[nan_mask].loc[:, nan_mask]
+            return x.iloc[nan_mask, nan_mask]
         else:  # extra arguments could be plain ndarrays
             return super()._drop_nans_2d(x, nan_mask)
 
@@ -671,11 +843,13 @@ def _make_endog_names(endog):
 
 
 def _make_exog_names(exog):
-    exog_var = exog.var(0)
-    if (exog_var == 0).any():
+    # constant columns, avoids the temporary copy of exog created by var
+    exog_min, exog_max = _column_min_max(exog)
+    is_const = exog_max == exog_min
+    if is_const.any():
         # assumes one constant in first or last position
         # avoid exception if more than one constant
-        const_idx = exog_var.argmin()
+        const_idx = is_const.argmax()
         exog_names = [f"x{i:d}" for i in range(1, exog.shape[1])]
         exog_names.insert(const_idx, "const")
     else:
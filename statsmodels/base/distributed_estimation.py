@@ -1,3 +1,10 @@
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+import gc
+from multiprocessing import shared_memory
+import os
+from typing import NamedTuple
+import weakref
+
 import numpy as np
 
 from statsmodels.base.elastic_net import RegularizedResults
@@ -15,6 +22,9 @@ methods of distribution
 
 - sequential, has no extra dependencies
 - parallel
+    - with a local process pool, concurrent.futures.ProcessPoolExecutor,
+      either sending the data partitions to the workers by pickling them
+      or placing them in shared memory
     - with joblib
         A variety of backends are supported through joblib
         This allows for different types of clusters besides
@@ -303,49 +313,118 @@ def _est_regularized_debiased(
     return params, grad, nodewise_row_l, nodewise_weight_l
 
 
-def _join_debiased(results_l, threshold=0):
+class DebiasedStatistics(NamedTuple):
     """
-    Join the results from each run of _est_regularized_debiased and
-    return the debiased estimate of the coefficients
+    Sufficient statistics of the partition results for the debiased join
+
+    Attributes
+    ----------
+    partitions : int
+        The number of partitions that were reduced.
+    params_sum : ndarray
+        The sum of the regularized parameter estimates of the partitions.
+    grad_sum : ndarray
+        The sum of the scaled gradients of the partitions.
+    nodewise_row : ndarray
+        The node-wise regression rows of all partitions, in the order of
+        the partitions, one row per parameter in total.
+    nodewise_weight : ndarray
+        The node-wise regression weights of all partitions.
+    """
+
+    partitions: int
+    params_sum: np.ndarray
+    grad_sum: np.ndarray
+    nodewise_row: np.ndarray
+    nodewise_weight: np.ndarray
+
+
+def _reduce_debiased(results_l):
+    """
+    Reduce partition results to the statistics needed by the debiased join
 
     Parameters
     ----------
     results_l : list
-        A list of tuples each one containing the params, grad,
-        nodewise_row and nodewise_weight values for each partition.
-    threshold : scalar, optional
-        The threshold at which the coefficients will be cut.
+        A list, in the order of the partitions, of tuples returned by
+        _est_regularized_debiased or of DebiasedStatistics from an earlier
+        reduction of consecutive partitions.
 
     Returns
     -------
-    ndarray
-        The debiased estimate of the coefficients.
+    DebiasedStatistics
+        The sums of the parameters and gradients and the stacked node-wise
+        regression results. Their size does not depend on the number of
+        partitions or observations, so the reduction can be done where the
+        partitions are estimated and only the statistics sent for the join.
     """
 
-    p = len(results_l[0][0])
-    partitions = len(results_l)
-
-    params_mn = np.zeros(p)
-    grad_mn = np.zeros(p)
+    first = results_l[0]
+    if isinstance(first, DebiasedStatistics):
+        p = len(first.params_sum)
+    else:
+        p = len(first[0])
+    partitions = 0
+    params_sum = np.zeros(p)
+    grad_sum = np.zeros(p)
 
     nodewise_row_l = []
     nodewise_weight_l = []
 
     for r in results_l:
+        if isinstance(r, DebiasedStatistics):
+            partitions += r.partitions
+            params_sum += r.params_sum
+            grad_sum += r.grad_sum
+            nodewise_row_l.extend(r.nodewise_row)
+            nodewise_weight_l.extend(r.nodewise_weight)
+        else:
+            partitions += 1
+            params_sum += r[0]
+            grad_sum += r[1]
+            nodewise_row_l.extend(r[2])
+            nodewise_weight_l.extend(r[3])
 
-        params_mn += r[0]
-        grad_mn += r[1]
+    return DebiasedStatistics(
+        partitions,
+        params_sum,
+        grad_sum,
+        np.array(nodewise_row_l),
+        np.array(nodewise_weight_l),
+    )
 
-        nodewise_row_l.extend(r[2])
-        nodewise_weight_l.extend(r[3])
 
-    nodewise_row_l = np.array(nodewise_row_l)
-    nodewise_weight_l = np.array(nodewise_weight_l)
+def _join_debiased(results_l, threshold=0):
+    """
+    Join the results from each run of _est_regularized_debiased and
+    return the debiased estimate of the coefficients
 
-    params_mn /= partitions
-    grad_mn *= -1.0 / partitions
+    Parameters
+    ----------
+    results_l : list or DebiasedStatistics
+        A list of tuples each one containing the params, grad,
+        nodewise_row and nodewise_weight values for each partition,
+        or the reduced statistics of all partitions, see
+        _reduce_debiased. The list can also contain the reduced
+        statistics of groups of consecutive partitions.
+    threshold : scalar, optional
+        The threshold at which the coefficients will be cut.
 
-    approx_inv_cov = _calc_approx_inv_cov(nodewise_row_l, nodewise_weight_l)
+    Returns
+    -------
+    ndarray
+        The debiased estimate of the coefficients.
+    """
+
+    if isinstance(results_l, DebiasedStatistics):
+        stats = results_l
+    else:
+        stats = _reduce_debiased(results_l)
+
+    params_mn = stats.params_sum / stats.partitions
+    grad_mn = -stats.grad_sum / stats.partitions
+
+    approx_inv_cov = _calc_approx_inv_cov(stats.nodewise_row, stats.nodewise_weight)
 
     debiased_params = params_mn + approx_inv_cov.dot(grad_mn)
 
@@ -393,6 +472,196 @@ def _helper_fit_partition(self, pnum, endog, exog, fit_kwds, init_kwds_e=None):
     return results
 
 
+def _helper_fit_partition_reduced(self, pnum, endog, exog, fit_kwds, init_kwds_e=None):
+    """
+    Fit a partition and reduce the result for the join
+
+    If the join_method is _join_debiased the result is reduced to
+    DebiasedStatistics in the worker, otherwise it is returned as is.
+    See _helper_fit_partition for the parameters.
+    """
+    results = _helper_fit_partition(self, pnum, endog, exog, fit_kwds, init_kwds_e)
+    if self.join_method is _join_debiased:
+        results = _reduce_debiased([results])
+    return results
+
+
+def _slice_rows(x, start, stop):
+    if hasattr(x, "iloc"):
+        return x.iloc[start:stop]
+    return x[start:stop]
+
+
+def partition_data(endog, exog, partitions):
+    """
+    Generator of consecutive data partitions for DistributedModel
+
+    Parameters
+    ----------
+    endog : array_like
+        The endogenous data of all observations.
+    exog : array_like
+        The exogenous data of all observations.
+    partitions : int
+        The number of partitions.
+
+    Yields
+    ------
+    endog : array_like
+        The endogenous data of the partition.
+    exog : array_like
+        The exogenous data of the partition.
+
+    Notes
+    -----
+    All partitions but the last have ``nobs // partitions`` observations,
+    the last partition also contains the remaining observations. Partitions
+    of ndarrays are views, so no data are copied when the partitions are
+    created. They are generated one at a time, so that the parallel
+    backends of DistributedModel can start estimating the first partitions
+    while later partitions are still being read.
+    """
+    nobs = exog.shape[0]
+    n_part = nobs // partitions
+    for pnum in range(partitions):
+        start = pnum * n_part
+        stop = nobs if pnum == partitions - 1 else start + n_part
+        yield _slice_rows(endog, start, stop), _slice_rows(exog, start, stop)
+
+
+def _data_owner(x):
+    """The ndarray that owns the memory of the ndarray x, or x itself"""
+    while isinstance(x.base, np.ndarray):
+        x = x.base
+    return x
+
+
+class _SharedBlock:
+    """A shared memory block holding an array and the partitions using it"""
+
+    def __init__(self, owner, on_release):
+        # size must be positive, empty partitions still get a block
+        self.shm = shared_memory.SharedMemory(create=True, size=max(owner.nbytes, 1))
+        shared = np.ndarray(
+            owner.shape, dtype=owner.dtype, buffer=self.shm.buf, strides=owner.strides
+        )
+        shared[...] = owner
+        del shared
+        self.address = owner.__array_interface__["data"][0]
+        self.pending = 0
+        self.ref = weakref.ref(owner, lambda _: self.release(0))
+        self._on_release = on_release
+
+    def release(self, n=1):
+        """Release n partitions, unlinks the block once it is no longer used"""
+        self.pending -= n
+        if self.pending == 0 and self.ref() is None and self.shm is not None:
+            self.unlink()
+
+    def unlink(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+            self._on_release(self)
+
+
+class _SharedData:
+    """
+    Shared memory blocks holding the data of the partitions
+
+    Partitions that are views of the same array, as those generated by
+    partition_data, are placed in a single block that holds the array, so
+    the data are copied to shared memory only once and the partitions are
+    sent to the workers as offsets into that block. A block is unlinked
+    once no pending partition uses it and the array it holds has been
+    garbage collected, so partitions read one at a time, e.g. from disk,
+    are only held in shared memory while they are estimated.
+    """
+
+    def __init__(self):
+        self._blocks = {}
+        self._live = set()
+
+    def share(self, x):
+        """Place x in shared memory, returns its block and spec"""
+        x = np.asarray(x)
+        owner = _data_owner(x)
+        if not (owner.flags.c_contiguous or owner.flags.f_contiguous):
+            owner = x = np.ascontiguousarray(x)
+        block = self._blocks.get(id(owner))
+        if block is None or block.ref() is not owner:
+            block = _SharedBlock(owner, self._forget)
+            self._blocks[id(owner)] = block
+            self._live.add(block)
+        block.pending += 1
+        offset = x.__array_interface__["data"][0] - block.address
+        return block, (block.shm.name, x.shape, x.dtype.str, offset, x.strides)
+
+    def _forget(self, block):
+        self._live.discard(block)
+        for key, value in list(self._blocks.items()):
+            if value is block:
+                del self._blocks[key]
+
+    def close(self):
+        """Unlink all blocks"""
+        for block in list(self._live):
+            block.unlink()
+
+
+def _helper_fit_partition_shared(self, pnum, specs, fit_kwds, init_kwds_e=None):
+    """
+    Fit a partition whose data are in shared memory blocks
+
+    The data are used in place, only the names of the blocks and the
+    offset, shape, dtype and strides of the arrays in them are sent to the
+    worker. The blocks are owned by the parent process, see _SharedData.
+
+    Parameters
+    ----------
+    self : DistributedModel class instance
+        An instance of DistributedModel.
+    pnum : scalar
+        index of current partition.
+    specs : tuple
+        The shared memory name, and the shape, dtype, offset and strides
+        in the block, of endog and exog.
+    fit_kwds : dict-like
+        Keywords needed for the model fitting.
+    init_kwds_e : dict-like, optional
+        Additional init_kwds to add for each partition.
+
+    Returns
+    -------
+    object
+        The estimation_method result, reduced as in
+        _helper_fit_partition_reduced.
+    """
+    blocks = [shared_memory.SharedMemory(name=spec[0]) for spec in specs]
+    try:
+        endog, exog = (
+            np.ndarray(
+                spec[1], dtype=spec[2], buffer=shm.buf, offset=spec[3], strides=spec[4]
+            )
+            for spec, shm in zip(specs, blocks, strict=True)
+        )
+        results = _helper_fit_partition_reduced(
+            self, pnum, endog, exog, fit_kwds, init_kwds_e
+        )
+        del endog, exog
+    finally:
+        # models may hold reference cycles to the data
+        gc.collect()
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                # still referenced, released when the array is collected
+                pass
+    return results
+
+
 class DistributedModel:
     __doc__ = """
     Distributed model class
@@ -513,6 +782,7 @@ class DistributedModel:
         parallel_method="sequential",
         parallel_backend=None,
         init_kwds_generator=None,
+        n_workers=None,
     ):
         """Performs the distributed estimation using the corresponding
         DistributedModel
@@ -525,16 +795,23 @@ class DistributedModel:
             element corresponds to an exog array.
         fit_kwds : dict-like, optional
             Keywords needed for the model fitting.
-        parallel_method : {"sequential", "joblib"}, optional
-            Type of distributed estimation to be used, currently
-            "sequential" and "joblib" are supported.
+        parallel_method : {"sequential", "joblib", "process", "shared_memory"}
+            Type of distributed estimation to be used. "process" estimates
+            the partitions in a local process pool and "shared_memory"
+            does the same but passes the data to the workers in shared
+            memory instead of pickling them, see fit_process.
         parallel_backend : None or joblib parallel_backend object, optional
             used to allow support for more complicated backends,
-            ex: dask.distributed
+            ex: dask.distributed. For "process" and "shared_memory" this
+            can be a concurrent.futures.Executor used instead of a new
+            process pool.
         init_kwds_generator : generator or None, optional
             Additional keyword generator that produces model init_kwds
             that may vary based on data partition.  The current usecase
             is for WLS and GLS
+        n_workers : int, optional
+            The number of workers for "process" and "shared_memory", see
+            fit_process.
 
         Returns
         -------
@@ -557,6 +834,16 @@ class DistributedModel:
                 data_generator, fit_kwds, parallel_backend, init_kwds_generator
             )
 
+        elif parallel_method in ("process", "shared_memory"):
+            results_l = self.fit_process(
+                data_generator,
+                fit_kwds,
+                parallel_backend,
+                init_kwds_generator,
+                use_shared_memory=parallel_method == "shared_memory",
+                n_workers=n_workers,
+            )
+
         else:
             raise ValueError(
                 f"parallel_method: {parallel_method} is currently not supported"
@@ -683,6 +970,131 @@ class DistributedModel:
 
         return results_l
 
+    def fit_process(
+        self,
+        data_generator,
+        fit_kwds,
+        parallel_backend=None,
+        init_kwds_generator=None,
+        use_shared_memory=False,
+        n_workers=None,
+    ):
+        """Performs the distributed estimation in a local process pool
+
+        Parameters
+        ----------
+        data_generator : generator
+            A generator that produces a sequence of tuples where the first
+            element in the tuple corresponds to an endog array and the
+            element corresponds to an exog array, e.g., partition_data.
+        fit_kwds : dict-like
+            Keywords needed for the model fitting.
+        parallel_backend : Executor or None, optional
+            The executor used to estimate the partitions. If None, a
+            concurrent.futures.ProcessPoolExecutor with n_workers workers
+            is created and shut down when the estimation is done.
+        init_kwds_generator : generator or None, optional
+            Additional keyword generator that produces model init_kwds
+            that may vary based on data partition.  The current usecase
+            is for WLS and GLS
+        use_shared_memory : bool, optional
+            If True, the data of the partitions are placed in shared memory
+            and the workers use them in place instead of receiving a
+            pickled copy. Partitions that are views of the same array,
+            e.g. from partition_data, share a single copy of that array.
+        n_workers : int, optional
+            The number of workers of the executor. Defaults to the number
+            of CPUs. This should be given if parallel_backend is an
+            executor with a different number of workers.
+
+        Returns
+        -------
+        list
+            If join_method is _join_debiased, a list with the
+            DebiasedStatistics of all partitions. Otherwise a list of the
+            estimation_method result for each partition.
+
+        Notes
+        -----
+        Partitions are consumed from data_generator while earlier
+        partitions are estimated. At most twice as many partitions as
+        there are workers are held in memory at the same time.
+
+        With the debiased join, each worker reduces the result of its
+        partition to the sufficient statistics of the join, and the
+        statistics are summed in the parent as the partitions finish, so
+        the per-partition results are never collected.
+        """
+
+        if init_kwds_generator is None:
+            tup_gen = enumerate((data, None) for data in data_generator)
+        else:
+            tup_gen = enumerate(zip(data_generator, init_kwds_generator, strict=True))
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if isinstance(parallel_backend, Executor):
+            executor = parallel_backend
+        elif parallel_backend is None:
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+        else:
+            raise TypeError("parallel_backend must be None or an Executor")
+        max_pending = 2 * n_workers
+        reduce_stats = self.join_method is _join_debiased
+
+        results_l = []
+        finished = {}
+        pending = {}
+        shared = _SharedData() if use_shared_memory else None
+
+        next_pnum = 0
+
+        def collect(done):
+            nonlocal next_pnum
+            for future in done:
+                pnum, blocks = pending.pop(future)
+                for block in blocks:
+                    block.release()
+                finished[pnum] = future.result()
+            # reduce in partition order, the node-wise rows are stacked
+            while next_pnum in finished:
+                result = finished.pop(next_pnum)
+                if reduce_stats and results_l:
+                    results_l[0] = _reduce_debiased([results_l[0], result])
+                else:
+                    results_l.append(result)
+                next_pnum += 1
+
+        try:
+            for pnum, ((endog, exog), init_kwds_e) in tup_gen:
+                blocks = []
+                try:
+                    if use_shared_memory:
+                        specs = []
+                        for x in (endog, exog):
+                            block, spec = shared.share(x)
+                            blocks.append(block)
+                            specs.append(spec)
+                        args = (_helper_fit_partition_shared, self, pnum, specs)
+                    else:
+                        args = (_helper_fit_partition_reduced, self, pnum, endog, exog)
+                    future = executor.submit(*args, fit_kwds, init_kwds_e)
+                except BaseException:
+                    for block in blocks:
+                        block.release()
+                    raise
+                pending[future] = (pnum, blocks)
+                if len(pending) >= max_pending:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+            collect(wait(pending).done)
+        finally:
+            if executor is not parallel_backend:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if shared is not None:
+                shared.close()
+
+        return results_l
+
 
 class DistributedResults(LikelihoodModelResults):
     """
@@ -4,17 +4,22 @@ from statsmodels.compat.python import lzip
 
 from collections import defaultdict
 from functools import reduce
+import queue
+import threading
+import time
 import warnings
 
 import numpy as np
 import pandas as pd
 from scipy import stats
 
+from statsmodels.base._fit_profile import FitProfile
+from statsmodels.base._params_cache import ParamsCache
 from statsmodels.base.data import handle_data
-from statsmodels.base.optimizer import Optimizer
+from statsmodels.base.optimizer import Optimizer, _multistart_n_jobs
 import statsmodels.base.wrapper as wrap
 from statsmodels.formula import handle_formula_data
-from statsmodels.formula._manager import FormulaManager
+from statsmodels.formula._manager import CompiledFormula, FormulaManager
 from statsmodels.stats.contrast import (
     ContrastResults,
     WaldTestResults,
@@ -63,6 +68,21 @@ _extra_param_doc = """
         formula interface."""
 
 
+def _get_compiled_formula(data, model_spec, mgr):
+    """
+    Compiled formula of a model specification, cached on the model data
+    """
+    compiled = data.__dict__.get("compiled_formula")
+    if (
+        compiled is None
+        or compiled.model_spec is not model_spec
+        or compiled.engine != mgr.engine
+    ):
+        compiled = CompiledFormula(model_spec, engine=mgr.engine)
+        data.compiled_formula = compiled
+    return compiled
+
+
 class Model:
     __doc__ = f"""
     A (predictive) statistical model. Intended to be subclassed, not used
@@ -99,7 +119,10 @@ class Model:
     def __init__(self, endog, exog=None, **kwargs):
         missing = kwargs.pop("missing", "none")
         hasconst = kwargs.pop("hasconst", None)
+        start = time.perf_counter()
         self.data = self._handle_data(endog, exog, missing, hasconst, **kwargs)
+        # reported in the "data" phase of fit profiles
+        self._handle_data_time = time.perf_counter() - start
         self.k_constant = self.data.k_constant
         self.exog = self.data.exog
         self.endog = self.data.endog
@@ -283,10 +306,56 @@ class Model:
 class LikelihoodModel(Model):
     """Likelihood model is a subclass of Model"""
 
+    # ParamsCache shared by loglike, score and hessian, only set during fit
+    _params_cache = None
+
     def __init__(self, endog, exog=None, **kwargs):
         super().__init__(endog, exog, **kwargs)
         self.initialize()
 
+    def _cached_at_params(self, params, name, func, *args):
+        """
+        Evaluate `func` at `params` using the params cache if it is active
+
+        Parameters
+        ----------
+        params : ndarray
+            The parameters at which `func` is evaluated.
+        name : str
+            Name under which the value is stored in the cache.
+        func : callable
+            Function called as ``func(params, *args)``.
+        *args
+            Extra arguments for `func`. Calls with extra arguments bypass the
+            cache.
+
+        Returns
+        -------
+        value
+            The value of ``func(params, *args)``. Arrays returned from the
+            cache are shared and must not be modified in place.
+        """
+        cache = self._params_cache
+        if cache is None:
+            return func(params, *args)
+        return cache.get(params, name, func, *args)
+
+    def _thread_copy(self):
+        """
+        Model used to evaluate the loglikelihood in another thread
+
+        Multistart fits with n_jobs > 1 evaluate the loglikelihood, score and
+        hessian concurrently in worker threads. Models whose evaluation
+        changes their state must return a copy that does not share that
+        state. The default returns the model itself.
+
+        Returns
+        -------
+        LikelihoodModel
+            The model, or a copy of it.
+        """
+        return self
+
     def initialize(self):
         """
         Initialize (possibly re-initialize) a Model instance
@@ -434,12 +503,40 @@ class LikelihoodModel(Model):
             calculated. However, it will be available in methods that use the
             hessian in the optimization (currently only with `"newton"`).
         **kwargs
-            All kwargs are passed to the chosen solver with one exception. The
-            following keyword controls what happens after the fit::
+            All kwargs are passed to the chosen solver with four exceptions.
+            The following keywords control the fit itself::
 
                 warn_convergence : bool, optional
                     If True, checks the model for the converged flag. If the
                     converged flag is False, a ConvergenceWarning is issued.
+                params_cache : bool or int, optional
+                    If True or a positive integer, loglike, score and hessian
+                    evaluations, and the intermediate quantities that models
+                    share between them, are memoized by params during the
+                    fit. An integer sets the maximum number of parameter
+                    vectors that are kept, True uses 8. Cache statistics are
+                    available in the `params_cache_info` attribute of the
+                    results. Default is False.
+                multistart : int or dict, optional
+                    Run the solver from several starting values, generated
+                    around `start_params` from a Halton sequence or at
+                    random, possibly in parallel threads and with early
+                    stopping. Models whose state changes when they are
+                    evaluated, such as state space models, are copied for
+                    each thread. An integer gives the number of starts. See
+                    `statsmodels.base.optimizer._fit_multistart` for the
+                    options. Per-start diagnostics are stored in
+                    ``mle_retvals["multistart"]``.
+                profile : bool, optional
+                    If True, the fit is instrumented and a ``FitProfile``
+                    is attached as the `fit_profile` attribute of the
+                    results. It records the wall time of data handling,
+                    setup, optimization, covariance computation and results
+                    creation, the number of loglike, score and hessian
+                    evaluations and the objective value after each
+                    iteration. Iterations are logged at DEBUG level and a
+                    summary at INFO level to the ``statsmodels.fit``
+                    logger. Default is False.
 
         Returns
         -------
@@ -565,6 +662,16 @@ class LikelihoodModel(Model):
 
         Hinv = None  # JP error if full_output=0, Hinv not defined
 
+        profile = kwargs.pop("profile", False)
+        if profile:
+            profile = FitProfile(f"{self.__class__.__name__}.fit(method={method!r})")
+            handle_data_time = getattr(self, "_handle_data_time", None)
+            if handle_data_time is not None:
+                profile.add_time("data", handle_data_time)
+            setup_start = time.perf_counter()
+        else:
+            profile = None
+
         if start_params is None:
             if hasattr(self, "start_params"):
                 start_params = self.start_params
@@ -583,26 +690,66 @@ class LikelihoodModel(Model):
         nobs = self.endog.shape[0]
         # f = lambda params, *args: -self.loglike(params, *args) / nobs
 
+        # Multistart fits with n_jobs > 1 run the starts in worker threads.
+        # Models such as MLEModel change their state when the loglike is
+        # evaluated, so each worker thread evaluates its own model, see
+        # _thread_copy
+        model_copies = queue.SimpleQueue()
+        local = threading.local()
+        main_thread = threading.get_ident()
+
+        def _model():
+            if threading.get_ident() == main_thread:
+                return self
+            model = getattr(local, "model", None)
+            if model is None:
+                model = local.model = model_copies.get_nowait()
+            return model
+
+        def loglike(params, *args):
+            model = _model()
+            return model._cached_at_params(params, "loglike", model.loglike, *args)
+
         def f(params, *args):
-            return -self.loglike(params, *args) / nobs
+            return -loglike(params, *args) / nobs
+
+        def _score(params, *args):
+            model = _model()
+            return model._cached_at_params(params, "score", model.score, *args)
+
+        def _hess(params, *args):
+            model = _model()
+            return model._cached_at_params(params, "hessian", model.hessian, *args)
+
+        if profile is not None:
+            loglike = profile.counted("loglike", loglike)
+            _score = profile.counted("score", _score)
+            _hess = profile.counted("hessian", _hess)
 
         if method == "newton":
             # TODO: why are score and hess positive?
             def score(params, *args):
-                return self.score(params, *args) / nobs
+                return _score(params, *args) / nobs
 
             def hess(params, *args):
-                return self.hessian(params, *args) / nobs
+                return _hess(params, *args) / nobs
 
         else:
 
             def score(params, *args):
-                return -self.score(params, *args) / nobs
+                return -_score(params, *args) / nobs
 
             def hess(params, *args):
-                return -self.hessian(params, *args) / nobs
+                return -_hess(params, *args) / nobs
 
         warn_convergence = kwargs.pop("warn_convergence", True)
+        params_cache = kwargs.pop("params_cache", False)
+        if params_cache is True:
+            params_cache = ParamsCache()
+        elif params_cache:
+            params_cache = ParamsCache(params_cache)
+        else:
+            params_cache = None
 
         # Remove covariance args before calling fir to allow strict checking
         if "cov_type" in kwargs:
@@ -617,53 +764,80 @@ class LikelihoodModel(Model):
             kwds["use_t"] = kwargs["use_t"]
             del kwargs["use_t"]
 
-        optimizer = Optimizer()
-        xopt, retvals, optim_settings = optimizer._fit(
-            f,
-            score,
-            start_params,
-            fargs,
-            kwargs,
-            hessian=hess,
-            method=method,
-            disp=disp,
-            maxiter=maxiter,
-            callback=callback,
-            retall=retall,
-            full_output=full_output,
-        )
-        # Restore cov_type, cov_kwds and use_t
-        optim_settings.update(kwds)
-        # NOTE: this is for fit_regularized and should be generalized
-        cov_params_func = kwargs.setdefault("cov_params_func", None)
-        if cov_params_func:
-            Hinv = cov_params_func(self, xopt, retvals)
-        elif method == "newton" and full_output:
-            Hinv = np.linalg.inv(-retvals["Hessian"]) / nobs
-        elif not skip_hessian:
-            H = -1 * self.hessian(xopt)
-            invertible = False
-            if np.all(np.isfinite(H)):
-                eigvals, eigvecs = np.linalg.eigh(H)
-                if np.min(eigvals) > 0:
-                    invertible = True
-
-            if invertible:
-                Hinv = eigvecs.dot(np.diag(1.0 / eigvals)).dot(eigvecs.T)
-                Hinv = np.asfortranarray((Hinv + Hinv.T) / 2.0)
-            else:
-                warnings.warn(
-                    "Inverting hessian failed, no bse or cov_params available",
-                    HessianInversionWarning,
-                    stacklevel=2,
-                )
-                Hinv = None
+        prev_params_cache = self._params_cache
+        self._params_cache = None
+        try:
+            multistart = kwargs.get("multistart")
+            n_jobs = _multistart_n_jobs(multistart) if multistart else 1
+            if n_jobs > 1:
+                # The main thread does not evaluate the model while the
+                # worker threads run, so one of them uses the model itself
+                model_copies.put(self)
+                for _ in range(n_jobs - 1):
+                    model = self._thread_copy()
+                    # The copies share the (thread safe) params cache
+                    model._params_cache = params_cache
+                    model_copies.put(model)
+            self._params_cache = params_cache
+            if profile is not None:
+                profile.add_time("setup", time.perf_counter() - setup_start)
+            optimizer = Optimizer()
+            xopt, retvals, optim_settings = optimizer._fit(
+                f,
+                score,
+                start_params,
+                fargs,
+                kwargs,
+                hessian=hess,
+                method=method,
+                disp=disp,
+                maxiter=maxiter,
+                callback=callback,
+                retall=retall,
+                full_output=full_output,
+                profile=profile,
+            )
+            cov_start = time.perf_counter()
+            # Restore cov_type, cov_kwds and use_t
+            optim_settings.update(kwds)
+            # NOTE: this is for fit_regularized and should be generalized
+            cov_params_func = kwargs.setdefault("cov_params_func", None)
+            if cov_params_func:
+                Hinv = cov_params_func(self, xopt, retvals)
+            elif method == "newton" and full_output:
+                Hinv = np.linalg.inv(-retvals["Hessian"]) / nobs
+            elif not skip_hessian:
+                H = -1 * _hess(xopt)
+                invertible = False
+                if np.all(np.isfinite(H)):
+                    eigvals, eigvecs = np.linalg.eigh(H)
+                    if np.min(eigvals) > 0:
+                        invertible = True
+
+                if invertible:
+                    Hinv = eigvecs.dot(np.diag(1.0 / eigvals)).dot(eigvecs.T)
+                    Hinv = np.asfortranarray((Hinv + Hinv.T) / 2.0)
+                else:
+                    warnings.warn(
+                        "Inverting hessian failed, no bse or cov_params available",
+                        HessianInversionWarning,
+                        stacklevel=2,
+                    )
+                    Hinv = None
+            if profile is not None:
+                profile.add_time("covariance", time.perf_counter() - cov_start)
+        finally:
+            self._params_cache = prev_params_cache
 
+        results_start = time.perf_counter()
         # TODO: add Hessian approximation and change the above if needed
         mlefit = LikelihoodModelResults(self, xopt, Hinv, scale=1.0, **kwds)
 
         # TODO: hardcode scale?
         mlefit.mle_retvals = retvals
+        mlefit.params_cache_info = (
+            params_cache.cache_info() if params_cache is not None else None
+        )
         if isinstance(retvals, dict):
             if warn_convergence and not retvals["converged"]:
                 from statsmodels.tools.sm_exceptions import ConvergenceWarning
@@ -676,6 +850,10 @@ class LikelihoodModel(Model):
                 )
 
         mlefit.mle_settings = optim_settings
+        if profile is not None:
+            profile.add_time("results", time.perf_counter() - results_start)
+            profile.log_summary()
+        mlefit.fit_profile = profile
         return mlefit
 
     def _fit_zeros(
@@ -1061,11 +1239,11 @@ class GenericLikelihoodModel(LikelihoodModel):
 
     def loglike(self, params):
         """Log-likelihood of model at params"""
-        return self.loglikeobs(params).sum(0)
+        return self._cached_at_params(params, "loglikeobs", self.loglikeobs).sum(0)
 
     def nloglike(self, params):
         """Negative log-likelihood of model at params"""
-        return -self.loglikeobs(params).sum(0)
+        return -self._cached_at_params(params, "loglikeobs", self.loglikeobs).sum(0)
 
     def loglikeobs(self, params):
         """
@@ -1297,7 +1475,8 @@ class Results:
             orig_exog_len = len(exog)
             is_dict = isinstance(exog, dict)
             try:
-                exog = mgr.get_matrices(model_spec, exog, pandas=True, prediction=True)
+                compiled = _get_compiled_formula(self.model.data, model_spec, mgr)
+                exog = compiled.transform(exog, pandas=True)
             except Exception as exc:
                 msg = (
                     "predict requires that you use a DataFrame when "
@@ -2447,7 +2626,7 @@ class LikelihoodModelResults(Results):
         upper = params + q * bse
         return np.asarray(lzip(lower, upper))
 
-    def save(self, fname, remove_data=False):
+    def save(self, fname, remove_data=False, format="pickle"):
         """
         Save a pickle of this instance
 
@@ -2460,6 +2639,12 @@ class LikelihoodModelResults(Results):
             If True, then all arrays with length nobs are set to None before
             pickling. See the remove_data method.
             In some cases not all arrays will be set to None.
+        format : {"pickle", "compact"}, optional
+            "pickle" (default) pickles the instance. "compact" writes an npz
+            archive with the parameters, their covariance and scalar
+            statistics stored as separate arrays, that can be loaded lazily
+            and memory-mapped, together with a pickle of the instance that is
+            only read on demand. See ``statsmodels.iolib.smpickle.save_compact``.
 
         Notes
         -----
@@ -2467,8 +2652,13 @@ class LikelihoodModelResults(Results):
         remove_data method then this will raise an exception.
         """
 
-        from statsmodels.iolib.smpickle import save_pickle
+        from statsmodels.iolib.smpickle import save_compact, save_pickle
 
+        if format == "compact":
+            save_compact(self, fname, remove_data=remove_data)
+            return
+        elif format != "pickle":
+            raise ValueError('format must be "pickle" or "compact"')
         if remove_data:
             self.remove_data()
 
@@ -2492,13 +2682,102 @@ class LikelihoodModelResults(Results):
 
         Returns
         -------
-        Results
-            The unpickled results instance.
+        {Results, CompactResults}
+            The unpickled results instance, or a lazily loaded
+            ``CompactResults`` if the file was saved with
+            ``format="compact"``.
         """
 
-        from statsmodels.iolib.smpickle import load_pickle
+        from statsmodels.iolib.smpickle import load_results
+
+        return load_results(fname)
 
-        return load_pickle(fname)
+    def bootstrap_params(
+        self,
+        nrep=999,
+        scheme="pairs",
+        n_jobs=1,
+        rng=None,
+        groups=None,
+        block_size=None,
+        fit_kwds=None,
+    ):
+        """
+        Bootstrap the parameter estimates by refitting the model
+
+        Parameters
+        ----------
+        nrep : int, optional
+            Number of bootstrap replications.
+        scheme : {"pairs", "residual", "wild", "block", "cluster"}, optional
+            The resampling scheme.
+
+            * "pairs" resamples observations, rows of endog, exog and of
+              observation level options of the model such as weights and
+              offsets, with replacement.
+            * "residual" adds resampled centered residuals to the fitted
+              values.
+            * "wild" multiplies the residuals by Rademacher weights, that
+              are drawn per cluster if `groups` is given.
+            * "block" resamples overlapping blocks of consecutive
+              observations of length `block_size` (moving block bootstrap).
+            * "cluster" resamples the clusters defined by `groups`.
+
+            "residual" and "wild" require a 1-d endog and are intended for
+            models with additive errors, e.g., linear regression.
+        n_jobs : int, optional
+            Number of threads that run replications concurrently. -1 uses
+            all available cores.
+        rng : {None, int, array_like[int], SeedSequence, Generator}, optional
+            Seed of the bootstrap. Each replication uses a generator seeded
+            with its own ``SeedSequence`` spawned from `rng`, so the results
+            do not depend on `n_jobs`.
+        groups : array_like, optional
+            Cluster labels, one per observation. Required for
+            ``scheme="cluster"``.
+        block_size : int, optional
+            The block length for ``scheme="block"``. Default is
+            ``ceil(nobs ** (1/3))``.
+        fit_kwds : dict, optional
+            Keyword arguments for the ``fit`` of the replications. By default
+            replications use the optimizer of the original fit and start at
+            the point estimate.
+
+        Returns
+        -------
+        BootstrapResults
+            Instance with the bootstrap estimates in ``bootstrap_params``
+            and methods ``conf_int`` for percentile and BCa intervals,
+            ``cov_params`` and ``summary_frame``.
+
+        Notes
+        -----
+        Replications run in threads, which is effective when fitting spends
+        most of its time in numpy or compiled code that releases the GIL.
+        Replications in which the fit fails with a ``LinAlgError`` have nan
+        estimates and are ignored in the summary statistics.
+
+        Examples
+        --------
+        >>> import statsmodels.api as sm
+        >>> data = sm.datasets.longley.load()
+        >>> exog = sm.add_constant(data.exog)
+        >>> res = sm.OLS(data.endog, exog).fit()
+        >>> boot = res.bootstrap_params(nrep=199, scheme="wild", rng=0)
+        >>> boot.conf_int(method="bca")
+        """
+        from statsmodels.base._bootstrap import bootstrap_params
+
+        return bootstrap_params(
+            self,
+            nrep=nrep,
+            scheme=scheme,
+            n_jobs=n_jobs,
+            rng=rng,
+            groups=groups,
+            block_size=block_size,
+            fit_kwds=fit_kwds,
+        )
 
     def remove_data(self):
         """
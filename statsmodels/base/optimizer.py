@@ -7,12 +7,17 @@ from __future__ import annotations
 
 from statsmodels.compat.scipy import SP_LT_115, SP_LT_118
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any
 import warnings
 
 import numpy as np
 from scipy import optimize
 
+from statsmodels.tools.parallel import _n_workers
+from statsmodels.tools.sequences import halton
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -52,6 +57,7 @@ class Optimizer:
         disp=True,
         callback=None,
         retall=False,
+        profile=None,
     ):
         """
         Fit function for any model with an objective function
@@ -101,6 +107,10 @@ class Optimizer:
         retall : bool, optional
             Set to True to return list of solutions at each iteration.
             Available in Results object's mle_retvals attribute.
+        profile : FitProfile, optional
+            If provided, the wall time of the optimization is recorded in the
+            "optimize" phase and the objective value after each iteration is
+            appended to ``profile.objective``.
 
         Returns
         -------
@@ -228,6 +238,9 @@ class Optimizer:
                     For a list of methods and their arguments, see
                     documentation of `scipy.optimize.minimize`.
                     If no method is specified, then BFGS is used.
+
+        All methods accept the `multistart` keyword argument to run the
+        solver from several starting values, see `_fit_multistart`.
         """
         # TODO: generalize the regularization stuff
         # Extract kwargs specific to fit_regularized calling fit
@@ -266,19 +279,28 @@ class Optimizer:
             fit_funcs.update(extra_fit_funcs)
 
         func = fit_funcs[method]
-        xopt, retvals = func(
-            objective,
-            gradient,
-            start_params,
-            fargs,
-            kwargs,
-            disp=disp,
-            maxiter=maxiter,
-            callback=callback,
-            retall=retall,
-            full_output=full_output,
-            hess=hessian,
-        )
+        multistart = kwargs.pop("multistart", None)
+        fit = _fit_multistart if multistart else func
+        fit_kwds = {"func": func, "multistart": multistart} if multistart else {}
+        user_callback = callback
+        if profile is not None:
+            callback = profile.trace_callback(callback, objective, fargs)
+            objective = profile.trace_objective(objective)
+        with profile.phase("optimize") if profile is not None else nullcontext():
+            xopt, retvals = fit(
+                objective,
+                gradient,
+                start_params,
+                fargs,
+                kwargs,
+                disp=disp,
+                maxiter=maxiter,
+                callback=callback,
+                retall=retall,
+                full_output=full_output,
+                hess=hessian,
+                **fit_kwds,
+            )
 
         optim_settings = {
             "optimizer": method,
@@ -287,11 +309,13 @@ class Optimizer:
             "full_output": full_output,
             "disp": disp,
             "fargs": fargs,
-            "callback": callback,
+            "callback": user_callback,
             "retall": retall,
             "extra_fit_funcs": extra_fit_funcs,
         }
         optim_settings.update(kwargs)
+        if multistart:
+            optim_settings["multistart"] = multistart
         # set as attributes or return?
         return xopt, retvals, optim_settings
 
@@ -1348,3 +1372,258 @@ def _fit_basinhopping(
         retvals = None
 
     return xopt, retvals
+
+
+def _multistart_points(start_params, n_starts, sequence, scale, bounds, seed):
+    """
+    Starting values for multistart optimization
+
+    The first row is `start_params`. The remaining rows fill the box
+    `bounds`, or the box ``start_params +/- scale`` if `bounds` is None.
+    """
+    start_params = np.asarray(start_params, dtype=float)
+    k = start_params.shape[0]
+    if bounds is None:
+        scale = np.broadcast_to(np.asarray(scale, dtype=float), (k,))
+        lower, upper = start_params - scale, start_params + scale
+    else:
+        lower, upper = np.asarray(bounds, dtype=float)
+    if n_starts <= 1:
+        return start_params[None, :]
+    if sequence == "halton":
+        unit = halton(k, n_starts - 1)
+    elif sequence == "random":
+        unit = np.random.default_rng(seed).random((n_starts - 1, k))
+    else:
+        raise ValueError('sequence must be "halton" or "random"')
+    return np.vstack([start_params, lower + unit * (upper - lower)])
+
+
+def _multistart_n_jobs(multistart):
+    """
+    Number of threads used by a multistart fit
+
+    Parameters
+    ----------
+    multistart : int or dict
+        The `multistart` argument of `_fit_multistart`.
+
+    Returns
+    -------
+    int
+        The number of threads, at least 1.
+    """
+    n_jobs = multistart.get("n_jobs", 1) if isinstance(multistart, dict) else 1
+    return _n_workers(n_jobs)
+
+
+def _fit_multistart(
+    f,
+    score,
+    start_params,
+    fargs,
+    kwargs,
+    disp=True,
+    maxiter=100,
+    callback=None,
+    retall=False,
+    full_output=True,
+    hess=None,
+    func=None,
+    multistart=None,
+):
+    """
+    Fit by running a solver from several starting values
+
+    Parameters
+    ----------
+    f : callable
+        Returns negative log likelihood given parameters.
+    score : callable
+        Returns gradient of negative log likelihood with respect to params.
+    start_params : array_like
+        Initial guess of the solution for the loglikelihood maximization.
+        This is always used as the first starting value.
+    fargs : tuple
+        Extra arguments passed to the objective function, i.e.
+        objective(x,*args)
+    kwargs : dict[str, Any]
+        Extra keyword arguments passed to the solver.
+    disp : bool, optional
+        Set to True to print a summary of the starts.
+    maxiter : int, optional
+        The maximum number of iterations to perform in each start.
+    callback : callable, optional
+        Called after each iteration, as callback(xk), where xk is the
+        current parameter vector. With ``n_jobs > 1`` it is called from
+        several threads.
+    retall : bool, optional
+        Set to True to return list of solutions at each iteration.
+        Available in Results object's mle_retvals attribute.
+    full_output : bool, optional
+        Set to True to have all available output in the Results object's
+        mle_retvals attribute. The output is dependent on the solver.
+    hess : callable, optional
+        Method for computing the Hessian matrix, if applicable.
+    func : callable
+        The solver, one of the ``_fit_*`` functions.
+    multistart : int or dict
+        Either the number of starting values or a dict with the options
+
+        * n_starts : int, number of starting values, default 10.
+        * sequence : {"halton", "random"}, how the starting values are
+          generated, default "halton".
+        * scale : float or ndarray, half-width of the box around
+          `start_params` from which the starting values are drawn, default 1.
+        * bounds : ndarray, optional, (2, k_params) array with lower and upper
+          bounds of the box. Overrides `scale`.
+        * seed : int or Generator, optional, seed for ``sequence="random"``.
+        * n_jobs : int, number of threads that run starts concurrently,
+          default 1. -1 uses all available cores.
+        * n_success : int, optional, stop once this many starts have
+          converged to the best objective value found so far. Remaining
+          starts are not run. Default is to run all starts.
+        * tol : float, relative tolerance used to decide whether two starts
+          found the same objective value, default 1e-6.
+
+    Returns
+    -------
+    xopt : ndarray
+        The solution with the smallest objective value.
+    retvals : dict or None
+        The solver output of the best start with the additional key
+        "multistart", a dict with per-start diagnostics: the arrays
+        "start_params", "xopt", "fopt", "converged" and "iterations", the
+        boolean array "completed" marking the starts that were run, and
+        "best", the index of the best start.
+
+    Notes
+    -----
+    Starts run in threads since the objective function usually closes over
+    a model instance. This is effective when the objective spends most of
+    its time in numpy or compiled code that releases the GIL. The objective,
+    score and hessian must be safe to call concurrently;
+    `LikelihoodModel.fit` ensures this by evaluating a copy of models whose
+    state changes during the evaluation in each thread, see
+    `LikelihoodModel._thread_copy`.
+    """
+    if not isinstance(multistart, dict):
+        multistart = {"n_starts": multistart}
+    options = {
+        "n_starts": 10,
+        "sequence": "halton",
+        "scale": 1.0,
+        "bounds": None,
+        "seed": None,
+        "n_jobs": 1,
+        "n_success": None,
+        "tol": 1e-6,
+    }
+    unknown = set(multistart).difference(options)
+    if unknown:
+        raise ValueError(f"Unknown multistart options: {', '.join(sorted(unknown))}")
+    options.update(multistart)
+    points = _multistart_points(
+        start_params,
+        int(options["n_starts"]),
+        options["sequence"],
+        options["scale"],
+        options["bounds"],
+        options["seed"],
+    )
+    n_starts, k_params = points.shape
+    n_jobs = _multistart_n_jobs(options)
+    n_success = options["n_success"]
+    tol = options["tol"]
+
+    xopts = np.full((n_starts, k_params), np.nan)
+    fopts = np.full(n_starts, np.nan)
+    converged = np.zeros(n_starts, dtype=bool)
+    iterations = np.full(n_starts, np.nan)
+    completed = np.zeros(n_starts, dtype=bool)
+    results = [None] * n_starts
+
+    def run_start(i):
+        kwds = dict(kwargs)
+        xopt, retvals = func(
+            f,
+            score,
+            points[i],
+            fargs,
+            kwds,
+            disp=False,
+            maxiter=maxiter,
+            callback=callback,
+            retall=retall,
+            full_output=True,
+            hess=hess,
+        )
+        return i, xopt, retvals, kwds
+
+    def record(i, xopt, retvals, kwds):
+        results[i] = (xopt, retvals, kwds)
+        completed[i] = True
+        xopts[i] = xopt
+        fopt = retvals.get("fopt", np.nan) if retvals else np.nan
+        fopts[i] = f(xopt, *fargs) if np.isnan(fopt) else fopt
+        converged[i] = bool(retvals.get("converged", False)) if retvals else False
+        iterations[i] = retvals.get("iterations", np.nan) if retvals else np.nan
+
+    def best_index():
+        candidates = completed & converged & np.isfinite(fopts)
+        if not candidates.any():
+            candidates = completed & np.isfinite(fopts)
+        if not candidates.any():
+            return int(np.flatnonzero(completed)[0])
+        return int(np.flatnonzero(candidates)[np.argmin(fopts[candidates])])
+
+    def should_stop():
+        if n_success is None:
+            return False
+        fbest = fopts[best_index()]
+        same = np.abs(fopts - fbest) <= tol * max(abs(fbest), 1.0)
+        return int((same & converged & completed).sum()) >= n_success
+
+    if n_jobs == 1:
+        for i in range(n_starts):
+            record(*run_start(i))
+            if should_stop():
+                break
+    else:
+        with ThreadPoolExecutor(n_jobs) as executor:
+            pending = {executor.submit(run_start, i) for i in range(n_starts)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(*future.result())
+                if should_stop():
+                    for future in pending:
+                        future.cancel()
+                    # starts already running cannot be interrupted
+                    for future in pending:
+                        if not future.cancelled():
+                            record(*future.result())
+                    break
+
+    best = best_index()
+    xopt, retvals, kwds = results[best]
+    # keep solver defaults of the best start in the reported settings
+    kwargs.update(kwds)
+    if disp:
+        print("Multistart optimization finished.")
+        print(f"         Starts run: {int(completed.sum()):d} of {n_starts:d}")
+        print(f"         Best start: {best:d}")
+        print(f"         Current function value: {fopts[best]:f}")
+    if not full_output:
+        return xopt, None
+    retvals = dict(retvals) if retvals else {}
+    retvals["multistart"] = {
+        "start_params": points,
+        "xopt": xopts,
+        "fopt": fopts,
+        "converged": converged,
+        "iterations": iterations,
+        "completed": completed,
+        "best": best,
+    }
+    return xopt, retvals
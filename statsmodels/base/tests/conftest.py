@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from statsmodels.tools.tools import add_constant
+
+
+@pytest.fixture(scope="module")
+def count_data():
+    """Overdispersed count data with a constant and two regressors"""
+    rs = np.random.RandomState(9876789)
+    nobs = 500
+    exog = add_constant(rs.standard_normal((nobs, 2)))
+    mu = np.exp(exog @ np.array([0.5, 0.3, -0.2]))
+    endog = rs.poisson(mu * rs.gamma(2, 0.5, size=nobs))
+    return endog, exog
@@ -0,0 +1,120 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+import pytest
+
+from statsmodels.base._bootstrap import BootstrapResults
+from statsmodels.discrete.discrete_model import Logit
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.tools.tools import add_constant
+
+
+@pytest.fixture(scope="module")
+def data():
+    rs = np.random.RandomState(3957)
+    nobs = 120
+    exog = add_constant(rs.standard_normal((nobs, 2)))
+    endog = exog.sum(1) + rs.standard_normal(nobs)
+    groups = np.repeat(np.arange(24), 5)
+    return endog, exog, groups
+
+
+@pytest.mark.parametrize("scheme", ["pairs", "residual", "wild", "block", "cluster"])
+def test_ols_schemes(data, scheme):
+    endog, exog, groups = data
+    res = OLS(endog, exog).fit()
+    boot = res.bootstrap_params(nrep=200, scheme=scheme, rng=0, groups=groups)
+
+    assert isinstance(boot, BootstrapResults)
+    assert_equal(boot.bootstrap_params.shape, (200, 3))
+    assert boot.converged.all()
+    assert_allclose(boot.params, res.params)
+    assert_allclose(boot.mean, res.params, atol=0.05)
+    assert_allclose(boot.bse, res.bse, rtol=0.35)
+    assert_allclose(np.sqrt(np.diag(boot.cov_params())), boot.bse)
+    ci = boot.conf_int()
+    assert np.all((ci[:, 0] < res.params) & (res.params < ci[:, 1]))
+
+
+def test_reproducible(data):
+    endog, exog, _ = data
+    res = OLS(endog, exog).fit()
+    boot = res.bootstrap_params(nrep=50, rng=12345)
+    boot_threads = res.bootstrap_params(nrep=50, rng=12345, n_jobs=3)
+    assert_equal(boot_threads.bootstrap_params, boot.bootstrap_params)
+    seed_seq = np.random.SeedSequence(12345)
+    boot_seq = res.bootstrap_params(nrep=50, rng=seed_seq)
+    assert_equal(boot_seq.bootstrap_params, boot.bootstrap_params)
+    other = res.bootstrap_params(nrep=50, rng=1)
+    assert np.all(other.bootstrap_params != boot.bootstrap_params)
+
+
+def test_bca(data):
+    endog, exog, groups = data
+    res = OLS(endog, exog).fit()
+    boot = res.bootstrap_params(nrep=400, rng=0)
+    jack = boot.jackknife_params()
+    assert_equal(jack.shape, (120, 3))
+    # leave-one-out estimates of OLS
+    keep = np.arange(1, 120)
+    expected = OLS(endog[keep], exog[keep]).fit().params
+    assert_allclose(jack[0], expected, rtol=1e-12)
+
+    ci_bca = boot.conf_int(alpha=0.1, method="bca")
+    ci_pct = boot.conf_int(alpha=0.1)
+    assert_allclose(ci_bca, ci_pct, atol=0.05)
+    assert_allclose(ci_bca, res.conf_int(alpha=0.1), atol=0.06)
+
+    boot = res.bootstrap_params(nrep=20, scheme="cluster", groups=groups, rng=0)
+    assert_equal(boot.jackknife_params().shape, (24, 3))
+    with pytest.raises(ValueError, match="method"):
+        boot.conf_int(method="basic")
+
+
+def test_pairs_resamples_init_kwds(data):
+    endog, exog, _ = data
+    rs = np.random.RandomState(0)
+    weights = rs.uniform(0.5, 2, size=endog.shape[0])
+    res = WLS(endog, exog, weights=weights).fit()
+    boot = res.bootstrap_params(nrep=1, rng=5)
+
+    idx = np.random.default_rng(np.random.SeedSequence(5).spawn(1)[0]).integers(
+        120, size=120
+    )
+    expected = WLS(endog[idx], exog[idx], weights=weights[idx]).fit().params
+    assert_allclose(boot.bootstrap_params[0], expected, rtol=1e-12)
+
+
+def test_mle_warm_start(data):
+    endog, exog, _ = data
+    endog = (endog > 1).astype(float)
+    res = Logit(endog, exog).fit(disp=0)
+    boot = res.bootstrap_params(nrep=100, rng=0)
+    assert boot.converged.all()
+    assert_allclose(boot.bse, res.bse, rtol=0.3)
+
+    res_glm = GLM(endog, exog, family=families.Binomial()).fit()
+    boot_glm = res_glm.bootstrap_params(nrep=100, rng=0)
+    assert_allclose(boot_glm.bootstrap_params, boot.bootstrap_params, rtol=1e-5)
+
+
+def test_summary_frame_pandas(data):
+    endog, exog, _ = data
+    exog = pd.DataFrame(exog, columns=["const", "a", "b"])
+    res = OLS(pd.Series(endog), exog).fit()
+    frame = res.bootstrap_params(nrep=20, rng=0).summary_frame()
+    assert_equal(list(frame.index), ["const", "a", "b"])
+    assert_allclose(frame["params"], res.params)
+
+
+def test_errors(data):
+    endog, exog, _ = data
+    res = OLS(endog, exog).fit()
+    with pytest.raises(ValueError, match="scheme"):
+        res.bootstrap_params(scheme="parametric")
+    with pytest.raises(ValueError, match="groups"):
+        res.bootstrap_params(scheme="cluster")
+    with pytest.raises(ValueError, match="block_size"):
+        res.bootstrap_params(scheme="block", block_size=0)
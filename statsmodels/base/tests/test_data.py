@@ -526,6 +526,9 @@ class TestMissingArray:
         data = sm_data.handle_data(self.y, self.X, "drop")
         np.testing.assert_array_equal(data.endog, y)
         np.testing.assert_array_equal(data.exog, X)
+        # positions of the dropped rows, as a list
+        assert isinstance(data.missing_row_idx, list)
+        assert data.missing_row_idx == [2, 10, 14]
 
     def test_none(self):
         data = sm_data.handle_data(self.y, self.X, "none", hasconst=False)
@@ -746,6 +749,55 @@ class TestHandleMissing:
         assert_frame_equal(data["exog"], X_exp)
         np.testing.assert_array_equal(data["endog"], y_exp)
 
+    @pytest.mark.parametrize("n_cpus", [1, 4])
+    def test_chunked(self, small_chunks, monkeypatch, n_cpus):
+        monkeypatch.setattr(sm_data.os, "cpu_count", lambda: n_cpus)
+        rs = np.random.RandomState(8643652)
+        arr = rs.randn(200, 4)
+        arr[[2, 50, 101, 199], [2, 3, 1, 0]] = np.nan
+        y, X = arr[:, 0], arr[:, 1:]
+        weights = np.ones(200)
+        weights[7] = np.nan
+        data, missing_idx = sm_data.handle_missing(
+            y, X, missing="drop", weights=weights
+        )
+        assert_equal(missing_idx, [2, 7, 50, 101, 199])
+
+        keep = np.ones(200, dtype=bool)
+        keep[missing_idx] = False
+        np.testing.assert_array_equal(data["endog"], y[keep])
+        np.testing.assert_array_equal(data["exog"], X[keep])
+        np.testing.assert_array_equal(data["weights"], weights[keep])
+
+        df = pd.DataFrame(X)
+        df[3] = pd.array(np.arange(200), dtype="Int64")
+        df.loc[11, 3] = pd.NA
+        data, missing_idx = sm_data.handle_missing(
+            pd.Series(y), df, missing="drop"
+        )
+        assert_equal(missing_idx, [2, 11, 50, 101, 199])
+        assert_frame_equal(data["exog"], df.drop(index=missing_idx))
+
+    def test_contiguous_views(self):
+        rs = np.random.RandomState(8643652)
+        arr = rs.randn(20, 4)
+        arr[:2, 1] = np.nan
+        arr[-1, 3] = np.nan
+        y, X = arr[:, 0], arr[:, 1:]
+        data, missing_idx = sm_data.handle_missing(y, X, missing="drop")
+        assert_equal(missing_idx, [0, 1, 19])
+        np.testing.assert_array_equal(data["exog"], X[2:19])
+        assert np.shares_memory(data["exog"], X)
+        assert np.shares_memory(data["endog"], y)
+
+        df = pd.DataFrame(X, index=pd.date_range("2000-1-1", periods=20))
+        data, _ = sm_data.handle_missing(pd.Series(y, index=df.index), df, "drop")
+        assert_frame_equal(data["exog"], df.iloc[2:19])
+
+        cov = np.eye(20)
+        data, _ = sm_data.handle_missing(y, X, missing="drop", sigma=cov)
+        np.testing.assert_array_equal(data["sigma"], np.eye(17))
+
     def test_noop(self):
         df = make_dataframe()
         df.iloc[[2, 5, 10], [2, 3, 1]] = np.nan
@@ -969,3 +1021,56 @@ def test_raise_nonfinite_exog():
     x[1, 1] = np.nan
     with pytest.raises(MissingDataError):
         OLS(y, x)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(sm_data, "_CHUNK_ELEMENTS", 16)
+
+
+@pytest.mark.parametrize("implicit", [True, False])
+def test_has_constant_chunked(small_chunks, implicit):
+    rs = np.random.RandomState(0)
+    nobs = 200
+    if implicit:
+        group = np.arange(nobs) < 60
+        exog = np.column_stack((group, ~group, rs.standard_normal(nobs)))
+    else:
+        exog = np.column_stack((np.arange(nobs), rs.standard_normal((nobs, 2))))
+    exog = exog.astype(float)
+    assert sm_data._chunk_rows(exog) is not None
+
+    data = sm_data.handle_data(rs.standard_normal(nobs), exog)
+    assert_equal(data.k_constant, int(implicit))
+    assert data.const_idx is None
+
+    rank_orig, rank_augm = sm_data._rank_with_ones(exog)
+    augmented = np.column_stack((np.ones(nobs), exog))
+    assert_equal(rank_orig, np.linalg.matrix_rank(exog))
+    assert_equal(rank_augm, np.linalg.matrix_rank(augmented))
+
+
+def test_exog_names_chunked(small_chunks):
+    rs = np.random.RandomState(0)
+    exog = np.column_stack((rs.standard_normal((100, 2)), np.ones(100)))
+    data = sm_data.handle_data(rs.standard_normal(100), exog)
+    assert_equal(data.const_idx, 2)
+    assert_equal(data.xnames, ["x1", "x2", "const"])
+
+    exog[5, 0] = np.nan
+    with pytest.raises(MissingDataError):
+        sm_data.handle_data(rs.standard_normal(100), exog)
+
+
+def test_no_copy_float64():
+    rs = np.random.RandomState(0)
+    exog = rs.standard_normal((100, 3))
+    endog = rs.standard_normal(100)
+    data = sm_data.handle_data(endog, exog)
+    assert np.shares_memory(data.exog, exog)
+    assert np.shares_memory(data.endog, endog)
+
+    df = pd.DataFrame(exog, columns=["a", "b", "c"])
+    data = sm_data.handle_data(pd.Series(endog), df)
+    assert np.shares_memory(data.exog, df.to_numpy())
+    assert_equal(data.xnames, ["a", "b", "c"])
@@ -1,8 +1,12 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
 from numpy.testing import assert_, assert_allclose, assert_equal
+import pandas as pd
 import pytest
 
 from statsmodels.base.distributed_estimation import (
+    DebiasedStatistics,
     DistributedModel,
     _calc_grad,
     _calc_wdesign_mat,
@@ -11,10 +15,13 @@ from statsmodels.base.distributed_estimation import (
     _est_unregularized_naive,
     _join_debiased,
     _join_naive,
+    _reduce_debiased,
+    _SharedData,
+    partition_data,
 )
 from statsmodels.genmod.families import Binomial
 from statsmodels.genmod.generalized_linear_model import GLM
-from statsmodels.regression.linear_model import OLS
+from statsmodels.regression.linear_model import OLS, WLS
 
 
 def _data_gen(endog, exog, partitions):
@@ -213,6 +220,31 @@ def test_join_debiased():
     )
 
 
+def test_reduce_debiased():
+
+    rs = np.random.RandomState(435265)
+    X = rs.normal(size=(60, 4))
+    y = rs.randint(0, 2, size=60)
+    res_l = [
+        _est_regularized_debiased(OLS(y_p, X_p), i, 3, fit_kwds={"alpha": 0.1})
+        for i, (y_p, X_p) in enumerate(partition_data(y, X, 3))
+    ]
+    joined = _join_debiased(res_l)
+
+    stats = _reduce_debiased(res_l)
+    assert isinstance(stats, DebiasedStatistics)
+    assert_equal(stats.partitions, 3)
+    assert_equal(stats.nodewise_row.shape, (4, 3))
+    assert_allclose(_join_debiased(stats), joined, rtol=1e-13)
+
+    # reduce groups of consecutive partitions separately
+    grouped = [_reduce_debiased(res_l[:2]), res_l[2]]
+    assert_allclose(_join_debiased(grouped), joined, rtol=1e-13)
+    assert_allclose(
+        _join_debiased(_reduce_debiased(grouped), threshold=10), np.zeros(4)
+    )
+
+
 def test_join_naive():
 
     # tests that the results of all the intermediate steps
@@ -516,3 +548,147 @@ def test_debiased_v_average():
     glmn = np.linalg.norm(fitGLMn.params - beta)
 
     assert_(glmdb < glmn)
+
+
+def test_partition_data():
+    X = np.arange(22.0).reshape(11, 2)
+    y = np.arange(11.0)
+    parts = list(partition_data(y, X, 3))
+    assert_equal([len(p[0]) for p in parts], [3, 3, 5])
+    for (y_p, X_p), (y_e, X_e) in zip(parts, _data_gen(y, X, 3), strict=True):
+        assert_equal(y_p, y_e)
+        assert_equal(X_p, X_e)
+        assert np.shares_memory(X_p, X)
+
+    df = pd.DataFrame(X, index=np.arange(11) + 100)
+    parts = list(partition_data(pd.Series(y, index=df.index), df, 2))
+    assert_equal(parts[1][1].index.tolist(), list(range(105, 111)))
+
+
+@pytest.mark.slow
+@pytest.mark.thread_unsafe(reason="Uses a process pool")
+@pytest.mark.parametrize("parallel_method", ["process", "shared_memory"])
+def test_fit_process(parallel_method):
+    rs = np.random.RandomState(435265)
+    X = rs.normal(size=(50, 3))
+    y = rs.randint(0, 2, size=50)
+
+    mod = DistributedModel(3, model_class=OLS)
+    fit = mod.fit(
+        partition_data(y, X, 3),
+        parallel_method=parallel_method,
+        fit_kwds={"alpha": 0.5},
+    )
+    assert_allclose(
+        fit.params, np.array([-0.124891, -0.050934, -0.403354]), atol=1e-6, rtol=0
+    )
+
+    mod = DistributedModel(2, model_class=GLM, init_kwds={"family": Binomial()})
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        fit = mod.fit(
+            partition_data(y, X, 2),
+            parallel_method=parallel_method,
+            parallel_backend=executor,
+            fit_kwds={"alpha": 0.5},
+        )
+    assert_allclose(
+        fit.params, np.array([-0.142513, -0.360324, -0.295485]), atol=1e-6, rtol=0
+    )
+
+
+@pytest.mark.parametrize("use_shared_memory", [False, True])
+def test_fit_process_executor(use_shared_memory):
+    rs = np.random.RandomState(435265)
+    X = rs.normal(size=(80, 3))
+    y = X.sum(1) + rs.normal(size=80)
+    weights = rs.uniform(1, 2, size=80)
+
+    def weights_gen():
+        for part in partition_data(weights, weights, 4):
+            yield {"weights": part[0]}
+
+    mod = DistributedModel(
+        4,
+        model_class=WLS,
+        estimation_method=_est_unregularized_naive,
+        join_method=_join_naive,
+    )
+    expected = mod.fit(
+        partition_data(y, X, 4), fit_kwds={}, init_kwds_generator=weights_gen()
+    )
+    # the executor allows two pending partitions, so later partitions are
+    # only read once earlier ones are done
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fit = mod.fit_process(
+            partition_data(y, X, 4),
+            {},
+            parallel_backend=executor,
+            init_kwds_generator=weights_gen(),
+            use_shared_memory=use_shared_memory,
+            n_workers=1,
+        )
+    assert_equal(len(fit), 4)
+    assert_allclose(_join_naive(fit), expected.params, rtol=1e-13)
+
+    with pytest.raises(TypeError, match="Executor"):
+        mod.fit_process(partition_data(y, X, 4), {}, parallel_backend=1)
+
+
+@pytest.mark.parametrize("use_shared_memory", [False, True])
+def test_fit_process_reduced(use_shared_memory):
+    rs = np.random.RandomState(435265)
+    X = rs.normal(size=(60, 3))
+    y = X.sum(1) + rs.normal(size=60)
+
+    mod = DistributedModel(3)
+    expected = mod.fit_sequential(partition_data(y, X, 3), {"alpha": 0.1})
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fit = mod.fit_process(
+            partition_data(y, X, 3),
+            {"alpha": 0.1},
+            parallel_backend=executor,
+            use_shared_memory=use_shared_memory,
+            n_workers=1,
+        )
+    # the workers return the statistics, which are summed as they arrive
+    assert_equal(len(fit), 1)
+    assert isinstance(fit[0], DebiasedStatistics)
+    stats = _reduce_debiased(expected)
+    assert_equal(fit[0].partitions, 3)
+    assert_allclose(fit[0].params_sum, stats.params_sum, rtol=1e-13)
+    assert_allclose(fit[0].nodewise_row, stats.nodewise_row, rtol=1e-13)
+    assert_allclose(_join_debiased(fit), _join_debiased(expected), rtol=1e-13)
+
+
+def test_shared_data():
+    X = np.arange(24.0).reshape(8, 3)
+    shared = _SharedData()
+    try:
+        blocks = []
+        for _, X_p in partition_data(X[:, 0], X, 2):
+            block, spec = shared.share(X_p[:, 1:])
+            blocks.append(block)
+            # views of X are offsets into a single copy of X
+            view = np.ndarray(
+                spec[1],
+                dtype=spec[2],
+                buffer=block.shm.buf,
+                offset=spec[3],
+                strides=spec[4],
+            )
+            assert_equal(view, X_p[:, 1:])
+            del view
+        assert blocks[0] is blocks[1]
+        assert_equal(blocks[0].pending, 2)
+
+        block, _ = shared.share(np.ones(3))
+        assert block is not blocks[0]
+        # unlinked when done, the array it holds is no longer referenced
+        block.release()
+        assert block.shm is None
+        blocks[0].release()
+        blocks[0].release()
+        assert blocks[0].shm is not None
+    finally:
+        shared.close()
+    assert blocks[0].shm is None
@@ -0,0 +1,106 @@
+import logging
+import pickle
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.base._fit_profile import FitProfile
+from statsmodels.base.optimizer import Optimizer
+from statsmodels.discrete.discrete_model import Poisson
+
+
+class CountingPoisson(Poisson):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = {"loglike": 0, "score": 0, "hessian": 0}
+
+    def loglike(self, params):
+        self.calls["loglike"] += 1
+        return super().loglike(params)
+
+    def score(self, params):
+        self.calls["score"] += 1
+        return super().score(params)
+
+    def hessian(self, params):
+        self.calls["hessian"] += 1
+        return super().hessian(params)
+
+
+@pytest.mark.parametrize("method", ["newton", "bfgs", "nm"])
+def test_fit_profile(count_data, method):
+    endog, exog = count_data
+    mod = CountingPoisson(endog, exog)
+    res = mod.fit(method=method, disp=0, maxiter=500, profile=True)
+    profile = res.fit_profile
+
+    assert isinstance(profile, FitProfile)
+    assert_equal(
+        list(profile.timings),
+        ["data", "setup", "optimize", "covariance", "results"],
+    )
+    assert all(seconds >= 0 for seconds in profile.timings.values())
+    assert_allclose(profile.total_time, sum(profile.timings.values()))
+    for key in ["score", "hessian"]:
+        assert_equal(profile.counts[key], mod.calls[key])
+    # evaluations made to record the objective at iterates are not counted
+    assert 0 < profile.counts["loglike"] <= mod.calls["loglike"]
+
+    assert profile.iterations > 0
+    if method == "newton":
+        assert_equal(profile.iterations, res.mle_retvals["iterations"])
+    assert_allclose(profile.objective[-1], -res.llf / len(endog), rtol=1e-8)
+    if method != "nm":
+        assert np.all(np.diff(profile.objective) <= 1e-12)
+    assert "iterations:" in profile.summary()
+
+    res_plain = mod.fit(method=method, disp=0, maxiter=500)
+    assert res_plain.fit_profile is None
+    assert_allclose(res.params, res_plain.params)
+
+
+def test_fit_profile_callback_and_logging(count_data, caplog):
+    endog, exog = count_data
+    seen = []
+    with caplog.at_level(logging.DEBUG, logger="statsmodels.fit"):
+        res = Poisson(endog, exog).fit(
+            method="bfgs", disp=0, profile=True, callback=seen.append
+        )
+    profile = res.fit_profile
+    assert_equal(len(seen), profile.iterations)
+    assert res.mle_settings["callback"] == seen.append
+    messages = [rec.getMessage() for rec in caplog.records]
+    iterations = [msg for msg in messages if ": iteration " in msg]
+    assert_equal(len(iterations), profile.iterations)
+    assert any(msg.endswith(profile.summary()) for msg in messages)
+
+    profile = pickle.loads(pickle.dumps(res)).fit_profile
+    assert_equal(profile.objective, res.fit_profile.objective)
+
+
+def test_optimizer_profile():
+    def objective(x):
+        return ((x - 1) ** 2).sum()
+
+    def gradient(x):
+        return 2 * (x - 1)
+
+    profile = FitProfile("quadratic")
+    objective_counted = profile.counted("loglike", objective)
+    xopt, retvals, settings = Optimizer()._fit(
+        objective_counted,
+        gradient,
+        np.zeros(3),
+        (),
+        {},
+        method="bfgs",
+        disp=False,
+        profile=profile,
+    )
+    assert_allclose(xopt, np.ones(3), atol=1e-6)
+    assert_equal(list(profile.timings), ["optimize"])
+    assert_equal(profile.counts["loglike"], retvals["fcalls"])
+    assert profile.iterations > 0
+    assert_allclose(profile.objective[-1], retvals["fopt"])
+    assert settings["callback"] is None
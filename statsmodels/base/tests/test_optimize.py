@@ -1,10 +1,16 @@
 import warnings
 
 import numpy as np
-from numpy.testing import assert_, assert_allclose, assert_almost_equal
+from numpy.testing import (
+    assert_,
+    assert_allclose,
+    assert_almost_equal,
+    assert_equal,
+)
 import pytest
 
 from statsmodels.base.optimizer import (
+    Optimizer,
     _fit_basinhopping,
     _fit_bfgs,
     _fit_cg,
@@ -199,12 +205,8 @@ def test_minimize_no_hess_method(min_method):
 
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
-        res = Poisson(endog, exog).fit(
-            method="minimize", min_method=min_method, disp=0
-        )
-    hess_warnings = [
-        wrn for wrn in w if "hess" in str(wrn.message).lower()
-    ]
+        res = Poisson(endog, exog).fit(method="minimize", min_method=min_method, disp=0)
+    hess_warnings = [wrn for wrn in w if "hess" in str(wrn.message).lower()]
     assert hess_warnings == []
     assert res.mle_retvals["converged"]
     assert_allclose(res.params, res_default.params, rtol=1e-4)
@@ -222,3 +224,148 @@ def test_lbfgs_disp_false_no_output(capsys):
     )
     captured = capsys.readouterr()
     assert captured.out == ""
+
+
+def two_wells(x):
+    # global minimum at x = -2, local minimum close to x = 2
+    return (x[0] ** 2 - 4) ** 2 + x[0] + x[1] ** 2
+
+
+def two_wells_score(x):
+    return np.array([4 * x[0] * (x[0] ** 2 - 4) + 1, 2 * x[1]])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("sequence", ["halton", "random"])
+def test_multistart(n_jobs, sequence):
+    start_params = np.array([2.5, 1.0])
+    xopt, retvals = _fit_bfgs(
+        two_wells, two_wells_score, start_params, (), {}, disp=False
+    )
+    assert xopt[0] > 0
+
+    multistart = {
+        "n_starts": 8,
+        "scale": 5.0,
+        "sequence": sequence,
+        "seed": 1234,
+        "n_jobs": n_jobs,
+    }
+    kwargs = {"multistart": multistart}
+    xopt, retvals, settings = Optimizer()._fit(
+        two_wells,
+        two_wells_score,
+        start_params,
+        (),
+        kwargs,
+        method="bfgs",
+        disp=False,
+    )
+    assert_allclose(xopt, [-2.031, 0.0], atol=1e-3)
+    diag = retvals["multistart"]
+    assert_equal(diag["start_params"].shape, (8, 2))
+    assert_equal(diag["start_params"][0], start_params)
+    assert diag["completed"].all()
+    assert_equal(diag["fopt"][diag["best"]], diag["fopt"].min())
+    assert_allclose(retvals["fopt"], two_wells(xopt))
+    assert settings["multistart"] is multistart
+    assert "multistart" not in kwargs
+
+
+def test_multistart_early_stop():
+    start_params = np.array([-2.5, 1.0])
+    bounds = np.array([[-3.0, -1.0], [-1.0, 1.0]])
+    multistart = {"n_starts": 10, "bounds": bounds, "n_success": 2}
+    xopt, retvals, _ = Optimizer()._fit(
+        two_wells,
+        two_wells_score,
+        start_params,
+        (),
+        {"multistart": multistart},
+        method="bfgs",
+        disp=False,
+    )
+    assert_allclose(xopt, [-2.031, 0.0], atol=1e-3)
+    completed = retvals["multistart"]["completed"]
+    assert_equal(completed.sum(), 2)
+    assert_equal(completed[:2], True)
+
+
+def test_multistart_model():
+    from statsmodels.discrete.discrete_model import Poisson
+    from statsmodels.tools.tools import add_constant
+
+    rs = np.random.RandomState(1234)
+    exog = add_constant(rs.standard_normal((200, 2)))
+    endog = rs.poisson(np.exp(exog @ np.array([0.2, 0.4, -0.3])))
+    mod = Poisson(endog, exog)
+    res = mod.fit(disp=False)
+    res_ms = mod.fit(method="bfgs", disp=False, multistart=4)
+    assert_allclose(res_ms.params, res.params, rtol=1e-4)
+    assert_equal(res_ms.mle_retvals["multistart"]["xopt"].shape, (4, 3))
+    assert_equal(res_ms.mle_settings["multistart"], 4)
+
+
+def test_multistart_statespace_n_jobs():
+    # MLEModel.loglike updates the model, so that concurrent starts must not
+    # share a model instance
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    rs = np.random.RandomState(1234)
+    eps = rs.standard_normal(301)
+    endog = np.zeros(300)
+    for t in range(2, 300):
+        endog[t] = 0.5 * endog[t - 1] + 0.2 * endog[t - 2] + eps[t] + 0.3 * eps[t - 1]
+    mod = SARIMAX(endog, order=(2, 0, 1))
+    multistart = {"n_starts": 6, "scale": 0.3}
+    res = mod.fit(disp=False, multistart=dict(multistart, n_jobs=1))
+    res_jobs = mod.fit(disp=False, multistart=dict(multistart, n_jobs=3))
+    desired = res.mle_retvals["multistart"]
+    actual = res_jobs.mle_retvals["multistart"]
+    assert_equal(actual["fopt"], desired["fopt"])
+    assert_equal(actual["xopt"], desired["xopt"])
+    assert_equal(res_jobs.params, res.params)
+
+    # the threads share the data but not the state space representation
+    model = mod._thread_copy()
+    assert model.ssm is not mod.ssm
+    assert model.ssm.endog is mod.ssm.endog
+    assert model.data is mod.data
+
+
+def test_multistart_n_jobs_no_copy():
+    # models without state that changes in loglike are shared by the threads
+    from statsmodels.discrete.discrete_model import Poisson
+
+    rs = np.random.RandomState(1234)
+    exog = np.column_stack([np.ones(200), rs.standard_normal(200)])
+    endog = rs.poisson(np.exp(exog @ [0.5, 0.2]))
+    mod = Poisson(endog, exog)
+    assert mod._thread_copy() is mod
+    multistart = {"n_starts": 4}
+    res = mod.fit(disp=False, method="bfgs", multistart=dict(multistart, n_jobs=1))
+    res_jobs = mod.fit(disp=False, method="bfgs", multistart=dict(multistart, n_jobs=2))
+    assert_allclose(res_jobs.params, res.params)
+
+
+def test_multistart_options():
+    with pytest.raises(ValueError, match="Unknown multistart options"):
+        Optimizer()._fit(
+            two_wells,
+            two_wells_score,
+            np.zeros(2),
+            (),
+            {"multistart": {"nstarts": 4}},
+            method="bfgs",
+            disp=False,
+        )
+    with pytest.raises(ValueError, match="sequence must be"):
+        Optimizer()._fit(
+            two_wells,
+            two_wells_score,
+            np.zeros(2),
+            (),
+            {"multistart": {"sequence": "sobol"}},
+            method="bfgs",
+            disp=False,
+        )
@@ -0,0 +1,110 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.base._params_cache import ParamsCache
+from statsmodels.base.model import GenericLikelihoodModel
+from statsmodels.discrete.discrete_model import NegativeBinomial, Poisson
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import GLM
+
+
+def test_params_cache_lru():
+    calls = []
+
+    def func(params):
+        calls.append(params.copy())
+        return params.sum()
+
+    cache = ParamsCache(maxsize=2)
+    p0, p1, p2 = np.zeros(2), np.ones(2), np.full(2, 2.0)
+    assert_equal(cache.get(p0, "sum", func), 0)
+    assert_equal(cache.get(p0.copy(), "sum", func), 0)
+    assert_equal(len(calls), 1)
+    cache.get(p1, "sum", func)
+    # touch p0 so that p1 is the least recently used entry
+    cache.get(p0, "sum", func)
+    cache.get(p2, "sum", func)
+    assert_equal(cache.cache_info(), (2, 3, 2, 2))
+    cache.get(p0, "sum", func)
+    cache.get(p1, "sum", func)
+    assert_equal(len(calls), 4)
+    # same values with different dtype are different keys
+    cache.get(p0.astype(complex), "sum", func)
+    assert_equal(len(calls), 5)
+    # extra arguments bypass the cache
+    cache.get(p0, "sum", lambda params, a: a, 3.0)
+    assert_equal(cache.cache_info().misses, 5)
+
+    cache.clear()
+    assert_equal(cache.cache_info(), (0, 0, 2, 0))
+    with pytest.raises(ValueError, match="maxsize"):
+        ParamsCache(0)
+
+
+@pytest.mark.parametrize("method", ["newton", "bfgs"])
+def test_poisson_params_cache(count_data, method):
+    endog, exog = count_data
+    mod = Poisson(endog, exog)
+    res = mod.fit(method=method, disp=0)
+    res_cached = mod.fit(method=method, disp=0, params_cache=4)
+
+    assert_allclose(res_cached.params, res.params, rtol=1e-12)
+    assert_allclose(res_cached.bse, res.bse, rtol=1e-12)
+    assert res.params_cache_info is None
+    info = res_cached.params_cache_info
+    assert info.hits > 0
+    assert_equal(info.maxsize, 4)
+    assert info.currsize <= 4
+    # the cache is only active during fit
+    assert mod._params_cache is None
+
+
+def test_negbin_params_cache(count_data):
+    endog, exog = count_data
+    mod = NegativeBinomial(endog, exog)
+    res = mod.fit(method="bfgs", disp=0)
+    res_cached = mod.fit(method="bfgs", disp=0, params_cache=True)
+
+    assert_allclose(res_cached.params, res.params, rtol=1e-12)
+    assert_allclose(res_cached.bse, res.bse, rtol=1e-10)
+    assert res_cached.params_cache_info.hits > 0
+    assert "params_cache" not in res_cached.mle_settings
+
+
+def test_generic_params_cache(count_data):
+    endog, exog = count_data
+
+    class PoissonGMLE(GenericLikelihoodModel):
+        def loglikeobs(self, params):
+            return Poisson.loglikeobs(self, params)
+
+        def _linpred_insample(self, params):
+            return self.exog @ params
+
+    mod = PoissonGMLE(endog, exog)
+    res = mod.fit(method="bfgs", disp=0)
+    res_cached = mod.fit(method="bfgs", disp=0, params_cache=True)
+
+    assert_allclose(res_cached.params, res.params, rtol=1e-12)
+    assert_allclose(res_cached.bse, res.bse, rtol=1e-12)
+    assert res_cached.params_cache_info.hits > 0
+
+
+def test_glm_params_cache(count_data):
+    endog, exog = count_data
+    mod = GLM(endog, exog, family=families.Poisson())
+    res = mod.fit(method="newton", disp=0)
+    res_cached = mod.fit(method="newton", disp=0, params_cache=4)
+
+    assert_allclose(res_cached.params, res.params, rtol=1e-12)
+    assert_allclose(res_cached.bse, res.bse, rtol=1e-12)
+    assert res.params_cache_info is None
+    info = res_cached.params_cache_info
+    assert info.hits > 0
+    assert_equal(info.maxsize, 4)
+
+    # IRLS does not evaluate the loglikelihood
+    res_irls = mod.fit(params_cache=4)
+    assert res_irls.params_cache_info is None
+    assert_allclose(res_irls.params, res.params, rtol=1e-6)
@@ -50,7 +50,7 @@ class ResultsWrapper:
         # print 'unpickling wrapper', dict_
         self.__dict__.update(dict_)
 
-    def save(self, fname, remove_data=False):
+    def save(self, fname, remove_data=False, format="pickle"):
         """
         Save a pickle of this instance.
 
@@ -63,9 +63,20 @@ class ResultsWrapper:
             If True, then all arrays with length nobs are set to None before
             pickling. See the remove_data method.
             In some cases not all arrays will be set to None.
+        format : {"pickle", "compact"}, optional
+            "pickle" (default) pickles the instance. "compact" writes an npz
+            archive with the parameters, their covariance and scalar
+            statistics stored as separate arrays, that can be loaded lazily
+            and memory-mapped, together with a pickle of the instance that is
+            only read on demand. See ``statsmodels.iolib.smpickle.save_compact``.
         """
-        from statsmodels.iolib.smpickle import save_pickle
+        from statsmodels.iolib.smpickle import save_compact, save_pickle
 
+        if format == "compact":
+            save_compact(self, fname, remove_data=remove_data)
+            return
+        elif format != "pickle":
+            raise ValueError('format must be "pickle" or "compact"')
         if remove_data:
             self.remove_data()
 
@@ -89,11 +100,13 @@ class ResultsWrapper:
 
         Returns
         -------
-        Results
-            The unpickled results instance.
+        {Results, CompactResults}
+            The unpickled results instance, or a lazily loaded
+            ``CompactResults`` if the file was saved with
+            ``format="compact"``.
         """
-        from statsmodels.iolib.smpickle import load_pickle
-        return load_pickle(fname)
+        from statsmodels.iolib.smpickle import load_results
+        return load_results(fname)
 
 
 def union_dicts(*dicts):
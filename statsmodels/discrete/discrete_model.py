@@ -1048,6 +1048,28 @@ class CountModel(DiscreteModel):
             kwds["exposure"] = np.exp(kwds["exposure"])
         return kwds
 
+    def _linpred_insample(self, params):
+        """
+        In-sample linear predictor, shared through the params cache in fit
+        """
+
+        def linpred(params):
+            offset = getattr(self, "offset", 0)
+            exposure = getattr(self, "exposure", 0)
+            return np.dot(self.exog, params[: self.exog.shape[1]]) + offset + exposure
+
+        return self._cached_at_params(params, "linpred", linpred)
+
+    def _mean_insample(self, params):
+        """
+        In-sample mean, exp of linear predictor, shared through the params cache
+        """
+
+        def mean(params):
+            return np.exp(self._linpred_insample(params))
+
+        return self._cached_at_params(params, "mean", mean)
+
     def _get_predict_arrays(self, exog=None, offset=None, exposure=None):
 
         # convert extras if not None
@@ -1383,9 +1405,7 @@ class Poisson(CountModel):
         -----
         .. math:: \\ln L=\\sum_{i=1}^{n}\\left[-\\lambda_{i}+y_{i}x_{i}^{\\prime}\\beta-\\ln y_{i}!\\right]
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = self._linpred_insample(params)
         endog = self.endog
         return np.sum(
             -np.exp(np.clip(XB, None, EXP_UPPER_LIMIT))
@@ -1414,9 +1434,7 @@ class Poisson(CountModel):
 
         for observations :math:`i=1,...,n`
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = self._linpred_insample(params)
         endog = self.endog
         # np.sum(stats.poisson.logpmf(endog, np.exp(XB)))
         return -np.exp(XB) + endog * XB - gammaln(endog + 1)
@@ -1599,10 +1617,8 @@ class Poisson(CountModel):
 
         .. math:: \\ln\\lambda_{i}=x_{i}\\beta
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X, params) + offset + exposure)
+        L = self._mean_insample(params)
         return np.dot(self.endog - L, X)
 
     def score_obs(self, params):
@@ -1629,10 +1645,8 @@ class Poisson(CountModel):
 
         .. math:: \\ln\\lambda_{i}=x_{i}\\beta
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X, params) + offset + exposure)
+        L = self._mean_insample(params)
         return (self.endog - L)[:, None] * X
 
     def score_factor(self, params):
@@ -1659,10 +1673,7 @@ class Poisson(CountModel):
 
         .. math:: \\ln\\lambda_{i}=x_{i}\\beta
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
-        X = self.exog
-        L = np.exp(np.dot(X, params) + offset + exposure)
+        L = self._mean_insample(params)
         return self.endog - L
 
     def hessian(self, params):
@@ -1688,10 +1699,8 @@ class Poisson(CountModel):
 
         .. math:: \\ln\\lambda_{i}=x_{i}\\beta
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X, params) + exposure + offset)
+        L = self._mean_insample(params)
         return -np.dot(L * X.T, X)
 
     def hessian_factor(self, params):
@@ -1717,10 +1726,7 @@ class Poisson(CountModel):
 
         .. math:: \\ln\\lambda_{i}=x_{i}\\beta
         """
-        offset = getattr(self, "offset", 0)
-        exposure = getattr(self, "exposure", 0)
-        X = self.exog
-        L = np.exp(np.dot(X, params) + exposure + offset)
+        L = self._mean_insample(params)
         return -L
 
     def _deriv_score_obs_dendog(self, params, scale=None):
@@ -2204,7 +2210,7 @@ class GeneralizedPoisson(CountModel):
         p = self.parameterization
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
         mu_p = np.power(mu, p)
         a1 = 1 + alpha * mu_p
         a2 = mu + alpha * mu_p * y
@@ -2275,7 +2281,7 @@ class GeneralizedPoisson(CountModel):
         params = params[:-1]
         p = self.parameterization
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
         mu_p = np.power(mu, p)
         a1 = 1 + alpha * mu_p
         a2 = mu + alpha * mu_p * y
@@ -2309,7 +2315,7 @@ class GeneralizedPoisson(CountModel):
         p = self.parameterization
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
         mu_p = np.power(mu, p)
         a1 = 1 + alpha * mu_p
         a2 = mu + alpha * mu_p * y
@@ -3629,7 +3635,7 @@ class NegativeBinomial(CountModel):
         else:
             gamma_ln = gammaln
         endog = self.endog
-        mu = self.predict(params)
+        mu = self._mean_insample(params)
         size = 1 / alpha * mu**Q
         prob = size / (size + mu)
         coeff = gamma_ln(size + endog) - gamma_ln(endog + 1) - gamma_ln(size)
@@ -3693,10 +3699,27 @@ class NegativeBinomial(CountModel):
     def _score_geom(self, params):
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
         dparams = exog * (y - mu) / (mu + 1)
         return dparams.sum(0)
 
+    def _dgpart_nb2(self, params):
+        """
+        digamma term of the NB2 score and hessian, shared through the params
+        cache in fit
+        """
+
+        def dgpart(params):
+            if self._transparams:  # lnalpha came in during fit
+                alpha = np.exp(params[-1])
+            else:
+                alpha = params[-1]
+            a1 = 1 / alpha
+            y = self.endog[:, None]
+            return digamma(y + a1) - digamma(a1)
+
+        return self._cached_at_params(params, "dgpart_nb2", dgpart)
+
     def _score_nbin(self, params, Q=0):
         """
         Score vector for NB2 model
@@ -3705,10 +3728,11 @@ class NegativeBinomial(CountModel):
             alpha = np.exp(params[-1])
         else:
             alpha = params[-1]
+        full_params = params
         params = params[:-1]
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
         a1 = 1 / alpha * mu**Q
         prob = a1 / (a1 + mu)  # a1 aka "size" in _ll_nbin
         if Q == 1:  # nb1
@@ -3724,7 +3748,7 @@ class NegativeBinomial(CountModel):
             ).sum()
 
         elif Q == 0:  # nb2
-            dgpart = digamma(y + a1) - digamma(a1)
+            dgpart = self._dgpart_nb2(full_params)
             dparams = exog * a1 * (y - mu) / (mu + a1)
             da1 = -(alpha**-2)
             dalpha = (
@@ -3743,7 +3767,7 @@ class NegativeBinomial(CountModel):
     def _hessian_geom(self, params):
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
 
         # for dl/dparams dparams
         dim = exog.shape[1]
@@ -3772,7 +3796,7 @@ class NegativeBinomial(CountModel):
         params = params[:-1]
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
 
         a1 = mu / alpha
         dgpart = digamma(y + a1) - digamma(a1)
@@ -3838,13 +3862,13 @@ class NegativeBinomial(CountModel):
         else:
             alpha = params[-1]
         a1 = 1 / alpha
+        dgpart = self._dgpart_nb2(params)
         params = params[:-1]
 
         exog = self.exog
         y = self.endog[:, None]
-        mu = self.predict(params)[:, None]
+        mu = self._mean_insample(params)[:, None]
         prob = a1 / (a1 + mu)
-        dgpart = digamma(a1 + y) - digamma(a1)
 
         # for dl/dparams dparams
         dim = exog.shape[1]
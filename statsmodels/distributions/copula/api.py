@@ -1,18 +1,3 @@
-from statsmodels.distributions.copula import depfunc_ev, transforms
-from statsmodels.distributions.copula.archimedean import (
-    ArchimedeanCopula,
-    ClaytonCopula,
-    FrankCopula,
-    GumbelCopula,
-)
-from statsmodels.distributions.copula.copulas import CopulaDistribution
-from statsmodels.distributions.copula.elliptical import GaussianCopula, StudentTCopula
-from statsmodels.distributions.copula.extreme_value import ExtremeValueCopula
-from statsmodels.distributions.copula.other_copulas import (
-    IndependenceCopula,
-    rvs_kernel,
-)
-
 __all__ = [
     "ArchimedeanCopula",
     "ClaytonCopula",
@@ -27,3 +12,28 @@ __all__ = [
     "rvs_kernel",
     "transforms"
 ]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "statsmodels.distributions.copula": ["depfunc_ev", "transforms"],
+        "statsmodels.distributions.copula.archimedean": [
+            "ArchimedeanCopula",
+            "ClaytonCopula",
+            "FrankCopula",
+            "GumbelCopula",
+        ],
+        "statsmodels.distributions.copula.copulas": ["CopulaDistribution"],
+        "statsmodels.distributions.copula.elliptical": [
+            "GaussianCopula",
+            "StudentTCopula",
+        ],
+        "statsmodels.distributions.copula.extreme_value": ["ExtremeValueCopula"],
+        "statsmodels.distributions.copula.other_copulas": [
+            "IndependenceCopula",
+            "rvs_kernel",
+        ],
+    },
+)
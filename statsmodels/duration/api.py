@@ -1,3 +1,11 @@
 __all__ = ["CumIncidenceRight", "PHReg", "SurvfuncRight", "survdiff"]
-from .hazard_regression import PHReg
-from .survfunc import CumIncidenceRight, SurvfuncRight, survdiff
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".hazard_regression": ["PHReg"],
+        ".survfunc": ["CumIncidenceRight", "SurvfuncRight", "survdiff"],
+    },
+)
@@ -8,7 +8,14 @@ __all__ = [
     "emplikeAFT"
 ]
 
-from .aft_el import emplikeAFT
-from .descriptive import DescStat, DescStatMV, DescStatUV
-from .elanova import ANOVA
-from .originregress import ELOriginRegress
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".aft_el": ["emplikeAFT"],
+        ".descriptive": ["DescStat", "DescStatMV", "DescStatUV"],
+        ".elanova": ["ANOVA"],
+        ".originregress": ["ELOriginRegress"],
+    },
+)
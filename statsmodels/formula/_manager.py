@@ -3,14 +3,23 @@ from __future__ import annotations
 from statsmodels.compat.pandas import PD_LT_3
 from statsmodels.compat.patsy import ensure_patsy_compat
 
-from collections import defaultdict
+import ast
+from collections import OrderedDict, defaultdict
 from collections.abc import Mapping, Sequence
+import copyreg
+import importlib
+import io
 import os
+import pickle
+import sys
+import threading
+import types
 from typing import Any, Literal, NamedTuple
 import warnings
 
 import numpy as np
 import pandas as pd
+from scipy import sparse as sp
 
 from statsmodels.tools.data import _to_pandas
 
@@ -33,6 +42,73 @@ try:
             self.missing_mask = total_mask
             return [v[good_mask, ...] if v.ndim > 1 else v[good_mask] for v in values]
 
+    class _SparseCoding:
+        """
+        Sparse contrast matrix that supports the access patterns of patsy
+
+        patsy only uses the shape of a contrast matrix and selects single
+        columns when building dense design matrices.
+        """
+
+        def __init__(self, matrix):
+            self.sparse = sp.csc_array(matrix)
+            self.shape = self.sparse.shape
+            self.ndim = 2
+
+        def __getitem__(self, key):
+            rows, col = key
+            return self.sparse[:, [col]].toarray()[:, 0][rows]
+
+        def __array__(self, dtype=None, copy=None):
+            return self.sparse.toarray().astype(dtype, copy=False)
+
+    class _SparseContrastMatrix(patsy.ContrastMatrix):
+        """ContrastMatrix that stores the matrix as a sparse array"""
+
+        def __init__(self, matrix, column_suffixes):
+            self.matrix = _SparseCoding(matrix)
+            self.column_suffixes = column_suffixes
+            if self.matrix.shape[1] != len(column_suffixes):
+                raise patsy.PatsyError("matrix and column_suffixes don't conform")
+
+        @property
+        def sparse_matrix(self):
+            return self.matrix.sparse
+
+        def __getstate__(self):
+            return self.__dict__
+
+    class _SparseTreatment:
+        """
+        Treatment coding that does not create a dense identity matrix
+
+        Produces the same coding and column names as patsy's Treatment.
+        """
+
+        def __init__(self, reference=None):
+            self.reference = reference
+
+        def code_with_intercept(self, levels):
+            from patsy.contrasts import _name_levels
+
+            suffixes = _name_levels("", levels)
+            return _SparseContrastMatrix(sp.eye_array(len(levels)), suffixes)
+
+        def code_without_intercept(self, levels):
+            from patsy.contrasts import _get_level, _name_levels
+
+            nlevels = len(levels)
+            reference = (
+                0 if self.reference is None else _get_level(levels, self.reference)
+            )
+            keep = np.delete(np.arange(nlevels), reference)
+            coding = sp.csc_array(
+                (np.ones(nlevels - 1), (keep, np.arange(nlevels - 1))),
+                shape=(nlevels, nlevels - 1),
+            )
+            suffixes = _name_levels("T.", [levels[i] for i in keep])
+            return _SparseContrastMatrix(coding, suffixes)
+
     HAVE_PATSY = True
 
 except ImportError:
@@ -77,6 +153,11 @@ elif DEFAULT_FORMULA_ENGINE == "formulaic" and not HAVE_FORMULAIC:
     )
 
 
+# Formulas ordered by _legacy_orderer, keyed by formula, data schema and context
+_LEGACY_ORDER_CACHE: OrderedDict = OrderedDict()
+_LEGACY_ORDER_CACHE_SIZE = 128
+_LEGACY_ORDER_LOCK = threading.Lock()
+
 EVAL_ENV_WARNING = """\
 EvalEnvironment is deprecated and support be removed in a future version. You can
 pass variables using a dict[str, value] where str is the variable name and the
@@ -121,6 +202,306 @@ def _maybe_convert_data(data):
     return data
 
 
+def _data_schema(data):
+    """Column names and dtypes of a DataFrame as a hashable key"""
+    return tuple(zip(data.columns, data.dtypes, strict=True))
+
+
+def _context_key(context):
+    """Hashable description of a formula context, None if not cacheable"""
+    if isinstance(context, int):
+        return context
+    if isinstance(context, Mapping):
+        try:
+            return tuple(
+                sorted(
+                    (key, type(val).__name__, str(getattr(val, "dtype", "")))
+                    for key, val in context.items()
+                )
+            )
+        except TypeError:
+            return None
+    return None
+
+
+def _categorical_factors(spec):
+    return frozenset(str(factor) for factor in spec.factor_contrasts)
+
+
+class _SpecPickler(pickle.Pickler):
+    """
+    Pickler for model specifications
+
+    patsy refuses to pickle its objects. They are plain Python objects, so
+    they are pickled through their instance dictionary. Modules, which appear
+    in the evaluation environments of factors, are pickled by name, as are
+    functions that are stored in a module under a name that differs from
+    their own, e.g., patsy's stateful transforms.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, types.ModuleType):
+            return importlib.import_module, (obj.__name__,)
+        if isinstance(obj, types.FunctionType):
+            module = sys.modules.get(obj.__module__)
+            if module is None or getattr(module, obj.__qualname__, None) is obj:
+                return NotImplemented
+            for name, value in vars(module).items():
+                if value is obj:
+                    return getattr, (module, name)
+            return NotImplemented
+        cls = type(obj)
+        if cls.__module__.startswith("patsy.") and hasattr(obj, "__dict__"):
+            return copyreg.__newobj__, (cls,), obj.__dict__
+        return NotImplemented
+
+
+def dumps_model_spec(model_spec):
+    """
+    Serialize a patsy DesignInfo or a formulaic ModelSpec
+
+    Parameters
+    ----------
+    model_spec : DesignInfo or ModelSpec
+        The model specification.
+
+    Returns
+    -------
+    bytes
+        The pickled model specification. Use ``loads_model_spec`` to restore
+        it.
+
+    Raises
+    ------
+    pickle.PicklingError
+        If the specification refers to objects that cannot be pickled, e.g.,
+        a lambda function used in the formula.
+    """
+    buffer = io.BytesIO()
+    try:
+        _SpecPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(model_spec)
+    except (AttributeError, TypeError, NotImplementedError) as exc:
+        raise pickle.PicklingError(
+            f"Unable to pickle the model specification: {exc}"
+        ) from exc
+    return buffer.getvalue()
+
+
+def loads_model_spec(data):
+    """
+    Restore a model specification serialized by ``dumps_model_spec``
+
+    Parameters
+    ----------
+    data : bytes
+        The output of ``dumps_model_spec``.
+
+    Returns
+    -------
+    DesignInfo or ModelSpec
+        The model specification.
+    """
+    return pickle.loads(data)
+
+
+def _row_kron(left, right):
+    """
+    Row-wise Kronecker product of two sparse matrices
+
+    Column ``i * right.shape[1] + j`` of the result is the product of column
+    ``i`` of left and column ``j`` of right.
+    """
+    left = sp.csr_array(left)
+    right = sp.csr_array(right)
+    nrows = left.shape[0]
+    nnz_left = np.diff(left.indptr)
+    nnz_right = np.diff(right.indptr)
+    counts = nnz_left * nnz_right
+    total = int(counts.sum())
+    # position of each non-zero of the result within its row
+    offset = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    per_right = np.repeat(nnz_right, counts)
+    idx_left = np.repeat(left.indptr[:-1], counts) + offset // np.maximum(per_right, 1)
+    idx_right = np.repeat(right.indptr[:-1], counts) + offset % np.maximum(per_right, 1)
+    data = left.data[idx_left] * right.data[idx_right]
+    cols = left.indices[idx_left] * right.shape[1] + right.indices[idx_right]
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    return sp.csr_array(
+        (data, cols, indptr), shape=(nrows, left.shape[1] * right.shape[1])
+    )
+
+
+def _sparse_design_matrix_builders(termlists, data, eval_env, na_action):
+    """
+    patsy.design_matrix_builders with sparse treatment coding
+
+    Follows patsy.design_matrix_builders, but replaces the default treatment
+    contrasts by a coding that stores the contrast matrix as a sparse array,
+    since patsy creates a dense identity matrix with one row and column for
+    each level of a categorical factor.
+    """
+    from patsy.build import (
+        _examine_factor_types,
+        _factors_memorize,
+        _make_subterm_infos,
+        _subterm_column_names_iter,
+    )
+    from patsy.design_info import DesignInfo, FactorInfo
+
+    def data_iter_maker():
+        return iter([data])
+
+    all_factors = set()
+    for termlist in termlists:
+        for term in termlist:
+            all_factors.update(term.factors)
+    factor_states = _factors_memorize(all_factors, data_iter_maker, eval_env)
+    num_column_counts, cat_levels_contrasts = _examine_factor_types(
+        all_factors, factor_states, data_iter_maker, na_action
+    )
+    for factor, (levels, contrast) in cat_levels_contrasts.items():
+        if contrast is None or contrast is patsy.Treatment:
+            contrast = _SparseTreatment()
+        elif type(contrast) is patsy.Treatment:
+            contrast = _SparseTreatment(contrast.reference)
+        cat_levels_contrasts[factor] = (levels, contrast)
+
+    factor_infos = {}
+    for factor in all_factors:
+        if factor in num_column_counts:
+            factor_infos[factor] = FactorInfo(
+                factor,
+                "numerical",
+                factor_states[factor],
+                num_columns=num_column_counts[factor],
+            )
+        else:
+            factor_infos[factor] = FactorInfo(
+                factor,
+                "categorical",
+                factor_states[factor],
+                categories=cat_levels_contrasts[factor][0],
+            )
+    design_infos = []
+    for termlist in termlists:
+        term_codings = _make_subterm_infos(
+            termlist, num_column_counts, cat_levels_contrasts
+        )
+        column_names = []
+        for subterms in term_codings.values():
+            for subterm in subterms:
+                column_names.extend(_subterm_column_names_iter(factor_infos, subterm))
+        design_factor_infos = {
+            factor: factor_infos[factor] for term in termlist for factor in term.factors
+        }
+        design_infos.append(
+            DesignInfo(
+                column_names,
+                factor_infos=design_factor_infos,
+                term_codings=term_codings,
+            )
+        )
+    return design_infos
+
+
+def _build_sparse_patsy(design_infos, data, na_action):
+    """
+    Build patsy design matrices as sparse matrices
+
+    Categorical factors are encoded by indexing a sparse copy of their
+    contrast matrix with the integer codes of the levels, so that dummy
+    variables are never created as dense arrays. The column order follows
+    patsy, where the left-most factor of a term varies fastest.
+    """
+    from patsy.build import _eval_factor
+
+    factor_infos = {}
+    for info in design_infos:
+        factor_infos.update(info.factor_infos)
+    values = {}
+    is_nas = []
+    origins = []
+    for factor, factor_info in factor_infos.items():
+        value, is_na = _eval_factor(factor_info, data, na_action)
+        values[factor] = np.asarray(value)
+        is_nas.append(np.asarray(is_na))
+        origins.append(factor.origin)
+    if is_nas:
+        nrows = is_nas[0].shape[0]
+    elif isinstance(data, pd.DataFrame):
+        nrows = data.shape[0]
+    else:
+        raise patsy.PatsyError(
+            "No design matrix has any non-trivial factors and the data is not "
+            "a DataFrame, so the number of rows is unknown."
+        )
+
+    missing_mask = np.zeros(nrows, dtype=bool)
+    for is_na in is_nas:
+        missing_mask |= is_na
+    if missing_mask.any():
+        if na_action.on_NA == "raise":
+            # raises an error that points to the factor with missing values
+            na_action.handle_NA(list(values.values()), is_nas, origins)
+        values = {factor: value[~missing_mask] for factor, value in values.items()}
+    nobs = int((~missing_mask).sum())
+
+    matrices = []
+    for info in design_infos:
+        blocks = []
+        for subterms in info.term_codings.values():
+            for subterm in subterms:
+                block = sp.csr_array(np.ones((nobs, 1)))
+                # the left-most factor varies fastest
+                for factor in subterm.factors:
+                    if factor_infos[factor].type == "categorical":
+                        contrast = subterm.contrast_matrices[factor]
+                        coding = getattr(contrast, "sparse_matrix", contrast.matrix)
+                        factor_block = sp.csr_array(coding)[values[factor]]
+                    else:
+                        factor_block = sp.csr_array(values[factor])
+                    block = _row_kron(factor_block, block)
+                blocks.append(block)
+        if blocks:
+            matrices.append(sp.hstack(blocks, format="csr"))
+        else:
+            matrices.append(sp.csr_array((nobs, 0)))
+    return matrices, missing_mask
+
+
+def _sparse_frame(mat, index, columns):
+    """DataFrame with sparse columns that have fill value 0"""
+    frame = pd.DataFrame.sparse.from_spmatrix(mat, index=index)
+    if any(dtype.fill_value != 0 for dtype in frame.dtypes):
+        # from_spmatrix uses NaN as the fill value in some pandas versions
+        arrays = {}
+        for i, (_, column) in enumerate(frame.items()):
+            values = column.array
+            arrays[i] = pd.arrays.SparseArray(
+                values.sp_values, sparse_index=values.sp_index, fill_value=0.0
+            )
+        frame = pd.DataFrame(arrays, index=index)
+    frame.columns = columns
+    return frame
+
+
+def _sparse_output(matrices, column_names, index, pandas):
+    """Dense lhs and sparse rhs, as pandas objects if pandas is True"""
+    out = []
+    for i, (mat, names) in enumerate(zip(matrices, column_names, strict=True)):
+        is_rhs = i == len(matrices) - 1
+        if not is_rhs:
+            mat = np.asarray(mat.toarray())
+            if pandas:
+                mat = pd.DataFrame(mat, index=index, columns=names)
+        else:
+            mat = sp.csr_array(mat)
+            if pandas:
+                mat = _sparse_frame(mat, index, names)
+        out.append(mat)
+    return out[0] if len(out) == 1 else tuple(out)
+
+
 class _FormulaOption:
     """
     Container for the global formula-related options.
@@ -385,7 +766,10 @@ class FormulaManager:
 
     @staticmethod
     def _legacy_orderer(
-        formula: str, data: pd.DataFrame, context: int | Mapping[str, Any]
+        formula: str,
+        data: pd.DataFrame,
+        context: int | Mapping[str, Any],
+        sparse: bool = False,
     ) -> formulaic.Formula:
         """
         Function to order a formulaic formula so when materialized it matches patsy.
@@ -398,6 +782,9 @@ class FormulaManager:
             The data used to materialize the formula.
         context : int or Mapping[str, Any]
             The context used to evaluate the formula.
+        sparse : bool, optional
+            Materialize the formula as a sparse matrix to find the
+            categorical variables.
 
         Returns
         -------
@@ -408,7 +795,8 @@ class FormulaManager:
             return formula
         if isinstance(context, int):
             context += 1
-        mm = formulaic.model_matrix(formula, data, context=context)
+        output = "sparse" if sparse else "pandas"
+        mm = formulaic.model_matrix(formula, data, context=context, output=output)
         feature_flags = formulaic.parser.DefaultFormulaParser.FeatureFlags.TWOSIDED
         parser = formulaic.parser.DefaultFormulaParser(feature_flags=feature_flags)
         _formula = formulaic.Formula(formula, _parser=parser, _ordering="none")
@@ -461,6 +849,39 @@ class FormulaManager:
         else:
             return formulaic.Formula(intercept + cats + final_conts, _ordering="none")
 
+    @staticmethod
+    def _legacy_order_key(formula, data, context):
+        if not isinstance(data, pd.DataFrame):
+            return None
+        context_key = _context_key(context)
+        if context_key is None:
+            return None
+        return formula, _data_schema(data), context_key
+
+    @staticmethod
+    def _get_legacy_order(key):
+        if key is None:
+            return None
+        with _LEGACY_ORDER_LOCK:
+            try:
+                _LEGACY_ORDER_CACHE.move_to_end(key)
+            except KeyError:
+                return None
+            except TypeError:
+                # unhashable column names or dtypes
+                return None
+            return _LEGACY_ORDER_CACHE[key]
+
+    @staticmethod
+    def _set_legacy_order(key, formula, categorical):
+        with _LEGACY_ORDER_LOCK:
+            try:
+                _LEGACY_ORDER_CACHE[key] = (formula, categorical)
+            except TypeError:
+                return
+            while len(_LEGACY_ORDER_CACHE) > _LEGACY_ORDER_CACHE_SIZE:
+                _LEGACY_ORDER_CACHE.popitem(last=False)
+
     def get_matrices(
         self,
         formula,
@@ -469,6 +890,7 @@ class FormulaManager:
         pandas=True,
         na_action=None,
         prediction=False,
+        sparse=False,
     ) -> (
         np.ndarray
         | tuple[np.ndarray, np.ndarray]
@@ -493,12 +915,19 @@ class FormulaManager:
         prediction : bool, optional
             True if using the formula for prediction. In this case, only the
             rhs is evaluated using data.
+        sparse : bool, optional
+            If True, the rhs design matrix is built as a sparse matrix.
+            Categorical variables and their interactions are encoded without
+            creating dense dummy arrays, which is much more memory efficient
+            for variables with many levels. The lhs is always dense.
 
         Returns
         -------
         tuple[DataFrame, ...], tuple[ndarray, ...], tuple[DesignMatrix, ...]
             If pandas is True, returns one or more DataFrames. If False,
             returns a NumPy ndarray (formulaic) or a DesignMatrix (patsy).
+            If sparse is True, the rhs is a DataFrame with sparse columns if
+            pandas is True, and a scipy.sparse csr_array otherwise.
         """
         # Convert Polars objects to pandas
         data = _to_pandas(data)
@@ -519,13 +948,18 @@ class FormulaManager:
                 _eval_env = eval_env
                 if isinstance(eval_env, patsy.eval.EvalEnvironment):
                     warnings.warn(EVAL_ENV_WARNING, FutureWarning, stacklevel=2)
-            if (
+            one_sided = (
                 isinstance(
                     formula, (patsy.design_info.DesignInfo, patsy.desc.ModelDesc)
                 )
                 or "~" not in formula
                 or formula.strip().startswith("~")
-            ):
+            )
+            if sparse:
+                return self._get_sparse_matrices_patsy(
+                    formula, data, _eval_env, na_action, pandas, one_sided
+                )
+            if one_sided:
                 output = patsy.dmatrix(
                     formula, data, eval_env=_eval_env, return_type=return_type, **kwargs
                 )
@@ -581,8 +1015,20 @@ class FormulaManager:
             _ordering = statsmodels.formula.options.ordering
             if isinstance(formula, self.model_spec_type):
                 _formula = formula
-            if _ordering == "legacy":
-                _formula = self._legacy_orderer(formula, _data, context=_eval_env)
+            order_key = cached_order = None
+            if _ordering == "legacy" and sparse:
+                _formula = self._legacy_orderer(
+                    formula, _data, context=_eval_env, sparse=True
+                )
+            elif _ordering == "legacy":
+                if isinstance(formula, str):
+                    order_key = self._legacy_order_key(formula, _data, _eval_env)
+                    cached_order = self._get_legacy_order(order_key)
+                if cached_order is not None:
+                    _formula = cached_order[0]
+                else:
+                    _formula = self._legacy_orderer(formula, _data, context=_eval_env)
+                ordered_formula = _formula
             else:
                 feature_flags = (
                     formulaic.parser.DefaultFormulaParser.FeatureFlags.TWOSIDED
@@ -596,6 +1042,13 @@ class FormulaManager:
             if prediction:
                 if hasattr(_formula, "rhs"):
                     _formula = _formula.rhs
+            if sparse:
+                output, self._spec, self._missing_mask = (
+                    self._get_sparse_matrices_formulaic(
+                        _formula, _data, _eval_env, kwargs.get("na_action"), pandas
+                    )
+                )
+                return output
             original_index = _data.index
             na_drop = "na_action" in kwargs and kwargs["na_action"] == "drop"
             if na_drop:
@@ -605,6 +1058,24 @@ class FormulaManager:
             output = formulaic.model_matrix(
                 _formula, _data, context=_eval_env, **kwargs
             )
+            if order_key is not None:
+                rhs = output.rhs if hasattr(output, "rhs") else output
+                categorical = _categorical_factors(rhs.model_spec)
+                if cached_order is not None and cached_order[1] != categorical:
+                    # The ordering depends on which variables are categorical,
+                    # which changed, e.g., for a variable in the context
+                    ordered_formula = self._legacy_orderer(
+                        formula, _data, context=_eval_env
+                    )
+                    _formula = ordered_formula
+                    if prediction and hasattr(_formula, "rhs"):
+                        _formula = _formula.rhs
+                    output = formulaic.model_matrix(
+                        _formula, _data, context=_eval_env, **kwargs
+                    )
+                    rhs = output.rhs if hasattr(output, "rhs") else output
+                    categorical = _categorical_factors(rhs.model_spec)
+                self._set_legacy_order(order_key, ordered_formula, categorical)
             if na_drop:
                 if isinstance(output, formulaic.ModelMatrices):
                     rhs = output.rhs
@@ -644,6 +1115,80 @@ class FormulaManager:
             self._spec = output.model_spec
             return output
 
+    def _get_sparse_matrices_patsy(
+        self, formula, data, eval_env, na_action, pandas, one_sided
+    ):
+        if isinstance(eval_env, int):
+            # frames relative to the caller of get_matrices
+            eval_env = patsy.EvalEnvironment.capture(eval_env, reference=1)
+        if not na_action:
+            na_action = NAAction()
+        elif isinstance(na_action, str):
+            na_action = NAAction(on_NA=na_action)
+        if isinstance(formula, patsy.design_info.DesignInfo):
+            design_infos = [formula]
+        else:
+            if isinstance(formula, str):
+                formula = patsy.ModelDesc.from_formula(formula)
+            termlists = [formula.rhs_termlist]
+            if not one_sided:
+                termlists.insert(0, formula.lhs_termlist)
+            design_infos = _sparse_design_matrix_builders(
+                termlists, data, eval_env, na_action
+            )
+        matrices, missing_mask = _build_sparse_patsy(design_infos, data, na_action)
+        if isinstance(na_action, NAAction):
+            na_action.missing_mask = missing_mask
+        self._missing_mask = missing_mask
+        self._spec = design_infos[-1]
+
+        index = getattr(data, "index", None)
+        if index is None:
+            index = pd.RangeIndex(missing_mask.shape[0])
+        index = index[~missing_mask]
+        return _sparse_output(
+            matrices, [list(info.column_names) for info in design_infos], index, pandas
+        )
+
+    @staticmethod
+    def _get_sparse_matrices_formulaic(formula, data, context, na_action, pandas):
+        if isinstance(context, int):
+            # frames relative to the caller of get_matrices
+            context += 1
+        kwargs = {"context": context}
+        if na_action:
+            kwargs["na_action"] = na_action
+        lhs_formula = None
+        rhs_formula = formula
+        if hasattr(formula, "rhs"):
+            lhs_formula, rhs_formula = formula.lhs, formula.rhs
+        # formulaic updates drop_rows with the rows that have missing values
+        drop_rows = set()
+        rhs = formulaic.model_matrix(
+            rhs_formula, data, output="sparse", drop_rows=drop_rows, **kwargs
+        )
+        matrices = [rhs]
+        if lhs_formula is not None:
+            n_dropped = len(drop_rows)
+            lhs = formulaic.model_matrix(
+                lhs_formula, data, output="sparse", drop_rows=drop_rows, **kwargs
+            )
+            if len(drop_rows) > n_dropped:
+                rhs = formulaic.model_matrix(
+                    rhs_formula, data, output="sparse", drop_rows=drop_rows, **kwargs
+                )
+            matrices = [lhs, rhs]
+        column_names = [list(mat.model_spec.column_names) for mat in matrices]
+        # unwrap the scipy matrices from formulaic's ModelMatrix
+        matrices = [getattr(mat, "__wrapped__", mat) for mat in matrices]
+        missing_mask = np.zeros(data.shape[0], dtype=bool)
+        missing_mask[sorted(drop_rows)] = True
+        return (
+            _sparse_output(matrices, column_names, data.index[~missing_mask], pandas),
+            rhs.model_spec,
+            pd.Series(missing_mask, index=data.index, name=None),
+        )
+
     def get_linear_constraints(
         self, constraints: np.ndarray | str | Sequence[str], variable_names: list[str]
     ):
@@ -1018,7 +1563,8 @@ class FormulaManager:
             The contrast matrix to use for hypothesis testing.
         """
         if self._using_patsy:
-            return model_spec.term_codings[term][0].contrast_matrices[factor].matrix
+            contrast = model_spec.term_codings[term][0].contrast_matrices[factor]
+            return np.asarray(contrast.matrix)
         else:
             cat = self.get_factor_categories(factor, model_spec)
             reduced_rank = True
@@ -1032,3 +1578,298 @@ class FormulaManager:
                     reduced_rank=reduced_rank
                 )
             )
+
+    def compile(self, formula, data, eval_env=0):
+        """
+        Compile the right-hand side of a formula for repeated use.
+
+        Parameters
+        ----------
+        formula : str, Formula, ModelSpec or DesignInfo
+            The formula to compile. Only the right-hand side is used.
+        data : DataFrame
+            The data used to determine the state of the formula, e.g., the
+            levels of categorical variables and the parameters of stateful
+            transforms.
+        eval_env : int or dict, optional
+            Additional context to use when evaluating the formula.
+
+        Returns
+        -------
+        CompiledFormula
+            The compiled formula that builds design matrices for new data.
+        """
+        if isinstance(eval_env, (int, np.integer)):
+            eval_env = int(eval_env) + 1
+        self.get_matrices(formula, data, eval_env=eval_env, prediction=True)
+        return CompiledFormula(self._spec, engine=self._engine)
+
+
+# patsy builtins that do not depend on whether their input is a Series
+_ARRAY_SAFE_CALLS = frozenset(
+    [
+        "I",
+        "C",
+        "Treatment",
+        "Poly",
+        "Sum",
+        "Helmert",
+        "Diff",
+        "center",
+        "standardize",
+        "scale",
+        "bs",
+        "cr",
+        "cc",
+        "te",
+    ]
+)
+_ARRAY_SAFE_NODES = (
+    ast.Name,
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.List,
+    ast.Tuple,
+    ast.keyword,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+    ast.Load,
+)
+
+
+def _is_array_safe(node):
+    """
+    Whether an expression gives the same values for arrays and Series
+
+    Only names, constants, arithmetic, comparisons, calls of the patsy
+    builtins and numpy ufuncs, e.g., ``np.log(x)``, are safe. Attributes
+    and methods of the variables, and numpy functions that dispatch to
+    pandas, such as ``np.mean``, are not.
+    """
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call):
+            func = child.func
+            if isinstance(func, ast.Name):
+                if func.id not in _ARRAY_SAFE_CALLS:
+                    return False
+            elif not (
+                isinstance(func, ast.Attribute)
+                and isinstance(func.value, ast.Name)
+                and func.value.id in ("np", "numpy")
+                and isinstance(getattr(np, func.attr, None), np.ufunc)
+            ):
+                return False
+        elif isinstance(child, ast.Attribute):
+            # only numpy ufuncs, checked with the call
+            value = child.value
+            if not (isinstance(value, ast.Name) and value.id in ("np", "numpy")):
+                return False
+        elif not isinstance(child, _ARRAY_SAFE_NODES):
+            return False
+    return True
+
+
+class CompiledFormula:
+    """
+    Model specification compiled for repeated design matrix builds.
+
+    Parameters
+    ----------
+    model_spec : ModelSpec or DesignInfo
+        The right-hand-side model specification, e.g., the ``model_spec``
+        of a model created using a formula.
+    engine : {"patsy", "formulaic"}, optional
+        The formula engine that created model_spec. If None, the default
+        engine is used.
+
+    Notes
+    -----
+    Building a design matrix for new data with patsy evaluates the formula
+    on the columns of the DataFrame. The compiled formula evaluates the
+    formula on the underlying arrays instead, which avoids the overhead of
+    pandas in every operation and is much faster for small data sets.
+    This is only done if the factors of the formula use nothing but
+    variable names, arithmetic, the patsy builtins, e.g., ``C`` and
+    ``center``, and numpy ufuncs, which give the same values for arrays and
+    Series. Other formulas, e.g., that use methods of Series such as
+    ``x.std()``, are evaluated on the columns as Series. Whether the
+    evaluation succeeds is determined once for every schema, the names and
+    dtypes of the columns used, of the data passed to ``transform``, and
+    the DataFrame is used if it fails.
+
+    Compiled formulas can be pickled. patsy model specifications refer to
+    the functions used in the formula, which must be importable.
+    """
+
+    _MAX_SCHEMAS = 32
+
+    def __init__(self, model_spec, engine=None):
+        mgr = FormulaManager(engine)
+        if not isinstance(model_spec, mgr.model_spec_type):
+            raise TypeError(
+                f"model_spec must be a {mgr.model_spec_type.__name__} when "
+                f"using {mgr.engine}, got a {type(model_spec).__name__}."
+            )
+        self._engine = mgr.engine
+        self._model_spec = model_spec
+        self._column_names = list(model_spec.column_names)
+        self._variables = self._find_variables()
+        self._array_safe = self._find_array_safe()
+        self._plans = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(engine={self._engine!r}, "
+            f"columns={self._column_names!r})"
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_model_spec"] = dumps_model_spec(self._model_spec)
+        state["_plans"] = {}
+        return state
+
+    def __setstate__(self, state):
+        state["_model_spec"] = loads_model_spec(state["_model_spec"])
+        self.__dict__.update(state)
+
+    @property
+    def engine(self):
+        """The formula engine."""
+        return self._engine
+
+    @property
+    def model_spec(self):
+        """The engine-specific model specification."""
+        return self._model_spec
+
+    @property
+    def column_names(self):
+        """The names of the columns of the design matrix."""
+        return list(self._column_names)
+
+    def _find_variables(self):
+        """Names used by the factors, None if all columns may be used"""
+        if self._engine != "patsy":
+            return None
+        names = set()
+        for factor in self._model_spec.factor_infos:
+            code = getattr(factor, "code", None)
+            if code is None or "Q(" in code:
+                return None
+            names.update(patsy.eval.ast_names(code))
+        return names
+
+    def _find_array_safe(self):
+        """Whether all factors give the same result for arrays and Series"""
+        if self._engine != "patsy":
+            return False
+        for factor in self._model_spec.factor_infos:
+            code = getattr(factor, "code", None)
+            if code is None:
+                return False
+            try:
+                tree = ast.parse(code.strip(), mode="eval")
+            except SyntaxError:
+                return False
+            if not _is_array_safe(tree.body):
+                return False
+        return True
+
+    def _namespace(self, data):
+        """Arrays, or Series, of the columns used, and their schema"""
+        namespace = {}
+        schema = []
+        for name in data.columns:
+            if self._variables is not None and name not in self._variables:
+                continue
+            column = data[name]
+            if not isinstance(column, pd.Series):
+                # duplicate column names
+                return None, None
+            dtype = column.dtype
+            schema.append((name, dtype))
+            if not self._array_safe:
+                namespace[name] = column
+            elif isinstance(dtype, pd.CategoricalDtype):
+                namespace[name] = column.array
+            elif isinstance(dtype, np.dtype):
+                namespace[name] = column.to_numpy()
+            else:
+                namespace[name] = column
+        return namespace, tuple(schema)
+
+    def _transform_patsy(self, data, namespace, pandas):
+        na_action = NAAction(on_NA="drop", NA_types=["None", "NaN"])
+        (design,) = patsy.build_design_matrices(
+            [self._model_spec], namespace, NA_action=na_action
+        )
+        design = np.asarray(design)
+        if not pandas:
+            return design
+        index = data.index
+        missing_mask = getattr(na_action, "missing_mask", None)
+        if missing_mask is not None and missing_mask.any():
+            index = index[~missing_mask]
+        return pd.DataFrame(design, index=index, columns=self._column_names)
+
+    def _transform_default(self, data, pandas):
+        mgr = FormulaManager(self._engine)
+        return mgr.get_matrices(self._model_spec, data, pandas=pandas, prediction=True)
+
+    def transform(self, data, pandas=True):
+        """
+        Build the design matrix for new data.
+
+        Parameters
+        ----------
+        data : DataFrame
+            The data. Other data structures accepted by formulas are
+            supported but are not faster than the model specification.
+        pandas : bool, optional
+            Return a DataFrame if True, otherwise return an ndarray.
+
+        Returns
+        -------
+        DataFrame or ndarray
+            The design matrix. Rows with missing values are dropped.
+        """
+        data = _to_pandas(data)
+        if not isinstance(data, pd.DataFrame) or data.shape[0] == 0:
+            return self._transform_default(data, pandas)
+        if self._engine == "formulaic":
+            if self._plans.get("direct", True):
+                try:
+                    return self._model_spec.get_model_matrix(
+                        _maybe_convert_data(data),
+                        output="pandas" if pandas else "numpy",
+                    )
+                except Exception:
+                    # e.g., functions that are not available without a context
+                    self._plans["direct"] = False
+            return self._transform_default(data, pandas)
+
+        namespace, schema = self._namespace(data)
+        try:
+            usable = schema is not None and self._plans.get(schema, True)
+        except TypeError:
+            # unhashable column names
+            schema = None
+            usable = namespace is not None
+        if usable:
+            try:
+                result = self._transform_patsy(data, namespace, pandas)
+            except Exception:
+                # the formula requires pandas objects, or the evaluation
+                # fails and is repeated on the DataFrame to raise the error
+                usable = False
+        if schema is not None:
+            if schema not in self._plans and len(self._plans) >= self._MAX_SCHEMAS:
+                self._plans.clear()
+            self._plans[schema] = usable
+        if usable:
+            return result
+        return self._transform_default(data, pandas)
@@ -1,38 +1,3 @@
-import statsmodels.discrete.conditional_models as dcm_
-import statsmodels.discrete.discrete_model as dm_
-import statsmodels.duration.hazard_regression as hr_
-import statsmodels.gam.generalized_additive_model as gam_
-import statsmodels.genmod.generalized_estimating_equations as gee_
-import statsmodels.genmod.generalized_linear_model as glm_
-import statsmodels.regression.linear_model as lm_
-import statsmodels.regression.mixed_linear_model as mlm_
-import statsmodels.regression.quantile_regression as qr_
-import statsmodels.robust.robust_linear_model as roblm_
-
-gls = lm_.GLS.from_formula
-wls = lm_.WLS.from_formula
-ols = lm_.OLS.from_formula
-glsar = lm_.GLSAR.from_formula
-mixedlm = mlm_.MixedLM.from_formula
-glm = glm_.GLM.from_formula
-rlm = roblm_.RLM.from_formula
-mnlogit = dm_.MNLogit.from_formula
-logit = dm_.Logit.from_formula
-probit = dm_.Probit.from_formula
-poisson = dm_.Poisson.from_formula
-negativebinomial = dm_.NegativeBinomial.from_formula
-quantreg = qr_.QuantReg.from_formula
-phreg = hr_.PHReg.from_formula
-ordinal_gee = gee_.OrdinalGEE.from_formula
-nominal_gee = gee_.NominalGEE.from_formula
-gee = gee_.GEE.from_formula
-glmgam = gam_.GLMGam.from_formula
-conditional_logit = dcm_.ConditionalLogit.from_formula
-conditional_mnlogit = dcm_.ConditionalMNLogit.from_formula
-conditional_poisson = dcm_.ConditionalPoisson.from_formula
-
-del lm_, dm_, mlm_, glm_, roblm_, qr_, hr_, gee_, gam_, dcm_
-
 __all__ = [
     "conditional_logit",
     "conditional_mnlogit",
@@ -56,3 +21,52 @@ __all__ = [
     "rlm",
     "wls",
 ]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "statsmodels.regression.linear_model": [
+            "GLS.from_formula as gls",
+            "WLS.from_formula as wls",
+            "OLS.from_formula as ols",
+            "GLSAR.from_formula as glsar",
+        ],
+        "statsmodels.regression.mixed_linear_model": [
+            "MixedLM.from_formula as mixedlm",
+        ],
+        "statsmodels.genmod.generalized_linear_model": [
+            "GLM.from_formula as glm",
+        ],
+        "statsmodels.robust.robust_linear_model": [
+            "RLM.from_formula as rlm",
+        ],
+        "statsmodels.discrete.discrete_model": [
+            "MNLogit.from_formula as mnlogit",
+            "Logit.from_formula as logit",
+            "Probit.from_formula as probit",
+            "Poisson.from_formula as poisson",
+            "NegativeBinomial.from_formula as negativebinomial",
+        ],
+        "statsmodels.regression.quantile_regression": [
+            "QuantReg.from_formula as quantreg",
+        ],
+        "statsmodels.duration.hazard_regression": [
+            "PHReg.from_formula as phreg",
+        ],
+        "statsmodels.genmod.generalized_estimating_equations": [
+            "OrdinalGEE.from_formula as ordinal_gee",
+            "NominalGEE.from_formula as nominal_gee",
+            "GEE.from_formula as gee",
+        ],
+        "statsmodels.gam.generalized_additive_model": [
+            "GLMGam.from_formula as glmgam",
+        ],
+        "statsmodels.discrete.conditional_models": [
+            "ConditionalLogit.from_formula as conditional_logit",
+            "ConditionalMNLogit.from_formula as conditional_mnlogit",
+            "ConditionalPoisson.from_formula as conditional_poisson",
+        ],
+    },
+)
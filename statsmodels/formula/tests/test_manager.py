@@ -1,11 +1,19 @@
+import pickle
 import threading
 
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import sparse as sp
 
 import statsmodels.formula
-from statsmodels.formula._manager import FormulaManager, LinearConstraintValues
+from statsmodels.formula import _manager
+from statsmodels.formula._manager import (
+    CompiledFormula,
+    FormulaManager,
+    LinearConstraintValues,
+)
+from statsmodels.regression.linear_model import OLS
 
 PATSY_ERROR_LOCK = threading.Lock()
 
@@ -562,3 +570,235 @@ def test_get_term_name_alt(engine, data):
     for term, name in zip(terms, names, strict=True):
         term_name = mgr.get_term_name(term)
         assert term_name == name, (terms, names)
+
+
+COMPILED_FORMULAS = [
+    "x + np.log(w) + C(c, Treatment('b'))",
+    "center(x) + z:c + I(x ** 2) + d",
+    "x + flag - 1",
+]
+
+
+@pytest.fixture
+def compiled_data():
+    rs = np.random.RandomState(1234)
+    n = 50
+    data = pd.DataFrame(
+        {
+            "y": rs.standard_normal(n),
+            "x": rs.standard_normal(n),
+            "z": rs.standard_normal(n),
+            "w": rs.uniform(1, 2, size=n),
+            "c": rs.choice(["a", "b", "c"], size=n).astype(object),
+            "d": pd.Categorical(rs.choice(["u", "v"], size=n)),
+            "flag": rs.standard_normal(n) > 0,
+        },
+        index=pd.RangeIndex(100, 100 + n),
+    )
+    return data
+
+
+@pytest.mark.parametrize("formula", COMPILED_FORMULAS)
+def test_compiled_formula(engine, compiled_data, formula):
+    mgr = FormulaManager(engine)
+    compiled = mgr.compile(formula, compiled_data)
+    assert isinstance(compiled, CompiledFormula)
+    assert compiled.engine == engine
+    assert compiled.column_names == mgr.get_column_names(compiled.model_spec)
+
+    new = compiled_data.iloc[5:15].copy()
+    new.loc[new.index[3], "x"] = np.nan
+    for _ in range(2):
+        result = compiled.transform(new)
+        expected = mgr.get_matrices(compiled.model_spec, new, prediction=True)
+        assert list(result.columns) == list(expected.columns)
+        assert list(result.index) == list(expected.index)
+        assert result.shape[0] == 9
+        np.testing.assert_allclose(
+            np.asarray(result, dtype=float), np.asarray(expected, dtype=float)
+        )
+    arr = compiled.transform(new, pandas=False)
+    assert isinstance(arr, np.ndarray)
+    np.testing.assert_allclose(np.asarray(arr, dtype=float), np.asarray(expected))
+
+    restored = pickle.loads(pickle.dumps(compiled))
+    np.testing.assert_allclose(
+        np.asarray(restored.transform(new), dtype=float),
+        np.asarray(result, dtype=float),
+    )
+
+
+@require_patsy
+def test_compiled_formula_pandas_methods(compiled_data):
+    mgr = FormulaManager("patsy")
+    compiled = mgr.compile("x.shift(1).fillna(0) + z", compiled_data)
+    new = compiled_data.iloc[:10]
+    result = compiled.transform(new)
+    expected = mgr.get_matrices(compiled.model_spec, new, prediction=True)
+    pd.testing.assert_frame_equal(result, expected, check_names=False)
+    # evaluated on the columns as Series
+    assert not compiled._array_safe
+    assert list(compiled._plans.values()) == [True]
+
+    compiled = mgr.compile("x + z", compiled_data)
+    with pytest.raises(patsy.PatsyError):
+        compiled.transform(new.drop(columns="z"))
+
+
+@require_patsy
+def test_compiled_formula_series_reductions(compiled_data):
+    # reductions of Series and arrays differ, std uses ddof=1 for Series,
+    # and missing values are skipped
+    mgr = FormulaManager("patsy")
+    new = compiled_data.iloc[:10].copy()
+    new.loc[new.index[2], "z"] = np.nan
+    for formula in ["I(x / x.std())", "I(x - z.mean()) + z"]:
+        compiled = mgr.compile(formula, compiled_data)
+        assert not compiled._array_safe
+        result = compiled.transform(new)
+        (expected,) = patsy.build_design_matrices(
+            [compiled.model_spec], new, return_type="dataframe"
+        )
+        pd.testing.assert_frame_equal(result, expected, check_names=False)
+
+    for formula in COMPILED_FORMULAS:
+        assert mgr.compile(formula, compiled_data)._array_safe
+
+    res = OLS.from_formula("y ~ I(x / x.std())", compiled_data).fit()
+    (exog,) = patsy.build_design_matrices(
+        [res.model.data.model_spec], compiled_data.iloc[:10]
+    )
+    np.testing.assert_allclose(
+        res.predict(compiled_data.iloc[:10]), np.asarray(exog) @ res.params
+    )
+
+
+@require_formulaic
+@pytest.mark.thread_unsafe(reason="uses the global cache of the legacy ordering")
+def test_legacy_order_cache(compiled_data):
+    mgr = FormulaManager("formulaic")
+    formula = "y ~ x + C(c) + x:C(c)"
+    _manager._LEGACY_ORDER_CACHE.clear()
+    _, rhs = mgr.get_matrices(formula, compiled_data)
+    assert len(_manager._LEGACY_ORDER_CACHE) == 1
+    _, rhs_cached = mgr.get_matrices(formula, compiled_data)
+    assert len(_manager._LEGACY_ORDER_CACHE) == 1
+    assert list(rhs_cached.columns) == list(rhs.columns)
+    pd.testing.assert_frame_equal(rhs_cached, rhs)
+
+    # the key includes the schema of the data
+    mgr.get_matrices(formula, compiled_data.astype({"x": "float32"}))
+    assert len(_manager._LEGACY_ORDER_CACHE) == 2
+
+    # a variable of the context that becomes categorical changes the order
+    formula = "y ~ x:v + x + v"
+    v = compiled_data["z"]
+    _, rhs = mgr.get_matrices(formula, compiled_data)
+    assert list(rhs.columns) == ["Intercept", "x:v", "x", "v"]
+    v = compiled_data["c"]  # noqa: F841
+    _, rhs = mgr.get_matrices(formula, compiled_data)
+    _manager._LEGACY_ORDER_CACHE.clear()
+    _, expected = mgr.get_matrices(formula, compiled_data)
+    assert list(rhs.columns) == list(expected.columns)
+    assert list(rhs.columns)[:4] == ["Intercept", "v[T.b]", "v[T.c]", "x"]
+
+
+@pytest.mark.thread_unsafe(reason="changes global formula_engine variable")
+def test_pickle_model_spec(engine, compiled_data, monkeypatch):
+    monkeypatch.setattr(statsmodels.formula.options, "formula_engine", engine)
+    res = OLS.from_formula("y ~ center(x) + C(c) + d", compiled_data).fit()
+    new = compiled_data.iloc[:5]
+    expected = res.predict(new)
+    assert isinstance(res.model.data.compiled_formula, CompiledFormula)
+
+    state = res.model.data.__getstate__()
+    assert "compiled_formula" not in state
+    assert "model_spec" not in state
+    assert isinstance(state["pickled_model_spec"], bytes)
+
+    # the model_spec is not rebuilt from the formula
+    def no_rebuild(*args, **kwargs):
+        raise AssertionError("model_spec rebuilt")
+
+    with monkeypatch.context() as m:
+        m.setattr(FormulaManager, "get_matrices", no_rebuild)
+        restored = pickle.loads(pickle.dumps(res))
+    pd.testing.assert_series_equal(restored.predict(new), expected)
+
+
+@require_patsy
+@pytest.mark.thread_unsafe(reason="changes global formula_engine variable")
+def test_pickle_model_spec_fallback(compiled_data, monkeypatch):
+    monkeypatch.setattr(statsmodels.formula.options, "formula_engine", "patsy")
+    res = OLS.from_formula("y ~ g(x) + z", compiled_data).fit()
+    new = compiled_data.iloc[:5]
+    state = res.model.data.__getstate__()
+    assert "pickled_model_spec" in state
+
+    square = lambda x: x**2  # noqa: E731, F841
+    res = OLS.from_formula("y ~ square(x) + z", compiled_data).fit()
+    state = res.model.data.__getstate__()
+    assert "pickled_model_spec" not in state
+    assert state["restore_model_spec"]
+    assert res.predict(new).shape == (5,)
+
+
+SPARSE_FORMULAS = [
+    "y ~ x + C(c) + x:C(c)",
+    "y ~ C(c):d + z",
+    "y ~ 0 + C(c) + d + C(c):x:z",
+    "y ~ C(c, Sum) * d + np.log(w)",
+    "y ~ C(c, Treatment('b')) + x",
+    "x + C(c)",
+]
+
+
+@pytest.mark.parametrize("formula", SPARSE_FORMULAS)
+def test_sparse_matrices(engine, compiled_data, formula):
+    data = compiled_data.copy()
+    data.loc[data.index[3], "x"] = np.nan
+    data.loc[data.index[7], "y"] = np.nan
+    mgr = FormulaManager(engine)
+    expected = mgr.get_matrices(formula, data)
+    expected_rhs = expected[-1] if isinstance(expected, tuple) else expected
+    missing = ~data.index.isin(expected_rhs.index)
+    result = mgr.get_matrices(formula, data, sparse=True)
+    np.testing.assert_equal(np.asarray(mgr.missing_mask), missing)
+    assert missing.any()
+    if not isinstance(expected, tuple):
+        expected, result = (expected,), (result,)
+    for res, exp in zip(result, expected, strict=True):
+        assert list(res.columns) == list(exp.columns)
+        assert list(res.index) == list(exp.index)
+        if res is result[-1]:
+            assert all(isinstance(dt, pd.SparseDtype) for dt in res.dtypes)
+            res = res.sparse.to_dense()
+        np.testing.assert_allclose(
+            np.asarray(res, dtype=float), np.asarray(exp, dtype=float)
+        )
+
+    arr = mgr.get_matrices(formula, data, sparse=True, pandas=False)
+    rhs = arr[-1] if isinstance(arr, tuple) else arr
+    assert sp.issparse(rhs)
+    np.testing.assert_allclose(rhs.toarray(), np.asarray(expected[-1], dtype=float))
+
+
+def test_sparse_matrices_many_levels(engine):
+    # a dense dummy matrix or contrast matrix would need about 8GB
+    rs = np.random.RandomState(0)
+    nobs, nlevels = 30000, 30000
+    data = pd.DataFrame(
+        {
+            "y": rs.standard_normal(nobs),
+            "g": np.array([f"g{i}" for i in range(nlevels)])[
+                rs.randint(0, nlevels, nobs)
+            ],
+        }
+    )
+    mgr = FormulaManager(engine)
+    y, x = mgr.get_matrices("y ~ C(g)", data, pandas=False, sparse=True)
+    levels = np.unique(data["g"])
+    assert x.shape == (nobs, levels.shape[0])
+    assert x.nnz == 2 * nobs - (data["g"] == levels[0]).sum()
+    assert mgr.get_column_names(mgr.spec)[1] == f"C(g)[T.{levels[1]}]"
+    np.testing.assert_allclose(y, data[["y"]])
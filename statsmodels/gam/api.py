@@ -1,5 +1,12 @@
-from .gam_cross_validation.gam_cross_validation import MultivariateGAMCVPath
-from .generalized_additive_model import GLMGam
-from .smooth_basis import BSplines, CyclicCubicSplines
-
 __all__ = ["BSplines", "CyclicCubicSplines", "GLMGam", "MultivariateGAMCVPath"]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".gam_cross_validation.gam_cross_validation": ["MultivariateGAMCVPath"],
+        ".generalized_additive_model": ["GLMGam"],
+        ".smooth_basis": ["BSplines", "CyclicCubicSplines"],
+    },
+)
@@ -9,8 +9,16 @@ __all__ = [
     "cov_struct",
     "families"
 ]
-from . import cov_struct, families
-from .bayes_mixed_glm import BinomialBayesMixedGLM, PoissonBayesMixedGLM
-from .generalized_estimating_equations import GEE, NominalGEE, OrdinalGEE
-from .generalized_linear_model import GLM
-from .qif import QIF
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".": ["cov_struct", "families"],
+        ".bayes_mixed_glm": ["BinomialBayesMixedGLM", "PoissonBayesMixedGLM"],
+        ".generalized_estimating_equations": ["GEE", "NominalGEE", "OrdinalGEE"],
+        ".generalized_linear_model": ["GLM"],
+        ".qif": ["QIF"],
+    },
+)
@@ -25,9 +25,8 @@ deviation.
 
 In many applications, `exog_vc` will be sparse.  A sparse matrix may
 be passed when constructing a model class.  If a dense matrix is
-passed, it will be converted internally to a sparse matrix.  There
-currently is no way to avoid creating a temporary dense version of
-`exog_vc` when using formulas.
+passed, it will be converted internally to a sparse matrix.  When
+using formulas, `exog_vc` is built directly as a sparse matrix.
 
 Model and parameterization
 --------------------------
@@ -435,17 +434,19 @@ class _BayesMixedGLM(base.Model):
 
         ident = []
         exog_vc = []
+        vc_names = []
         vcp_names = []
         j = 0
         for na, fml in vc_formulas.items():
             mgr = FormulaManager()
-            mat = mgr.get_matrices(fml, data, pandas=True)
+            # sparse to avoid dense dummy variables for groups with many levels
+            mat = mgr.get_matrices(fml, data, pandas=False, sparse=True)
             exog_vc.append(mat)
+            vc_names.extend(mgr.get_column_names(mgr.spec))
             vcp_names.append(na)
             ident.append(j * np.ones(mat.shape[1], dtype=np.int_))
             j += 1
-        exog_vc = pd.concat(exog_vc, axis=1)
-        vc_names = exog_vc.columns.tolist()
+        exog_vc = sparse.hstack(exog_vc, format="csr")
 
         ident = np.concatenate(ident)
 
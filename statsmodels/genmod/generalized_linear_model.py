@@ -1244,6 +1244,11 @@ class GLM(base.LikelihoodModel):
             observed Hessian is used in fitting. 'eim' is the expected Hessian.
             This may provide more stable fits, but adds assumption that the
             Hessian is correctly specified.
+        params_cache : bool or int, optional
+            (available with scipy optimizer fits) Cache of the
+            log-likelihood, score and Hessian evaluated during the
+            optimization, see `LikelihoodModel.fit`. IRLS fits do not use
+            it, and their `params_cache_info` is None.
 
         Notes
         -----
@@ -1391,6 +1396,8 @@ class GLM(base.LikelihoodModel):
 
         # TODO: iteration count is not always available
         history = {"iteration": 0}
+        glm_results.fit_profile = rslt.fit_profile
+        glm_results.params_cache_info = rslt.params_cache_info
         if full_output:
             glm_results.mle_retvals = rslt.mle_retvals
             if "iterations" in rslt.mle_retvals:
@@ -1416,6 +1423,8 @@ class GLM(base.LikelihoodModel):
         iteratively reweighted least squares (IRLS).
         """
         attach_wls = kwargs.pop("attach_wls", False)
+        # IRLS does not evaluate the loglikelihood, so there is nothing to cache
+        kwargs.pop("params_cache", None)
         atol = kwargs.get("atol")
         rtol = kwargs.get("rtol", 0.0)
         tol_criterion = kwargs.get("tol_criterion", "deviance")
@@ -1497,6 +1506,7 @@ class GLM(base.LikelihoodModel):
         )
 
         glm_results.method = "IRLS"
+        glm_results.params_cache_info = None
         glm_results.mle_settings = {}
         glm_results.mle_settings["wls_method"] = wls_method
         glm_results.mle_settings["optimizer"] = glm_results.method
@@ -2392,6 +2402,67 @@ class GLMResults(base.LikelihoodModelResults):
 
         return res
 
+    def iter_prediction(
+        self,
+        exog,
+        chunksize=100000,
+        exposure=None,
+        offset=None,
+        transform=True,
+        which=None,
+        row_labels=None,
+    ):
+        """
+        Compute prediction results in blocks of rows
+
+        Parameters
+        ----------
+        exog : array_like
+            The values for which you want to predict, see get_prediction.
+        chunksize : int, optional
+            The number of rows of exog in each block.
+        exposure : array_like, optional
+            Exposure time values, only can be used with the log link
+            function.
+        offset : array_like, optional
+            Offset values.
+        transform : bool, optional
+            If the model was fit via a formula, do you want to pass
+            exog through the formula. Default is True.
+        which : None or {'mean', 'linear', 'var_unscaled'}, optional
+            Statistic to predict, see get_prediction.
+        row_labels : list of str, optional
+            If row_labels are provided, then they will replace the generated
+            labels.
+
+        Returns
+        -------
+        generator
+            Generator that yields the prediction results of each block of
+            rows of exog, instances of the class returned by get_prediction.
+
+        See Also
+        --------
+        get_prediction
+            Prediction results for all rows at once.
+
+        Notes
+        -----
+        Arrays of exposure and offset with one entry per row of exog are
+        split into blocks together with exog. The memory used for each block
+        is proportional to the size of the block.
+        """
+        return pred.iter_prediction(
+            self,
+            exog,
+            chunksize=chunksize,
+            row_labels=row_labels,
+            exposure=exposure,
+            offset=offset,
+            transform=transform,
+            which=which,
+        )
+
     @Appender(pinfer.score_test.__doc__)
     def score_test(
         self,
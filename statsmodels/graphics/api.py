@@ -1,29 +1,3 @@
-from . import tsaplots as tsa
-from .agreement import mean_diff_plot
-from .boxplots import beanplot, violinplot
-from .correlation import plot_corr, plot_corr_grid
-from .factorplots import interaction_plot
-from .functional import fboxplot, hdrboxplot, rainbowplot
-from .gofplots import qqplot
-from .plottools import rainbow
-from .regressionplots import (
-    abline_plot,
-    add_ellipse,
-    add_lowess,
-    added_variable_resids,
-    ceres_resids,
-    influence_plot,
-    partial_resids,
-    plot_ccpr,
-    plot_ccpr_grid,
-    plot_fit,
-    plot_leverage_resid2,
-    plot_partregress,
-    plot_partregress_grid,
-    plot_regress_exog,
-)
-from .utils import create_mpl_ax, create_mpl_fig
-
 __all__ = [
     "abline_plot",
     "add_ellipse",
@@ -54,3 +28,36 @@ __all__ = [
     "tsa",
     "violinplot",
 ]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".": ["tsaplots as tsa"],
+        ".agreement": ["mean_diff_plot"],
+        ".boxplots": ["beanplot", "violinplot"],
+        ".correlation": ["plot_corr", "plot_corr_grid"],
+        ".factorplots": ["interaction_plot"],
+        ".functional": ["fboxplot", "hdrboxplot", "rainbowplot"],
+        ".gofplots": ["qqplot"],
+        ".plottools": ["rainbow"],
+        ".regressionplots": [
+            "abline_plot",
+            "add_ellipse",
+            "add_lowess",
+            "added_variable_resids",
+            "ceres_resids",
+            "influence_plot",
+            "partial_resids",
+            "plot_ccpr",
+            "plot_ccpr_grid",
+            "plot_fit",
+            "plot_leverage_resid2",
+            "plot_partregress",
+            "plot_partregress_grid",
+            "plot_regress_exog",
+        ],
+        ".utils": ["create_mpl_ax", "create_mpl_fig"],
+    },
+)
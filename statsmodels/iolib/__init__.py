@@ -1,13 +1,15 @@
 from statsmodels.tools._test_runner import PytestTester
 
 from .foreign import savetxt
-from .smpickle import load_pickle, save_pickle
+from .smpickle import load_compact, load_pickle, save_compact, save_pickle
 from .table import SimpleTable, csv2st
 
 __all__ = [
            "SimpleTable",
            "csv2st",
+           "load_compact",
            "load_pickle",
+           "save_compact",
            "save_pickle",
            "savetxt",
            "test",
@@ -1,10 +1,20 @@
 __all__ = [
     "SimpleTable",
     "csv2st",
+    "load_compact",
     "load_pickle",
+    "save_compact",
     "save_pickle",
     "savetxt"
 ]
-from .foreign import savetxt
-from .smpickle import load_pickle, save_pickle
-from .table import SimpleTable, csv2st
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".foreign": ["savetxt"],
+        ".smpickle": ["load_compact", "load_pickle", "save_compact", "save_pickle"],
+        ".table": ["SimpleTable", "csv2st"],
+    },
+)
@@ -1,6 +1,17 @@
 """Helper files for pickling"""
 
+from io import BytesIO
+import json
+from pathlib import Path
 import pickle
+import struct
+import warnings
+import zipfile
+
+import numpy as np
+from numpy.lib._iotools import _is_string_like
+import pandas as pd
+from scipy import stats
 
 from statsmodels.iolib.openfile import get_file_obj
 
@@ -60,3 +71,410 @@ def load_pickle(fname):
     """
     with get_file_obj(fname, "rb") as fin:
         return _CompatUnpickler(fin).load()
+
+
+# Scalar statistics stored in compact results files if the results have them
+_COMPACT_STATS = (
+    "nobs",
+    "df_model",
+    "df_resid",
+    "k_constant",
+    "scale",
+    "llf",
+    "llnull",
+    "llr",
+    "llr_pvalue",
+    "prsquared",
+    "aic",
+    "bic",
+    "hqic",
+    "rsquared",
+    "rsquared_adj",
+    "fvalue",
+    "f_pvalue",
+    "ssr",
+    "mse_resid",
+    "deviance",
+    "pearson_chi2",
+)
+# Per-parameter statistics, stored as columns of equal length
+_COMPACT_COLUMNS = ("params", "bse", "tvalues", "pvalues")
+_COMPACT_VERSION = 1
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+def _scalar_or_none(results, name):
+    try:
+        value = getattr(results, name)
+    except Exception:
+        # statistics that are not available, e.g., after remove_data
+        return None
+    if np.ndim(value) != 0:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _array_or_none(results, name):
+    try:
+        value = getattr(results, name)
+        if callable(value):
+            value = value()
+        return np.asarray(value, dtype=float)
+    except Exception:
+        return None
+
+
+def save_compact(results, fname, include_pickle=True, remove_data=False):
+    """
+    Save fitted results in a compact columnar file
+
+    The file is an uncompressed npz archive that holds the parameters, their
+    standard errors, t-values and p-values, the covariance of the parameters,
+    and scalar statistics such as the log-likelihood and information
+    criteria. Each is stored as a separate array so that they can be read,
+    or memory-mapped, individually.
+
+    Parameters
+    ----------
+    results : Results
+        A results instance, e.g., the output of a model's ``fit`` method.
+    fname : str, pathlib.Path or file-like object
+        Filename or handle to write to.
+    include_pickle : bool, optional
+        If True (default), a pickle of the full results instance is stored
+        in the archive as well, see ``CompactResults.load_results``. This
+        member is only read on demand.
+    remove_data : bool, optional
+        If True, data arrays are removed from `results` before it is
+        pickled, see the results' ``remove_data`` method. Statistics are
+        computed before the data are removed. Only used if `include_pickle`
+        is True.
+
+    See Also
+    --------
+    load_compact
+        Load a compact results file.
+    """
+    wrapped = results
+    results = getattr(results, "_results", results)
+    arrays = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name in _COMPACT_COLUMNS:
+            arrays[name] = _array_or_none(results, name)
+        arrays["cov_params"] = _array_or_none(results, "cov_params")
+        scalars = {name: _scalar_or_none(results, name) for name in _COMPACT_STATS}
+    arrays = {key: value for key, value in arrays.items() if value is not None}
+    if "params" not in arrays:
+        raise ValueError("results must have params")
+    scalars = {key: value for key, value in scalars.items() if value is not None}
+    arrays["stats_names"] = np.array(list(scalars), dtype=str)
+    arrays["stats_values"] = np.array(list(scalars.values()), dtype=float)
+
+    model = results.model
+    try:
+        param_names = model.exog_names
+    except Exception:
+        param_names = None
+    if param_names is not None and len(param_names) == len(arrays["params"]):
+        arrays["param_names"] = np.array(param_names, dtype=str)
+    try:
+        endog_names = model.endog_names
+    except Exception:
+        endog_names = None
+    meta = {
+        "version": _COMPACT_VERSION,
+        "model": type(model).__name__,
+        "results": type(results).__name__,
+        "endog_names": endog_names,
+        "cov_type": getattr(results, "cov_type", None),
+        "use_t": bool(getattr(results, "use_t", False)),
+    }
+    arrays["meta"] = np.array(json.dumps(meta, default=str))
+
+    if include_pickle:
+        if remove_data:
+            wrapped.remove_data()
+        buffer = pickle.dumps(wrapped, protocol=-1)
+        arrays["pickle"] = np.frombuffer(buffer, dtype=np.uint8)
+
+    with get_file_obj(fname, "wb") as fout:
+        np.savez(fout, **arrays)
+
+
+def _read_member(source, name, mmap_mode):
+    """Read an array from an npz archive, memory-mapped if possible"""
+    member = name + ".npy"
+    with zipfile.ZipFile(source) as zf:
+        info = zf.getinfo(member)
+    if (
+        mmap_mode is not None
+        and isinstance(source, Path)
+        and info.compress_type == zipfile.ZIP_STORED
+    ):
+        with source.open("rb") as fin:
+            # skip the local file header, see the zip specification
+            fin.seek(info.header_offset)
+            header = fin.read(30)
+            name_len, extra_len = struct.unpack("<HH", header[26:30])
+            fin.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(fin)
+            if version == (1, 0):
+                read_header = np.lib.format.read_array_header_1_0
+            else:
+                read_header = np.lib.format.read_array_header_2_0
+            shape, fortran_order, dtype = read_header(fin)
+            offset = fin.tell()
+        if dtype.kind in "fiuc" and int(np.prod(shape)) > 0:
+            order = "F" if fortran_order else "C"
+            return np.memmap(
+                source,
+                dtype=dtype,
+                mode=mmap_mode,
+                offset=offset,
+                shape=shape,
+                order=order,
+            )
+    with zipfile.ZipFile(source) as zf, zf.open(member) as fin:
+        return np.lib.format.read_array(fin, allow_pickle=False)
+
+
+class CompactResults:
+    """
+    Results loaded from a compact results file
+
+    Parameters
+    ----------
+    fname : str, pathlib.Path or file-like object
+        The compact results file, see ``save_compact``.
+    mmap_mode : {None, "r", "c"}, optional
+        Mode used to memory-map numeric arrays if `fname` is a path. The
+        default "r" maps arrays read-only. If None, or if `fname` is a file
+        handle, arrays are read into memory when they are first accessed.
+        The file is not kept open between accesses.
+
+    Attributes
+    ----------
+    model_class : str
+        Name of the model class of the saved results.
+    results_class : str
+        Name of the results class of the saved results.
+    endog_names : str or list[str]
+        Name of the dependent variable.
+    cov_type : str
+        The covariance type of the saved results.
+    use_t : bool
+        Whether inference uses the t distribution.
+    stats : dict[str, float]
+        Scalar statistics of the saved results. These are also available as
+        attributes, e.g., ``llf`` or ``aic``.
+
+    Notes
+    -----
+    Only the archive directory and the scalar statistics are read when the
+    instance is created. Parameter arrays are read on first access and the
+    full results instance only by ``load_results``.
+    """
+
+    def __init__(self, fname, mmap_mode="r"):
+        if _is_string_like(fname):
+            fname = Path(fname)
+        if isinstance(fname, Path):
+            self._source = fname
+        else:
+            # file handles are read into memory since they may be closed later
+            self._source = BytesIO(fname.read())
+        self._mmap_mode = mmap_mode
+        self._arrays = {}
+        with zipfile.ZipFile(self._source) as zf:
+            self._members = {name[: -len(".npy")] for name in zf.namelist()}
+        meta = json.loads(str(self._get("meta")))
+        self.model_class = meta["model"]
+        self.results_class = meta["results"]
+        self.endog_names = meta["endog_names"]
+        self.cov_type = meta["cov_type"]
+        self.use_t = meta["use_t"]
+        names = self._get("stats_names")
+        values = self._get("stats_values")
+        self.stats = dict(zip(names.tolist(), values.tolist(), strict=True))
+
+    def __getstate__(self):
+        raise TypeError("CompactResults cannot be pickled, use load_results")
+
+    def __getattr__(self, name):
+        # only called if name is not found, scalar statistics are attributes
+        stats = self.__dict__.get("stats", {})
+        if name in stats:
+            return stats[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.stats))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {self.results_class}>"
+
+    def _get(self, name):
+        if name not in self._members:
+            raise AttributeError(f"{name} was not stored in the results file")
+        if name not in self._arrays:
+            self._arrays[name] = _read_member(self._source, name, self._mmap_mode)
+        return self._arrays[name]
+
+    def _wrap(self, value):
+        if "param_names" not in self._members or value.ndim != 1:
+            return value
+        return pd.Series(value, index=self._get("param_names").tolist())
+
+    @property
+    def param_names(self):
+        """Names of the parameters, None if not stored"""
+        if "param_names" not in self._members:
+            return None
+        return self._get("param_names").tolist()
+
+    @property
+    def params(self):
+        """The estimated parameters"""
+        return self._wrap(self._get("params"))
+
+    @property
+    def bse(self):
+        """The standard errors of the parameter estimates"""
+        return self._wrap(self._get("bse"))
+
+    @property
+    def tvalues(self):
+        """The test statistics for the parameters being zero"""
+        return self._wrap(self._get("tvalues"))
+
+    @property
+    def pvalues(self):
+        """The p-values of the tests for the parameters being zero"""
+        return self._wrap(self._get("pvalues"))
+
+    def cov_params(self):
+        """
+        The covariance of the parameter estimates
+
+        Returns
+        -------
+        {ndarray, DataFrame}
+            The covariance matrix, a DataFrame if parameter names are stored.
+        """
+        cov = self._get("cov_params")
+        names = self.param_names
+        if names is None or cov.shape != (len(names), len(names)):
+            return cov
+        return pd.DataFrame(cov, index=names, columns=names)
+
+    def conf_int(self, alpha=0.05):
+        """
+        Confidence intervals of the parameters
+
+        Parameters
+        ----------
+        alpha : float, optional
+            The significance level, the intervals have coverage 1 - alpha.
+
+        Returns
+        -------
+        {ndarray, DataFrame}
+            Lower and upper bounds in the columns, a DataFrame if parameter
+            names are stored.
+        """
+        params = np.asarray(self._get("params"))
+        bse = np.asarray(self._get("bse"))
+        if self.use_t and "df_resid" in self.stats:
+            q = stats.t.ppf(1 - alpha / 2, self.stats["df_resid"])
+        else:
+            q = stats.norm.ppf(1 - alpha / 2)
+        ci = np.column_stack((params - q * bse, params + q * bse))
+        names = self.param_names
+        if names is None or params.ndim != 1:
+            return ci
+        return pd.DataFrame(ci, index=names, columns=[0, 1])
+
+    def load_results(self):
+        """
+        Load the full results instance stored in the file
+
+        .. warning::
+
+           Loading pickled models is not secure against erroneous or
+           maliciously constructed data. Never unpickle data received from
+           an untrusted or unauthenticated source.
+
+        Returns
+        -------
+        Results
+            The unpickled results instance.
+        """
+        if "pickle" not in self._members:
+            raise ValueError("The results file does not contain a pickle")
+        buffer = _read_member(self._source, "pickle", None)
+        return _CompatUnpickler(BytesIO(buffer.tobytes())).load()
+
+
+def load_compact(fname, mmap_mode="r"):
+    """
+    Load results saved in a compact results file
+
+    Parameters
+    ----------
+    fname : str, pathlib.Path or file-like object
+        Filename or handle to read from.
+    mmap_mode : {None, "r", "c"}, optional
+        Mode used to memory-map numeric arrays if `fname` is a path. If None,
+        arrays are read into memory when they are first accessed.
+
+    Returns
+    -------
+    CompactResults
+        Lazy view of the stored statistics. The full results instance can be
+        restored with its ``load_results`` method.
+
+    See Also
+    --------
+    save_compact
+        Save results in a compact results file.
+    """
+    return CompactResults(fname, mmap_mode=mmap_mode)
+
+
+def _is_compact_file(fname):
+    """Check whether fname is a compact results file, i.e., a zip archive"""
+    if _is_string_like(fname) or isinstance(fname, Path):
+        with Path(fname).open("rb") as fin:
+            return fin.read(4) == _ZIP_MAGIC
+    if hasattr(fname, "seek") and hasattr(fname, "tell"):
+        pos = fname.tell()
+        magic = fname.read(4)
+        fname.seek(pos)
+        return magic == _ZIP_MAGIC
+    return False
+
+
+def load_results(fname):
+    """
+    Load results saved as a pickle or as a compact results file
+
+    Parameters
+    ----------
+    fname : str, pathlib.Path or file-like object
+        Filename or handle to read from.
+
+    Returns
+    -------
+    {Results, CompactResults}
+        The unpickled results if `fname` is a pickle, otherwise the lazily
+        loaded compact results.
+    """
+    if _is_compact_file(fname):
+        return load_compact(fname)
+    return load_pickle(fname)
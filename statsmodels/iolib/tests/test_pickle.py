@@ -6,9 +6,23 @@ import pathlib
 from pathlib import Path
 import tempfile
 
-from numpy.testing import assert_equal
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+import pytest
 
-from statsmodels.iolib.smpickle import load_pickle, save_pickle
+from statsmodels.discrete.discrete_model import Logit
+from statsmodels.iolib.smpickle import (
+    CompactResults,
+    load_compact,
+    load_pickle,
+    load_results,
+    save_compact,
+    save_pickle,
+)
+from statsmodels.regression.linear_model import OLS
+from statsmodels.tools.tools import add_constant
 
 
 def test_pickle():
@@ -74,3 +88,70 @@ def test_pickle_supports_open():
     save_pickle(a, path_pathlib)
     c = load_pickle(path_pathlib)
     assert_equal(a, c)
+
+
+@pytest.fixture(scope="module")
+def logit_results():
+    rs = np.random.RandomState(0)
+    exog = pd.DataFrame(rs.standard_normal((200, 2)), columns=["a", "b"])
+    endog = pd.Series((exog.a + rs.standard_normal(200) > 0).astype(float), name="y")
+    return Logit(endog, add_constant(exog)).fit(disp=0)
+
+
+def test_compact_results(logit_results, tmp_path):
+    res = logit_results
+    path = tmp_path / "res.npz"
+    res.save(path, format="compact")
+
+    loaded = load_results(path)
+    assert isinstance(loaded, CompactResults)
+    assert_equal(loaded.model_class, "Logit")
+    assert_equal(loaded.endog_names, "y")
+    assert isinstance(loaded._get("params"), np.memmap)
+    assert_series_equal(loaded.params, res.params)
+    assert_series_equal(loaded.bse, res.bse)
+    assert_series_equal(loaded.pvalues, res.pvalues)
+    assert_frame_equal(loaded.cov_params(), res.cov_params())
+    assert_frame_equal(loaded.conf_int(), res.conf_int())
+    assert_allclose(loaded.llf, res.llf, rtol=1e-14)
+    assert_allclose(loaded.prsquared, res.prsquared, rtol=1e-14)
+    assert "llnull" in dir(loaded)
+    with pytest.raises(AttributeError):
+        _ = loaded.rsquared
+
+    full = loaded.load_results()
+    assert_series_equal(full.params, res.params)
+    assert_allclose(full.predict(), res.predict())
+
+
+def test_compact_results_handle():
+    rs = np.random.RandomState(0)
+    exog = add_constant(rs.standard_normal((100, 2)))
+    endog = exog.sum(1) + rs.standard_normal(100)
+    res = OLS(endog, exog).fit(cov_type="HC1")
+
+    fh = BytesIO()
+    save_compact(res, fh, include_pickle=False)
+    fh.seek(0)
+    loaded = res.load(fh)
+    fh.close()
+    assert not isinstance(loaded._get("params"), np.memmap)
+    assert_equal(loaded.param_names, ["const", "x1", "x2"])
+    assert_equal(loaded.cov_type, "HC1")
+    assert_allclose(np.asarray(loaded.params), res.params)
+    assert_allclose(np.asarray(loaded.conf_int()), res.conf_int())
+    assert_allclose(loaded.rsquared, res.rsquared)
+    with pytest.raises(ValueError, match="does not contain"):
+        loaded.load_results()
+    with pytest.raises(ValueError, match="format"):
+        res.save(BytesIO(), format="npz")
+
+
+def test_compact_results_remove_data(logit_results, tmp_path):
+    model = logit_results.model
+    res = Logit(model.data.orig_endog, model.data.orig_exog).fit(disp=0)
+    path = tmp_path / "res.npz"
+    res.save(path, remove_data=True, format="compact")
+    loaded = load_compact(path, mmap_mode=None)
+    assert_allclose(loaded.llnull, logit_results.llnull)
+    assert loaded.load_results().model.endog is None
@@ -1,7 +1,11 @@
 __all__ = ["PoissonGMLE", "PoissonOffsetGMLE", "PoissonZiGMLE", "TLinearModel"]
-from .count import (  # NonlinearDeltaCov
-    PoissonGMLE,
-    PoissonOffsetGMLE,
-    PoissonZiGMLE,
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".count": ["PoissonGMLE", "PoissonOffsetGMLE", "PoissonZiGMLE"],
+        ".tmodel": ["TLinearModel"],
+    },
 )
-from .tmodel import TLinearModel
@@ -9,9 +9,16 @@ __all__ = [
     "factor_rotation"
 ]
 
-from . import factor_rotation
-from .cancorr import CanCorr
-from .factor import Factor, FactorResults
-from .manova import MANOVA
-from .multivariate_ols import MultivariateLS, MultivariateLSResults
-from .pca import PCA
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".": ["factor_rotation"],
+        ".cancorr": ["CanCorr"],
+        ".factor": ["Factor", "FactorResults"],
+        ".manova": ["MANOVA"],
+        ".multivariate_ols": ["MultivariateLS", "MultivariateLSResults"],
+        ".pca": ["PCA"],
+    },
+)
@@ -10,13 +10,21 @@ __all__ = [
     "lowess",
     "pdf_kernel_asym",
 ]
-from . import bandwidths
-from .kde import KDEUnivariate
-from .kernel_density import (
-    EstimatorSettings,
-    KDEMultivariate,
-    KDEMultivariateConditional,
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".": ["bandwidths"],
+        ".kde": ["KDEUnivariate"],
+        ".kernel_density": [
+            "EstimatorSettings",
+            "KDEMultivariate",
+            "KDEMultivariateConditional",
+        ],
+        ".kernel_regression": ["KernelCensoredReg", "KernelReg"],
+        ".kernels_asymmetric": ["cdf_kernel_asym", "pdf_kernel_asym"],
+        ".smoothers_lowess": ["lowess"],
+    },
 )
-from .kernel_regression import KernelCensoredReg, KernelReg
-from .kernels_asymmetric import cdf_kernel_asym, pdf_kernel_asym
-from .smoothers_lowess import lowess
@@ -1,3 +1,10 @@
-from .betareg import BetaModel
-
 __all__ = ["BetaModel"]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".betareg": ["BetaModel"],
+    },
+)
@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from statsmodels.base._prediction_inference import _var_linear_predict
 from statsmodels.formula._manager import FormulaManager
 
 
@@ -205,8 +206,7 @@ def get_prediction(self, exog=None, transform=True, weights=None,
         pred_kwds = {}
     predicted_mean = self.model.predict(self.params, exog, **pred_kwds)
 
-    covb = self.cov_params()
-    var_pred_mean = (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred_mean = _var_linear_predict(self, exog)
     var_resid = self.scale  # self.mse_resid / weights
 
     # TODO: check that we have correct scale, Refactor scale #???
@@ -3005,6 +3005,67 @@ class RegressionResults(base.LikelihoodModelResults):
             **kwargs,
         )
 
+    def iter_prediction(
+        self,
+        exog,
+        chunksize=100000,
+        transform=True,
+        weights=None,
+        row_labels=None,
+        **kwargs,
+    ):
+        """
+        Compute prediction results in blocks of rows
+
+        Parameters
+        ----------
+        exog : array_like
+            The values for which you want to predict, see get_prediction.
+        chunksize : int, optional
+            The number of rows of exog in each block.
+        transform : bool, optional
+            If the model was fit via a formula, do you want to pass
+            exog through the formula. Default is True.
+        weights : array_like, optional
+            Weights interpreted as in WLS, used for the variance of the
+            predicted residual. Arrays with one weight per row of exog are
+            split into blocks together with exog.
+        row_labels : array_like, optional
+            A list of row labels to use. If not provided, read `exog` is
+            available.
+        **kwargs
+            Additional keyword arguments of get_prediction.
+
+        Returns
+        -------
+        generator
+            Generator that yields a PredictionResults instance for each block
+            of rows of exog, with the predicted mean, standard errors and
+            intervals of the block.
+
+        See Also
+        --------
+        get_prediction
+            Prediction results for all rows at once.
+
+        Notes
+        -----
+        The memory used for each block is proportional to the size of the
+        block so that predictions for very large exog can be computed and
+        written out block by block.
+        """
+        from statsmodels.base._prediction_inference import iter_prediction
+
+        return iter_prediction(
+            self,
+            exog,
+            chunksize=chunksize,
+            row_labels=row_labels,
+            transform=transform,
+            weights=weights,
+            **kwargs,
+        )
+
     def summary(
         self,
         yname: str | None = None,
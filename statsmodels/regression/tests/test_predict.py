@@ -329,3 +329,55 @@ def test_prediction_results_t_test():
     pred_t = res_t.get_prediction()
     assert pred_t.dist is sp_stats.t
     assert pred_t.dist_args == (pred_t.df,)
+
+
+@pytest.fixture
+def small_prediction_chunks(monkeypatch):
+    from statsmodels.base import _prediction_inference
+
+    monkeypatch.setattr(_prediction_inference, "_CHUNK_ELEMENTS", 10)
+
+
+def test_iter_prediction_wls(small_prediction_chunks):
+    rs = np.random.RandomState(871254)
+    exog = np.column_stack([np.ones(60), rs.standard_normal((60, 2))])
+    endog = exog.sum(1) + rs.standard_normal(60)
+    res = WLS(endog, exog, weights=rs.uniform(1, 2, size=60)).fit()
+
+    exog_new = pd.DataFrame(
+        np.column_stack([np.ones(25), rs.standard_normal((25, 2))]),
+        index=np.arange(25) + 100,
+    )
+    weights = rs.uniform(1, 2, size=25)
+    pred = res.get_prediction(exog_new, weights=weights)
+    covb = res.cov_params()
+    expected = (exog_new.values * (covb @ exog_new.values.T).T).sum(1)
+    assert_allclose(pred.var_pred_mean, expected, rtol=1e-12)
+
+    blocks = list(res.iter_prediction(exog_new, chunksize=10, weights=weights))
+    assert_equal([len(block.predicted_mean) for block in blocks], [10, 10, 5])
+    frame = pd.concat([block.summary_frame() for block in blocks])
+    assert_allclose(frame, pred.summary_frame(), rtol=1e-12)
+    assert_equal(frame.index.to_numpy(), exog_new.index.to_numpy())
+
+    with pytest.raises(ValueError, match="chunksize"):
+        res.iter_prediction(exog_new, chunksize=0)
+
+
+def test_iter_prediction_glm():
+    from statsmodels.genmod import families
+    from statsmodels.genmod.generalized_linear_model import GLM
+
+    rs = np.random.RandomState(871254)
+    exog = np.column_stack([np.ones(80), rs.standard_normal((80, 2))])
+    endog = rs.poisson(np.exp(exog @ [0.5, 0.2, -0.2]))
+    res = GLM(endog, exog, family=families.Poisson()).fit()
+
+    offset = rs.standard_normal(30) * 0.1
+    for which in [None, "mean", "linear"]:
+        pred = res.get_prediction(exog[:30], offset=offset, which=which)
+        blocks = res.iter_prediction(
+            exog[:30], chunksize=7, offset=offset, which=which
+        )
+        frame = pd.concat([block.summary_frame() for block in blocks])
+        assert_allclose(frame, pred.summary_frame(), rtol=1e-12)
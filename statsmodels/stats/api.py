@@ -1,185 +1,3 @@
-from statsmodels.sandbox.stats.runs import Runs, runstest_1samp, runstest_2samp
-from statsmodels.stats.contingency_tables import (
-    SquareTable,
-    StratifiedTable,
-    Table,
-    Table2x2,
-    cochrans_q,
-    mcnemar,
-)
-
-from . import (
-    covariance,
-    diagnostic,
-    gof,
-    moment_helpers,
-    multicomp,
-    sandwich_covariance,
-    stattools,
-)
-from ._adnorm import normal_ad
-from ._knockoff import RegressionFDR
-from ._lilliefors import lilliefors
-from .anova import AnovaRM, anova_lm
-from .correlation_tools import (
-    FactoredPSDMatrix,
-    corr_clipped,
-    corr_nearest,
-    corr_nearest_factor,
-    corr_thresholded,
-    cov_nearest,
-    cov_nearest_factor_homog,
-)
-from .covariance import (
-    corr_normal_scores,
-    corr_quadrant,
-    corr_rank,
-    transform_corr_normal,
-)
-from .descriptivestats import Describe
-from .diagnostic import (
-    acorr_breusch_godfrey,
-    acorr_ljungbox,
-    acorr_lm,
-    breaks_cusumolsresid,
-    breaks_hansen,
-    compare_cox,
-    compare_encompassing,
-    compare_j,
-    het_arch,
-    het_breuschpagan,
-    het_goldfeldquandt,
-    het_white,
-    linear_harvey_collier,
-    linear_lm,
-    linear_rainbow,
-    linear_reset,
-    pesaran_timmermann,
-    recursive_olsresiduals,
-    spec_white,
-)
-from .gof import chisquare_effectsize, gof_chisquare_discrete, powerdiscrepancy
-from .inter_rater import cohens_kappa, fleiss_kappa
-from .mediation import Mediation
-from .meta_analysis import (
-    combine_effects,
-    effectsize_2proportions,
-    effectsize_smd,
-)
-from .multicomp import tukeyhsd
-from .multitest import (
-    NullDistribution,
-    fdrcorrection,
-    fdrcorrection_twostage,
-    local_fdr,
-    local_fdr_correction,
-    multipletests,
-)
-from .multivariate import (
-    confint_mvmean,
-    confint_mvmean_fromstats,
-    test_cov,
-    test_cov_blockdiagonal,
-    test_cov_diagonal,
-    test_cov_oneway,
-    test_cov_spherical,
-    test_mvmean,
-    test_mvmean_2indep,
-)
-from .nonparametric import jonckheere_terpstra
-from .oaxaca import OaxacaBlinder
-from .oneway import (  # mean and scale; power; from stats; effect size
-    anova_generic,
-    anova_oneway,
-    confint_effectsize_oneway,
-    confint_noncentrality,
-    convert_effectsize_fsqu,
-    effectsize_oneway,
-    equivalence_oneway,
-    equivalence_oneway_generic,
-    equivalence_scale_oneway,
-    f2_to_wellek,
-    fstat_to_wellek,
-    power_equivalence_oneway,
-    simulate_power_equivalence_oneway,
-    test_scale_oneway,
-    wellek_to_f2,
-)
-from .power import (
-    FTestAnovaPower,
-    FTestPower,
-    GofChisquarePower,
-    NormalIndPower,
-    TTestIndPower,
-    TTestPower,
-    tt_ind_solve_power,
-    tt_solve_power,
-    zt_ind_solve_power,
-)
-from .proportion import (  # 2 sample functions:
-    binom_test,
-    binom_test_reject_interval,
-    binom_tost,
-    binom_tost_reject_interval,
-    confint_proportions_2indep,
-    multinomial_proportions_confint,
-    power_binom_tost,
-    power_proportions_2indep,
-    power_ztost_prop,
-    proportion_confint,
-    proportion_effectsize,
-    proportions_chisquare,
-    proportions_chisquare_allpairs,
-    proportions_chisquare_pairscontrol,
-    proportions_ztest,
-    proportions_ztost,
-    samplesize_confint_proportion,
-    samplesize_proportions_2indep_onetail,
-    test_proportions_2indep,
-    tost_proportions_2indep,
-)
-from .rates import (  # 1 sample:; 2-sample; power
-    confint_poisson,
-    confint_poisson_2indep,
-    confint_quantile_poisson,
-    etest_poisson_2indep,
-    nonequivalence_poisson_2indep,
-    power_equivalence_neginb_2indep,
-    power_equivalence_poisson_2indep,
-    power_negbin_ratio_2indep,
-    power_poisson_diff_2indep,
-    power_poisson_ratio_2indep,
-    test_poisson,
-    test_poisson_2indep,
-    tolerance_int_poisson,
-    tost_poisson_2indep,
-)
-from .sandwich_covariance import (
-    cov_cluster,
-    cov_cluster_2groups,
-    cov_hac,
-    cov_hc0,
-    cov_hc1,
-    cov_hc2,
-    cov_hc3,
-    cov_nw_panel,
-    cov_white_simple,
-    se_cov,
-    weights_bartlett,
-    weights_uniform,
-)
-from .stattools import durbin_watson, jarque_bera, omni_normtest
-from .weightstats import (
-    CompareMeans,
-    DescrStatsW,
-    ttest_ind,
-    ttost_ind,
-    ttost_paired,
-    zconfint,
-    ztest,
-    ztost,
-)
-
 __all__ = [
     "AnovaRM",
     "CompareMeans",
@@ -342,3 +160,191 @@ __all__ = [
     "ztest",
     "ztost",
 ]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "statsmodels.sandbox.stats.runs": ["Runs", "runstest_1samp", "runstest_2samp"],
+        "statsmodels.stats.contingency_tables": [
+            "SquareTable",
+            "StratifiedTable",
+            "Table",
+            "Table2x2",
+            "cochrans_q",
+            "mcnemar",
+        ],
+        ".": [
+            "covariance",
+            "diagnostic",
+            "gof",
+            "moment_helpers",
+            "multicomp",
+            "sandwich_covariance",
+            "stattools",
+        ],
+        "._adnorm": ["normal_ad"],
+        "._knockoff": ["RegressionFDR"],
+        "._lilliefors": ["lilliefors"],
+        ".anova": ["AnovaRM", "anova_lm"],
+        ".correlation_tools": [
+            "FactoredPSDMatrix",
+            "corr_clipped",
+            "corr_nearest",
+            "corr_nearest_factor",
+            "corr_thresholded",
+            "cov_nearest",
+            "cov_nearest_factor_homog",
+        ],
+        ".covariance": [
+            "corr_normal_scores",
+            "corr_quadrant",
+            "corr_rank",
+            "transform_corr_normal",
+        ],
+        ".descriptivestats": ["Describe"],
+        ".diagnostic": [
+            "acorr_breusch_godfrey",
+            "acorr_ljungbox",
+            "acorr_lm",
+            "breaks_cusumolsresid",
+            "breaks_hansen",
+            "compare_cox",
+            "compare_encompassing",
+            "compare_j",
+            "het_arch",
+            "het_breuschpagan",
+            "het_goldfeldquandt",
+            "het_white",
+            "linear_harvey_collier",
+            "linear_lm",
+            "linear_rainbow",
+            "linear_reset",
+            "pesaran_timmermann",
+            "recursive_olsresiduals",
+            "spec_white",
+        ],
+        ".gof": ["chisquare_effectsize", "gof_chisquare_discrete", "powerdiscrepancy"],
+        ".inter_rater": ["cohens_kappa", "fleiss_kappa"],
+        ".mediation": ["Mediation"],
+        ".meta_analysis": [
+            "combine_effects",
+            "effectsize_2proportions",
+            "effectsize_smd",
+        ],
+        ".multicomp": ["tukeyhsd"],
+        ".multitest": [
+            "NullDistribution",
+            "fdrcorrection",
+            "fdrcorrection_twostage",
+            "local_fdr",
+            "local_fdr_correction",
+            "multipletests",
+        ],
+        ".multivariate": [
+            "confint_mvmean",
+            "confint_mvmean_fromstats",
+            "test_cov",
+            "test_cov_blockdiagonal",
+            "test_cov_diagonal",
+            "test_cov_oneway",
+            "test_cov_spherical",
+            "test_mvmean",
+            "test_mvmean_2indep",
+        ],
+        ".nonparametric": ["jonckheere_terpstra"],
+        ".oaxaca": ["OaxacaBlinder"],
+        ".oneway": [
+            "anova_generic",
+            "anova_oneway",
+            "confint_effectsize_oneway",
+            "confint_noncentrality",
+            "convert_effectsize_fsqu",
+            "effectsize_oneway",
+            "equivalence_oneway",
+            "equivalence_oneway_generic",
+            "equivalence_scale_oneway",
+            "f2_to_wellek",
+            "fstat_to_wellek",
+            "power_equivalence_oneway",
+            "simulate_power_equivalence_oneway",
+            "test_scale_oneway",
+            "wellek_to_f2",
+        ],
+        ".power": [
+            "FTestAnovaPower",
+            "FTestPower",
+            "GofChisquarePower",
+            "NormalIndPower",
+            "TTestIndPower",
+            "TTestPower",
+            "tt_ind_solve_power",
+            "tt_solve_power",
+            "zt_ind_solve_power",
+        ],
+        ".proportion": [
+            "binom_test",
+            "binom_test_reject_interval",
+            "binom_tost",
+            "binom_tost_reject_interval",
+            "confint_proportions_2indep",
+            "multinomial_proportions_confint",
+            "power_binom_tost",
+            "power_proportions_2indep",
+            "power_ztost_prop",
+            "proportion_confint",
+            "proportion_effectsize",
+            "proportions_chisquare",
+            "proportions_chisquare_allpairs",
+            "proportions_chisquare_pairscontrol",
+            "proportions_ztest",
+            "proportions_ztost",
+            "samplesize_confint_proportion",
+            "samplesize_proportions_2indep_onetail",
+            "test_proportions_2indep",
+            "tost_proportions_2indep",
+        ],
+        ".rates": [
+            "confint_poisson",
+            "confint_poisson_2indep",
+            "confint_quantile_poisson",
+            "etest_poisson_2indep",
+            "nonequivalence_poisson_2indep",
+            "power_equivalence_neginb_2indep",
+            "power_equivalence_poisson_2indep",
+            "power_negbin_ratio_2indep",
+            "power_poisson_diff_2indep",
+            "power_poisson_ratio_2indep",
+            "test_poisson",
+            "test_poisson_2indep",
+            "tolerance_int_poisson",
+            "tost_poisson_2indep",
+        ],
+        ".sandwich_covariance": [
+            "cov_cluster",
+            "cov_cluster_2groups",
+            "cov_hac",
+            "cov_hc0",
+            "cov_hc1",
+            "cov_hc2",
+            "cov_hc3",
+            "cov_nw_panel",
+            "cov_white_simple",
+            "se_cov",
+            "weights_bartlett",
+            "weights_uniform",
+        ],
+        ".stattools": ["durbin_watson", "jarque_bera", "omni_normtest"],
+        ".weightstats": [
+            "CompareMeans",
+            "DescrStatsW",
+            "ttest_ind",
+            "ttost_ind",
+            "ttost_paired",
+            "zconfint",
+            "ztest",
+            "ztost",
+        ],
+    },
+)
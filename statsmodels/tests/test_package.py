@@ -29,9 +29,42 @@ def test_lazy_imports():
 )
 def test_docstring_optimization_compat():
     # GH#5235 check that importing with stripped docstrings does not raise
-    cmd = sys.executable + ' -OO -c "import statsmodels.api as sm"'
+    # the star import loads all lazily imported attributes
+    cmd = sys.executable + ' -OO -c "from statsmodels.api import *"'
     p = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE)
     out = p.communicate()
     rc = p.returncode
     assert rc == 0, out
+
+
+@pytest.mark.skipif(
+    PYTHON_IMPL_WASM,
+    reason="Can't start subprocess in WASM/Pyodide"
+)
+@pytest.mark.parametrize(
+    "module",
+    [
+        "statsmodels.api",
+        "statsmodels.graphics.api",
+        "statsmodels.stats.api",
+        "statsmodels.tsa.api",
+        "statsmodels.tsa.statespace.api",
+    ],
+)
+def test_api_import_is_lazy(module):
+    # Importing an api module must not import numpy, scipy or pandas, or
+    # model code that depends on them. These are only imported when an
+    # attribute is first accessed.
+    cmd = (
+        f"import {module} as api, sys; "
+        "heavy = [m for m in sys.modules "
+        "if m.split('.')[0] in ('numpy', 'scipy', 'pandas', 'patsy')]; "
+        "assert not heavy, heavy[:5]; "
+        "[getattr(api, name) for name in api.__all__]; "
+        "assert 'numpy' in sys.modules"
+    )
+    p = subprocess.run(
+        [sys.executable, "-c", cmd], capture_output=True, text=True, check=False
+    )
+    assert p.returncode == 0, p.stderr
@@ -1,9 +1,10 @@
 """Utility functions and testing helpers for statsmodels"""
 
+from statsmodels import _lazy
 from statsmodels.tools._test_runner import PytestTester
 
-from .tools import add_constant
-
 __all__ = ["add_constant", "test"]
 
+__getattr__, __dir__ = _lazy.attach(__name__, {".tools": ["add_constant"]})
+
 test = PytestTester()
@@ -45,12 +45,18 @@ without dependencies.
 #
 # in example: if J = d x*beta / d beta then J'J == X'X
 #    similar to https://en.wikipedia.org/wiki/Levenberg%E2%80%93Marquardt_algorithm
+from functools import partial
+from itertools import chain, islice
+
 import numpy as np
 
 from statsmodels.tools.docstring_helpers import Appender, Substitution
 
 # NOTE: we only do double precision internally so far
 EPS = np.finfo(float).eps
+# Maximum number of elements of the points that are stacked at a time when
+# a function is evaluated batched or with an executor
+_MAX_CHUNK_ELEMENTS = 2**20
 
 _hessian_docs = """
     Calculate Hessian with finite difference derivative approximation
@@ -69,6 +75,14 @@ _hessian_docs = """
     kwargs : dict, optional
         Keyword arguments for function `f`.
     %(extra_params)s
+    batched : bool, optional
+        If True, `f` is called once with a 2d array that holds all points at
+        which the function is evaluated, one point per row, and must return
+        an array with the function values in the first dimension.
+    executor : concurrent.futures.Executor, optional
+        If provided and `batched` is False, the points are evaluated with
+        ``executor.map``. A process pool requires that `f` and `args` can be
+        pickled.
 
     Returns
     -------
@@ -133,7 +147,85 @@ def _get_epsilon(x, s, epsilon, n):
     return np.asarray(h)
 
 
-def approx_fprime(x, f, epsilon=None, args=(), kwargs=None, centered=False):
+def _call(x, f, args, kwargs):
+    return f(x, *args, **kwargs)
+
+
+def _eval_points(
+    f, points, n_points, args, kwargs, batched=False, executor=None
+):
+    """
+    Evaluate a function at each of a sequence of points
+
+    Parameters
+    ----------
+    f : callable
+        Function called as ``f(point, *args, **kwargs)``, or as
+        ``f(points, *args, **kwargs)`` with a 2d array of points if
+        `batched` is True.
+    points : iterable
+        The points, 1d arrays of the same length. They are created lazily,
+        so that at most `_MAX_CHUNK_ELEMENTS` elements of points are held in
+        memory at a time.
+    n_points : int
+        The number of points.
+    args : tuple
+        Additional arguments for `f`.
+    kwargs : dict
+        Additional keyword arguments for `f`.
+    batched : bool, optional
+        Whether `f` accepts a 2d array of points at once.
+    executor : concurrent.futures.Executor, optional
+        Executor used to map `f` over the points if `batched` is False.
+
+    Returns
+    -------
+    ndarray
+        Function values, stacked along the first dimension.
+    """
+    func = partial(_call, f=f, args=args, kwargs=kwargs)
+    if not batched and executor is None:
+        points = iter(points)
+        first = np.asarray(func(next(points)))
+        # the first point may be an integer x, but the others are not
+        dtype = np.promote_types(first.dtype, float)
+        values = np.empty((n_points,) + first.shape, dtype=dtype)
+        values[0] = first
+        for k, point in enumerate(points, 1):
+            values[k] = func(point)
+        return values
+
+    points = iter(points)
+    values = []
+    remaining = n_points
+    while remaining > 0:
+        first = next(points)
+        chunksize = min(remaining, max(_MAX_CHUNK_ELEMENTS // max(first.size, 1), 1))
+        chunk = np.array([first, *islice(points, chunksize - 1)])
+        remaining -= chunksize
+        if batched:
+            chunk_values = np.asarray(f(chunk, *args, **kwargs))
+            if chunk_values.shape[:1] != chunk.shape[:1]:
+                raise ValueError(
+                    "f must return one value per row of points when batched is "
+                    "True"
+                )
+            values.append(chunk_values)
+        else:
+            values.append(np.array(list(executor.map(func, chunk))))
+    return np.concatenate(values)
+
+
+def approx_fprime(
+    x,
+    f,
+    epsilon=None,
+    args=(),
+    kwargs=None,
+    centered=False,
+    batched=False,
+    executor=None,
+):
     """
     Gradient of function, or Jacobian if function f returns 1d array
 
@@ -153,6 +245,14 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs=None, centered=False):
     centered : bool, optional
         Whether central difference should be returned. If not, does forward
         differencing.
+    batched : bool, optional
+        If True, `f` is called once with a 2d array that holds all points at
+        which the function is evaluated, one point per row, and must return
+        an array with the function values in the first dimension.
+    executor : concurrent.futures.Executor, optional
+        If provided and `batched` is False, the points are evaluated with
+        ``executor.map``. A process pool requires that `f` and `args` can be
+        pickled.
 
     Returns
     -------
@@ -167,26 +267,28 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs=None, centered=False):
     the Jacobian of the first observation would be [:, 0, :]
 
     """
+    x = np.asarray(x)
     n = len(x)
     kwargs = {} if kwargs is None else kwargs
-    f0 = f(*((x, *args)), **kwargs)
-    dim = np.atleast_1d(f0).shape  # it could be a scalar
-    grad = np.zeros((n, *dim), np.promote_types(float, x.dtype))
-    ei = np.zeros((n,), float)
     if not centered:
         epsilon = _get_epsilon(x, 2, epsilon, n)
-        for k in range(n):
-            ei[k] = epsilon[k]
-            grad[k, :] = (f(*((x + ei, *args)), **kwargs) - f0) / epsilon[k]
-            ei[k] = 0.0
+        points = chain([x], (x + e for e in np.diag(epsilon)))
+        values = _eval_points(f, points, n + 1, args, kwargs, batched, executor)
+        f0 = values[0]
+        dim = np.atleast_1d(f0).shape  # it could be a scalar
+        step = epsilon.reshape((n,) + (1,) * len(dim))
+        fdiff = values[1:].reshape((n, *dim)) - np.reshape(f0, dim)
     else:
         epsilon = _get_epsilon(x, 3, epsilon, n) / 2.0
-        for k in range(n):
-            ei[k] = epsilon[k]
-            grad[k, :] = (
-                f(*((x + ei, *args)), **kwargs) - f(*((x - ei, *args)), **kwargs)
-            ) / (2 * epsilon[k])
-            ei[k] = 0.0
+        ee = np.diag(epsilon)
+        points = chain((x + e for e in ee), (x - e for e in ee))
+        values = _eval_points(f, points, 2 * n, args, kwargs, batched, executor)
+        dim = np.atleast_1d(values[0]).shape
+        step = 2 * epsilon.reshape((n,) + (1,) * len(dim))
+        values = values.reshape((2, n, *dim))
+        fdiff = values[0] - values[1]
+    grad = np.zeros((n, *dim), np.promote_types(float, x.dtype))
+    grad[...] = fdiff / step
 
     if n == 1:
         return grad.T
@@ -241,7 +343,9 @@ def _approx_fprime_scalar(x, f, epsilon=None, args=(), kwargs=None, centered=Fal
     return grad
 
 
-def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs=None):
+def approx_fprime_cs(
+    x, f, epsilon=None, args=(), kwargs=None, batched=False, executor=None
+):
     """
     Calculate gradient or Jacobian with complex step derivative approximation
 
@@ -258,6 +362,15 @@ def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs=None):
         Tuple of additional arguments for function `f`.
     kwargs : dict, optional
         Dictionary of additional keyword arguments for function `f`.
+    batched : bool, optional
+        If True, `f` is called once with a 2d complex array that holds all
+        points at which the function is evaluated, one point per row, and
+        must return an array with the function values in the first
+        dimension.
+    executor : concurrent.futures.Executor, optional
+        If provided and `batched` is False, the points are evaluated with
+        ``executor.map``. A process pool requires that `f` and `args` can be
+        pickled.
 
     Returns
     -------
@@ -280,12 +393,14 @@ def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs=None):
 
     epsilon = _get_epsilon(x, 1, epsilon, n)
     increments = np.identity(n) * 1j * epsilon
-    # TODO: see if this can be vectorized, but usually dim is small
-    partials = [
-        f(x + ih, *args, **kwargs).imag / epsilon[i] for i, ih in enumerate(increments)
-    ]
+    points = (x + ih for ih in increments)
+    values = _eval_points(f, points, n, args, kwargs, batched, executor)
+    # align the stepsize of each point with the leading axis of the values
+    ndim_extra = values.ndim - epsilon.ndim
+    step = epsilon.reshape(epsilon.shape[:1] + (1,) * ndim_extra + epsilon.shape[1:])
+    partials = values.imag / step
 
-    return np.array(partials).T
+    return partials.T
 
 
 def _approx_fprime_cs_scalar(x, f, epsilon=None, args=(), kwargs=None):
@@ -406,26 +521,39 @@ def approx_hess_cs(x, f, epsilon=None, args=(), kwargs=None):
 """,
 )
 @Appender(_hessian_docs)
-def approx_hess1(x, f, epsilon=None, args=(), kwargs=None, return_grad=False):
+def approx_hess1(
+    x,
+    f,
+    epsilon=None,
+    args=(),
+    kwargs=None,
+    return_grad=False,
+    batched=False,
+    executor=None,
+):
     kwargs = {} if kwargs is None else kwargs
     n = len(x)
     h = _get_epsilon(x, 3, epsilon, n)
     ee = np.diag(h)
-
-    f0 = f(*((x, *args)), **kwargs)
-    # Compute forward step
-    g = np.zeros(n)
-    for i in range(n):
-        g[i] = f(*((x + ee[i, :], *args)), **kwargs)
+    idx_i, idx_j = np.triu_indices(n)
+
+    # evaluate at x, the forward steps and the "double" forward steps
+    n_points = 1 + n + len(idx_i)
+    points = chain(
+        [x],
+        (x + e for e in ee),
+        (x + ee[i] + ee[j] for i, j in zip(idx_i, idx_j, strict=True)),
+    )
+    values = _eval_points(f, points, n_points, args, kwargs, batched, executor)
+    values = values.reshape(n_points)
+    f0 = values[0]
+    g = values[1 : n + 1]
+    fpp = values[n + 1 :]
 
     hess = np.outer(h, h)  # this is now epsilon**2
-    # Compute "double" forward step
-    for i in range(n):
-        for j in range(i, n):
-            hess[i, j] = (
-                f(*((x + ee[i, :] + ee[j, :], *args)), **kwargs) - g[i] - g[j] + f0
-            ) / hess[i, j]
-            hess[j, i] = hess[i, j]
+    hess_upper = (fpp - g[idx_i] - g[idx_j] + f0) / hess[idx_i, idx_j]
+    hess[idx_i, idx_j] = hess_upper
+    hess[idx_j, idx_i] = hess_upper
     if return_grad:
         grad = (g - f0) / h
         return hess, grad
@@ -449,35 +577,47 @@ def approx_hess1(x, f, epsilon=None, args=(), kwargs=None, return_grad=False):
 """,
 )
 @Appender(_hessian_docs)
-def approx_hess2(x, f, epsilon=None, args=(), kwargs=None, return_grad=False):
+def approx_hess2(
+    x,
+    f,
+    epsilon=None,
+    args=(),
+    kwargs=None,
+    return_grad=False,
+    batched=False,
+    executor=None,
+):
     kwargs = {} if kwargs is None else kwargs
     n = len(x)
     # NOTE: ridout suggesting using eps**(1/4)*theta
     h = _get_epsilon(x, 3, epsilon, n)
     ee = np.diag(h)
-    f0 = f(*((x, *args)), **kwargs)
-    # Compute forward step
-    g = np.zeros(n)
-    gg = np.zeros(n)
-    for i in range(n):
-        g[i] = f(*((x + ee[i, :], *args)), **kwargs)
-        gg[i] = f(*((x - ee[i, :], *args)), **kwargs)
+    idx_i, idx_j = np.triu_indices(n)
+    n_pairs = len(idx_i)
+
+    # evaluate at x, the forward and backward steps and the "double" steps
+    n_points = 1 + 2 * n + 2 * n_pairs
+    points = chain(
+        [x],
+        (x + e for e in ee),
+        (x - e for e in ee),
+        (x + (ee[i] + ee[j]) for i, j in zip(idx_i, idx_j, strict=True)),
+        (x - (ee[i] + ee[j]) for i, j in zip(idx_i, idx_j, strict=True)),
+    )
+    values = _eval_points(f, points, n_points, args, kwargs, batched, executor)
+    values = values.reshape(n_points)
+    f0 = values[0]
+    g = values[1 : n + 1]
+    gg = values[n + 1 : 2 * n + 1]
+    fpp = values[2 * n + 1 : 2 * n + 1 + n_pairs]
+    fmm = values[2 * n + 1 + n_pairs :]
 
     hess = np.outer(h, h)  # this is now epsilon**2
-    # Compute "double" forward step
-    for i in range(n):
-        for j in range(i, n):
-            hess[i, j] = (
-                f(*((x + ee[i, :] + ee[j, :], *args)), **kwargs)
-                - g[i]
-                - g[j]
-                + f0
-                + f(*((x - ee[i, :] - ee[j, :], *args)), **kwargs)
-                - gg[i]
-                - gg[j]
-                + f0
-            ) / (2 * hess[i, j])
-            hess[j, i] = hess[i, j]
+    hess_upper = (fpp - g[idx_i] - g[idx_j] + f0 + fmm - gg[idx_i] - gg[idx_j] + f0) / (
+        2 * hess[idx_i, idx_j]
+    )
+    hess[idx_i, idx_j] = hess_upper
+    hess[idx_j, idx_i] = hess_upper
     if return_grad:
         grad = (g - f0) / h
         return hess, grad
@@ -496,32 +636,40 @@ def approx_hess2(x, f, epsilon=None, args=(), kwargs=None, return_grad=False):
                                                      - d[k]*e[k])))""",
 )
 @Appender(_hessian_docs)
-def approx_hess3(x, f, epsilon=None, args=(), kwargs=None):
+def approx_hess3(
+    x, f, epsilon=None, args=(), kwargs=None, batched=False, executor=None
+):
     kwargs = {} if kwargs is None else kwargs
     n = len(x)
     h = _get_epsilon(x, 4, epsilon, n)
     ee = np.diag(h)
     hess = np.outer(h, h)
-
-    for i in range(n):
-        for j in range(i, n):
-            hess[i, j] = np.squeeze(
-                (
-                    f(*((x + ee[i, :] + ee[j, :], *args)), **kwargs)
-                    - f(*((x + ee[i, :] - ee[j, :], *args)), **kwargs)
-                    - (
-                        f(*((x - ee[i, :] + ee[j, :], *args)), **kwargs)
-                        - f(*((x - ee[i, :] - ee[j, :], *args)), **kwargs)
-                    )
-                )
-                / (4.0 * hess[i, j])
-            )
-            hess[j, i] = hess[i, j]
+    idx_i, idx_j = np.triu_indices(n)
+
+    points = chain(
+        ((x + ee[i]) + ee[j] for i, j in zip(idx_i, idx_j, strict=True)),
+        ((x + ee[i]) - ee[j] for i, j in zip(idx_i, idx_j, strict=True)),
+        ((x - ee[i]) + ee[j] for i, j in zip(idx_i, idx_j, strict=True)),
+        ((x - ee[i]) - ee[j] for i, j in zip(idx_i, idx_j, strict=True)),
+    )
+    values = _eval_points(f, points, 4 * len(idx_i), args, kwargs, batched, executor)
+    fpp, fpm, fmp, fmm = values.reshape(4, len(idx_i))
+    hess_upper = (fpp - fpm - (fmp - fmm)) / (4.0 * hess[idx_i, idx_j])
+    hess[idx_i, idx_j] = hess_upper
+    hess[idx_j, idx_i] = hess_upper
     return hess
 
 
-def approx_hess(x, f, epsilon=None, args=(), kwargs=None):
-    return approx_hess3(x, f, epsilon=epsilon, args=args, kwargs=kwargs)
+def approx_hess(x, f, epsilon=None, args=(), kwargs=None, batched=False, executor=None):
+    return approx_hess3(
+        x,
+        f,
+        epsilon=epsilon,
+        args=args,
+        kwargs=kwargs,
+        batched=batched,
+        executor=executor,
+    )
 
 
 approx_hess.__doc__ = approx_hess3.__doc__ + "\n    This is an alias for approx_hess3"
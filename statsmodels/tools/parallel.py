@@ -11,12 +11,41 @@ changes for statsmodels (Josef Perktold)
 
 """
 
+import os
+
 from statsmodels.tools.sm_exceptions import (
     ModuleUnavailableWarning,
     module_unavailable_doc,
 )
 
 
+def _n_workers(n_jobs, n_tasks=None):
+    """
+    Number of threads or processes used for n_jobs
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        The requested number of jobs. None and 0 use one job, negative
+        values are relative to the number of CPUs, -1 uses all CPUs.
+    n_tasks : int, optional
+        The number of tasks. If given, at most one job per task is used.
+
+    Returns
+    -------
+    int
+        The number of workers, at least 1.
+    """
+    if n_jobs is None or n_jobs == 0:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    n_jobs = int(n_jobs)
+    if n_tasks is not None:
+        n_jobs = min(n_jobs, n_tasks)
+    return max(n_jobs, 1)
+
+
 def parallel_func(func, n_jobs, verbose=5):
     """
     Return parallel instance with delayed function
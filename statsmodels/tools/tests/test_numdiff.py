@@ -8,8 +8,12 @@ Should Hessian also work per observation, if fun returns 2d
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from numpy.testing import assert_allclose, assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal, assert_equal
+import pytest
+from scipy import optimize
 
 import statsmodels.api as sm
 from statsmodels.tools import numdiff
@@ -377,3 +381,114 @@ def test_approx_hess_matches_approx_hess3():
 
     x = np.array([1.0, 2.0, 3.0])
     assert_allclose(numdiff.approx_hess(x, fun), numdiff.approx_hess3(x, fun))
+
+
+def _loglike_logit(params, endog, exog):
+    linpred = exog @ params
+    return (endog * linpred - np.log1p(np.exp(linpred))).sum()
+
+
+def _loglike_logit_batched(params, endog, exog):
+    linpred = exog @ params.T
+    return (endog[:, None] * linpred - np.log1p(np.exp(linpred))).sum(0)
+
+
+def _loglikeobs_logit_batched(params, endog, exog):
+    linpred = exog @ params.T
+    return (endog[:, None] * linpred - np.log1p(np.exp(linpred))).T
+
+
+@pytest.fixture(scope="module")
+def logit_data():
+    rs = np.random.RandomState(987125)
+    exog = rs.standard_normal((300, 3))
+    endog = (rs.random_sample(300) < 0.5).astype(float)
+    params = np.array([0.2, -0.5, 1.0])
+    return params, (endog, exog)
+
+
+@pytest.mark.parametrize("centered", [True, False])
+def test_approx_fprime_batched(logit_data, centered):
+    params, args = logit_data
+    expected = approx_fprime(params, _loglike_logit, args=args, centered=centered)
+    batched = approx_fprime(
+        params, _loglike_logit_batched, args=args, centered=centered, batched=True
+    )
+    # the vectorized sums round differently, finite differences amplify this
+    assert_allclose(batched, expected, rtol=1e-5)
+    with ThreadPoolExecutor(2) as executor:
+        pooled = approx_fprime(
+            params, _loglike_logit, args=args, centered=centered, executor=executor
+        )
+    assert_equal(pooled, expected)
+
+    # Jacobian of observation-level values
+    def loglikeobs(params, endog, exog):
+        return _loglikeobs_logit_batched(params[None, :], endog, exog)[0]
+
+    expected = approx_fprime(params, loglikeobs, args=args, centered=centered)
+    batched = approx_fprime(
+        params, _loglikeobs_logit_batched, args=args, centered=centered, batched=True
+    )
+    assert_equal(batched.shape, (300, 3))
+    assert_allclose(batched, expected, rtol=1e-5, atol=1e-8)
+
+
+def test_approx_fprime_cs_batched(logit_data):
+    params, args = logit_data
+    expected = approx_fprime_cs(params, _loglike_logit, args=args)
+    batched = approx_fprime_cs(params, _loglike_logit_batched, args=args, batched=True)
+    assert_allclose(batched, expected, rtol=1e-12)
+
+
+def _rosen(x):
+    x = np.asarray(x)
+    return np.sum(
+        100.0 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2, axis=-1
+    )
+
+
+@pytest.mark.parametrize(
+    "approx_hess",
+    [numdiff.approx_hess1, numdiff.approx_hess2, numdiff.approx_hess3],
+)
+def test_approx_hess_batched(approx_hess):
+    x = np.array([0.8, 1.2, 0.9, 1.1])
+    hess_true = optimize.rosen_hess(x)
+
+    expected = approx_hess(x, _rosen)
+    assert_allclose(expected, hess_true, rtol=1e-4, atol=1e-2)
+    batched = approx_hess(x, _rosen, batched=True)
+    assert_allclose(batched, expected, rtol=1e-12)
+    with ThreadPoolExecutor(2) as executor:
+        pooled = approx_hess(x, _rosen, executor=executor)
+    assert_equal(pooled, expected)
+
+
+def test_approx_hess_batched_chunks(monkeypatch):
+    # points are stacked in chunks of at most _MAX_CHUNK_ELEMENTS elements
+    monkeypatch.setattr(numdiff, "_MAX_CHUNK_ELEMENTS", 12)
+    x = np.array([0.8, 1.2, 0.9, 1.1])
+    expected = numdiff.approx_hess3(x, _rosen)
+    sizes = []
+
+    def rosen(points):
+        sizes.append(points.shape[0])
+        return _rosen(points)
+
+    batched = numdiff.approx_hess3(x, rosen, batched=True)
+    assert_allclose(batched, expected, rtol=1e-12)
+    assert_equal(sizes, [3] * 13 + [1])
+    with ThreadPoolExecutor(2) as executor:
+        pooled = numdiff.approx_hess3(x, _rosen, executor=executor)
+    assert_equal(pooled, expected)
+
+
+def test_batched_wrong_shape(logit_data):
+    params, args = logit_data
+
+    def loglike_total(params, endog, exog):
+        return _loglike_logit_batched(params, endog, exog).sum()
+
+    with pytest.raises(ValueError, match="one value per row"):
+        approx_fprime(params, loglike_total, args=args, batched=True)
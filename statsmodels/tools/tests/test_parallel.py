@@ -1,10 +1,11 @@
 from math import sqrt
+import os
 import warnings
 
 from numpy import arange, testing
 import pytest
 
-from statsmodels.tools.parallel import parallel_func
+from statsmodels.tools.parallel import _n_workers, parallel_func
 
 
 @pytest.mark.joblib
@@ -16,3 +17,15 @@ def test_parallel():
         parallel, p_func, n_jobs = parallel_func(sqrt, n_jobs=-1, verbose=0)
         y = parallel(p_func(i**2) for i in range(10))
     testing.assert_equal(x, y)
+
+
+def test_n_workers():
+    n_cpus = os.cpu_count() or 1
+    assert _n_workers(None) == 1
+    assert _n_workers(0) == 1
+    assert _n_workers(3) == 3
+    assert _n_workers(-1) == n_cpus
+    assert _n_workers(-2) == max(n_cpus - 1, 1)
+    assert _n_workers(-1000) == 1
+    assert _n_workers(8, 3) == 3
+    assert _n_workers(4, 0) == 1
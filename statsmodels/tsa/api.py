@@ -69,56 +69,62 @@ __all__ = [
     "zivot_andrews"
 ]
 
-from statsmodels.graphics import tsaplots as graphics
+from statsmodels import _lazy
 
-from . import interp, stattools, tsatools, vector_ar as var
-from .ar_model import AR, AutoReg
-from .ardl import ARDL, UECM, ardl_select_order
-from .arima import api as arima
-from .arima.model import ARIMA
-from .arima_process import ArmaProcess, arma_generate_sample
-from .base import datetools
-from .exponential_smoothing.ets import ETSModel
-from .filters import api as filters, bk_filter, cf_filter, hp_filter
-from .filters.hamilton_filter import hamilton_filter
-from .forecasting.stl import STLForecast
-from .holtwinters import ExponentialSmoothing, Holt, SimpleExpSmoothing
-from .innovations import api as innovations
-from .regime_switching.markov_autoregression import MarkovAutoregression
-from .regime_switching.markov_regression import MarkovRegression
-from .seasonal import STL, seasonal_decompose
-from .statespace import api as statespace
-from .statespace.dynamic_factor import DynamicFactor
-from .statespace.dynamic_factor_mq import DynamicFactorMQ
-from .statespace.sarimax import SARIMAX
-from .statespace.structural import UnobservedComponents
-from .statespace.varmax import VARMAX
-from .stattools import (
-    acf,
-    acovf,
-    adfuller,
-    arma_order_select_ic,
-    bds,
-    block_jackknife,
-    breakvar_heteroskedasticity_test,
-    ccf,
-    ccovf,
-    coint,
-    diebold_mariano_test,
-    kpss,
-    leybourne,
-    pacf,
-    pacf_burg,
-    pacf_ols,
-    pacf_yw,
-    pccf,
-    q_stat,
-    range_unit_root_test,
-    zivot_andrews,
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "statsmodels.graphics": ["tsaplots as graphics"],
+        ".": ["interp", "stattools", "tsatools", "vector_ar as var"],
+        ".ar_model": ["AR", "AutoReg"],
+        ".ardl": ["ARDL", "UECM", "ardl_select_order"],
+        ".arima": ["api as arima"],
+        ".arima.model": ["ARIMA"],
+        ".arima_process": ["ArmaProcess", "arma_generate_sample"],
+        ".base": ["datetools"],
+        ".exponential_smoothing.ets": ["ETSModel"],
+        ".filters": ["api as filters", "bk_filter", "cf_filter", "hp_filter"],
+        ".filters.hamilton_filter": ["hamilton_filter"],
+        ".forecasting.stl": ["STLForecast"],
+        ".holtwinters": ["ExponentialSmoothing", "Holt", "SimpleExpSmoothing"],
+        ".innovations": ["api as innovations"],
+        ".regime_switching.markov_autoregression": ["MarkovAutoregression"],
+        ".regime_switching.markov_regression": ["MarkovRegression"],
+        ".seasonal": ["STL", "seasonal_decompose"],
+        ".statespace": ["api as statespace"],
+        ".statespace.dynamic_factor": ["DynamicFactor"],
+        ".statespace.dynamic_factor_mq": ["DynamicFactorMQ"],
+        ".statespace.sarimax": ["SARIMAX"],
+        ".statespace.structural": ["UnobservedComponents"],
+        ".statespace.varmax": ["VARMAX"],
+        ".stattools": [
+            "acf",
+            "acovf",
+            "adfuller",
+            "arma_order_select_ic",
+            "bds",
+            "block_jackknife",
+            "breakvar_heteroskedasticity_test",
+            "ccf",
+            "ccovf",
+            "coint",
+            "diebold_mariano_test",
+            "kpss",
+            "leybourne",
+            "pacf",
+            "pacf_burg",
+            "pacf_ols",
+            "pacf_yw",
+            "pccf",
+            "q_stat",
+            "range_unit_root_test",
+            "zivot_andrews",
+        ],
+        ".tsatools": ["add_lag", "add_trend", "detrend", "lagmat", "lagmat2ds"],
+        ".vector_ar.local_proj": ["LocalProjections"],
+        ".vector_ar.svar_model": ["SVAR"],
+        ".vector_ar.var_model": ["VAR"],
+        ".vector_ar.vecm": ["VECM"],
+        ".x13": ["x13_arima_analysis", "x13_arima_select_order"],
+    },
 )
-from .tsatools import add_lag, add_trend, detrend, lagmat, lagmat2ds
-from .vector_ar.local_proj import LocalProjections
-from .vector_ar.svar_model import SVAR
-from .vector_ar.var_model import VAR
-from .vector_ar.vecm import VECM
-from .x13 import x13_arima_analysis, x13_arima_select_order
@@ -1,3 +1,10 @@
 __all__ = ["ARIMA"]
 
-from statsmodels.tsa.arima.model import ARIMA
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "statsmodels.tsa.arima.model": ["ARIMA"],
+    },
+)
@@ -8,13 +8,21 @@ __all__ = [
            "miso_lfilter",
            "recursive_filter",
 ]
-from .bk_filter import bkfilter
-from .cf_filter import cffilter
-from .filtertools import (
-           CycleTrendResult,
-           convolution_filter,
-           miso_lfilter,
-           recursive_filter,
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".bk_filter": ["bkfilter"],
+        ".cf_filter": ["cffilter"],
+        ".filtertools": [
+            "CycleTrendResult",
+            "convolution_filter",
+            "miso_lfilter",
+            "recursive_filter",
+        ],
+        ".hamilton_filter": ["hamilton_filter"],
+        ".hp_filter": ["hpfilter"],
+    },
 )
-from .hamilton_filter import hamilton_filter
-from .hp_filter import hpfilter
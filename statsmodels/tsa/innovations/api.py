@@ -1,11 +1,3 @@
-from .arma_innovations import (
-    arma_innovations,
-    arma_loglike,
-    arma_loglikeobs,
-    arma_score,
-    arma_scoreobs,
-)
-
 __all__ = [
     "arma_innovations",
     "arma_loglike",
@@ -13,3 +5,18 @@ __all__ = [
     "arma_score",
     "arma_scoreobs",
 ]
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".arma_innovations": [
+            "arma_innovations",
+            "arma_loglike",
+            "arma_loglikeobs",
+            "arma_score",
+            "arma_scoreobs",
+        ],
+    },
+)
@@ -5,6 +5,7 @@ Author: Chad Fulton
 License: BSD-3
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 
 import numpy as np
@@ -16,21 +17,30 @@ import statsmodels.base.wrapper as wrap
 from statsmodels.tools._decorators import cache_readonly
 from statsmodels.tools.eval_measures import aic, bic, hqic
 from statsmodels.tools.numdiff import approx_fprime_cs, approx_hess_cs
+from statsmodels.tools.parallel import _n_workers
 from statsmodels.tools.rng_qrng import check_random_state
 from statsmodels.tools.sm_exceptions import EstimationWarning
 from statsmodels.tools.tools import Bunch, pinv_extended
 import statsmodels.tsa.base.tsa_model as tsbase
 from statsmodels.tsa.regime_switching._hamilton_filter import (
     chamilton_filter_log,
+    chamilton_filter_log_batch,
     dhamilton_filter_log,
+    dhamilton_filter_log_batch,
     shamilton_filter_log,
+    shamilton_filter_log_batch,
     zhamilton_filter_log,
+    zhamilton_filter_log_batch,
 )
 from statsmodels.tsa.regime_switching._kim_smoother import (
     ckim_smoother_log,
+    ckim_smoother_log_batch,
     dkim_smoother_log,
+    dkim_smoother_log_batch,
     skim_smoother_log,
+    skim_smoother_log_batch,
     zkim_smoother_log,
+    zkim_smoother_log_batch,
 )
 from statsmodels.tsa.statespace.tools import (
     _safe_cond,
@@ -52,6 +62,20 @@ prefix_kim_smoother_log_map = {
     "z": zkim_smoother_log,
 }
 
+prefix_hamilton_filter_log_batch_map = {
+    "s": shamilton_filter_log_batch,
+    "d": dhamilton_filter_log_batch,
+    "c": chamilton_filter_log_batch,
+    "z": zhamilton_filter_log_batch,
+}
+
+prefix_kim_smoother_log_batch_map = {
+    "s": skim_smoother_log_batch,
+    "d": dkim_smoother_log_batch,
+    "c": ckim_smoother_log_batch,
+    "z": zkim_smoother_log_batch,
+}
+
 
 def _logistic(x):
     """Note that this is not a vectorized function"""
@@ -337,6 +361,221 @@ def cy_kim_smoother_log(
     return smoothed_joint_probabilities, smoothed_marginal_probabilities
 
 
+def cy_hamilton_filter_log_batch(
+    initial_probabilities, regime_transition, conditional_loglikelihoods, model_order
+):
+    """
+    Hamilton filter in log space for many sets of parameters
+
+    Parameters
+    ----------
+    initial_probabilities : ndarray
+        Array of initial probabilities, shaped (nparams, k_regimes).
+    regime_transition : ndarray
+        Matrices of regime transition probabilities, shaped either
+        (nparams, k_regimes, k_regimes, 1) or if there are time-varying
+        transition probabilities (nparams, k_regimes, k_regimes,
+        nobs + order).
+    conditional_loglikelihoods : ndarray
+        Array of loglikelihoods conditional on the last `order+1` regimes,
+        shaped (nparams,) + (k_regimes,)*(order + 1) + (nobs,).
+    model_order : int
+        The order of the model, used to determine the appropriate subset
+        of the `regime_transition` array to use in the recursions.
+
+    Returns
+    -------
+    tuple
+        The output of `cy_hamilton_filter_log`, with each array stacked
+        along a new leading dimension of length nparams.
+
+    See Also
+    --------
+    cy_hamilton_filter_log
+
+    Notes
+    -----
+    The filters for all of the sets of parameters are applied in a single
+    call to the Cython inner loop, which does not hold the GIL.
+    """
+
+    # Dimensions
+    nparams, k_regimes = initial_probabilities.shape
+    nobs = conditional_loglikelihoods.shape[-1]
+    order = conditional_loglikelihoods.ndim - 3
+    dtype = conditional_loglikelihoods.dtype
+
+    # Check for compatible shapes.
+    incompatible_shapes = (
+        regime_transition.shape[-1] not in (1, nobs + model_order)
+        or regime_transition.shape[:3] != (nparams, k_regimes, k_regimes)
+        or conditional_loglikelihoods.shape[:2] != (nparams, k_regimes)
+    )
+    if incompatible_shapes:
+        raise ValueError("Arguments do not have compatible shapes")
+
+    # Convert to log space
+    initial_probabilities = np.log(initial_probabilities)
+    regime_transition = np.log(np.maximum(regime_transition, 1e-20))
+
+    # Storage
+    k_joint = k_regimes ** (order + 1)
+    shape = (nparams,) + (k_regimes,) * (order + 1)
+    predicted_joint_probabilities = np.zeros(shape + (nobs,), dtype=dtype)
+    joint_loglikelihoods = np.zeros((nparams, nobs), dtype)
+    filtered_joint_probabilities = np.zeros(shape + (nobs + 1,), dtype=dtype)
+
+    # Initial probabilities
+    tmp = np.copy(initial_probabilities)
+    transition_t = 0
+    for i in range(order):
+        if regime_transition.shape[-1] > 1:
+            transition_t = i
+        tmp = (
+            np.reshape(
+                regime_transition[..., transition_t],
+                (nparams, k_regimes, k_regimes) + (1,) * i,
+            )
+            + tmp[:, None]
+        )
+    filtered_joint_probabilities[..., 0] = tmp
+
+    # Get appropriate subset of transition matrix
+    if regime_transition.shape[-1] > 1:
+        regime_transition = regime_transition[..., model_order:]
+
+    # Run Cython filter iterations
+    prefix, dtype, _ = find_best_blas_type(
+        (
+            regime_transition,
+            conditional_loglikelihoods,
+            joint_loglikelihoods,
+            predicted_joint_probabilities,
+            filtered_joint_probabilities,
+        )
+    )
+    func = prefix_hamilton_filter_log_batch_map[prefix]
+    func(
+        nobs,
+        k_regimes,
+        order,
+        np.ascontiguousarray(regime_transition),
+        np.ascontiguousarray(conditional_loglikelihoods).reshape(
+            nparams, k_joint, nobs
+        ),
+        joint_loglikelihoods,
+        predicted_joint_probabilities.reshape(nparams, k_joint, nobs),
+        filtered_joint_probabilities.reshape(nparams, k_joint, nobs + 1),
+    )
+
+    # Save log versions for smoother
+    predicted_joint_probabilities_log = predicted_joint_probabilities
+    filtered_joint_probabilities_log = filtered_joint_probabilities
+
+    # Convert out of log scale
+    predicted_joint_probabilities = np.exp(predicted_joint_probabilities)
+    filtered_joint_probabilities = np.exp(filtered_joint_probabilities)
+
+    # S_t | t
+    filtered_marginal_probabilities = filtered_joint_probabilities[..., 1:]
+    for _ in range(order):
+        filtered_marginal_probabilities = np.sum(
+            filtered_marginal_probabilities, axis=-2
+        )
+
+    return (
+        filtered_marginal_probabilities,
+        predicted_joint_probabilities,
+        joint_loglikelihoods,
+        filtered_joint_probabilities[..., 1:],
+        predicted_joint_probabilities_log,
+        filtered_joint_probabilities_log[..., 1:],
+    )
+
+
+def cy_kim_smoother_log_batch(
+    regime_transition, predicted_joint_probabilities, filtered_joint_probabilities
+):
+    """
+    Kim smoother in log space for many sets of parameters
+
+    Parameters
+    ----------
+    regime_transition : ndarray
+        Matrices of regime transition probabilities, shaped either
+        (nparams, k_regimes, k_regimes, 1) or if there are time-varying
+        transition probabilities (nparams, k_regimes, k_regimes, nobs).
+    predicted_joint_probabilities : ndarray
+        Array of logged predicted joint probabilities, shaped
+        (nparams,) + (k_regimes,) * (order + 1) + (nobs,).
+    filtered_joint_probabilities : ndarray
+        Array of logged filtered joint probabilities, shaped
+        (nparams,) + (k_regimes,) * (order + 1) + (nobs,).
+
+    Returns
+    -------
+    smoothed_joint_probabilities : ndarray
+        Shaped (nparams,) + (k_regimes,) * (order + 1) + (nobs,).
+    smoothed_marginal_probabilities : ndarray
+        Shaped (nparams, k_regimes, nobs).
+
+    See Also
+    --------
+    cy_kim_smoother_log
+    """
+
+    # Dimensions
+    nparams, k_regimes = filtered_joint_probabilities.shape[:2]
+    nobs = filtered_joint_probabilities.shape[-1]
+    order = filtered_joint_probabilities.ndim - 3
+    dtype = filtered_joint_probabilities.dtype
+    k_joint = k_regimes ** (order + 1)
+
+    # Storage
+    smoothed_joint_probabilities = np.zeros(
+        filtered_joint_probabilities.shape, dtype=dtype
+    )
+
+    # Get appropriate subset of transition matrix
+    if regime_transition.shape[-1] == nobs + order:
+        regime_transition = regime_transition[..., order:]
+
+    # Convert to log space
+    regime_transition = np.log(np.maximum(regime_transition, 1e-20))
+
+    # Run Cython smoother iterations
+    prefix, dtype, _ = find_best_blas_type(
+        (regime_transition, predicted_joint_probabilities, filtered_joint_probabilities)
+    )
+    func = prefix_kim_smoother_log_batch_map[prefix]
+    func(
+        nobs,
+        k_regimes,
+        order,
+        np.ascontiguousarray(regime_transition),
+        np.ascontiguousarray(predicted_joint_probabilities).reshape(
+            nparams, k_joint, nobs
+        ),
+        np.ascontiguousarray(filtered_joint_probabilities).reshape(
+            nparams, k_joint, nobs
+        ),
+        smoothed_joint_probabilities.reshape(nparams, k_joint, nobs),
+    )
+
+    # Convert back from log space
+    smoothed_joint_probabilities = np.exp(smoothed_joint_probabilities)
+
+    # Get smoothed marginal probabilities S_t | T by integrating out
+    # S_{t-k+1}, S_{t-k+2}, ..., S_{t-1}
+    smoothed_marginal_probabilities = smoothed_joint_probabilities
+    for _ in range(order):
+        smoothed_marginal_probabilities = np.sum(
+            smoothed_marginal_probabilities, axis=-2
+        )
+
+    return smoothed_joint_probabilities, smoothed_marginal_probabilities
+
+
 class MarkovSwitchingParams:
     """
     Class to hold parameters in Markov switching models
@@ -881,6 +1120,33 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
             self.order,
         )
 
+    def _filter_many(self, params):
+        # Stack the inputs to the filter for each set of parameters
+        regime_transition = np.array(
+            [self.regime_transition_matrix(p) for p in params]
+        )
+        initial_probabilities = np.array(
+            [
+                self.initial_probabilities(p, regime_transition[i])
+                for i, p in enumerate(params)
+            ]
+        )
+        conditional_loglikelihoods = np.array(
+            [self._conditional_loglikelihoods(p) for p in params]
+        )
+
+        # Apply the batched filter
+        return (
+            regime_transition,
+            initial_probabilities,
+            conditional_loglikelihoods,
+        ) + cy_hamilton_filter_log_batch(
+            initial_probabilities,
+            regime_transition,
+            conditional_loglikelihoods,
+            self.order,
+        )
+
     def filter(
         self,
         params,
@@ -1127,6 +1393,53 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
         """
         return np.sum(self.loglikeobs(params, transformed))
 
+    def loglike_many(self, params, transformed=True, n_jobs=1):
+        """
+        Loglikelihood evaluation at many sets of parameters
+
+        Parameters
+        ----------
+        params : array_like
+            The sets of parameters, (nparams, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        n_jobs : int, optional
+            The number of threads among which the sets of parameters are
+            split. Negative values are relative to the number of CPUs.
+            Default is 1.
+
+        Returns
+        -------
+        ndarray
+            The loglikelihood for each set of parameters, (nparams,).
+
+        See Also
+        --------
+        loglike
+
+        Notes
+        -----
+        The Hamilton filter is applied to all of the sets of parameters
+        assigned to a thread in a single call to the Cython inner loop, which
+        does not hold the GIL.
+        """
+        params = np.array(params, ndmin=2)
+
+        if not transformed:
+            params = np.array([self.transform_params(p) for p in params])
+
+        n_workers = _n_workers(n_jobs, len(params))
+        if n_workers == 1:
+            loglikeobs = self._filter_many(params)[5]
+        else:
+            chunks = np.array_split(params, n_workers)
+            with ThreadPoolExecutor(n_workers) as executor:
+                loglikeobs = np.concatenate(
+                    [out[5] for out in executor.map(self._filter_many, chunks)]
+                )
+
+        return np.sum(loglikeobs, axis=-1)
+
     def score(self, params, transformed=True):
         """
         Compute the score function at params
@@ -1193,6 +1506,7 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
         search_iter=5,
         search_scale=1.0,
         rng=None,
+        n_jobs=1,
         **kwargs,
     ):
         """
@@ -1261,6 +1575,11 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
             of ints, a new ``Generator`` is created, seeded with `rng`. If
             `rng` is already a ``Generator`` or ``RandomState`` instance,
             that instance is used.
+        n_jobs : int, optional
+            The number of threads among which the random start parameter
+            search repetitions are split. Negative values are relative to the
+            number of CPUs. The selected start parameters do not depend on
+            `n_jobs`. Default is 1.
         **kwargs
             Additional keyword arguments to pass to the optimizer.
 
@@ -1284,6 +1603,7 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
                 em_iter=search_iter,
                 scale=search_scale,
                 rng=rng,
+                n_jobs=n_jobs,
             )
             transformed = True
 
@@ -1501,6 +1821,7 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
         em_iter=5,
         scale=1.0,
         rng=None,
+        n_jobs=1,
     ):
         """
         Search for starting parameters as random permutations of a vector
@@ -1527,11 +1848,21 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
             of ints, a new ``Generator`` is created, seeded with `rng`. If
             `rng` is already a ``Generator`` or ``RandomState`` instance,
             that instance is used.
+        n_jobs : int, optional
+            The number of threads among which the random permutations are
+            split. Negative values are relative to the number of CPUs.
+            Default is 1.
 
         Notes
         -----
         This is a private method for finding good starting parameters for MLE
         by scoring, where the defaults have been set heuristically.
+
+        All of the random permutations are drawn before the EM iterations are
+        applied, and the permutations are then scored together with
+        `loglike_many`, so that the result does not depend on `n_jobs`. If
+        that fails, they are scored one at a time and the permutations whose
+        log-likelihood cannot be computed are skipped.
         """
         if start_params is None:
             start_params = self.start_params
@@ -1560,26 +1891,53 @@ class MarkovSwitching(tsbase.TimeSeriesModel):
         for i in range(self.k_params):
             variates[:, i] = scale[i] * rng.uniform(-0.5, 0.5, size=reps)
 
+        def search(variates):
+            try:
+                return self._fit_em(
+                    start_params + variates,
+                    transformed=False,
+                    maxiter=em_iter,
+                    return_params=True,
+                )
+            except Exception:  # FIXME: catch something specific
+                return None
+
+        # Errors of candidates for which the log-likelihood or the
+        # untransformed parameters cannot be computed
+        errors = (np.linalg.LinAlgError, ValueError, FloatingPointError)
+
+        def score(params):
+            try:
+                return self.loglike(params)
+            except errors:
+                return np.nan
+
         llf = self.loglike(start_params, transformed=False)
         params = start_params
-        for i in range(reps):
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
 
-                try:
-                    proposed_params = self._fit_em(
-                        start_params + variates[i],
-                        transformed=False,
-                        maxiter=em_iter,
-                        return_params=True,
-                    )
-                    proposed_llf = self.loglike(proposed_params)
+            n_workers = _n_workers(n_jobs, reps)
+            if n_workers == 1:
+                proposed = [search(v) for v in variates]
+            else:
+                with ThreadPoolExecutor(n_workers) as executor:
+                    proposed = list(executor.map(search, variates))
+            proposed = [p for p in proposed if p is not None]
 
-                    if proposed_llf > llf:
-                        llf = proposed_llf
-                        params = self.untransform_params(proposed_params)
-                except Exception:  # FIXME: catch something specific
-                    pass
+            if len(proposed) > 0:
+                try:
+                    proposed_llf = self.loglike_many(proposed)
+                except errors:
+                    # Score one at a time, skipping only the failing ones
+                    proposed_llf = np.array([score(p) for p in proposed])
+                proposed_llf[np.isnan(proposed_llf)] = -np.inf
+                i = np.argmax(proposed_llf)
+                if proposed_llf[i] > llf:
+                    try:
+                        params = self.untransform_params(proposed[i])
+                    except errors:
+                        pass
 
         # Return transformed parameters
         return self.transform_params(params)
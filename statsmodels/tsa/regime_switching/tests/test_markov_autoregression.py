@@ -13,7 +13,10 @@ import pandas as pd
 import pytest
 
 from statsmodels.tools import add_constant
-from statsmodels.tsa.regime_switching import markov_autoregression
+from statsmodels.tsa.regime_switching import (
+    markov_autoregression,
+    markov_switching,
+)
 
 current_path = Path(__file__).resolve().parent
 
@@ -901,3 +904,89 @@ class TestFilardoPandas(MarkovAutoregression):
         assert_allclose(self.result.expected_durations,
                         self.mar_filardo[["duration0", "duration1"]].iloc[5:],
                         rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("tvtp", [False, True])
+def test_batch_filter_smoother(tvtp):
+    if tvtp:
+        mod = markov_autoregression.MarkovAutoregression(
+            rgnp, k_regimes=2, order=1,
+            exog_tvtp=np.c_[np.ones(len(rgnp)), rec])
+        params = np.r_[6.564923, 7.846371, -8.064123, -15.37636,
+                       1.027190, -0.719760, np.exp(-0.217003)**2,
+                       0.161489, 0.022536]
+    else:
+        mod = markov_autoregression.MarkovAutoregression(
+            rgnp, k_regimes=2, order=4, switching_ar=False)
+        params = np.r_[0.754673, 0.095915, -0.358811, 1.163516,
+                       np.exp(-0.262658)**2, 0.013486, -0.057521,
+                       -0.246983, -0.212923]
+    rs = np.random.RandomState(1234)
+    params = np.array([mod.transform_params(
+        mod.untransform_params(params) + 0.1 * rs.standard_normal(len(params)))
+        for _ in range(5)])
+
+    out = mod._filter_many(params)
+    smoothed = markov_switching.cy_kim_smoother_log_batch(
+        out[0], out[7], out[8])
+    for i in range(len(params)):
+        res = mod.smooth(params[i], return_raw=True)
+        assert_allclose(out[3][i], res.filtered_marginal_probabilities)
+        assert_allclose(out[5][i], res.joint_loglikelihoods)
+        assert_allclose(out[6][i], res.filtered_joint_probabilities)
+        assert_allclose(smoothed[0][i], res.smoothed_joint_probabilities)
+        assert_allclose(smoothed[1][i], res.smoothed_marginal_probabilities)
+
+    desired = [mod.loglike(p) for p in params]
+    assert_allclose(mod.loglike_many(params), desired)
+    assert_allclose(mod.loglike_many(params, n_jobs=2), desired)
+    assert_allclose(
+        mod.loglike_many([mod.untransform_params(p) for p in params],
+                         transformed=False), desired)
+
+
+def test_start_params_search_n_jobs():
+    mod = markov_autoregression.MarkovAutoregression(
+        rgnp, k_regimes=2, order=4, switching_ar=False)
+    desired = mod._start_params_search(
+        10, em_iter=2, rng=np.random.RandomState(1234))
+    actual = mod._start_params_search(
+        10, em_iter=2, rng=np.random.RandomState(1234), n_jobs=3)
+    assert_equal(actual, desired)
+    assert mod.loglike(actual) > mod.loglike(mod.start_params)
+
+    res = mod.fit(search_reps=4, rng=np.random.RandomState(1234), n_jobs=2,
+                  return_params=True)
+    desired = mod.fit(search_reps=4, rng=np.random.RandomState(1234),
+                      return_params=True)
+    assert_equal(res, desired)
+
+
+def test_start_params_search_failing_candidate(monkeypatch):
+    mod = markov_autoregression.MarkovAutoregression(
+        rgnp, k_regimes=2, order=4, switching_ar=False)
+    desired = mod._start_params_search(
+        10, em_iter=2, rng=np.random.RandomState(1234))
+
+    def loglike_many(params, transformed=True, n_jobs=1):
+        raise ValueError("batched evaluation failed")
+
+    # falls back to scoring the candidates one at a time
+    monkeypatch.setattr(mod, "loglike_many", loglike_many)
+    actual = mod._start_params_search(
+        10, em_iter=2, rng=np.random.RandomState(1234))
+    assert_allclose(actual, desired)
+
+    # only the failing candidate is skipped
+    loglike = mod.loglike
+
+    def loglike_failing(params, *args, **kwargs):
+        if np.allclose(params, desired):
+            raise ValueError("candidate failed")
+        return loglike(params, *args, **kwargs)
+
+    monkeypatch.setattr(mod, "loglike", loglike_failing)
+    actual = mod._start_params_search(
+        10, em_iter=2, rng=np.random.RandomState(1234))
+    assert not np.allclose(actual, desired)
+    assert loglike(actual) > loglike(mod.start_params)
@@ -0,0 +1,30 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Square-root Kalman Filter declarations
+
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+
+from statsmodels.tsa.statespace._kalman_filter cimport (
+    dKalmanFilter,
+    sKalmanFilter,
+)
+from statsmodels.tsa.statespace._representation cimport (
+    dStatespace,
+    sStatespace,
+)
+
+
+# Single precision
+cdef int sforecast_square_root(sKalmanFilter kfilter, sStatespace model)
+cdef int supdating_square_root(sKalmanFilter kfilter, sStatespace model)
+cdef int sprediction_square_root(sKalmanFilter kfilter, sStatespace model)
+
+# Double precision
+cdef int dforecast_square_root(dKalmanFilter kfilter, dStatespace model)
+cdef int dupdating_square_root(dKalmanFilter kfilter, dStatespace model)
+cdef int dprediction_square_root(dKalmanFilter kfilter, dStatespace model)
@@ -94,7 +94,7 @@ cdef class sKalmanFilter(object):
     cdef public int [:] univariate_filter
 
     # ### Kalman filter properties
-    cdef readonly np.float32_t [:] loglikelihood, scale
+    cdef readonly np.float64_t [:] loglikelihood, scale
     cdef readonly np.float32_t [::1,:] filtered_state, predicted_state, forecast, forecast_error, standardized_forecast_error
     cdef readonly np.float32_t [::1,:,:] filtered_state_cov, predicted_state_cov, forecast_error_cov, predicted_diffuse_state_cov, forecast_error_diffuse_cov, M, M_inf
     cdef readonly np.float32_t [::1,:,:] kalman_gain
@@ -119,6 +119,12 @@ cdef class sKalmanFilter(object):
 
     cdef readonly np.float32_t [::1,:] CW, CtmpW, CMW, CM, CprevFiZ, CtmpM, CMWZ
 
+    # Arrays for the square-root filter
+    cdef readonly np.float32_t [::1,:] sqrt_state_cov, sqrt_state_cov_source
+    cdef readonly np.float32_t [::1,:] sqrt_filtered_state_cov, sqrt_filtered_state_cov_source
+    cdef readonly np.float32_t [:] sqrt_prearray, sqrt_tau, sqrt_work, sqrt_tmp
+    cdef readonly blas_int [:] sqrt_ipiv
+
 
     cdef readonly np.float32_t determinant
 
@@ -154,8 +160,8 @@ cdef class sKalmanFilter(object):
     cdef np.float32_t * _M_inf
 
     cdef np.float32_t * _kalman_gain
-    cdef np.float32_t * _loglikelihood
-    cdef np.float32_t * _scale
+    cdef np.float64_t * _loglikelihood
+    cdef np.float64_t * _scale
 
     cdef np.float32_t * _converged_forecast_error_cov
     cdef np.float32_t * _converged_filtered_state_cov
@@ -274,6 +280,12 @@ cdef class dKalmanFilter(object):
 
     cdef readonly np.float64_t [::1,:] CW, CtmpW, CMW, CM, CprevFiZ, CtmpM, CMWZ
 
+    # Arrays for the square-root filter
+    cdef readonly np.float64_t [::1,:] sqrt_state_cov, sqrt_state_cov_source
+    cdef readonly np.float64_t [::1,:] sqrt_filtered_state_cov, sqrt_filtered_state_cov_source
+    cdef readonly np.float64_t [:] sqrt_prearray, sqrt_tau, sqrt_work, sqrt_tmp
+    cdef readonly blas_int [:] sqrt_ipiv
+
     cdef readonly np.float64_t determinant
 
     # ### Pointers to current-iteration arrays
@@ -403,7 +415,7 @@ cdef class cKalmanFilter(object):
     cdef public int [:] univariate_filter
 
     # ### Kalman filter properties
-    cdef readonly np.complex64_t [:] loglikelihood, scale
+    cdef readonly np.complex128_t [:] loglikelihood, scale
     cdef readonly np.complex64_t [::1,:] filtered_state, predicted_state, forecast, forecast_error, standardized_forecast_error
     cdef readonly np.complex64_t [::1,:,:] filtered_state_cov, predicted_state_cov, forecast_error_cov, predicted_diffuse_state_cov, forecast_error_diffuse_cov, M, M_inf
     cdef readonly np.complex64_t [::1,:,:] kalman_gain
@@ -428,6 +440,12 @@ cdef class cKalmanFilter(object):
 
     cdef readonly np.complex64_t [::1,:] CW, CtmpW, CMW, CM, CprevFiZ, CtmpM, CMWZ
 
+    # Arrays for the square-root filter
+    cdef readonly np.complex64_t [::1,:] sqrt_state_cov, sqrt_state_cov_source
+    cdef readonly np.complex64_t [::1,:] sqrt_filtered_state_cov, sqrt_filtered_state_cov_source
+    cdef readonly np.complex64_t [:] sqrt_prearray, sqrt_tau, sqrt_work, sqrt_tmp
+    cdef readonly blas_int [:] sqrt_ipiv
+
 
     cdef readonly np.complex64_t determinant
 
@@ -463,8 +481,8 @@ cdef class cKalmanFilter(object):
     cdef np.complex64_t * _M_inf
 
     cdef np.complex64_t * _kalman_gain
-    cdef np.complex64_t * _loglikelihood
-    cdef np.complex64_t * _scale
+    cdef np.complex128_t * _loglikelihood
+    cdef np.complex128_t * _scale
 
     cdef np.complex64_t * _converged_forecast_error_cov
     cdef np.complex64_t * _converged_filtered_state_cov
@@ -583,6 +601,12 @@ cdef class zKalmanFilter(object):
 
     cdef readonly np.complex128_t [::1,:] CW, CtmpW, CMW, CM, CprevFiZ, CtmpM, CMWZ
 
+    # Arrays for the square-root filter
+    cdef readonly np.complex128_t [::1,:] sqrt_state_cov, sqrt_state_cov_source
+    cdef readonly np.complex128_t [::1,:] sqrt_filtered_state_cov, sqrt_filtered_state_cov_source
+    cdef readonly np.complex128_t [:] sqrt_prearray, sqrt_tau, sqrt_work, sqrt_tmp
+    cdef readonly blas_int [:] sqrt_ipiv
+
 
     cdef readonly np.complex128_t determinant
 
@@ -20,6 +20,22 @@ cdef int SMOOTH_CLASSICAL
 cdef int SMOOTH_ALTERNATIVE
 cdef int SMOOTH_UNIVARIATE
 
+cdef int SMOOTHER_MEMORY_STORE_ALL
+cdef int SMOOTHER_MEMORY_NO_COV
+cdef int SMOOTHER_MEMORY_COV_DIAGONAL
+cdef int SMOOTHER_MEMORY_NO_ESTIMATOR
+cdef int SMOOTHER_MEMORY_CONSERVE
+
+
+cdef inline int _ring_index(int t, int ring) noexcept nogil:
+    # Index of period t in an array that stores either all periods or, if
+    # `ring` is true, only the three periods used by a backwards recursion
+    # (the input period t+1, the current period t and, for the univariate
+    # smoother, the output period t-1)
+    if ring:
+        return t % 3
+    return t
+
 # Typical imports
 
 cimport numpy as np
@@ -50,6 +66,7 @@ cdef class sKalmanSmoother(object):
     cdef readonly int smooth_method
     cdef readonly int _smooth_method
     cdef readonly int filter_method
+    cdef readonly int smoother_conserve_memory
 
     cdef readonly np.float32_t [::1,:] scaled_smoothed_estimator
     cdef readonly np.float32_t [::1,:,:] scaled_smoothed_estimator_cov
@@ -60,6 +77,7 @@ cdef class sKalmanSmoother(object):
     cdef readonly np.float32_t [::1,:] smoothed_state_disturbance
     cdef readonly np.float32_t [::1,:,:] smoothed_measurement_disturbance_cov
     cdef readonly np.float32_t [::1,:,:] smoothed_state_disturbance_cov
+    cdef readonly np.float32_t [::1,:] smoothed_state_var, smoothed_measurement_disturbance_var, smoothed_state_disturbance_var
 
     cdef readonly np.float32_t [::1,:,:] smoothed_state_autocov, innovations_transition
     cdef readonly np.float32_t [::1,:] tmp_autocov
@@ -142,6 +160,7 @@ cdef class sKalmanSmoother(object):
     cdef int check_filter_method_changed(self)
     cdef int reset_filter_method(self, int force_reset=*)
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
+    cpdef set_smoother_conserve_memory(self, int smoother_conserve_memory, int force_reset=*)
     cpdef set_smooth_method(self, int smooth_method)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
@@ -163,6 +182,7 @@ cdef class dKalmanSmoother(object):
     cdef readonly int smooth_method
     cdef readonly int _smooth_method
     cdef readonly int filter_method
+    cdef readonly int smoother_conserve_memory
 
     cdef readonly np.float64_t [::1,:] scaled_smoothed_estimator
     cdef readonly np.float64_t [::1,:,:] scaled_smoothed_estimator_cov
@@ -173,6 +193,7 @@ cdef class dKalmanSmoother(object):
     cdef readonly np.float64_t [::1,:] smoothed_state_disturbance
     cdef readonly np.float64_t [::1,:,:] smoothed_measurement_disturbance_cov
     cdef readonly np.float64_t [::1,:,:] smoothed_state_disturbance_cov
+    cdef readonly np.float64_t [::1,:] smoothed_state_var, smoothed_measurement_disturbance_var, smoothed_state_disturbance_var
 
     cdef readonly np.float64_t [::1,:,:] smoothed_state_autocov, innovations_transition
     cdef readonly np.float64_t [::1,:] tmp_autocov
@@ -255,6 +276,7 @@ cdef class dKalmanSmoother(object):
     cdef int check_filter_method_changed(self)
     cdef int reset_filter_method(self, int force_reset=*)
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
+    cpdef set_smoother_conserve_memory(self, int smoother_conserve_memory, int force_reset=*)
     cpdef set_smooth_method(self, int smooth_method)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
@@ -276,6 +298,7 @@ cdef class cKalmanSmoother(object):
     cdef readonly int smooth_method
     cdef readonly int _smooth_method
     cdef readonly int filter_method
+    cdef readonly int smoother_conserve_memory
 
     cdef readonly np.complex64_t [::1,:] scaled_smoothed_estimator
     cdef readonly np.complex64_t [::1,:,:] scaled_smoothed_estimator_cov
@@ -286,6 +309,7 @@ cdef class cKalmanSmoother(object):
     cdef readonly np.complex64_t [::1,:] smoothed_state_disturbance
     cdef readonly np.complex64_t [::1,:,:] smoothed_measurement_disturbance_cov
     cdef readonly np.complex64_t [::1,:,:] smoothed_state_disturbance_cov
+    cdef readonly np.complex64_t [::1,:] smoothed_state_var, smoothed_measurement_disturbance_var, smoothed_state_disturbance_var
 
     cdef readonly np.complex64_t [::1,:,:] smoothed_state_autocov, innovations_transition
     cdef readonly np.complex64_t [::1,:] tmp_autocov
@@ -368,6 +392,7 @@ cdef class cKalmanSmoother(object):
     cdef int check_filter_method_changed(self)
     cdef int reset_filter_method(self, int force_reset=*)
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
+    cpdef set_smoother_conserve_memory(self, int smoother_conserve_memory, int force_reset=*)
     cpdef set_smooth_method(self, int smooth_method)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
@@ -389,6 +414,7 @@ cdef class zKalmanSmoother(object):
     cdef readonly int smooth_method
     cdef readonly int _smooth_method
     cdef readonly int filter_method
+    cdef readonly int smoother_conserve_memory
 
     cdef readonly np.complex128_t [::1,:] scaled_smoothed_estimator
     cdef readonly np.complex128_t [::1,:,:] scaled_smoothed_estimator_cov
@@ -399,6 +425,7 @@ cdef class zKalmanSmoother(object):
     cdef readonly np.complex128_t [::1,:] smoothed_state_disturbance
     cdef readonly np.complex128_t [::1,:,:] smoothed_measurement_disturbance_cov
     cdef readonly np.complex128_t [::1,:,:] smoothed_state_disturbance_cov
+    cdef readonly np.complex128_t [::1,:] smoothed_state_var, smoothed_measurement_disturbance_var, smoothed_state_disturbance_var
 
     cdef readonly np.complex128_t [::1,:,:] smoothed_state_autocov, innovations_transition
     cdef readonly np.complex128_t [::1,:] tmp_autocov
@@ -481,6 +508,7 @@ cdef class zKalmanSmoother(object):
     cdef int check_filter_method_changed(self)
     cdef int reset_filter_method(self, int force_reset=*)
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
+    cpdef set_smoother_conserve_memory(self, int smoother_conserve_memory, int force_reset=*)
     cpdef set_smooth_method(self, int smooth_method)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
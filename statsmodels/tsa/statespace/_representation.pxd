@@ -32,6 +32,9 @@ cdef class sStatespace(object):
     cdef readonly int _diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition, identity_transition
+    cdef public int sparse_transition
+    cdef public int [:] transition_indptr, transition_indices
+    cdef public np.float32_t [:] transition_data
 
     # Temporary arrays
     cdef np.float32_t [::1,:] tmp
@@ -87,6 +90,9 @@ cdef class sStatespace(object):
     cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse, unsigned int reset=*) except *
     cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
     cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
+    cdef void sparse_transition_state(self, int transpose, np.float32_t * x, np.float32_t * y)
+    cdef void sparse_transition_left(self, int transpose, int n, np.float32_t * a, int lda, np.float32_t * b, int ldb)
+    cdef void sparse_transition_right(self, int transpose, int n, np.float32_t * a, int lda, np.float32_t * b, int ldb)
 
 cdef class dStatespace(object):
     # Statespace dimensions
@@ -109,6 +115,9 @@ cdef class dStatespace(object):
     cdef readonly int _diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition, identity_transition
+    cdef public int sparse_transition
+    cdef public int [:] transition_indptr, transition_indices
+    cdef public np.float64_t [:] transition_data
 
     # Temporary arrays
     cdef np.float64_t [::1,:] tmp
@@ -164,6 +173,9 @@ cdef class dStatespace(object):
     cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse, unsigned int reset=*) except *
     cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
     cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
+    cdef void sparse_transition_state(self, int transpose, np.float64_t * x, np.float64_t * y)
+    cdef void sparse_transition_left(self, int transpose, int n, np.float64_t * a, int lda, np.float64_t * b, int ldb)
+    cdef void sparse_transition_right(self, int transpose, int n, np.float64_t * a, int lda, np.float64_t * b, int ldb)
 
 cdef class cStatespace(object):
     # Statespace dimensions
@@ -186,6 +198,9 @@ cdef class cStatespace(object):
     cdef readonly int _diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition, identity_transition
+    cdef public int sparse_transition
+    cdef public int [:] transition_indptr, transition_indices
+    cdef public np.complex64_t [:] transition_data
 
     # Temporary arrays
     cdef np.complex64_t [::1,:] tmp
@@ -241,6 +256,9 @@ cdef class cStatespace(object):
     cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse, unsigned int reset=*) except *
     cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
     cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
+    cdef void sparse_transition_state(self, int transpose, np.complex64_t * x, np.complex64_t * y)
+    cdef void sparse_transition_left(self, int transpose, int n, np.complex64_t * a, int lda, np.complex64_t * b, int ldb)
+    cdef void sparse_transition_right(self, int transpose, int n, np.complex64_t * a, int lda, np.complex64_t * b, int ldb)
 
 cdef class zStatespace(object):
     # Statespace dimensions
@@ -263,6 +281,9 @@ cdef class zStatespace(object):
     cdef readonly int _diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition, identity_transition
+    cdef public int sparse_transition
+    cdef public int [:] transition_indptr, transition_indices
+    cdef public np.complex128_t [:] transition_data
 
     # Temporary arrays
     cdef np.complex128_t [::1,:] tmp
@@ -318,6 +339,9 @@ cdef class zStatespace(object):
     cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse, unsigned int reset=*) except *
     cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
     cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t, unsigned int reset=*) except *
+    cdef void sparse_transition_state(self, int transpose, np.complex128_t * x, np.complex128_t * y)
+    cdef void sparse_transition_left(self, int transpose, int n, np.complex128_t * a, int lda, np.complex128_t * b, int ldb)
+    cdef void sparse_transition_right(self, int transpose, int n, np.complex128_t * a, int lda, np.complex128_t * b, int ldb)
 
 cdef int sselect_cov(int k, int k_posdef,
                            np.float32_t * tmp,
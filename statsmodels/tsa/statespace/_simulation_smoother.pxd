@@ -106,6 +106,7 @@ cdef class sSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.float32_t [:] variates, int pretransformed=*)
     cpdef set_initial_state(self, np.float32_t [:] initial_state)
     cpdef simulate(self, int simulation_output=*)
+    cpdef simulate_states(self, np.float32_t [::1,:] measurement_disturbance_variates, np.float32_t [::1,:] state_disturbance_variates, np.float32_t [::1,:] initial_state_variates)
 
     cdef np.float32_t generate_obs(self, int t, np.float32_t * obs, np.float32_t * state, np.float32_t * variates)
     cdef np.float32_t generate_state(self, int t, np.float32_t * state, np.float32_t * input_state, np.float32_t * variates)
@@ -181,6 +182,7 @@ cdef class dSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.float64_t [:] variates, int pretransformed=*)
     cpdef set_initial_state(self, np.float64_t [:] initial_state)
     cpdef simulate(self, int simulation_output=*)
+    cpdef simulate_states(self, np.float64_t [::1,:] measurement_disturbance_variates, np.float64_t [::1,:] state_disturbance_variates, np.float64_t [::1,:] initial_state_variates)
 
     cdef np.float64_t generate_obs(self, int t, np.float64_t * obs, np.float64_t * state, np.float64_t * variates)
     cdef np.float64_t generate_state(self, int t, np.float64_t * state, np.float64_t * input_state, np.float64_t * variates)
@@ -256,6 +258,7 @@ cdef class cSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.complex64_t [:] variates, int pretransformed=*)
     cpdef set_initial_state(self, np.complex64_t [:] initial_state)
     cpdef simulate(self, int simulation_output=*)
+    cpdef simulate_states(self, np.complex64_t [::1,:] measurement_disturbance_variates, np.complex64_t [::1,:] state_disturbance_variates, np.complex64_t [::1,:] initial_state_variates)
 
     cdef np.complex64_t generate_obs(self, int t, np.complex64_t * obs, np.complex64_t * state, np.complex64_t * variates)
     cdef np.complex64_t generate_state(self, int t, np.complex64_t * state, np.complex64_t * input_state, np.complex64_t * variates)
@@ -331,6 +334,7 @@ cdef class zSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.complex128_t [:] variates, int pretransformed=*)
     cpdef set_initial_state(self, np.complex128_t [:] initial_state)
     cpdef simulate(self, int simulation_output=*)
+    cpdef simulate_states(self, np.complex128_t [::1,:] measurement_disturbance_variates, np.complex128_t [::1,:] state_disturbance_variates, np.complex128_t [::1,:] initial_state_variates)
 
     cdef np.complex128_t generate_obs(self, int t, np.complex128_t * obs, np.complex128_t * state, np.complex128_t * variates)
     cdef np.complex128_t generate_state(self, int t, np.complex128_t * state, np.complex128_t * input_state, np.complex128_t * variates)
@@ -6,8 +6,16 @@ __all__ = [
            "MLEResults",
            "tools",
 ]
-from . import tools
-from .exponential_smoothing import ExponentialSmoothing
-from .initialization import Initialization
-from .mlemodel import MLEModel, MLEResults
-from .sarimax import SARIMAX
+
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".": ["tools"],
+        ".exponential_smoothing": ["ExponentialSmoothing"],
+        ".initialization": ["Initialization"],
+        ".mlemodel": ["MLEModel", "MLEResults"],
+        ".sarimax": ["SARIMAX"],
+    },
+)
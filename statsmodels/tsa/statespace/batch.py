@@ -0,0 +1,412 @@
+"""
+Batched Kalman filter and smoother
+
+Filters and smooths a panel of independent series that share the
+specification of a state space model in a single call to the compiled
+filter, so that there is no Python overhead for each series.
+
+License: Simplified-BSD
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+
+import numpy as np
+
+from statsmodels.tools.parallel import _n_workers
+from statsmodels.tsa.statespace import _batch_kalman
+
+MATRICES = [
+    "design",
+    "obs_intercept",
+    "obs_cov",
+    "transition",
+    "state_intercept",
+    "state_cov",
+]
+
+
+def _system(ssm, complex_step=False, filter_name="batched Kalman filter"):
+    """
+    System matrices and initialization of the current parameters
+
+    If `complex_step` is True, the parameters were updated with a complex
+    step and the initialization is computed with the compiled, complex-valued
+    initialization.
+    """
+    if ssm.filter_concentrated:
+        raise NotImplementedError(
+            f"The {filter_name} does not support concentrating the"
+            " scale out of the likelihood."
+        )
+    if ssm.initialization is None:
+        raise RuntimeError("Statespace model not initialized.")
+    if complex_step:
+        ssm._initialize_representation(prefix="z")
+        ssm._initialize_state(prefix="z", complex_step=True)
+        statespace = ssm._statespaces["z"]
+        initial_state = np.array(statespace.initial_state)
+        diffuse_cov = np.array(statespace.initial_diffuse_state_cov)
+        initial_state_cov = np.array(statespace.initial_state_cov)
+    else:
+        initial_state, diffuse_cov, initial_state_cov = ssm.initialization(
+            model=ssm
+        )
+    if np.any(diffuse_cov):
+        raise NotImplementedError(
+            f"The {filter_name} does not support exact diffuse"
+            " initialization. Use approximate diffuse initialization instead."
+        )
+    # Copies of the arrays including the time dimension
+    system = {
+        name: np.array(getattr(ssm, name)) for name in MATRICES if name != "state_cov"
+    }
+    # R Q R'
+    selection = ssm.selection
+    state_cov = ssm.state_cov
+    nt = max(selection.shape[2], state_cov.shape[2])
+    selected_state_cov = np.zeros(
+        (ssm.k_states, ssm.k_states, nt), dtype=np.result_type(selection, state_cov)
+    )
+    for t in range(nt):
+        sel = selection[..., t if selection.shape[2] > 1 else 0]
+        cov = state_cov[..., t if state_cov.shape[2] > 1 else 0]
+        selected_state_cov[..., t] = sel @ cov @ sel.T
+    system["state_cov"] = selected_state_cov
+
+    if ssm.timing_init_filtered:
+        # The initialization is for the state at time zero, a_{0|0}
+        transition = system["transition"][..., 0]
+        initial_state = (
+            transition @ initial_state + system["state_intercept"][:, 0]
+        )
+        initial_state_cov = (
+            transition @ initial_state_cov @ transition.T
+            + selected_state_cov[..., 0]
+        )
+    system["initial_state"] = initial_state
+    system["initial_state_cov"] = initial_state_cov
+    return system
+
+
+class BatchKalmanResults:
+    """
+    Results of the batched Kalman filter and smoother
+
+    Parameters
+    ----------
+    system : dict
+        The system matrices, with trailing time and series dimensions.
+    loglikelihood_burn : int
+        The number of initial periods that are excluded from the
+        loglikelihood `llf`.
+    **outputs
+        The arrays filled by the filter and smoother, in the layout of the
+        compiled filter.
+
+    Attributes
+    ----------
+    nseries : int
+        The number of series.
+    nobs : int
+        The number of observations of each series.
+    llf_obs : ndarray
+        The loglikelihood of each observation, (nseries, nobs).
+    llf : ndarray
+        The loglikelihood of each series, (nseries,).
+    failed : ndarray
+        Boolean array that is True for the series for which the forecast
+        error covariance matrix was not positive definite. Their
+        loglikelihood is NaN.
+    predicted_state : ndarray
+        The state predicted for the period following the last observation,
+        (nseries, k_states).
+    predicted_state_cov : ndarray
+        The covariance matrix of the predicted state,
+        (nseries, k_states, k_states).
+    filtered_state : ndarray or None
+        The filtered states, (nseries, k_states, nobs), if stored.
+    filtered_state_cov : ndarray or None
+        The covariance matrices of the filtered states,
+        (nseries, k_states, k_states, nobs), if stored.
+    smoothed_state : ndarray or None
+        The smoothed states, (nseries, k_states, nobs), if smoothed.
+    smoothed_state_cov : ndarray or None
+        The covariance matrices of the smoothed states,
+        (nseries, k_states, k_states, nobs), if smoothed and stored.
+    """
+
+    def __init__(self, system, loglikelihood_burn, **outputs):
+        self._system = system
+        self.loglikelihood_burn = loglikelihood_burn
+        llf_obs = outputs["loglikelihood"].T
+        self.llf_obs = llf_obs
+        self.nseries, self.nobs = llf_obs.shape
+        self.k_endog, self.k_states = system["design"].shape[:2]
+        self.llf = llf_obs[:, loglikelihood_burn:].sum(axis=1)
+        self.failed = np.isnan(self.llf)
+
+        def series_first(name):
+            value = outputs.get(name)
+            if value is None:
+                return None
+            value = np.moveaxis(value, -1, 0)
+            if self.failed.any() and name.startswith("smoothed"):
+                value[self.failed] = np.nan
+            return value
+
+        self.predicted_state = series_first("predicted_state")
+        self.predicted_state_cov = series_first("predicted_state_cov")
+        self.filtered_state = series_first("filtered_state")
+        self.filtered_state_cov = series_first("filtered_state_cov")
+        self.smoothed_state = series_first("smoothed_state")
+        self.smoothed_state_cov = series_first("smoothed_state_cov")
+
+    def _series_matrix(self, name):
+        # (nseries or 1, ...) view of a time-invariant system matrix
+        value = self._system[name]
+        if value.shape[-2] > 1:
+            raise ValueError(
+                "Forecasting requires time-invariant system matrices."
+            )
+        return np.moveaxis(value[..., 0, :], -1, 0)
+
+    def forecast(self, steps=1, return_var=False):
+        """
+        Out-of-sample forecasts of all series
+
+        Parameters
+        ----------
+        steps : int, optional
+            The number of periods to forecast. Default is 1.
+        return_var : bool, optional
+            Whether to also return the variance of the forecasts. Default is
+            False.
+
+        Returns
+        -------
+        forecast : ndarray
+            The forecasts, (nseries, steps, k_endog).
+        var : ndarray
+            The variances of the forecasts, (nseries, steps, k_endog). Only
+            returned if `return_var` is True.
+        """
+        design = self._series_matrix("design")
+        obs_intercept = self._series_matrix("obs_intercept")
+        obs_cov = self._series_matrix("obs_cov")
+        transition = self._series_matrix("transition")
+        state_intercept = self._series_matrix("state_intercept")
+        state_cov = self._series_matrix("state_cov")
+
+        state = self.predicted_state[..., None]
+        state_cov_t = self.predicted_state_cov
+        forecast = np.empty((self.nseries, steps, self.k_endog))
+        var = np.empty((self.nseries, steps, self.k_endog))
+        for h in range(steps):
+            forecast[:, h] = (design @ state)[..., 0] + obs_intercept
+            if return_var:
+                cov = design @ state_cov_t @ design.swapaxes(1, 2) + obs_cov
+                var[:, h] = np.diagonal(cov, axis1=1, axis2=2)
+            state = transition @ state + state_intercept[..., None]
+            state_cov_t = (
+                transition @ state_cov_t @ transition.swapaxes(1, 2) + state_cov
+            )
+        if return_var:
+            return forecast, var
+        return forecast
+
+
+def batch_kalman(
+    model,
+    params,
+    endog,
+    transformed=True,
+    includes_fixed=False,
+    smooth=False,
+    store_filtered=False,
+    store_cov=False,
+    n_jobs=1,
+):
+    """
+    Kalman filter and smoother for many series that share a model
+
+    Parameters
+    ----------
+    model : MLEModel
+        A state space model that defines the structure shared by all series.
+        Its system matrices, including any that depend on exogenous
+        variables, are used for all series.
+    params : array_like
+        The parameters, either one set that is shared by all series,
+        (k_params,), or one set for each series, (nseries, k_params).
+    endog : array_like
+        The observations, (nseries, nobs) or (nseries, nobs, k_endog).
+        Missing observations are NaN.
+    transformed : bool, optional
+        Whether or not `params` is already transformed. Default is True.
+    includes_fixed : bool, optional
+        If parameters were previously fixed with the `fix_params` method,
+        this argument describes whether or not `params` also includes the
+        fixed parameters. Default is False.
+    smooth : bool, optional
+        Whether to run the smoother. Default is False.
+    store_filtered : bool, optional
+        Whether to store the filtered states. Default is False.
+    store_cov : bool, optional
+        Whether to store the covariance matrices of the stored filtered and
+        smoothed states. Default is False.
+    n_jobs : int, optional
+        The number of threads among which the series are split. The compiled
+        filter releases the GIL. Negative values are relative to the number
+        of CPUs. Default is 1.
+
+    Returns
+    -------
+    BatchKalmanResults
+    """
+    ssm = model.ssm
+    endog = np.asarray(endog, dtype=float)
+    if endog.ndim == 2 and ssm.k_endog == 1:
+        endog = endog[:, :, None]
+    if endog.ndim != 3 or endog.shape[2] != ssm.k_endog:
+        raise ValueError(
+            f"endog must have shape (nseries, nobs, {ssm.k_endog}), got"
+            f" {endog.shape}."
+        )
+    nseries, nobs = endog.shape[:2]
+    if nseries == 0 or nobs == 0:
+        raise ValueError("endog must contain at least one series and period.")
+
+    params = np.asarray(params)
+    if params.ndim == 1:
+        params = params[None, :]
+    elif params.ndim != 2 or params.shape[0] != nseries:
+        raise ValueError(
+            "params must have shape (k_params,) or (nseries, k_params)."
+        )
+    system = _stack_system(model, params, nobs, transformed, includes_fixed)
+
+    k_states = ssm.k_states
+    outputs = {
+        "loglikelihood": np.zeros((nobs, nseries), order="F"),
+        "predicted_state": np.zeros((k_states, nseries), order="F"),
+        "predicted_state_cov": np.zeros((k_states, k_states, nseries), order="F"),
+    }
+    if store_filtered:
+        outputs["filtered_state"] = np.zeros((k_states, nobs, nseries), order="F")
+        if store_cov:
+            outputs["filtered_state_cov"] = np.zeros(
+                (k_states, k_states, nobs, nseries), order="F"
+            )
+    if smooth:
+        outputs["smoothed_state"] = np.zeros((k_states, nobs, nseries), order="F")
+        if store_cov:
+            outputs["smoothed_state_cov"] = np.zeros(
+                (k_states, k_states, nobs, nseries), order="F"
+            )
+
+    # (k_endog, nobs, nseries), a view if endog is C-contiguous
+    endog = np.asfortranarray(endog.transpose(2, 1, 0))
+    _run(endog, system, outputs, nseries, n_jobs)
+
+    return BatchKalmanResults(system, ssm.loglikelihood_burn, **outputs)
+
+
+def loglike_many(model, params, transformed=True, includes_fixed=False, n_jobs=1):
+    """
+    Loglikelihood of a model's observations for many sets of parameters
+
+    Parameters
+    ----------
+    model : MLEModel
+        The state space model.
+    params : array_like
+        The sets of parameters, (nparams, k_params).
+    transformed : bool, optional
+        Whether or not `params` is already transformed. Default is True.
+    includes_fixed : bool, optional
+        If parameters were previously fixed with the `fix_params` method,
+        this argument describes whether or not `params` also includes the
+        fixed parameters. Default is False.
+    n_jobs : int, optional
+        The number of threads among which the sets of parameters are split.
+        Each thread runs the compiled filter, which releases the GIL, with
+        its own workspace. Negative values are relative to the number of
+        CPUs. Default is 1.
+
+    Returns
+    -------
+    ndarray
+        The loglikelihood for each set of parameters, (nparams,). It is NaN
+        for the sets of parameters for which the forecast error covariance
+        matrix is not positive definite.
+    """
+    ssm = model.ssm
+    params = np.asarray(params)
+    if params.ndim != 2:
+        raise ValueError("params must have shape (nparams, k_params).")
+    nparams = params.shape[0]
+    if nparams == 0:
+        return np.zeros(0)
+
+    system = _stack_system(model, params, ssm.nobs, transformed, includes_fixed)
+    outputs = {
+        "loglikelihood": np.zeros((ssm.nobs, nparams), order="F"),
+        "predicted_state": np.zeros((ssm.k_states, nparams), order="F"),
+        "predicted_state_cov": np.zeros(
+            (ssm.k_states, ssm.k_states, nparams), order="F"
+        ),
+    }
+    # All filters share the observations, (k_endog, nobs, 1)
+    endog = np.asfortranarray(ssm.endog, dtype=float)[:, :, None]
+    _run(endog, system, outputs, nparams, n_jobs)
+    return outputs["loglikelihood"][ssm.loglikelihood_burn :].sum(axis=0)
+
+
+def _stack_system(model, params, nobs, transformed, includes_fixed):
+    # System matrices of each set of parameters, stacked on a trailing
+    # series dimension
+    system = {}
+    for i, param in enumerate(params):
+        model.update(param, transformed=transformed, includes_fixed=includes_fixed)
+        current = _system(model.ssm)
+        for name, value in current.items():
+            if name not in system:
+                system[name] = np.zeros(value.shape + (params.shape[0],), order="F")
+            elif system[name].shape[:-1] != value.shape:
+                raise ValueError(
+                    f"The shape of the {name} matrix differs between parameters."
+                )
+            system[name][..., i] = value
+    for name in MATRICES:
+        if system[name].shape[-2] not in (1, nobs):
+            raise ValueError(
+                f"The {name} matrix is time-varying with {system[name].shape[-2]}"
+                f" periods, but endog has {nobs} periods."
+            )
+    return system
+
+
+def _run(endog, system, outputs, nseries, n_jobs):
+    # Split the series among threads, each of which calls the compiled filter
+    # and so allocates its own workspace
+    def run(bounds):
+        return _batch_kalman.dbatch_kalman(
+            endog,
+            *[system[name] for name in MATRICES],
+            system["initial_state"],
+            system["initial_state_cov"],
+            start=bounds[0],
+            stop=bounds[1],
+            **outputs,
+        )
+
+    n_workers = _n_workers(n_jobs, nseries)
+    edges = np.linspace(0, nseries, n_workers + 1).astype(int)
+    chunks = list(itertools.pairwise(edges))
+    if n_workers == 1:
+        for chunk in chunks:
+            run(chunk)
+    else:
+        with ThreadPoolExecutor(n_workers) as executor:
+            list(executor.map(run, chunks))
@@ -155,13 +155,16 @@ class CFASimulationSmoother:
                 (inv_chol, True), np.eye(inv_chol.shape[1]))
         return self._posterior_cov
 
-    def simulate(self, variates=None, update_posterior=True):
+    def simulate(self, variates=None, update_posterior=True,
+                 nsimulations=None):
         r"""
         Perform simulation smoothing (via Cholesky factor algorithm)
 
         Does not return anything, but populates the object's `simulated_state`
         attribute, and also makes available the attributes `posterior_mean`,
-        `posterior_cov`, and `posterior_cov_inv_chol_sparse`.
+        `posterior_cov`, and `posterior_cov_inv_chol_sparse`. If
+        `nsimulations` is given, many draws are computed at once and
+        returned.
 
         Parameters
         ----------
@@ -169,13 +172,25 @@ class CFASimulationSmoother:
             Random variates, distributed standard Normal. Usually only
             specified if results are to be replicated (e.g., to enforce a seed)
             or for testing. If not specified, random variates are drawn. Must
-            be shaped (k_states, nobs).
+            be shaped (k_states, nobs), or (nsimulations, nobs, k_states) if
+            `nsimulations` is given.
         update_posterior : bool, optional
             Whether to update the posterior mean and covariance matrix (held
             in the `posterior_mean` and `posterior_cov_inv_chol_sparse`
             attributes) prior to performing the simulation. Default is True.
             Can be set to False if the posterior moments have already been
             computed and only a new simulated draw is desired.
+        nsimulations : int, optional
+            If specified, the number of draws to compute at once, all of
+            which share the Cholesky factor of the inverse posterior
+            covariance matrix.
+
+        Returns
+        -------
+        simulated_state : ndarray
+            Only returned if `nsimulations` is specified. The draws of the
+            state vector, shaped (nsimulations, nobs, k_states). These are
+            also available in the `simulated_state` attribute.
 
         Notes
         -----
@@ -214,7 +229,20 @@ class CFASimulationSmoother:
         prefix, dtype, create = self.model._initialize_representation()
 
         # Validate variates and get in required datatype
-        if variates is not None:
+        if nsimulations is not None:
+            nsimulations = int(nsimulations)
+            if nsimulations < 1:
+                raise ValueError("`nsimulations` must be a positive integer.")
+            if variates is not None:
+                variates = np.asarray(variates)
+                if variates.shape != (nsimulations, self.model.nobs,
+                                      self.model.k_states):
+                    raise ValueError(
+                        "Invalid shape for variates: requires"
+                        f" {(nsimulations, self.model.nobs, self.model.k_states)},"
+                        f" got {variates.shape}")
+                variates = variates.astype(dtype)
+        elif variates is not None:
             tools.validate_matrix_shape("variates", variates.shape,
                                         self.model.k_states,
                                         self.model.nobs, 1)
@@ -238,4 +266,7 @@ class CFASimulationSmoother:
             self._posterior_cov = None
 
         # Perform simulation smoothing
-        self.simulated_state = sim.simulate(variates=variates)
+        self.simulated_state = sim.simulate(variates=variates,
+                                            nsimulations=nsimulations)
+        if nsimulations is not None:
+            return self.simulated_state
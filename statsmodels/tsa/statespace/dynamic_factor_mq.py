@@ -7,6 +7,7 @@ License: BSD-3
 from statsmodels.compat.pandas import MONTH_END, QUARTER_END
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 
 import numpy as np
@@ -22,6 +23,7 @@ from statsmodels.multivariate.pca import PCA
 from statsmodels.regression.linear_model import OLS
 from statsmodels.tools._decorators import cache_readonly
 from statsmodels.tools.data import _is_using_pandas
+from statsmodels.tools.parallel import _n_workers
 from statsmodels.tools.sm_exceptions import ConvergenceWarning, EstimationWarning
 from statsmodels.tools.tools import Bunch
 from statsmodels.tools.validation import int_like, string_like
@@ -45,6 +47,16 @@ from statsmodels.tsa.tsatools import lagmat
 from statsmodels.tsa.vector_ar.var_model import VAR
 
 
+def _map(func, items, n_jobs=1):
+    # Apply `func` to each of `items`, split among threads if `n_jobs` > 1
+    items = list(items)
+    n_workers = _n_workers(n_jobs, len(items))
+    if n_workers == 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(n_workers) as executor:
+        return list(executor.map(func, items))
+
+
 class FactorBlock(dict):
     """
     Helper class for describing and indexing a block of factors
@@ -2281,7 +2293,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
             full_output=1, disp=False, callback=None, return_params=False,
             optim_score=None, optim_complex_step=None, optim_hessian=None,
             flags=None, low_memory=False, llf_decrease_action="revert",
-            llf_decrease_tolerance=1e-4, **kwargs):
+            llf_decrease_tolerance=1e-4, em_acceleration=None, n_jobs=1,
+            **kwargs):
         """
         Fits the model by maximum likelihood via Kalman filter
 
@@ -2420,6 +2433,13 @@ class DynamicFactorMQ(mlemodel.MLEModel):
             larger than zero allows small decreases in the log-likelihood that
             may be caused by numerical issues. If set to zero, then any
             decrease will trigger the `llf_decrease_action`. Default is 1e-4.
+        em_acceleration : {None, 'squarem'}, optional
+            Acceleration scheme for the EM algorithm, if the EM algorithm is
+            used for fitting. See `fit_em` for details. Default is None.
+        n_jobs : int, optional
+            The number of threads among which the regressions of the EM
+            maximization step are split, if the EM algorithm is used for
+            fitting. Default is 1.
         **kwargs
             Additional keyword arguments to pass to the optimizer.
 
@@ -2440,7 +2460,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                 mstep_method=mstep_method, full_output=full_output, disp=disp,
                 return_params=return_params, low_memory=low_memory,
                 llf_decrease_action=llf_decrease_action,
-                llf_decrease_tolerance=llf_decrease_tolerance, **kwargs)
+                llf_decrease_tolerance=llf_decrease_tolerance,
+                em_acceleration=em_acceleration, n_jobs=n_jobs, **kwargs)
         else:
             return super().fit(
                 start_params=start_params, transformed=transformed,
@@ -2457,7 +2478,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                cov_kwds=None, maxiter=500, tolerance=1e-6, disp=False,
                em_initialization=True, mstep_method=None, full_output=True,
                return_params=False, low_memory=False,
-               llf_decrease_action="revert", llf_decrease_tolerance=1e-4):
+               llf_decrease_action="revert", llf_decrease_tolerance=1e-4,
+               em_acceleration=None, n_jobs=1):
         """
         Fits the model by maximum likelihood via the EM algorithm
 
@@ -2541,6 +2563,16 @@ class DynamicFactorMQ(mlemodel.MLEModel):
             larger than zero allows small decreases in the log-likelihood that
             may be caused by numerical issues. If set to zero, then any
             decrease will trigger the `llf_decrease_action`. Default is 1e-4.
+        em_acceleration : {None, 'squarem'}, optional
+            Acceleration scheme for the EM algorithm. None performs plain EM
+            iterations, while 'squarem' uses the squared iterative method
+            (SQUAREM) of Varadhan and Roland (2008). See the notes for details.
+            Default is None.
+        n_jobs : int, optional
+            The number of threads among which the regressions of the
+            maximization step (one for each observed variable and one for
+            each factor block) are split. Negative values are relative to the
+            number of CPUs. Default is 1.
 
         Returns
         -------
@@ -2550,6 +2582,26 @@ class DynamicFactorMQ(mlemodel.MLEModel):
         --------
         statsmodels.tsa.statespace.mlemodel.MLEModel.fit
         statsmodels.tsa.statespace.mlemodel.MLEResults
+
+        Notes
+        -----
+        With `em_acceleration="squarem"`, each iteration performs two EM
+        steps and extrapolates along the resulting path of the parameters,
+        using the "SqS3" step length of Varadhan and Roland (2008). A third EM
+        step from the extrapolated parameters stabilizes the iteration. If
+        the extrapolated parameters have a lower log-likelihood than the
+        parameters after the first EM step, the step length is shortened,
+        falling back to the second EM step. As a result, each iteration
+        requires at least three Kalman smoother passes, and `maxiter` and
+        the convergence `tolerance` apply to these accelerated iterations.
+        Typically many fewer smoother passes are required in total.
+
+        References
+        ----------
+        .. [*] Varadhan, Ravi, and Christophe Roland. 2008.
+           "Simple and Globally Convergent Methods for Accelerating the
+           Convergence of Any EM Algorithm."
+           Scandinavian Journal of Statistics 35 (2): 335-53.
         """
         if self._has_fixed_params:
             raise NotImplementedError("Cannot fit using the EM algorithm while"
@@ -2570,6 +2622,9 @@ class DynamicFactorMQ(mlemodel.MLEModel):
         llf_decrease_action = string_like(
             llf_decrease_action, "llf_decrease_action",
             options=["ignore", "warn", "revert"])
+        em_acceleration = string_like(
+            em_acceleration, "em_acceleration", optional=True,
+            options=["squarem"])
 
         disp = int(disp)
 
@@ -2584,8 +2639,14 @@ class DynamicFactorMQ(mlemodel.MLEModel):
         terminate = False
         # init_stationary = None if em_initialization else True
         while i < maxiter and not terminate and (i < 1 or (delta > tolerance)):
-            out = self._em_iteration(params[-1], init=init,
-                                     mstep_method=mstep_method)
+            if em_acceleration == "squarem":
+                out = self._em_squarem_iteration(
+                    params[-1], init=init, mstep_method=mstep_method,
+                    em_initialization=em_initialization, n_jobs=n_jobs)
+            else:
+                out = self._em_iteration(params[-1], init=init,
+                                         mstep_method=mstep_method,
+                                         n_jobs=n_jobs)
             new_llf = out[0].llf_obs.sum()
 
             # If we are not using EM initialization, then we need to check for
@@ -2662,7 +2723,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                         disp=disp, return_params=return_params,
                         low_memory=low_memory,
                         llf_decrease_action=llf_decrease_action,
-                        llf_decrease_tolerance=llf_decrease_tolerance)
+                        llf_decrease_tolerance=llf_decrease_tolerance,
+                        em_acceleration=em_acceleration, n_jobs=n_jobs)
                     self.ssm.initialize(self._default_initialization())
                     return results
 
@@ -2759,7 +2821,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
             if full_output:
                 llf.append(result.llf)
                 em_retvals = Bunch(params=np.array(params), llf=np.array(llf), iter=i, inits=inits)
-                em_settings = Bunch(method="em", tolerance=tolerance, maxiter=maxiter)
+                em_settings = Bunch(method="em", tolerance=tolerance, maxiter=maxiter,
+                                    em_acceleration=em_acceleration)
             else:
                 em_retvals = None
                 em_settings = None
@@ -2769,17 +2832,93 @@ class DynamicFactorMQ(mlemodel.MLEModel):
 
         return result
 
-    def _em_iteration(self, params0, init=None, mstep_method=None):
+    def _em_iteration(self, params0, init=None, mstep_method=None, n_jobs=1):
         """EM iteration"""
         # (E)xpectation step
         res = self._em_expectation_step(params0, init=init)
 
         # (M)aximization step
         params1 = self._em_maximization_step(res, params0,
-                                             mstep_method=mstep_method)
+                                             mstep_method=mstep_method,
+                                             n_jobs=n_jobs)
 
         return res, params1
 
+    def _em_squarem_iteration(self, params0, init=None, mstep_method=None,
+                              em_initialization=True, n_jobs=1):
+        """SQUAREM iteration (Varadhan and Roland, 2008, scheme "SqS3")"""
+        # The EM map updates the initialization along with the parameters
+        # (if `em_initialization=True`), so that both are extrapolated
+        k_params = len(params0)
+        extrapolate_init = em_initialization and init is not None
+
+        def em_init(res):
+            if not em_initialization:
+                return init
+            return initialization.Initialization(
+                self.k_states, "known", constant=res.smoothed_state[..., 0],
+                stationary_cov=res.smoothed_state_cov[..., 0])
+
+        def pack(params, init):
+            if not extrapolate_init:
+                return params
+            return np.r_[params, init.constant, init.stationary_cov.ravel()]
+
+        def unpack(x):
+            params = x[:k_params]
+            if not extrapolate_init:
+                return params, init2
+            constant = x[k_params:k_params + self.k_states]
+            cov = x[k_params + self.k_states:].reshape(self.k_states,
+                                                       self.k_states)
+            cov = (cov + cov.T) / 2
+            eigvals = np.linalg.eigvalsh(cov)
+            if eigvals[0] < -1e-8 * max(eigvals[-1], 1):
+                raise ValueError("Extrapolated initialization is not"
+                                 " positive semi-definite.")
+            return params, initialization.Initialization(
+                self.k_states, "known", constant=constant,
+                stationary_cov=cov)
+
+        # Two EM steps
+        res0, params1 = self._em_iteration(
+            params0, init=init, mstep_method=mstep_method, n_jobs=n_jobs)
+        init1 = em_init(res0)
+        res1, params2 = self._em_iteration(
+            params1, init=init1, mstep_method=mstep_method, n_jobs=n_jobs)
+        init2 = em_init(res1)
+        llf1 = res1.llf_obs.sum()
+
+        # Step length
+        x0 = pack(params0, init)
+        r = pack(params1, init1) - x0
+        v = pack(params2, init2) - x0 - 2 * r
+        norm_v = np.linalg.norm(v)
+        step = -np.linalg.norm(r) / norm_v if norm_v > 0 else -1
+        step = min(step, -1)
+
+        # Extrapolate and stabilize with a further EM step, shortening the
+        # step length if the log-likelihood decreases (note that a step length
+        # of -1 corresponds to `params2`, which is always accepted)
+        for alpha in [step, (step - 1) / 2]:
+            if alpha == -1:
+                break
+            try:
+                params, init_alpha = unpack(x0 - 2 * alpha * r + alpha**2 * v)
+                if np.any(params[self._p["idiosyncratic_var"]] < 0):
+                    continue
+                out = self._em_iteration(
+                    params, init=init_alpha, mstep_method=mstep_method,
+                    n_jobs=n_jobs)
+            except (LinAlgError, ValueError):
+                continue
+            llf = out[0].llf_obs.sum()
+            if np.isfinite(llf) and llf >= llf1:
+                return out
+
+        return self._em_iteration(params2, init=init2,
+                                  mstep_method=mstep_method, n_jobs=n_jobs)
+
     def _em_expectation_step(self, params0, init=None):
         """EM expectation step"""
         # (E)xpectation step
@@ -2800,7 +2939,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
 
         return res
 
-    def _em_maximization_step(self, res, params0, mstep_method=None):
+    def _em_maximization_step(self, res, params0, mstep_method=None,
+                              n_jobs=1):
         """EM maximization step"""
         s = self._s
 
@@ -2829,12 +2969,11 @@ class DynamicFactorMQ(mlemodel.MLEModel):
         else:
             raise ValueError(f'Invalid maximization step method: "{mstep_method}".')
         # TODO: compute H is pretty slow
-        Lambda, H = func(res, Eaa, a, compute_H=(not self.idiosyncratic_ar1))
+        Lambda, H = func(res, Eaa, a, compute_H=(not self.idiosyncratic_ar1),
+                         n_jobs=n_jobs)
 
         # Factor VAR and covariance
-        factor_ar = []
-        factor_cov = []
-        for b in s.factor_blocks:
+        def factor_block(b):
             A = Eaa[:-1, b["factors_ar"], b["factors_ar"]].sum(axis=0)
             B = Eaa1[:, b["factors_L1"], b["factors_ar"]].sum(axis=0)
             C = Eaa[1:, b["factors_L1"], b["factors_L1"]].sum(axis=0)
@@ -2849,6 +2988,11 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                 f_A = np.linalg.solve(A, B.T).T
 
             f_Q = (C - f_A @ B.T) / nobs
+            return f_A, f_Q
+
+        factor_ar = []
+        factor_cov = []
+        for f_A, f_Q in _map(factor_block, s.factor_blocks, n_jobs):
             factor_ar += f_A.ravel().tolist()
             factor_cov += (
                 np.linalg.cholesky(f_Q)[np.tril_indices_from(f_Q)].tolist())
@@ -2886,7 +3030,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
 
         return params1
 
-    def _em_maximization_obs_nonmissing(self, res, Eaa, a, compute_H=False):
+    def _em_maximization_obs_nonmissing(self, res, Eaa, a, compute_H=False,
+                                        n_jobs=1):
         """EM maximization step, observation equation without missing data"""
         s = self._s
         dtype = Eaa.dtype
@@ -2897,7 +3042,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
         # never choose this method in that case
         k = s.k_states_factors
         Lambda = np.zeros((self.k_endog, k), dtype=dtype)
-        for i in range(self.k_endog):
+
+        def loadings(i):
             y = self.endog[:, i:i + 1]
             iloc = self._s.endog_factor_iloc[i]
             factor_ix = s["factors_L1"][iloc]
@@ -2918,6 +3064,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                 # positive-definiteness
                 Lambda[i, factor_ix] = np.linalg.solve(A, B.T).T
 
+        _map(loadings, range(self.k_endog), n_jobs)
+
         # Compute new obs cov
         # Note: this is unnecessary if `idiosyncratic_ar1=True`.
         # This is written in a slightly more general way than
@@ -2936,7 +3084,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
 
         return Lambda, H
 
-    def _em_maximization_obs_missing(self, res, Eaa, a, compute_H=False):
+    def _em_maximization_obs_missing(self, res, Eaa, a, compute_H=False,
+                                     n_jobs=1):
         """EM maximization step, observation equation with missing data"""
         s = self._s
         dtype = Eaa.dtype
@@ -2950,7 +3099,7 @@ class DynamicFactorMQ(mlemodel.MLEModel):
 
         # Compute design for monthly
         # Note: the relevant A changes for each i
-        for i in range(self.k_endog_M):
+        def loadings_M(i):
             iloc = self._s.endog_factor_iloc[i]
             factor_ix = s["factors_L1"][iloc]
 
@@ -2972,13 +3121,16 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                 # positive-definiteness
                 Lambda[i, factor_ix] = np.linalg.solve(Ai, Bi.T).T
 
+        _map(loadings_M, range(self.k_endog_M), n_jobs)
+
         # Compute unrestricted design for quarterly
         # See Banbura at al. (2011), where this is described in Appendix C,
         # between equations (13) and (14).
         if self.k_endog_Q > 0:
             # Note: the relevant A changes for each i
             multipliers = np.array([1, 2, 3, 2, 1])[:, None]
-            for i in range(self.k_endog_M, self.k_endog):
+
+            def loadings_Q(i):
                 iloc = self._s.endog_factor_iloc[i]
                 factor_ix = s["factors_L1_5_ix"][:, iloc].ravel().tolist()
 
@@ -3021,6 +3173,8 @@ class DynamicFactorMQ(mlemodel.MLEModel):
                                   Aii @ R.T @ RARi @ R @ unrestricted)
                 Lambda[i, factor_ix] = restricted
 
+            _map(loadings_Q, range(self.k_endog_M, self.k_endog), n_jobs)
+
         # Compute new obs cov
         # Note: this is unnecessary if `idiosyncratic_ar1=True`.
         # See Banbura and Modugno (2014), equation (12)
@@ -4171,6 +4325,19 @@ class DynamicFactorMQResults(mlemodel.MLEResults):
             endog, fit_kwargs=fit_kwargs,
             retain_standardization=retain_standardization, **kwargs)
 
+    def update(self, endog, smoothing_lag=None):
+        """
+        Update the results in place with new observations
+
+        Not available for this model, since the data may be standardized and
+        may contain quarterly variables. See the `append` and `extend` methods
+        instead.
+        """
+        raise NotImplementedError(
+            "Updating results in place is not available for dynamic factor"
+            " models with mixed frequencies. Use `append` or `extend` instead."
+        )
+
     def apply(self, endog, k_endog_monthly=None, endog_quarterly=None,
               refit=False, fit_kwargs=None, copy_initialization=False,
               retain_standardization=True, **kwargs):
@@ -407,6 +407,9 @@ class Initialization:
             filter_results.model.k_states, a=a, Pstar=Pstar, Pinf=Pinf
         )
 
+    def __deepcopy__(self, memo):
+        return tools._deepcopy_without_compiled(self, memo, ("_initializations",))
+
     def __setitem__(self, index, initialization_type):
         self.set(index, initialization_type)
 
@@ -93,7 +93,9 @@ class KalmanFilter(Representation):
         inversion, and stability methods. See `set_filter_method`,
         `set_inversion_method`, and `set_stability_method`.
         Keyword arguments may be used to provide default values for state space
-        matrices. See `Representation` for more details.
+        matrices, or `single_precision` to filter in single precision (which
+        is best combined with the square-root filter, see
+        `set_filter_method`). See `Representation` for more details.
 
     See Also
     --------
@@ -158,7 +160,7 @@ class KalmanFilter(Representation):
     filter_augmented = OptionWrapper("filter_method", FILTER_AUGMENTED)
     """(bool) Flag for augmented Kalman filtering. Not implemented"""
     filter_square_root = OptionWrapper("filter_method", FILTER_SQUARE_ROOT)
-    """(bool) Flag for square-root Kalman filtering. Not implemented"""
+    """(bool) Flag for square-root Kalman filtering"""
     filter_univariate = OptionWrapper("filter_method", FILTER_UNIVARIATE)
     """(bool) Flag for univariate filtering of multivariate observation vector"""
     filter_collapsed = OptionWrapper("filter_method", FILTER_COLLAPSED)
@@ -475,6 +477,12 @@ class KalmanFilter(Representation):
         FILTER_COLLAPSED
             Collapsed approach to Kalman filtering. Will be used *in addition*
             to conventional or univariate filtering.
+        FILTER_SQUARE_ROOT
+            Square-root Kalman filter, in which the state covariance
+            matrices are propagated through their Cholesky factors, so that
+            they remain symmetric and positive semi-definite. It modifies the
+            conventional filter (so that the univariate method overrides it)
+            and complex-valued data are always filtered conventionally.
         FILTER_CONCENTRATED
             Use the concentrated log-likelihood function. Will be used
             *in addition* to the other options.
@@ -1411,6 +1419,25 @@ class FilterResults(FrozenRepresentation):
 
     _attributes = FrozenRepresentation._model_attributes + _filter_attributes
 
+    # Output arrays with a final (time) axis, which are extended by
+    # `_append_results`
+    _filter_output = [
+        "missing", "nmissing", "univariate_filter", "filtered_state",
+        "filtered_state_cov", "predicted_state", "predicted_state_cov",
+        "forecasts_error_diffuse_cov", "predicted_diffuse_state_cov",
+        "tmp1", "tmp2", "tmp3", "tmp4", "M", "M_diffuse", "forecasts",
+        "forecasts_error", "forecasts_error_cov", "llf_obs",
+        "missing_forecasts", "missing_forecasts_error",
+        "missing_forecasts_error_cov", "collapsed_forecasts",
+        "collapsed_forecasts_error", "collapsed_forecasts_error_cov",
+        "_kalman_gain", "_standardized_forecasts_error"
+    ]
+    _missing_output = {
+        "missing_forecasts": "forecasts",
+        "missing_forecasts_error": "forecasts_error",
+        "missing_forecasts_error_cov": "forecasts_error_cov",
+    }
+
     def __init__(self, model):
         super().__init__(model)
 
@@ -1418,6 +1445,9 @@ class FilterResults(FrozenRepresentation):
         self._kalman_gain = None
         self._standardized_forecasts_error = None
 
+        # Buffers holding output arrays that have been extended
+        self._output_buffers = {}
+
     def update_representation(self, model, only_options=False):
         """
         Update the results to match a given model
@@ -1769,6 +1799,88 @@ class FilterResults(FrozenRepresentation):
             self.llf = self.llf_obs[0]
             self.llf_obs = None
 
+    def _append_output(self, name, values, start, nobs):
+        """
+        Write into an output array from a given period, extending it
+
+        Parameters
+        ----------
+        name : str
+            The name of the output array.
+        values : ndarray or None
+            Values to write into the output array, starting from period
+            `start`. If None, zeros are written.
+        start : int
+            The first period to write into.
+        nobs : int
+            The number of periods in the extended output.
+
+        Notes
+        -----
+        Extended arrays are views of buffers whose capacity is doubled when
+        exhausted, so that repeatedly extending an output array requires
+        amortized constant time and memory per period.
+        """
+        current = getattr(self, name)
+        end = nobs + current.shape[-1] - self.nobs
+        buffer = self._output_buffers.get(name)
+        if (buffer is None or current.base is not buffer
+                or buffer.shape[-1] < end):
+            capacity = max(end, 2 * current.shape[-1])
+            buffer = np.zeros(current.shape[:-1] + (capacity,),
+                              dtype=current.dtype)
+            buffer[..., :current.shape[-1]] = current
+            self._output_buffers[name] = buffer
+        buffer[..., start:end] = 0 if values is None else values
+        setattr(self, name, buffer[..., :end])
+
+    def _append_results(self, model, results):
+        """
+        Extend the filter results with output for new observations
+
+        Parameters
+        ----------
+        model : Representation
+            The model object, bound to the data including the new
+            observations.
+        results : FilterResults
+            Results from applying the Kalman filter to the final periods of
+            the data bound to `model`, including at least all of the new
+            observations.
+
+        Notes
+        -----
+        This method is rarely required except for internal usage.
+        """
+        nobs = model.nobs
+        offset = self.nobs - (nobs - results.nobs)
+
+        # If the new observations are the first to include missing values,
+        # then the missing-value forecast output starts as the usual output
+        for name, base in self._missing_output.items():
+            if getattr(self, name) is None and getattr(results, name) is not None:
+                setattr(self, name, np.copy(getattr(self, base)))
+
+        for name in self._filter_output:
+            if getattr(self, name, None) is None:
+                continue
+            values = getattr(results, name, None)
+            if values is None and name in self._missing_output:
+                values = getattr(results, self._missing_output[name])
+            # Cached output that is otherwise computed on demand
+            elif values is None and name.startswith("_"):
+                values = getattr(results, name[1:])
+            if values is not None:
+                values = values[..., offset:]
+            self._append_output(name, values, self.nobs, nobs)
+
+        self.llf += np.sum(results.llf_obs[offset:])
+
+        self.model = model
+        self.endog = model.endog
+        self.nobs = nobs
+        self.shapes["obs"] = self.endog.shape
+
     @property
     def kalman_gain(self):
         """Kalman gain matrices"""
@@ -33,6 +33,15 @@ SMOOTH_CLASSICAL = 0x02
 SMOOTH_ALTERNATIVE = 0x04
 SMOOTH_UNIVARIATE = 0x08
 
+SMOOTHER_MEMORY_STORE_ALL = 0
+SMOOTHER_MEMORY_NO_COV = 0x01
+SMOOTHER_MEMORY_COV_DIAGONAL = 0x02
+SMOOTHER_MEMORY_NO_ESTIMATOR = 0x04
+SMOOTHER_MEMORY_CONSERVE = (
+    SMOOTHER_MEMORY_NO_COV | SMOOTHER_MEMORY_COV_DIAGONAL |
+    SMOOTHER_MEMORY_NO_ESTIMATOR
+)
+
 
 class KalmanSmoother(KalmanFilter):
     r"""
@@ -94,9 +103,32 @@ class KalmanSmoother(KalmanFilter):
     smooth_univariate = OptionWrapper("smooth_method", SMOOTH_UNIVARIATE)
     """(bool) Flag for univariate smoothing (uses modified Bryson-Frazier timing)"""
 
+    smoother_memory_options = [
+        "smoother_memory_store_all", "smoother_memory_no_cov",
+        "smoother_memory_cov_diagonal", "smoother_memory_no_estimator",
+        "smoother_memory_conserve"
+    ]
+
+    smoother_memory_store_all = OptionWrapper(
+        "smoother_conserve_memory", SMOOTHER_MEMORY_STORE_ALL)
+    """(bool) Flag for storing all smoother output"""
+    smoother_memory_no_cov = OptionWrapper(
+        "smoother_conserve_memory", SMOOTHER_MEMORY_NO_COV)
+    """(bool) Flag to prevent computing and storing smoothed covariances"""
+    smoother_memory_cov_diagonal = OptionWrapper(
+        "smoother_conserve_memory", SMOOTHER_MEMORY_COV_DIAGONAL)
+    """(bool) Flag to only store the diagonals of smoothed covariances"""
+    smoother_memory_no_estimator = OptionWrapper(
+        "smoother_conserve_memory", SMOOTHER_MEMORY_NO_ESTIMATOR)
+    """(bool) Flag to prevent storing the smoother recursions"""
+    smoother_memory_conserve = OptionWrapper(
+        "smoother_conserve_memory", SMOOTHER_MEMORY_CONSERVE)
+    """(bool) Flag to conserve the maximum amount of smoother memory"""
+
     # Default smoother options
     smoother_output = SMOOTHER_ALL
     smooth_method = 0
+    smoother_conserve_memory = SMOOTHER_MEMORY_STORE_ALL
 
     def __init__(self, k_endog, k_states, k_posdef=None, results_class=None,
                  kalman_smoother_classes=None, **kwargs):
@@ -111,6 +143,10 @@ class KalmanSmoother(KalmanFilter):
         keys = ["smooth_method"] + KalmanSmoother.smooth_methods
         smooth_method_kwargs = {key: kwargs.pop(key) for key in keys
                                 if key in kwargs}
+        keys = (["smoother_conserve_memory"] +
+                KalmanSmoother.smoother_memory_options)
+        smoother_memory_kwargs = {key: kwargs.pop(key) for key in keys
+                                  if key in kwargs}
 
         # Initialize the base class
         super().__init__(
@@ -129,6 +165,7 @@ class KalmanSmoother(KalmanFilter):
         # Set the smoother options
         self.set_smoother_output(**smoother_output_kwargs)
         self.set_smooth_method(**smooth_method_kwargs)
+        self.set_smoother_conserve_memory(**smoother_memory_kwargs)
 
     def _clone_kwargs(self, endog, **kwargs):
         # See Representation._clone_kwargs for docstring
@@ -137,6 +174,8 @@ class KalmanSmoother(KalmanFilter):
         # Get defaults for options
         kwargs.setdefault("smoother_output", self.smoother_output)
         kwargs.setdefault("smooth_method", self.smooth_method)
+        kwargs.setdefault("smoother_conserve_memory",
+                          self.smoother_conserve_memory)
 
         return kwargs
 
@@ -148,11 +187,14 @@ class KalmanSmoother(KalmanFilter):
         return None
 
     def _initialize_smoother(self, smoother_output=None, smooth_method=None,
-                             prefix=None, **kwargs):
+                             prefix=None, smoother_conserve_memory=None,
+                             **kwargs):
         if smoother_output is None:
             smoother_output = self.smoother_output
         if smooth_method is None:
             smooth_method = self.smooth_method
+        if smoother_conserve_memory is None:
+            smoother_conserve_memory = self.smoother_conserve_memory
 
         # Make sure we have the required Kalman filter
         prefix, dtype, create_filter, create_statespace = (
@@ -176,13 +218,18 @@ class KalmanSmoother(KalmanFilter):
             cls = self.prefix_kalman_smoother_map[prefix]
             self._kalman_smoothers[prefix] = cls(
                 self._statespaces[prefix], self._kalman_filters[prefix],
-                smoother_output, smooth_method
+                smoother_output, smooth_method, smoother_conserve_memory
             )
         # Otherwise, update the smoother parameters
         else:
-            self._kalman_smoothers[prefix].set_smoother_output(
-                smoother_output, False)
-            self._kalman_smoothers[prefix].set_smooth_method(smooth_method)
+            kalman_smoother = self._kalman_smoothers[prefix]
+            # Memory conservation is validated against the smooth method
+            if smoother_conserve_memory:
+                kalman_smoother.set_smooth_method(smooth_method)
+            kalman_smoother.set_smoother_conserve_memory(
+                smoother_conserve_memory, False)
+            kalman_smoother.set_smoother_output(smoother_output, False)
+            kalman_smoother.set_smooth_method(smooth_method)
 
         return prefix, dtype, create_smoother, create_filter, create_statespace
 
@@ -346,12 +393,90 @@ class KalmanSmoother(KalmanFilter):
             if name in kwargs:
                 setattr(self, name, kwargs[name])
 
+    def set_smoother_conserve_memory(self, smoother_conserve_memory=None,
+                                     **kwargs):
+        r"""
+        Set the smoother memory conservation method
+
+        By default, the Kalman smoother stores its output for every period.
+        The memory conservation options control which of those arrays are
+        stored, independently of the memory conservation options of the
+        Kalman filter.
+
+        Parameters
+        ----------
+        smoother_conserve_memory : int, optional
+            Bitmask value to set the memory conservation method to. See notes
+            for details.
+        **kwargs
+            Keyword arguments may be used to influence the memory conservation
+            method by setting individual boolean flags. See notes for details.
+
+        Notes
+        -----
+        The memory conservation method is defined by a collection of boolean
+        flags, and is internally stored as a bitmask. The methods available
+        are:
+
+        SMOOTHER_MEMORY_STORE_ALL = 0
+            Store all smoother output.
+        SMOOTHER_MEMORY_NO_COV = 0x01
+            Do not compute or store the covariance matrices of the smoothed
+            states and disturbances, or the smoothed state autocovariances, so
+            that only the smoothed means are available.
+        SMOOTHER_MEMORY_COV_DIAGONAL = 0x02
+            Only store the diagonals of the covariance matrices of the
+            smoothed states and disturbances, as `smoothed_state_var`,
+            `smoothed_measurement_disturbance_var` and
+            `smoothed_state_disturbance_var`. The smoothed state
+            autocovariances are not computed.
+        SMOOTHER_MEMORY_NO_ESTIMATOR = 0x04
+            Do not store the scaled smoothed estimator, its covariance matrix
+            and the innovations transition matrix for every period, but only
+            the periods used by the backwards recursions.
+        SMOOTHER_MEMORY_CONSERVE
+            Combines all of the above, so that only the smoothed states and
+            disturbances are stored.
+
+        Output that is not stored is None in the `SmootherResults`. Memory
+        conservation is only available with the conventional and univariate
+        smoothing methods.
+
+        If the bitmask is set directly via the `smoother_conserve_memory`
+        argument, then the full method must be provided.
+
+        If keyword arguments are used to set individual boolean flags, then
+        the lowercase of the method must be used as an argument name, and the
+        value is the desired value of the boolean flag (True or False).
+
+        Examples
+        --------
+        >>> mod = sm.tsa.statespace.SARIMAX(range(10))
+        >>> mod.ssm.smoother_conserve_memory
+        0
+        >>> mod.ssm.smoother_memory_cov_diagonal = True
+        >>> mod.ssm.smoother_conserve_memory
+        2
+        >>> res = mod.ssm.smooth()
+        >>> res.smoothed_state_cov is None
+        True
+        >>> res.smoothed_state_var.shape
+        (1, 10)
+        """
+        if smoother_conserve_memory is not None:
+            self.smoother_conserve_memory = smoother_conserve_memory
+        for name in KalmanSmoother.smoother_memory_options:
+            if name in kwargs:
+                setattr(self, name, kwargs[name])
+
     def _smooth(self, smoother_output=None, smooth_method=None, prefix=None,
-                complex_step=False, results=None, **kwargs):
+                complex_step=False, results=None,
+                smoother_conserve_memory=None, **kwargs):
         # Initialize the smoother
         prefix, dtype, create_smoother, create_filter, create_statespace = (
             self._initialize_smoother(
-                smoother_output, smooth_method, prefix=prefix, **kwargs
+                smoother_output, smooth_method, prefix=prefix,
+                smoother_conserve_memory=smoother_conserve_memory, **kwargs
             ))
 
         # Check that the filter and statespace weren't just recreated
@@ -371,7 +496,8 @@ class KalmanSmoother(KalmanFilter):
     def smooth(self, smoother_output=None, smooth_method=None, results=None,
                run_filter=True, prefix=None, complex_step=False,
                update_representation=True, update_filter=True,
-               update_smoother=True, **kwargs):
+               update_smoother=True, smoother_conserve_memory=None,
+               **kwargs):
         """
         Apply the Kalman smoother to the statespace model.
 
@@ -407,6 +533,10 @@ class KalmanSmoother(KalmanFilter):
         update_smoother : bool, optional
             Whether or not to update the smoother results in the results
             object with the output of the Kalman smoother. Default is True.
+        smoother_conserve_memory : int, optional
+            Determines which Kalman smoother output is stored, see
+            `set_smoother_conserve_memory`. Default is the method specified
+            by `smoother_conserve_memory` in the current state space model.
         **kwargs
             Additional keyword arguments to pass to the Kalman filter. See
             `KalmanFilter.filter` for more details.
@@ -433,7 +563,9 @@ class KalmanSmoother(KalmanFilter):
         # Run the smoother
         if smoother_output is None:
             smoother_output = self.smoother_output
-        smoother = self._smooth(smoother_output, results=results, **kwargs)
+        smoother = self._smooth(
+            smoother_output, results=results,
+            smoother_conserve_memory=smoother_conserve_memory, **kwargs)
 
         # Update the results
         if update_smoother:
@@ -575,6 +707,16 @@ class SmootherResults(FilterResults):
         period.
     smoothed_state_disturbance_cov : ndarray
         The smoothed state disturbance covariance matrices at each time period.
+    smoother_conserve_memory : int
+        Bitmask representing the selected smoother memory conservation
+        method. Output that was not stored is None.
+    smoothed_state_var : ndarray
+        The diagonals of the smoothed state covariance matrices.
+    smoothed_measurement_disturbance_var : ndarray
+        The diagonals of the smoothed measurement disturbance covariance
+        matrices.
+    smoothed_state_disturbance_var : ndarray
+        The diagonals of the smoothed state disturbance covariance matrices.
     """
 
     _smoother_attributes = [
@@ -583,13 +725,32 @@ class SmootherResults(FilterResults):
         "smoothed_state", "smoothed_state_cov", "smoothed_state_autocov",
         "smoothed_measurement_disturbance", "smoothed_state_disturbance",
         "smoothed_measurement_disturbance_cov",
-        "smoothed_state_disturbance_cov", "innovations_transition"
+        "smoothed_state_disturbance_cov", "innovations_transition",
+        "smoothed_state_var", "smoothed_measurement_disturbance_var",
+        "smoothed_state_disturbance_var"
     ]
 
     _smoother_options = KalmanSmoother.smoother_outputs
 
     _attributes = FilterResults._model_attributes + _smoother_attributes
 
+    # Output arrays with a final (time) axis, which are extended by
+    # `_append_results`
+    _smoother_output = [
+        "scaled_smoothed_estimator", "scaled_smoothed_estimator_cov",
+        "smoothing_error", "smoothed_state", "smoothed_state_cov",
+        "smoothed_state_autocov", "smoothed_measurement_disturbance",
+        "smoothed_state_disturbance", "smoothed_measurement_disturbance_cov",
+        "smoothed_state_disturbance_cov", "innovations_transition",
+        "smoothed_state_var", "smoothed_measurement_disturbance_var",
+        "smoothed_state_disturbance_var"
+    ]
+    _smoother_diffuse_output = [
+        "scaled_smoothed_diffuse_estimator",
+        "scaled_smoothed_diffuse1_estimator_cov",
+        "scaled_smoothed_diffuse2_estimator_cov"
+    ]
+
     def update_representation(self, model, only_options=False):
         """
         Update the results to match a given model
@@ -635,18 +796,33 @@ class SmootherResults(FilterResults):
         # Copy the appropriate output
         attributes = []
 
+        # The memory conservation method is taken from the smoother itself,
+        # since it may have been given for a single call to `smooth`
+        memory = smoother.smoother_conserve_memory
+        self.smoother_conserve_memory = memory
+        self.smoother_memory_no_cov = bool(memory & SMOOTHER_MEMORY_NO_COV)
+        self.smoother_memory_cov_diagonal = bool(
+            memory & SMOOTHER_MEMORY_COV_DIAGONAL)
+        self.smoother_memory_no_estimator = bool(
+            memory & SMOOTHER_MEMORY_NO_ESTIMATOR)
+        no_cov = self.smoother_memory_no_cov
+        full_cov = not (no_cov or self.smoother_memory_cov_diagonal)
+        no_estimator = self.smoother_memory_no_estimator
+
         # Since update_representation will already have been called, we can
         # use the boolean options smoother_* and know they match the smoother
         # itself
-        if self.smoother_state or self.smoother_disturbance:
+        if ((self.smoother_state or self.smoother_disturbance)
+                and not no_estimator):
             attributes.append("scaled_smoothed_estimator")
-        if self.smoother_state_cov or self.smoother_disturbance_cov:
+        if ((self.smoother_state_cov or self.smoother_disturbance_cov)
+                and not (no_estimator or no_cov)):
             attributes.append("scaled_smoothed_estimator_cov")
         if self.smoother_state:
             attributes.append("smoothed_state")
-        if self.smoother_state_cov:
+        if self.smoother_state_cov and full_cov:
             attributes.append("smoothed_state_cov")
-        if self.smoother_state_autocov:
+        if self.smoother_state_autocov and full_cov:
             attributes.append("smoothed_state_autocov")
         if self.smoother_disturbance:
             attributes += [
@@ -654,7 +830,7 @@ class SmootherResults(FilterResults):
                 "smoothed_measurement_disturbance",
                 "smoothed_state_disturbance"
             ]
-        if self.smoother_disturbance_cov:
+        if self.smoother_disturbance_cov and full_cov:
             attributes += [
                 "smoothed_measurement_disturbance_cov",
                 "smoothed_state_disturbance_cov"
@@ -683,7 +859,8 @@ class SmootherResults(FilterResults):
                         # In the missing data case, we want to set the missing
                         # components equal to their unconditional distribution
                         copy_index_matrix(
-                            self.obs_cov, matrix, self.missing,
+                            np.asarray(self.obs_cov, dtype=matrix.dtype),
+                            matrix, self.missing,
                             index_rows=True, index_cols=True, inplace=True,
                             prefix=self.prefix)
                     else:
@@ -695,14 +872,43 @@ class SmootherResults(FilterResults):
             else:
                 setattr(self, name, None)
 
-        self.innovations_transition = (
-            np.array(smoother.innovations_transition, copy=True))
+        if not no_estimator:
+            self.innovations_transition = (
+                np.array(smoother.innovations_transition, copy=True))
+
+        # Diagonals of the covariance matrices
+        if self.smoother_state_cov and not no_cov:
+            if full_cov:
+                self.smoothed_state_var = np.diagonal(
+                    self.smoothed_state_cov).T.copy()
+            else:
+                self.smoothed_state_var = np.array(
+                    smoother.smoothed_state_var, copy=True)
+        if self.smoother_disturbance_cov and not no_cov:
+            if full_cov:
+                self.smoothed_measurement_disturbance_var = np.diagonal(
+                    self.smoothed_measurement_disturbance_cov).T.copy()
+                self.smoothed_state_disturbance_var = np.diagonal(
+                    self.smoothed_state_disturbance_cov).T.copy()
+            else:
+                var = np.array(smoother.smoothed_measurement_disturbance_var,
+                               copy=True)
+                if has_missing:
+                    var = np.array(reorder_missing_vector(
+                        var, self.missing, prefix=self.prefix))
+                    # As for the covariance matrices, the missing components
+                    # have their unconditional variance
+                    obs_var = np.diagonal(self.obs_cov).T.astype(var.dtype)
+                    var = np.where(self.missing, obs_var, var)
+                self.smoothed_measurement_disturbance_var = var
+                self.smoothed_state_disturbance_var = np.array(
+                    smoother.smoothed_state_disturbance_var, copy=True)
 
         # Diffuse objects
         self.scaled_smoothed_diffuse_estimator = None
         self.scaled_smoothed_diffuse1_estimator_cov = None
         self.scaled_smoothed_diffuse2_estimator_cov = None
-        if self.nobs_diffuse > 0:
+        if self.nobs_diffuse > 0 and not no_estimator:
             self.scaled_smoothed_diffuse_estimator = np.array(
                 smoother.scaled_smoothed_diffuse_estimator, copy=True)
             self.scaled_smoothed_diffuse1_estimator_cov = np.array(
@@ -741,19 +947,67 @@ class SmootherResults(FilterResults):
         # loglikelihood values and all of the covariance matrices and the
         # values that depend on the covariance matrices
         if self.filter_concentrated and self.model._scale is None:
-            self.smoothed_state_cov *= self.scale
-            self.smoothed_state_autocov *= self.scale
-            self.smoothed_state_disturbance_cov *= self.scale
-            self.smoothed_measurement_disturbance_cov *= self.scale
-            self.scaled_smoothed_estimator_presample /= self.scale
-            self.scaled_smoothed_estimator /= self.scale
-            self.scaled_smoothed_estimator_cov_presample /= self.scale
-            self.scaled_smoothed_estimator_cov /= self.scale
-            self.smoothing_error /= self.scale
+            for name in ["smoothed_state_cov", "smoothed_state_autocov",
+                         "smoothed_state_disturbance_cov",
+                         "smoothed_measurement_disturbance_cov",
+                         "smoothed_state_var",
+                         "smoothed_measurement_disturbance_var",
+                         "smoothed_state_disturbance_var"]:
+                if getattr(self, name) is not None:
+                    getattr(self, name)[:] *= self.scale
+            if "scaled_smoothed_estimator" in attributes:
+                self.scaled_smoothed_estimator_presample /= self.scale
+                self.scaled_smoothed_estimator /= self.scale
+            if "scaled_smoothed_estimator_cov" in attributes:
+                self.scaled_smoothed_estimator_cov_presample /= self.scale
+                self.scaled_smoothed_estimator_cov /= self.scale
+            if self.smoothing_error is not None:
+                self.smoothing_error /= self.scale
 
         # Cache
         self.__smoothed_state_autocovariance = {}
 
+    def _append_results(self, model, results):
+        """
+        Extend the smoother results with output for new observations
+
+        Parameters
+        ----------
+        model : Representation
+            The model object, bound to the data including the new
+            observations.
+        results : SmootherResults
+            Results from applying the Kalman filter and smoother to the final
+            periods of the data bound to `model`, including at least all of
+            the new observations.
+
+        Notes
+        -----
+        The smoother output for all periods included in `results` is
+        replaced, while the smoother output for earlier periods is left as
+        it was.
+
+        This method is rarely required except for internal usage.
+        """
+        nobs = model.nobs
+        start = nobs - results.nobs
+
+        for name in self._smoother_output:
+            if getattr(self, name, None) is not None:
+                self._append_output(name, getattr(results, name), start, nobs)
+        # The diffuse periods have ended, so that these are zero for all new
+        # periods
+        for name in self._smoother_diffuse_output:
+            if getattr(self, name, None) is not None:
+                self._append_output(name, None, self.nobs, nobs)
+
+        super()._append_results(model, results)
+
+        self._smoothed_forecasts = None
+        self._smoothed_forecasts_error = None
+        self._smoothed_forecasts_error_cov = None
+        self.__smoothed_state_autocovariance = {}
+
     def _smoothed_state_autocovariance(self, shift, start, end,
                                        extend_kwargs=None):
         """
@@ -797,6 +1051,15 @@ class SmootherResults(FilterResults):
             max_insample = self.nobs - shift + 1
         n_postsample = max(0, end - max_insample)
 
+        # Cannot compute autocovariances if smoother memory conservation has
+        # been used to avoid storing the required arrays
+        if self.smoother_memory_no_cov or (
+                shift != 0 and self.smoother_memory_no_estimator):
+            raise ValueError("Smoothed state autocovariances are not"
+                             " available if smoother memory conservation has"
+                             " been used to avoid storing smoothed"
+                             " covariances or scaled smoothed estimators.")
+
         # Get full in-sample arrays
         if shift != 0:
             L = self.innovations_transition
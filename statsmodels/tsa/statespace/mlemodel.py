@@ -9,6 +9,7 @@ from statsmodels.compat.numpy import inplace_reshape
 from statsmodels.compat.pandas import deprecate_kwarg, is_int_index
 
 import contextlib
+import copy
 import datetime as dt
 from types import SimpleNamespace
 import warnings
@@ -34,12 +35,24 @@ import statsmodels.tsa.base.prediction as pred
 import statsmodels.tsa.base.tsa_model as tsbase
 from statsmodels.tsa.stattools._stattools import breakvar_heteroskedasticity_test
 
+from .batch import MATRICES, _system, batch_kalman, loglike_many
 from .initialization import Initialization
-from .kalman_filter import INVERT_UNIVARIATE, MEMORY_CONSERVE, SOLVE_LU
+from .kalman_filter import (
+    INVERT_UNIVARIATE,
+    MEMORY_CONSERVE,
+    MEMORY_NO_SMOOTHING,
+    SOLVE_LU,
+)
 from .kalman_smoother import SmootherResults
 from .news import NewsResults
 from .simulation_smoother import SimulationSmoother
-from .tools import _safe_cond, concat, get_impact_dates, prepare_exog
+from .tools import (
+    _safe_cond,
+    concat,
+    get_impact_dates,
+    prefix_kalman_filter_score_map,
+    prepare_exog,
+)
 
 
 def _handle_args(names, defaults, *args, **kwargs):
@@ -110,8 +123,9 @@ class MLEModel(tsbase.TimeSeriesModel):
         'M', 'A', or 'Q'. This is optional if dates are given.
     **kwargs
         Keyword arguments may be used to provide default values for state space
-        matrices or for Kalman filtering options. See `Representation`, and
-        `KalmanFilter` for more details.
+        matrices or for Kalman filtering options, such as `single_precision`
+        to run the Kalman filter and smoother in single precision. See
+        `Representation`, and `KalmanFilter` for more details.
 
     Attributes
     ----------
@@ -239,12 +253,72 @@ class MLEModel(tsbase.TimeSeriesModel):
             raise NotImplementedError
         return index
 
+    def _append_endog(self, endog):
+        """
+        Append new observations to the data of the model, in place
+
+        Parameters
+        ----------
+        endog : array_like
+            New observations, shaped (nobs, k_endog), directly following the
+            end of the current data. If the model data is Pandas, then this
+            must be a Pandas object of the same type, with the appropriate
+            index.
+
+        Notes
+        -----
+        The data is held in a buffer whose capacity is doubled when exhausted,
+        so that repeatedly appending observations requires amortized constant
+        time and memory per observation.
+
+        This method is used by `MLEResults.update`, which applies it to a copy
+        of the model.
+        """
+        nobs = self.nobs + len(endog)
+        _, _, _, index = self._get_prediction_index(0, nobs - 1, silent=True)
+        if index is None:
+            index = pd.RangeIndex(nobs)
+
+        buffer = getattr(self, "_endog_buffer", None)
+        if buffer is None or self.endog.base is not buffer or len(buffer) < nobs:
+            buffer = np.empty(
+                (max(nobs, 2 * self.nobs), self.k_endog), dtype=self.endog.dtype
+            )
+            buffer[: self.nobs] = self.endog
+            self._endog_buffer = buffer
+        buffer[self.nobs : nobs] = np.reshape(endog, (-1, self.k_endog))
+
+        self.endog = buffer[:nobs]
+        self.nobs = nobs
+        self.ssm.bind(self.endog)
+
+        # Update the data handler and the index
+        data = self.data
+        endog_view = self.endog if np.ndim(data.endog) > 1 else self.endog[:, 0]
+        if isinstance(data, PandasData):
+            data.orig_endog = pd.concat([data.orig_endog, endog])
+        else:
+            data.orig_endog = endog_view
+        data.endog = endog_view
+        data._cache = {}
+        self._index = index
+        if self._index_dates:
+            data.dates = self._index
+
     def __setitem__(self, key, value):
         return self.ssm.__setitem__(key, value)
 
     def __getitem__(self, key):
         return self.ssm.__getitem__(key)
 
+    def _thread_copy(self):
+        # `update` sets the parameters in the state space representation,
+        # so the copy gets its own `ssm`, sharing the data with this model
+        model = copy.copy(self)
+        memo = {id(self.ssm.endog): self.ssm.endog}
+        model.ssm = copy.deepcopy(self.ssm, memo)
+        return model
+
     def _get_init_kwds(self):
         # Get keywords based on model attributes
         kwds = super()._get_init_kwds()
@@ -417,6 +491,33 @@ class MLEModel(tsbase.TimeSeriesModel):
         """
         self.ssm.set_smoother_output(smoother_output, **kwargs)
 
+    def set_smoother_conserve_memory(self, smoother_conserve_memory=None,
+                                     **kwargs):
+        """
+        Set the smoother memory conservation method
+
+        By default, the Kalman smoother computes and stores all of the
+        requested smoother output in every period. This can be reduced, for
+        example to store only the diagonals of the smoothed covariance
+        matrices.
+
+        Parameters
+        ----------
+        smoother_conserve_memory : int, optional
+            Bitmask value to set the smoother memory conservation method to.
+            See notes for details.
+        **kwargs
+            Keyword arguments may be used to influence the memory conservation
+            method by setting individual boolean flags.
+
+        Notes
+        -----
+        This method is rarely used. See the corresponding function in the
+        `KalmanSmoother` class for details.
+        """
+        self.ssm.set_smoother_conserve_memory(smoother_conserve_memory,
+                                              **kwargs)
+
     def initialize_known(self, initial_state, initial_state_cov):
         """Initialize known"""
         self.ssm.initialize_known(initial_state, initial_state_cov)
@@ -629,18 +730,20 @@ class MLEModel(tsbase.TimeSeriesModel):
         return_params : bool, optional
             Whether or not to return only the array of maximizing parameters.
             Default is False.
-        optim_score : {'harvey', 'approx'} or None, optional
+        optim_score : {'harvey', 'analytic', 'approx'} or None, optional
             The method by which the score vector is calculated. 'harvey' uses
-            the method from Harvey (1989), 'approx' uses either finite
-            difference or complex step differentiation depending upon the
-            value of `optim_complex_step`, and None uses the built-in gradient
-            approximation of the optimizer. Default is None. This keyword is
-            only relevant if the optimization method uses the score.
+            the method from Harvey (1989), 'analytic' uses a single pass of a
+            Kalman filter that also propagates the partial derivatives of the
+            states, 'approx' uses either finite difference or complex step
+            differentiation depending upon the value of `optim_complex_step`,
+            and None uses the built-in gradient approximation of the
+            optimizer. Default is None. This keyword is only relevant if the
+            optimization method uses the score.
         optim_complex_step : bool, optional
             Whether or not to use complex step differentiation when
             approximating the score; if False, finite difference approximation
             is used. Default is True. This keyword is only relevant if
-            `optim_score` is set to 'harvey' or 'approx'.
+            `optim_score` is set to 'harvey', 'analytic' or 'approx'.
         optim_hessian : {'opg', 'oim', 'approx'}, optional
             The method by which the Hessian is numerically approximated. 'opg'
             uses outer product of gradients, 'oim' uses the information
@@ -766,19 +869,25 @@ class MLEModel(tsbase.TimeSeriesModel):
                 func = self.filter
             else:
                 func = self.smooth
-            res = func(
-                mlefit.params,
-                transformed=False,
-                includes_fixed=False,
-                cov_type=cov_type,
-                cov_kwds=cov_kwds,
-            )
+            profile = getattr(mlefit, "fit_profile", None)
+            with profile.phase(func.__name__) if profile else contextlib.nullcontext():
+                res = func(
+                    mlefit.params,
+                    transformed=False,
+                    includes_fixed=False,
+                    cov_type=cov_type,
+                    cov_kwds=cov_kwds,
+                )
 
             # Attach to the underlying results instance rather than the
             # wrapper, so these attributes also show up in dir(res).
             res._results.mlefit = mlefit
             res._results.mle_retvals = mlefit.mle_retvals
             res._results.mle_settings = mlefit.mle_settings
+            res._results.fit_profile = profile
+            res._results.params_cache_info = getattr(
+                mlefit, "params_cache_info", None
+            )
 
             # Reset memory conservation
             if low_memory:
@@ -1009,6 +1118,188 @@ class MLEModel(tsbase.TimeSeriesModel):
             results_wrapper_class,
         )
 
+    def filter_batch(
+        self,
+        params,
+        endog,
+        transformed=True,
+        includes_fixed=False,
+        store_filtered=False,
+        store_cov=False,
+        n_jobs=1,
+    ):
+        """
+        Kalman filtering of many series that share this model
+
+        Parameters
+        ----------
+        params : array_like
+            The parameters, either one set that is shared by all series,
+            (k_params,), or one set for each series, (nseries, k_params).
+        endog : array_like
+            The observations of the series, (nseries, nobs) or
+            (nseries, nobs, k_endog). Missing observations are NaN.
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+        store_filtered : bool, optional
+            Whether to store the filtered states. Default is False.
+        store_cov : bool, optional
+            Whether to also store the covariance matrices of the filtered
+            states. Default is False.
+        n_jobs : int, optional
+            The number of threads among which the series are split. Negative
+            values are relative to the number of CPUs. Default is 1.
+
+        Returns
+        -------
+        BatchKalmanResults
+            The loglikelihoods, the states predicted for the period after the
+            sample, which can be used to forecast all series, and the stored
+            filtered states.
+
+        See Also
+        --------
+        smooth_batch
+        statsmodels.tsa.statespace.batch.batch_kalman
+
+        Notes
+        -----
+        All series are filtered in a single call to the compiled conventional
+        Kalman filter. The system matrices of the model, including those that
+        depend on exogenous variables, are used for all series. Parameters
+        that differ between series only require the system matrices to be
+        computed once for each series. Exact diffuse initialization and
+        concentrating the scale are not supported, and the filter options of
+        the model, e.g., univariate filtering, are not used.
+        """
+        return batch_kalman(
+            self,
+            params,
+            endog,
+            transformed=transformed,
+            includes_fixed=includes_fixed,
+            store_filtered=store_filtered,
+            store_cov=store_cov,
+            n_jobs=n_jobs,
+        )
+
+    def smooth_batch(
+        self,
+        params,
+        endog,
+        transformed=True,
+        includes_fixed=False,
+        store_filtered=False,
+        store_cov=False,
+        n_jobs=1,
+    ):
+        """
+        Kalman smoothing of many series that share this model
+
+        Parameters
+        ----------
+        params : array_like
+            The parameters, either one set that is shared by all series,
+            (k_params,), or one set for each series, (nseries, k_params).
+        endog : array_like
+            The observations of the series, (nseries, nobs) or
+            (nseries, nobs, k_endog). Missing observations are NaN.
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+        store_filtered : bool, optional
+            Whether to store the filtered states. Default is False.
+        store_cov : bool, optional
+            Whether to also store the covariance matrices of the filtered and
+            smoothed states. Default is False.
+        n_jobs : int, optional
+            The number of threads among which the series are split. Negative
+            values are relative to the number of CPUs. Default is 1.
+
+        Returns
+        -------
+        BatchKalmanResults
+            The results of `filter_batch` and the smoothed states.
+
+        See Also
+        --------
+        filter_batch
+        statsmodels.tsa.statespace.batch.batch_kalman
+        """
+        return batch_kalman(
+            self,
+            params,
+            endog,
+            transformed=transformed,
+            includes_fixed=includes_fixed,
+            smooth=True,
+            store_filtered=store_filtered,
+            store_cov=store_cov,
+            n_jobs=n_jobs,
+        )
+
+    def loglike_many(self, params, transformed=True, includes_fixed=False, n_jobs=1):
+        """
+        Loglikelihood evaluation at many sets of parameters
+
+        Parameters
+        ----------
+        params : array_like
+            The sets of parameters, (nparams, k_params).
+        transformed : bool, optional
+            Whether or not `params` is already transformed. Default is True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+        n_jobs : int, optional
+            The number of threads among which the sets of parameters are
+            split. Negative values are relative to the number of CPUs.
+            Default is 1.
+
+        Returns
+        -------
+        ndarray
+            The loglikelihood for each set of parameters, (nparams,).
+
+        See Also
+        --------
+        loglike
+        filter_batch
+
+        Notes
+        -----
+        The observations of the model are filtered once for each set of
+        parameters by the compiled conventional Kalman filter used by
+        `filter_batch`. The filters are independent, so that with `n_jobs`
+        larger than one they run concurrently in threads, each with its own
+        workspace, without holding the GIL. This is useful, e.g., for grid
+        searches of starting parameters or for population-based optimizers.
+
+        Exact diffuse initialization and concentrating the scale are not
+        supported, and the filter options of the model, e.g., univariate
+        filtering, are not used. The loglikelihood is NaN for the sets of
+        parameters for which the forecast error covariance matrix is not
+        positive definite.
+        """
+        return loglike_many(
+            self,
+            params,
+            transformed=transformed,
+            includes_fixed=includes_fixed,
+            n_jobs=n_jobs,
+        )
+
     _loglike_param_names = ["transformed", "includes_fixed", "complex_step"]
     _loglike_param_defaults = [True, False, False]
 
@@ -1584,6 +1875,114 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return -partials / 2.0
 
+    def _score_analytic(self, params, approx_complex_step=True, **kwargs):
+        score_obs = self._score_obs_analytic(
+            params, approx_complex_step=approx_complex_step, **kwargs
+        )
+        return np.sum(score_obs, axis=0)
+
+    def _score_obs_analytic(
+        self,
+        params,
+        approx_complex_step=True,
+        includes_fixed=False,
+        **kwargs,
+    ):
+        """
+        Score per observation from the derivative Kalman filter
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters at which to evaluate the score.
+        approx_complex_step : bool, optional
+            Whether or not to compute the partial derivatives of the system
+            matrices with respect to the parameters using complex step
+            differentiation; otherwise finite differences are used. Default is
+            True.
+        includes_fixed : bool, optional
+            If parameters were previously fixed with the `fix_params` method,
+            this argument describes whether or not `params` also includes
+            the fixed parameters, in addition to the free parameters. Default
+            is False.
+        **kwargs
+            Additional keyword arguments. The `loglikelihood_burn` keyword
+            overrides the number of burned observations, for which the score
+            is zero.
+
+        Notes
+        -----
+        The partial derivatives of the system matrices are computed by
+        updating the model once for each parameter, without running the
+        Kalman filter. A single pass of the conventional Kalman filter, which
+        also propagates the partial derivatives of the predicted state and
+        its covariance matrix, then gives the score analytically, see Harvey
+        (1989), section 3.4.5. This requires a non-diffuse initialization and
+        that the scale is not concentrated out of the likelihood.
+
+        References
+        ----------
+        Harvey, Andrew C. 1990.
+        Forecasting, Structural Time Series Models and the Kalman Filter.
+        Cambridge University Press.
+        """
+        params = np.array(params, ndmin=1)
+        n = len(params)
+        name = "analytic score"
+
+        # Partial derivatives of the system matrices
+        partials = {}
+        epsilon = _get_epsilon(params, 2, None, n)
+        if not approx_complex_step:
+            self.update(params, transformed=True, includes_fixed=includes_fixed)
+            system = _system(self.ssm, filter_name=name)
+        for i in range(n):
+            if approx_complex_step:
+                ih = np.zeros(n, dtype=complex)
+                ih[i] = 1j * epsilon[i]
+                self.update(
+                    params + ih,
+                    transformed=True,
+                    includes_fixed=includes_fixed,
+                    complex_step=True,
+                )
+                current = _system(self.ssm, complex_step=True, filter_name=name)
+            else:
+                ei = np.zeros(n)
+                ei[i] = epsilon[i]
+                self.update(
+                    params + ei, transformed=True, includes_fixed=includes_fixed
+                )
+                current = _system(self.ssm, filter_name=name)
+            for key, value in current.items():
+                if key not in partials:
+                    partials[key] = np.zeros(value.shape + (n,), order="F")
+                if approx_complex_step:
+                    partials[key][..., i] = value.imag / epsilon[i]
+                else:
+                    partials[key][..., i] = (value - system[key]) / epsilon[i]
+
+        self.update(params, transformed=True, includes_fixed=includes_fixed)
+        system = _system(self.ssm, filter_name=name)
+
+        prefix = self.ssm.prefix if self.ssm.prefix in ("s", "d") else "d"
+        dtype = np.float32 if prefix == "s" else np.float64
+        llf_obs = np.zeros(self.nobs, dtype=dtype)
+        score_obs = np.zeros((self.nobs, n), dtype=dtype, order="F")
+        keys = MATRICES + ["initial_state", "initial_state_cov"]
+        prefix_kalman_filter_score_map[prefix](
+            np.asfortranarray(self.ssm.endog, dtype=dtype),
+            *[np.asfortranarray(system[key], dtype=dtype) for key in keys],
+            *[np.asfortranarray(partials[key], dtype=dtype) for key in keys],
+            llf_obs,
+            score_obs,
+        )
+        loglikelihood_burn = kwargs.get(
+            "loglikelihood_burn", self.ssm.loglikelihood_burn
+        )
+        score_obs[:loglikelihood_burn] = 0
+        return np.asarray(score_obs, dtype=float)
+
     _score_param_names = [
         "transformed",
         "includes_fixed",
@@ -1613,8 +2012,14 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglike` method.
+        By default, this is a numerical approximation, calculated using
+        first-order complex step differentiation on the `loglike` method. With
+        `score_method='analytic'` the score is instead computed in a single
+        pass of a Kalman filter that also propagates the partial derivatives
+        of the predicted states and their covariance matrices, which only
+        requires numerical derivatives of the system matrices. This requires
+        a non-diffuse initialization and that the scale is not concentrated
+        out of the likelihood.
 
         Both args and kwargs are necessary because the optimizer from
         `fit` must call this function and only supports passing arguments via
@@ -1660,6 +2065,11 @@ class MLEModel(tsbase.TimeSeriesModel):
             score = self._score_harvey(
                 params, approx_complex_step=approx_complex_step, **kwargs
             )
+        elif method == "analytic":
+            kwargs["includes_fixed"] = True
+            score = self._score_analytic(
+                params, approx_complex_step=approx_complex_step, **kwargs
+            )
         elif method == "approx" and approx_complex_step:
             kwargs["includes_fixed"] = True
             score = self._score_complex_step(params, **kwargs)
@@ -1696,8 +2106,10 @@ class MLEModel(tsbase.TimeSeriesModel):
         ----------
         params : array_like
             Array of parameters at which to evaluate the score.
-        method : {'approx', 'harvey'}, optional
+        method : {'approx', 'harvey', 'analytic'}, optional
             The method by which the score is calculated. Default is 'approx'.
+            'analytic' uses a Kalman filter that also propagates the partial
+            derivatives of the predicted states, see `score`.
         transformed : bool, optional
             Whether or not `params` is already transformed. Default is True.
         includes_fixed : bool, optional
@@ -1750,6 +2162,10 @@ class MLEModel(tsbase.TimeSeriesModel):
             score = self._score_obs_harvey(
                 params, approx_complex_step=approx_complex_step, **kwargs
             )
+        elif method == "analytic":
+            score = self._score_obs_analytic(
+                params, approx_complex_step=approx_complex_step, **kwargs
+            )
         elif method == "approx" and approx_complex_step:
             # the default epsilon can be too small
             epsilon = _get_epsilon(params, 2.0, None, len(params))
@@ -2728,6 +3144,58 @@ class MLEResults(tsbase.TimeSeriesModelResults):
     statsmodels.tsa.statespace.representation.FrozenRepresentation
     """
 
+    # References of filter and smoother output
+    _filter_output_arrays = [
+        "filtered_state",
+        "filtered_state_cov",
+        "predicted_state",
+        "predicted_state_cov",
+        "forecasts",
+        "forecasts_error",
+        "forecasts_error_cov",
+        "standardized_forecasts_error",
+        "forecasts_error_diffuse_cov",
+        "predicted_diffuse_state_cov",
+        "scaled_smoothed_estimator",
+        "scaled_smoothed_estimator_cov",
+        "smoothing_error",
+        "smoothed_state",
+        "smoothed_state_cov",
+        "smoothed_state_autocov",
+        "smoothed_measurement_disturbance",
+        "smoothed_state_disturbance",
+        "smoothed_measurement_disturbance_cov",
+        "smoothed_state_disturbance_cov",
+        "smoothed_state_var",
+        "smoothed_measurement_disturbance_var",
+        "smoothed_state_disturbance_var",
+    ]
+
+    # Smoother output that is not stored under each of the smoother memory
+    # conservation options
+    _smoother_memory_output = {
+        "smoother_memory_no_cov": [
+            "scaled_smoothed_estimator_cov",
+            "smoothed_state_cov",
+            "smoothed_state_autocov",
+            "smoothed_measurement_disturbance_cov",
+            "smoothed_state_disturbance_cov",
+            "smoothed_state_var",
+            "smoothed_measurement_disturbance_var",
+            "smoothed_state_disturbance_var",
+        ],
+        "smoother_memory_cov_diagonal": [
+            "smoothed_state_cov",
+            "smoothed_state_autocov",
+            "smoothed_measurement_disturbance_cov",
+            "smoothed_state_disturbance_cov",
+        ],
+        "smoother_memory_no_estimator": [
+            "scaled_smoothed_estimator",
+            "scaled_smoothed_estimator_cov",
+        ],
+    }
+
     def __init__(self, model, params, results, cov_type=None, cov_kwds=None, **kwargs):
         self.data = model.data
         scale = results.scale
@@ -2759,6 +3227,8 @@ class MLEResults(tsbase.TimeSeriesModelResults):
             self.smoother_results = results
         else:
             self.smoother_results = None
+        # Copy of the model that includes observations added by `update`
+        self._updated_model = None
 
         # Dimensions
         self.nobs = self.filter_results.nobs
@@ -2823,30 +3293,19 @@ class MLEResults(tsbase.TimeSeriesModelResults):
             )
         self.model.update(self.params, transformed=True, includes_fixed=True)
 
-        # References of filter and smoother output
-        extra_arrays = [
-            "filtered_state",
-            "filtered_state_cov",
-            "predicted_state",
-            "predicted_state_cov",
-            "forecasts",
-            "forecasts_error",
-            "forecasts_error_cov",
-            "standardized_forecasts_error",
-            "forecasts_error_diffuse_cov",
-            "predicted_diffuse_state_cov",
-            "scaled_smoothed_estimator",
-            "scaled_smoothed_estimator_cov",
-            "smoothing_error",
-            "smoothed_state",
-            "smoothed_state_cov",
-            "smoothed_state_autocov",
-            "smoothed_measurement_disturbance",
-            "smoothed_state_disturbance",
-            "smoothed_measurement_disturbance_cov",
-            "smoothed_state_disturbance_cov",
-        ]
-        for name in extra_arrays:
+        self._set_output_attributes()
+
+        # Handle removing data
+        self._data_attr_model = getattr(self, "_data_attr_model", [])
+        self._data_attr_model.extend(["ssm"])
+        self._data_attr.extend(self._filter_output_arrays)
+        self._data_attr.extend(["filter_results", "smoother_results"])
+
+    def _set_output_attributes(self):
+        """
+        Set references to the filter and smoother output arrays
+        """
+        for name in self._filter_output_arrays:
             setattr(self, name, getattr(self.filter_results, name, None))
 
         # Remove too-short results when memory conservation was used
@@ -2870,6 +3329,17 @@ class MLEResults(tsbase.TimeSeriesModelResults):
         if self.filter_results.memory_no_std_forecast:
             self.standardized_forecasts_error = None
 
+        # Smoother output that was not stored due to smoother memory
+        # conservation raises an informative error on access (see
+        # `__getattr__`) rather than silently being None
+        self._smoother_memory_unavailable = {}
+        for option, names in self._smoother_memory_output.items():
+            if getattr(self.filter_results, option, False):
+                for name in names:
+                    self._smoother_memory_unavailable.setdefault(name, option)
+        for name in self._smoother_memory_unavailable:
+            self.__dict__.pop(name, None)
+
         # Save more convenient access to states
         # (will create a private attribute _states here and provide actual
         # access via a getter, so that we can e.g., issue a warning in the case
@@ -2943,7 +3413,7 @@ class MLEResults(tsbase.TimeSeriesModelResults):
             )
         else:
             self._states.smoothed = self.smoothed_state.T
-        if self.smoothed_state_cov is None:
+        if getattr(self, "smoothed_state_cov", None) is None:
             self._states.smoothed_cov = None
         elif use_pandas:
             tmp = np.transpose(self.smoothed_state_cov, (2, 0, 1))
@@ -2955,11 +3425,18 @@ class MLEResults(tsbase.TimeSeriesModelResults):
         else:
             self._states.smoothed_cov = np.transpose(self.smoothed_state_cov, (2, 0, 1))
 
-        # Handle removing data
-        self._data_attr_model = getattr(self, "_data_attr_model", [])
-        self._data_attr_model.extend(["ssm"])
-        self._data_attr.extend(extra_arrays)
-        self._data_attr.extend(["filter_results", "smoother_results"])
+    def __getattr__(self, name):
+        unavailable = self.__dict__.get("_smoother_memory_unavailable", {})
+        if name in unavailable:
+            msg = (f"`{name}` is not available because smoother memory"
+                   f" conservation (`{unavailable[name]}`) was used to avoid"
+                   " storing it.")
+            if f"{name[:-4]}_var" in self._filter_output_arrays and (
+                    unavailable[name] == "smoother_memory_cov_diagonal"):
+                msg += f" The diagonal is available as `{name[:-4]}_var`."
+            raise AttributeError(msg)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def _get_robustcov_results(self, cov_type="opg", **kwargs):
         """
@@ -3861,6 +4338,14 @@ class MLEResults(tsbase.TimeSeriesModelResults):
         if start is None:
             start = 0
 
+        # Smoothed predictions require the smoothed state covariances, which
+        # are not stored with smoother memory conservation. Raise the error
+        # naming the option here rather than failing in PredictionResults.
+        if information_set == "smoothed":
+            unavailable = self.__dict__.get("_smoother_memory_unavailable", {})
+            if "smoothed_state_cov" in unavailable:
+                _ = self.smoothed_state_cov
+
         # Handle start, end, dynamic
         start, end, out_of_sample, prediction_index = self.model._get_prediction_index(
             start, end, index
@@ -5159,6 +5644,178 @@ class MLEResults(tsbase.TimeSeriesModelResults):
 
         return res
 
+    def update(self, endog, smoothing_lag=None):
+        """
+        Update the results in place with new observations
+
+        Continues the Kalman filter from the final predicted state and
+        predicted state covariance matrix, so that only the new observations
+        are filtered, and adds the output for the new observations to the
+        output of these results.
+
+        Parameters
+        ----------
+        endog : array_like
+            New observations from the modeled time-series process.
+        smoothing_lag : int, optional
+            If these results include smoother output, the number of periods
+            before the new observations for which the smoother output is also
+            recomputed (fixed-lag smoothing). Default is 0, so that the
+            smoother output is only computed for the new observations.
+
+        See Also
+        --------
+        statsmodels.tsa.statespace.mlemodel.MLEResults.append
+        statsmodels.tsa.statespace.mlemodel.MLEResults.extend
+
+        Notes
+        -----
+        The `endog` argument to this method should consist of new observations
+        that occurred directly after the last element of the model's current
+        `endog` array, and must be formatted in the same way (e.g., Pandas
+        Series versus Numpy array) as the original `endog` array.
+
+        The cost of an update depends only on the number of new observations
+        (plus `smoothing_lag`) and not on the number of previous observations.
+        Output arrays are held in buffers whose capacity is doubled when
+        exhausted, so that repeated updates require amortized constant memory
+        per observation.
+
+        The smoother output for periods before the recomputed periods is not
+        changed, so that it only conditions on the observations that were
+        available when it was computed. To retrieve smoother output that
+        conditions on the full dataset, see the `append` method.
+
+        The parameters and their covariance matrix are not changed. The
+        results are attached to a copy of the model that includes the new
+        observations, and the original model is not modified.
+
+        This method is only available for models with time-invariant system
+        matrices and without exogenous regressors, for which all Kalman filter
+        output was stored and the scale was not concentrated out of the
+        likelihood.
+        """
+        if (
+            getattr(self.model, "k_exog", 0) > 0
+            or self.model.data.orig_exog is not None
+        ):
+            raise NotImplementedError(
+                "Updating results in place is not available for models with"
+                " exogenous regressors."
+            )
+        if any(
+            getattr(self.model.ssm, name).shape[-1] > 1
+            for name in self.model.ssm.shapes
+            if name != "obs"
+        ):
+            raise NotImplementedError(
+                "Updating results in place is only available for models with"
+                " time-invariant system matrices."
+            )
+        conserve_memory = self.filter_results.conserve_memory
+        if (
+            conserve_memory & ~MEMORY_NO_SMOOTHING
+            or self.filter_results.filter_concentrated
+        ):
+            raise NotImplementedError(
+                "Updating results in place is not available when memory"
+                " conservation was used or when the scale was concentrated"
+                " out of the likelihood."
+            )
+        if self.nobs_diffuse >= self.nobs:
+            raise ValueError(
+                "Cannot update results in place before the end of the diffuse"
+                " periods."
+            )
+        smoothed = self.smoother_results is not None and any(
+            getattr(self.smoother_results, name, None) is not None
+            for name in self.smoother_results._smoother_output
+        )
+        if smoothing_lag is None:
+            smoothing_lag = 0
+        elif not smoothed:
+            raise ValueError(
+                "Fixed-lag smoothing requires results that include smoother"
+                " output."
+            )
+        smoothing_lag = int(smoothing_lag)
+        if smoothing_lag < 0:
+            raise ValueError("`smoothing_lag` must be non-negative.")
+
+        # Validate the new observations
+        nobs = self.nobs + len(endog)
+        _, _, _, update_ix = self.model._get_prediction_index(self.nobs, nobs - 1)
+        if isinstance(self.model.data, PandasData):
+            _check_index(update_ix, endog, "`endog`")
+            orig_endog = self.model.data.orig_endog
+            if isinstance(orig_endog, pd.Series):
+                endog = pd.Series(
+                    np.reshape(np.asarray(endog), -1),
+                    index=update_ix,
+                    name=orig_endog.name,
+                )
+            else:
+                endog = pd.DataFrame(
+                    np.reshape(np.asarray(endog), (-1, self.model.k_endog)),
+                    index=update_ix,
+                    columns=orig_endog.columns,
+                )
+        else:
+            endog = np.reshape(endog, (-1, self.model.k_endog))
+
+        # Results are not attached to a model that is shared with other
+        # objects, and copies are made of the system matrices so that later
+        # updates to the original model do not affect them
+        if self.model is not self._updated_model:
+            mod = copy.copy(self.model)
+            mod.data = copy.copy(mod.data)
+            matrices = {
+                name: np.array(getattr(mod.ssm, name), order="F")
+                for name in mod.ssm.shapes
+                if name != "obs"
+            }
+            mod.ssm = mod.ssm.clone(mod.endog, **matrices)
+            self._updated_model = self.model = mod
+        mod = self.model
+        if self._has_fixed_params:
+            with mod.fix_params(self._fixed_params):
+                mod.update(self.params, transformed=True, includes_fixed=True)
+        else:
+            mod.update(self.params, transformed=True, includes_fixed=True)
+        mod._append_endog(endog)
+
+        # Apply the Kalman filter (and smoother) to the new observations,
+        # beginning from the stored predicted state
+        if smoothed:
+            start = max(self.nobs - smoothing_lag, self.nobs_diffuse, 0)
+        else:
+            start = self.nobs
+        ssm = mod.ssm
+        window = ssm.clone(
+            mod.endog[start:],
+            initialization=Initialization(
+                ssm.k_states,
+                "known",
+                constant=self.filter_results.predicted_state[:, start],
+                stationary_cov=self.filter_results.predicted_state_cov[:, :, start],
+            ),
+            conserve_memory=conserve_memory,
+            loglikelihood_burn=0,
+        )
+        if smoothed:
+            results = window.smooth()
+        else:
+            results = window.filter()
+        self.filter_results._append_results(ssm, results)
+
+        # Update the results attributes
+        self.data = mod.data
+        self.nobs = nobs
+        self.nobs_effective = self.nobs - self.loglikelihood_burn
+        self.df_resid = self.nobs_effective - self.df_model
+        self._cache = {}
+        self._set_output_attributes()
+
     def apply(
         self,
         endog,
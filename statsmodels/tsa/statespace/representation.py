@@ -118,6 +118,22 @@ class Representation:
         If an endogenous vector is not given (i.e., `k_endog` is an integer),
         the default datatype of the state space matrices can optionally be
         specified. Default is `np.float64`.
+    single_precision : bool, optional
+        Whether to run the filter, smoother and simulation smoother in single
+        precision (float32) instead of double precision, which halves their
+        memory use. The loglikelihood is still accumulated in double
+        precision. Complex-valued (complex-step) computations always use
+        double precision. Default is False.
+    sparse_transition : bool, optional
+        Whether to exploit the structure of the transition matrix. If it is
+        the identity matrix, products with it are skipped. If it is
+        time-invariant, has at least `sparse_transition_min_states` rows and
+        at most a fraction `sparse_transition_density` of its elements are
+        nonzero (as is the case for companion matrices of autoregressions with
+        many lags or for seasonal components), then it is stored in
+        compressed sparse row format and the Kalman filter and smoother
+        compute products with it in :math:`O(m \cdot nnz)` rather than
+        :math:`O(m^3)` operations. Default is True.
     design : array_like, optional
         The design matrix, :math:`Z`. Default is set to zeros.
     obs_intercept : array_like, optional
@@ -164,6 +180,16 @@ class Representation:
     initial_variance : float
         Initial variance for approximate diffuse
         initialization. Default is 1e6.
+    single_precision : bool
+        Whether the state space computations use single precision.
+    sparse_transition : bool
+        Whether the structure of the transition matrix is exploited.
+    sparse_transition_min_states : int
+        Minimum number of states for which a sparse transition matrix is
+        stored in compressed sparse row format. Default is 32.
+    sparse_transition_density : float
+        Maximum fraction of nonzero elements for which the transition matrix
+        is stored in compressed sparse row format. Default is 0.25.
 
     Notes
     -----
@@ -241,6 +267,9 @@ class Representation:
     :math:`Q~(k\_posdef \times k\_posdef \times nobs)`
     """
 
+    sparse_transition_min_states = 32
+    sparse_transition_density = 0.25
+
     def __init__(
         self,
         k_endog,
@@ -249,6 +278,8 @@ class Representation:
         initial_variance=1e6,
         nobs=0,
         dtype=np.float64,
+        single_precision=False,
+        sparse_transition=True,
         design=None,
         obs_intercept=None,
         obs_cov=None,
@@ -260,6 +291,8 @@ class Representation:
         **kwargs,
     ):
         self.shapes = {}
+        self.single_precision = single_precision
+        self.sparse_transition = sparse_transition
 
         # Check if k_endog is actually the endog array
         endog = None
@@ -388,6 +421,20 @@ class Representation:
 
         # Caches
         self._time_invariant = None
+        self._transition_structures = {}
+
+    def __deepcopy__(self, memo):
+        return tools._deepcopy_without_compiled(
+            self,
+            memo,
+            (
+                "_statespaces",
+                "_kalman_filters",
+                "_kalman_smoothers",
+                "_simulators",
+                "_simulation_smoothers",
+            ),
+        )
 
     def __getitem__(self, key):
         _type = type(key)
@@ -751,7 +798,10 @@ class Representation:
         )
         if self.endog is not None:
             arrays = (self.endog,) + arrays
-        return find_best_blas_type(arrays)[0]
+        prefix = find_best_blas_type(arrays)[0]
+        if self.single_precision and prefix == "d":
+            prefix = "s"
+        return prefix
 
     @property
     def dtype(self):
@@ -1098,7 +1148,12 @@ class Representation:
                 existing = self._representations[prefix][matrix]
                 if matrix == "obs":
                     # existing[:] = self.obs.astype(dtype)
-                    pass
+                    # (but data with a different number of observations may
+                    # have been bound since the matrices were created)
+                    if existing.shape != self.obs.shape:
+                        self._representations[prefix][matrix] = self.obs.astype(
+                            dtype
+                        )
                 else:
                     new = getattr(self, "_" + matrix).astype(dtype)
                     if existing.shape == new.shape:
@@ -1141,8 +1196,81 @@ class Representation:
                 self._representations[prefix]["state_cov"],
             )
 
+        self._initialize_transition_structure(prefix)
+
         return prefix, dtype, create
 
+    def _initialize_transition_structure(self, prefix):
+        ss = self._statespaces[prefix]
+        transition = self._representations[prefix]["transition"]
+        options = (
+            self.sparse_transition,
+            self.sparse_transition_min_states,
+            self.sparse_transition_density,
+        )
+
+        # The structure of a time-invariant transition matrix is cached while
+        # the matrix and the options are unchanged
+        if transition.shape[2] == 1:
+            cached = self._transition_structures.get(prefix)
+            if (
+                cached is None
+                or cached[0] != options
+                or cached[1].shape != transition.shape
+                or not np.array_equal(cached[1], transition)
+            ):
+                cached = (
+                    options,
+                    transition.copy(),
+                    self._transition_structure(transition),
+                )
+                self._transition_structures[prefix] = cached
+            identity, csr = cached[2]
+        else:
+            identity, csr = self._transition_structure(transition)
+
+        ss.identity_transition = int(identity)
+        ss.sparse_transition = 0
+        if csr is not None:
+            ss.transition_indptr, ss.transition_indices, ss.transition_data = csr
+            ss.sparse_transition = 1
+
+    def _transition_structure(self, transition):
+        """
+        Whether the transition is the identity, and its sparse representation
+
+        Returns
+        -------
+        identity : bool
+            Whether the transition matrix is the identity in all periods.
+        csr : tuple or None
+            The row pointers, column indices and values of a time-invariant
+            sparse transition matrix in compressed sparse row format, or None
+            if it is not stored in sparse format.
+        """
+        if not self.sparse_transition:
+            return False, None
+        k_states = transition.shape[0]
+
+        # Check one period at a time, to avoid a temporary of the size of a
+        # time-varying transition matrix
+        identity = np.eye(k_states, dtype=transition.dtype)
+        if all(
+            np.array_equal(transition[:, :, t], identity)
+            for t in range(transition.shape[2])
+        ):
+            return True, None
+
+        if transition.shape[2] > 1 or k_states < self.sparse_transition_min_states:
+            return False, None
+        nonzero = transition[:, :, 0] != 0
+        if nonzero.sum() > self.sparse_transition_density * k_states**2:
+            return False, None
+        rows, cols = np.nonzero(nonzero)
+        indptr = np.zeros(k_states + 1, dtype=np.int32)
+        np.cumsum(nonzero.sum(axis=1), out=indptr[1:])
+        return False, (indptr, cols.astype(np.int32), transition[rows, cols, 0])
+
     def _initialize_state(self, prefix=None, complex_step=False):
         # TODO once the transition to using the Initialization objects is
         # complete, this should be moved entirely to the _{{prefix}}Statespace
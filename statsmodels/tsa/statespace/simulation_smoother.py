@@ -592,12 +592,15 @@ class SimulationSmoothResults:
         pretransformed_state_disturbance_variates=None,
         pretransformed_initial_state_variates=False,
         rng=None,
+        nsimulations=None,
     ):
         r"""
         Perform simulation smoothing
 
         Does not return anything, but populates the object's `simulated_*`
-        attributes, as specified by simulation output.
+        attributes, as specified by simulation output. If `nsimulations` is
+        given, many draws of the state vector are computed at once and
+        returned.
 
         Parameters
         ----------
@@ -652,6 +655,25 @@ class SimulationSmoothResults:
 
                random_state has been deprecated. In-line with SPEC-007, use
                rng for passing a random number generator or seed.
+        nsimulations : int, optional
+            If specified, the number of draws of the state vector to compute
+            in a single pass. The covariance matrices, gains and
+            factorizations of the Kalman filter over the simulated data are
+            then computed once and reused for all draws whenever possible
+            (i.e., if there is no missing data and no univariate, collapsed
+            or exact diffuse filtering). In this case, any provided variates
+            must have a leading dimension of length `nsimulations` (e.g.,
+            `state_disturbance_variates` is shaped `nsimulations` x `nobs` x
+            `k_posdef` and `initial_state_variates` is shaped `nsimulations`
+            x `k_states`), they cannot be pretransformed, and only the state
+            is simulated.
+
+        Returns
+        -------
+        simulated_state : ndarray
+            Only returned if `nsimulations` is specified. The draws of the
+            state vector, shaped `nsimulations` x `nobs` x `k_states`. These
+            are also available in the `simulated_state` attribute.
         """
         if pretransformed_measurement_disturbance_variates is None:
             pretransformed_measurement_disturbance_variates = False
@@ -689,6 +711,39 @@ class SimulationSmoothResults:
         # Initialize the state
         self.model._initialize_state(prefix=prefix)
 
+        if nsimulations is not None:
+            if (
+                pretransformed_measurement_disturbance_variates
+                or pretransformed_state_disturbance_variates
+                or pretransformed_initial_state_variates
+            ):
+                raise ValueError(
+                    "Pretransformed variates are not supported when"
+                    " `nsimulations` is specified."
+                )
+            nsimulations = int(nsimulations)
+            if nsimulations < 1:
+                raise ValueError("`nsimulations` must be a positive integer.")
+            sizes = [
+                self._simulation_smoother.measurement_disturbance_variates.shape[0],
+                self._simulation_smoother.state_disturbance_variates.shape[0],
+                self.model.k_states,
+            ]
+            variates = [
+                measurement_disturbance_variates,
+                state_disturbance_variates,
+                initial_state_variates,
+            ]
+            for i in range(3):
+                if variates[i] is None:
+                    variates[i] = rng.normal(size=(nsimulations, sizes[i]))
+                variates[i] = np.reshape(variates[i], (nsimulations, sizes[i]))
+                variates[i] = np.array(variates[i].T, dtype=self.dtype, order="F")
+            self._simulated_state = np.asarray(
+                self._simulation_smoother.simulate_states(*variates)
+            )
+            return self._simulated_state
+
         # Draw the (independent) random variates for disturbances in the
         # simulation
         if measurement_disturbance_variates is not None:
@@ -0,0 +1,187 @@
+"""
+Tests for the batched Kalman filter and smoother
+
+License: Simplified-BSD
+"""
+
+import warnings
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.tsa.statespace import sarimax, structural, varmax
+from statsmodels.tsa.statespace.batch import BatchKalmanResults
+
+
+@pytest.fixture(scope="module")
+def panel():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal((8, 60)), axis=1)
+    endog += rs.standard_normal((8, 60))
+    endog[2, 10:14] = np.nan
+    endog[5, 0] = np.nan
+    return endog
+
+
+def check_series(res, i, desired, burn=0):
+    assert_allclose(res.llf[i], desired.llf)
+    assert_allclose(res.llf_obs[i], desired.llf_obs, atol=1e-10)
+    assert_allclose(res.predicted_state[i], desired.predicted_state[:, -1])
+    assert_allclose(
+        res.predicted_state_cov[i], desired.predicted_state_cov[..., -1], atol=1e-7
+    )
+    if res.filtered_state is not None:
+        assert_allclose(res.filtered_state[i], desired.filtered_state, atol=1e-8)
+    if res.filtered_state_cov is not None:
+        assert_allclose(
+            res.filtered_state_cov[i], desired.filtered_state_cov, atol=1e-8
+        )
+    if res.smoothed_state is not None:
+        assert_allclose(res.smoothed_state[i], desired.smoothed_state, atol=1e-6)
+    if res.smoothed_state_cov is not None:
+        # with approximate diffuse initialization, the covariances of the
+        # first periods are subject to cancellation
+        assert_allclose(
+            res.smoothed_state_cov[i][..., burn + 1 :],
+            desired.smoothed_state_cov[..., burn + 1 :],
+            atol=1e-6,
+        )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_structural(panel, n_jobs):
+    mod = structural.UnobservedComponents(
+        panel[0], "local linear trend", seasonal=4
+    )
+    params = np.array([1.0, 0.5, 0.1, 0.2])
+    res = mod.smooth_batch(params, panel, store_filtered=True, store_cov=True,
+                           n_jobs=n_jobs)
+    assert isinstance(res, BatchKalmanResults)
+    assert_equal(res.llf_obs.shape, (8, 60))
+    assert not res.failed.any()
+
+    fcast, var = res.forecast(5, return_var=True)
+    assert_equal(fcast.shape, (8, 5, 1))
+    for i in range(panel.shape[0]):
+        desired = mod.clone(panel[i]).smooth(params)
+        check_series(res, i, desired, burn=mod.loglikelihood_burn)
+        assert_allclose(fcast[i, :, 0], desired.forecast(5))
+        assert_allclose(var[i, :, 0], desired.get_forecast(5).var_pred_mean)
+
+
+def test_params_per_series(panel):
+    mod = sarimax.SARIMAX(panel[0], order=(2, 0, 1))
+    rs = np.random.RandomState(0)
+    params = np.array([0.5, 0.2, 0.3, 1.2]) * rs.uniform(0.8, 1.2, size=(8, 4))
+    res = mod.filter_batch(params, panel, store_filtered=True)
+    assert res.smoothed_state is None
+    assert res.filtered_state_cov is None
+
+    fcast = res.forecast(3)
+    for i in range(panel.shape[0]):
+        desired = mod.clone(panel[i]).filter(params[i])
+        check_series(res, i, desired)
+        assert_allclose(fcast[i, :, 0], desired.forecast(3))
+
+
+def test_multivariate_missing(panel):
+    rs = np.random.RandomState(0)
+    endog = np.stack([panel, 0.5 * panel + rs.standard_normal(panel.shape)], -1)
+    endog = np.diff(endog, axis=1)
+    endog[1, 5, 0] = np.nan
+    endog[4, 20:25, 1] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        mod = varmax.VARMAX(endog[0], order=(1, 0), trend="c")
+    params = mod.start_params
+    res = mod.smooth_batch(params, endog, store_cov=True)
+    for i in range(endog.shape[0]):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            desired = mod.clone(endog[i]).smooth(params)
+        check_series(res, i, desired)
+
+
+def test_time_varying(panel):
+    # exog enters through a time-varying observation intercept
+    exog = np.random.RandomState(0).standard_normal((60, 1))
+    mod = sarimax.SARIMAX(panel[0], exog=exog, order=(1, 0, 0),
+                          mle_regression=True)
+    params = np.array([0.3, 0.5, 1.0])
+    res = mod.smooth_batch(params, panel)
+    for i in range(panel.shape[0]):
+        desired = mod.clone(panel[i], exog=exog).smooth(params)
+        check_series(res, i, desired)
+    with pytest.raises(ValueError, match="time-invariant"):
+        res.forecast(1)
+    with pytest.raises(ValueError, match="time-varying"):
+        mod.filter_batch(params, panel[:, :50])
+
+
+def test_invalid(panel):
+    mod = structural.UnobservedComponents(panel[0], "local level")
+    with pytest.raises(ValueError, match="params must have shape"):
+        mod.filter_batch(np.ones((3, 2)), panel)
+    with pytest.raises(ValueError, match="endog must have shape"):
+        mod.filter_batch([1.0, 1.0], panel[:, :, None, None])
+
+    mod = structural.UnobservedComponents(
+        panel[0], "local level", use_exact_diffuse=True
+    )
+    with pytest.raises(NotImplementedError, match="exact diffuse"):
+        mod.filter_batch([1.0, 1.0], panel)
+
+
+def test_failed_series(panel):
+    mod = sarimax.SARIMAX(panel[0], order=(1, 0, 0))
+    params = np.array([[0.5, 1.0]] * 8)
+    # a zero variance gives a singular forecast error variance
+    params[3, 1] = 0.0
+    res = mod.smooth_batch(params, panel)
+    assert_equal(res.failed, np.arange(8) == 3)
+    assert np.isnan(res.llf[3])
+    assert np.isnan(res.smoothed_state[3]).all()
+    assert np.isfinite(res.llf[[0, 1, 2, 4, 5, 6, 7]]).all()
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3, -1])
+def test_loglike_many(panel, n_jobs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        mod = varmax.VARMAX(np.diff(panel[:2].T, axis=0), order=(1, 0),
+                            measurement_error=True)
+    rs = np.random.RandomState(1234)
+    params = mod.start_params + 0.05 * rs.standard_normal((10, mod.k_params))
+    llf = mod.loglike_many(params, n_jobs=n_jobs)
+    assert_equal(llf.shape, (10,))
+    assert_allclose(llf, [mod.loglike(p) for p in params])
+
+
+def test_loglike_many_options(panel):
+    # Missing data, a burn-in period, fixed and untransformed parameters
+    mod = sarimax.SARIMAX(panel[2], order=(1, 1, 1))
+    mod.ssm.loglikelihood_burn = 3
+    params = np.array([[0.5, 0.2, 1.3], [-0.1, 0.4, 0.9], [0.8, -0.3, 2.0]])
+    unconstrained = np.array([mod.untransform_params(p) for p in params])
+    llf = mod.loglike_many(unconstrained, transformed=False)
+    assert_allclose(llf, [mod.loglike(p) for p in params])
+
+    with mod.fix_params({"ar.L1": 0.5}):
+        llf = mod.loglike_many(params[:, 1:], n_jobs=2)
+        assert_allclose(llf, [mod.loglike(p) for p in params[:, 1:]])
+        llf = mod.loglike_many(params, includes_fixed=True)
+        desired = [mod.loglike(p, includes_fixed=True) for p in params]
+        assert_allclose(llf, desired)
+
+    # Singular forecast error variance
+    params[1, 2] = 0.0
+    llf = mod.loglike_many(params)
+    assert_equal(np.isnan(llf), [False, True, False])
+
+    assert_equal(mod.loglike_many(np.zeros((0, 3))).shape, (0,))
+    with pytest.raises(ValueError, match="params must have shape"):
+        mod.loglike_many(params[0])
+    mod = sarimax.SARIMAX(panel[2], order=(1, 0, 0), concentrate_scale=True)
+    with pytest.raises(NotImplementedError, match="concentrating the scale"):
+        mod.loglike_many([[0.5]])
@@ -191,3 +191,22 @@ def test_dfm():
     # Test zero variates
     sim_cfa.simulate(np.zeros((mod.k_states, mod.nobs)))
     assert_allclose(sim_cfa.simulated_state, res.smoothed_state)
+
+
+def test_nsimulations():
+    mod = dynamic_factor.DynamicFactor(dta, k_factors=2, factor_order=1)
+    mod.update(mod.start_params)
+    sim_cfa = mod.simulation_smoother(method="cfa")
+
+    rs = np.random.RandomState(1234)
+    variates = rs.normal(size=(3, mod.nobs, mod.k_states))
+    actual = sim_cfa.simulate(variates, nsimulations=3)
+    assert actual.shape == (3, mod.nobs, mod.k_states)
+
+    for i in range(3):
+        sim_cfa.simulate(variates[i].T, update_posterior=False)
+        assert_allclose(actual[i], sim_cfa.simulated_state.T)
+
+    # Random draws
+    actual = sim_cfa.simulate(nsimulations=2)
+    assert actual.shape == (2, mod.nobs, mod.k_states)
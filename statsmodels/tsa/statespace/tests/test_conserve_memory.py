@@ -12,7 +12,7 @@ import pandas as pd
 import pytest
 
 from statsmodels.datasets import macrodata
-from statsmodels.tsa.statespace import dynamic_factor, sarimax, varmax
+from statsmodels.tsa.statespace import dynamic_factor, sarimax, structural, varmax
 from statsmodels.tsa.statespace.kalman_filter import (
     MEMORY_CONSERVE,
     MEMORY_NO_FORECAST_COV,
@@ -23,6 +23,12 @@ from statsmodels.tsa.statespace.kalman_filter import (
     MEMORY_NO_PREDICTED_MEAN,
     MEMORY_NO_SMOOTHING,
 )
+from statsmodels.tsa.statespace.kalman_smoother import (
+    SMOOTHER_MEMORY_CONSERVE,
+    SMOOTHER_MEMORY_COV_DIAGONAL,
+    SMOOTHER_MEMORY_NO_COV,
+    SMOOTHER_MEMORY_NO_ESTIMATOR,
+)
 
 dta = macrodata.load_pandas().data
 dta.index = pd.date_range(start="1959-01-01", end="2009-07-01", freq="QS")
@@ -359,3 +365,132 @@ def test_invalid_fittedvalues_resid_predict():
             res.predict(dynamic=True)
         with pytest.raises(ValueError, match=message):
             res.predict(start=endog.index[10], dynamic=True)
+
+
+def check_smoother_memory(mod, params, smoother_conserve_memory):
+    desired = mod.smooth(params)
+    res = mod.smooth(params, smoother_conserve_memory=smoother_conserve_memory)
+    assert_equal(res.smoother_results.smoother_conserve_memory,
+                 smoother_conserve_memory)
+
+    # Means are always stored
+    assert_allclose(res.smoothed_state, desired.smoothed_state, atol=1e-10)
+    assert_allclose(res.smoothed_state_disturbance,
+                    desired.smoothed_state_disturbance, atol=1e-10)
+    assert_allclose(res.smoothed_measurement_disturbance,
+                    desired.smoothed_measurement_disturbance, atol=1e-10)
+    assert_allclose(res.llf, desired.llf)
+
+    names = ["smoothed_state", "smoothed_state_disturbance",
+             "smoothed_measurement_disturbance"]
+    if smoother_conserve_memory & SMOOTHER_MEMORY_NO_COV:
+        for name in names:
+            with pytest.raises(AttributeError, match="smoother_memory_no_cov"):
+                getattr(res, name + "_cov")
+            with pytest.raises(AttributeError, match="smoother_memory_no_cov"):
+                getattr(res, name + "_var")
+        assert_(res.states.smoothed_cov is None)
+    elif smoother_conserve_memory & SMOOTHER_MEMORY_COV_DIAGONAL:
+        for name in names:
+            message = ("smoother_memory_cov_diagonal.*The diagonal is"
+                       f" available as `{name}_var`")
+            with pytest.raises(AttributeError, match=message):
+                getattr(res, name + "_cov")
+            assert_allclose(getattr(res, name + "_var"),
+                            np.diagonal(getattr(desired, name + "_cov")).T,
+                            atol=1e-10)
+        with pytest.raises(AttributeError, match="smoothed_state_autocov"):
+            _ = res.smoothed_state_autocov
+    else:
+        assert_allclose(res.smoothed_state_cov, desired.smoothed_state_cov,
+                        atol=1e-10)
+        assert_allclose(res.smoothed_state_autocov,
+                        desired.smoothed_state_autocov, atol=1e-10)
+
+    # Smoothed predictions need the smoothed state covariances
+    if smoother_conserve_memory & (SMOOTHER_MEMORY_NO_COV |
+                                   SMOOTHER_MEMORY_COV_DIAGONAL):
+        with pytest.raises(AttributeError, match="smoother_memory_"):
+            res.get_prediction(information_set="smoothed")
+        with pytest.raises(AttributeError, match="smoother_memory_"):
+            res.predict(information_set="smoothed")
+    else:
+        assert_allclose(
+            res.get_prediction(information_set="smoothed").predicted_mean,
+            desired.get_prediction(information_set="smoothed").predicted_mean,
+            atol=1e-10)
+
+    if smoother_conserve_memory & SMOOTHER_MEMORY_NO_ESTIMATOR:
+        with pytest.raises(AttributeError,
+                           match="smoother_memory_no_estimator"):
+            _ = res.scaled_smoothed_estimator
+    else:
+        assert_allclose(res.scaled_smoothed_estimator,
+                        desired.scaled_smoothed_estimator, atol=1e-10)
+
+
+SMOOTHER_MEMORY_OPTIONS = [
+    SMOOTHER_MEMORY_NO_COV, SMOOTHER_MEMORY_COV_DIAGONAL,
+    SMOOTHER_MEMORY_NO_ESTIMATOR,
+    SMOOTHER_MEMORY_COV_DIAGONAL | SMOOTHER_MEMORY_NO_ESTIMATOR,
+    SMOOTHER_MEMORY_CONSERVE]
+
+
+@pytest.mark.parametrize("univariate", [True, False])
+@pytest.mark.parametrize("smoother_conserve_memory", SMOOTHER_MEMORY_OPTIONS)
+def test_smoother_memory(univariate, smoother_conserve_memory):
+    endog = np.log(dta[["realgdp", "realcons", "realinv"]]).diff().iloc[1:]
+    endog = endog.copy()
+    endog.iloc[10:13, 0] = np.nan
+    endog.iloc[50] = np.nan
+    mod = dynamic_factor.DynamicFactor(endog, k_factors=2, factor_order=2)
+    mod.ssm.filter_univariate = univariate
+    check_smoother_memory(mod, mod.start_params, smoother_conserve_memory)
+
+
+@pytest.mark.parametrize("smoother_conserve_memory", SMOOTHER_MEMORY_OPTIONS)
+def test_smoother_memory_diffuse_concentrated(smoother_conserve_memory):
+    # Exact diffuse initialization
+    endog = dta["infl"]
+    mod = structural.UnobservedComponents(endog, "lltrend",
+                                          use_exact_diffuse=True)
+    check_smoother_memory(mod, [1.0, 0.5, 0.1], smoother_conserve_memory)
+
+    # Concentrated scale
+    mod = sarimax.SARIMAX(endog, order=(1, 1, 1), concentrate_scale=True)
+    check_smoother_memory(mod, [0.5, 0.2], smoother_conserve_memory)
+
+
+def test_smoother_memory_options():
+    endog = dta["infl"].iloc[:50]
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0))
+
+    # Setting the option on the model persists across calls
+    mod.set_smoother_conserve_memory(smoother_memory_cov_diagonal=True)
+    assert_equal(mod.ssm.smoother_conserve_memory,
+                 SMOOTHER_MEMORY_COV_DIAGONAL)
+    res = mod.smooth([0.5, 1.0])
+    assert_equal(res.smoother_results.smoother_conserve_memory,
+                 SMOOTHER_MEMORY_COV_DIAGONAL)
+    assert_(res.smoother_results.smoothed_state_cov is None)
+    assert_equal(res.smoothed_state_var.shape, (1, 50))
+
+    # Autocovariances cannot be computed without the required arrays
+    res = mod.smooth([0.5, 1.0], smoother_conserve_memory=(
+        SMOOTHER_MEMORY_CONSERVE))
+    message = "Smoothed state autocovariances are not available"
+    with pytest.raises(ValueError, match=message):
+        res.smoother_results.smoothed_state_autocovariance(lag=1)
+
+    # Back to storing everything
+    mod.set_smoother_conserve_memory(0)
+    res = mod.smooth([0.5, 1.0])
+    assert_equal(res.smoothed_state_cov.shape, (1, 1, 50))
+    assert_equal(
+        res.smoother_results.smoothed_state_autocovariance(lag=1).shape,
+        (1, 1, 50))
+
+    # Only the conventional and univariate smoothers are supported
+    mod.ssm.smooth_classical = True
+    with pytest.raises(ValueError, match="smoother memory conservation"):
+        mod.smooth([0.5, 1.0], smoother_conserve_memory=SMOOTHER_MEMORY_NO_COV)
@@ -2905,3 +2905,64 @@ def test_filter_reproduces_model_loglike():
     assert_allclose(filt.llf, mod.loglike(res.params), rtol=1e-8)
     assert_allclose(filt.params, res.params)
     assert np.isfinite(filt.llf)
+
+
+def gen_mq_data(nobs=120):
+    rs = np.random.RandomState(1234)
+    factor = np.zeros(nobs)
+    for t in range(1, nobs):
+        factor[t] = 0.7 * factor[t - 1] + rs.standard_normal()
+    endog = (factor[:, None] * [0.5, -0.9, 0.2, 0.7] +
+             rs.standard_normal((nobs, 4)))
+    ix = pd.period_range(start="2000-01", periods=nobs, freq="M")
+    endog = pd.DataFrame(endog, index=ix, columns=["a", "b", "c", "d"])
+    endog.iloc[10:20, 0] = np.nan
+    endog_Q = endog.iloc[2::3, 3:]
+    endog_Q.index = endog_Q.index.asfreq("Q")
+    return endog.iloc[:, :3], endog_Q
+
+
+def test_em_squarem():
+    # Test that the SQUAREM-accelerated EM algorithm converges to the same
+    # optimum as plain EM iterations, in fewer iterations
+    endog_M, endog_Q = gen_mq_data()
+    mod = dynamic_factor_mq.DynamicFactorMQ(
+        endog_M, endog_quarterly=endog_Q, factor_orders=1)
+
+    res_em = mod.fit(tolerance=1e-8, maxiter=5000)
+    res_squarem = mod.fit(tolerance=1e-8, maxiter=5000,
+                          em_acceleration="squarem")
+
+    assert_equal(res_squarem.mle_settings.em_acceleration, "squarem")
+    assert_(res_em.mle_settings.em_acceleration is None)
+    assert_allclose(res_squarem.llf, res_em.llf, atol=1e-2)
+    assert_allclose(res_squarem.params, res_em.params, atol=1e-2)
+    # Each accelerated iteration requires at least three smoother passes
+    assert_(3 * res_squarem.mle_retvals.iter < res_em.mle_retvals.iter)
+
+    with pytest.raises(ValueError, match="em_acceleration"):
+        mod.fit(em_acceleration="invalid")
+
+
+@pytest.mark.parametrize("mstep_method", ["missing", "nonmissing"])
+def test_em_n_jobs(mstep_method):
+    # Test that splitting the maximization step regressions among threads
+    # gives identical parameters
+    endog_M, endog_Q = gen_mq_data()
+    factors = {"a": ["f1", "f2"], "b": ["f1"], "c": ["f1", "f2"],
+               "d": ["f1", "f2"]}
+    if mstep_method == "nonmissing":
+        endog_M = endog_M.bfill()
+        endog_Q = None
+        del factors["d"]
+    mod = dynamic_factor_mq.DynamicFactorMQ(
+        endog_M, endog_quarterly=endog_Q, factors=factors, factor_orders=1)
+
+    params0 = mod.start_params
+    _, desired = mod._em_iteration(params0, mstep_method=mstep_method)
+    _, actual = mod._em_iteration(params0, mstep_method=mstep_method,
+                                  n_jobs=2)
+    assert_equal(actual, desired)
+
+    res = mod.fit(maxiter=5, n_jobs=-1)
+    assert_allclose(res.params, mod.fit(maxiter=5).params)
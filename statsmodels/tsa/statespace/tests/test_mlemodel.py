@@ -25,6 +25,7 @@ from statsmodels.tsa.statespace import (
     kalman_filter,
     kalman_smoother,
     sarimax,
+    structural,
     varmax,
 )
 from statsmodels.tsa.statespace.mlemodel import MLEModel, MLEResultsWrapper
@@ -370,6 +371,12 @@ def test_score_analytic_ar1():
         approx_centered=True,
     )
     assert_allclose(harvey_fd_centered, analytic_score, atol=1e-5)
+    derivative_cs = mod.score(params, transformed=True, method="analytic")
+    assert_allclose(derivative_cs, analytic_score)
+    derivative_fd = mod.score(
+        params, transformed=True, method="analytic", approx_complex_step=False
+    )
+    assert_allclose(derivative_fd, analytic_score, atol=1e-5)
 
     # Check the approximations for untransformed parameters. The analytic
     # check now comes from chain rule with the analytic derivative of the
@@ -423,6 +430,8 @@ def test_score_analytic_ar1():
         approx_centered=True,
     )
     assert_allclose(harvey_fd_centered, analytic_score, atol=1e-5)
+    derivative_cs = mod.score(uparams, transformed=False, method="analytic")
+    assert_allclose(derivative_cs, analytic_score)
 
     # Check the Hessian: these approximations are not very good, particularly
     # when phi is close to 0
@@ -447,6 +456,69 @@ def test_score_analytic_ar1():
         )
 
 
+def _derivative_filter_models():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal(100))
+    endog[20:25] = np.nan
+    exog = rs.standard_normal((100, 1))
+    mod = sarimax.SARIMAX(endog, order=(2, 1, 1), seasonal_order=(1, 0, 0, 4))
+    yield mod, np.r_[0.3, 0.1, 0.2, 0.1, 1.2]
+    mod = sarimax.SARIMAX(endog, exog=exog, order=(1, 0, 0), mle_regression=True)
+    yield mod, np.r_[0.5, 0.5, 1.0]
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0), trend="c")
+    mod.ssm.timing_init_filtered = True
+    yield mod, np.r_[0.1, 0.5, 1.0]
+    mod = structural.UnobservedComponents(endog, "local linear trend")
+    yield mod, np.r_[1.0, 0.5, 0.1]
+    endog = rs.standard_normal((100, 2))
+    endog[5, 0] = np.nan
+    endog[10, :] = np.nan
+    mod = varmax.VARMAX(endog, order=(1, 0), trend="c")
+    yield mod, mod.start_params
+
+
+@pytest.mark.parametrize("mod, params", list(_derivative_filter_models()))
+def test_score_derivative_filter(mod, params):
+    # The derivative Kalman filter against the complex step score
+    assert_allclose(
+        mod.score(params, method="analytic"), mod.score(params), rtol=1e-6
+    )
+    assert_allclose(
+        mod.score_obs(params, method="analytic"),
+        mod.score_obs(params),
+        rtol=1e-6,
+        atol=1e-6,
+    )
+
+    # Fixed parameters
+    with mod.fix_params({mod.param_names[-1]: params[-1]}):
+        assert_allclose(
+            mod.score(params[:-1], method="analytic"),
+            mod.score(params[:-1]),
+            rtol=1e-6,
+        )
+
+
+def test_score_derivative_filter_invalid():
+    endog = np.arange(10.0)
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0), concentrate_scale=True)
+    with pytest.raises(NotImplementedError, match="concentrating the scale"):
+        mod.score([0.5], method="analytic")
+    mod = structural.UnobservedComponents(
+        endog, "local level", use_exact_diffuse=True
+    )
+    with pytest.raises(NotImplementedError, match="exact diffuse"):
+        mod.score([1.0, 1.0], method="analytic")
+
+
+def test_fit_derivative_filter():
+    endog = nile.load_pandas().data["volume"].values
+    mod = structural.UnobservedComponents(endog, "local level")
+    res = mod.fit(method="bfgs", optim_score="analytic", disp=False)
+    desired = mod.fit(method="bfgs", optim_score="approx", disp=False)
+    assert_allclose(res.params, desired.params, rtol=1e-4)
+
+
 def test_cov_params():
     mod, res = get_dummy_mod()
 
@@ -1394,3 +1466,62 @@ def test_set_inversion_method_and_initialization_property():
     mod.initialization = new_init
     assert mod.ssm.initialization is new_init
     assert mod.initialization is new_init
+
+
+def test_single_precision():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal(1000))
+    params = [1.0, 0.5, 0.1]
+    desired = structural.UnobservedComponents(
+        endog, "local linear trend"
+    ).smooth(params)
+
+    mod = structural.UnobservedComponents(
+        endog, "local linear trend", single_precision=True
+    )
+    assert mod.ssm.prefix == "s"
+    res = mod.smooth(params)
+    assert_equal(res.filter_results.filtered_state.dtype, np.float32)
+    assert_equal(res.smoothed_state.dtype, np.float32)
+    # The loglikelihood is accumulated in double precision
+    assert_equal(res.llf_obs.dtype, np.float64)
+    assert_allclose(res.llf, desired.llf, rtol=1e-5)
+    assert_allclose(mod.loglike(params), res.llf, rtol=1e-6)
+    # (except for the first periods of the approximate diffuse initialization)
+    assert_allclose(
+        res.smoothed_state[:, 2:], desired.smoothed_state[:, 2:], atol=1e-3
+    )
+
+    # The square-root filter is nearly as accurate as double precision
+    mod.ssm.filter_square_root = True
+    assert_allclose(mod.loglike(params), desired.llf, rtol=1e-7)
+
+    sim = mod.simulation_smoother()
+    sim.simulate(rng=1234)
+    assert_equal(sim.simulated_state.dtype, np.float32)
+    assert_equal(sim.simulated_state.shape, (2, 1000))
+
+    # Complex-step derivatives are computed in double precision
+    assert_allclose(mod.score(params), desired.model.score(params), rtol=1e-4)
+
+    # Missing observations, the smoothed measurement disturbance covariances
+    # of the missing components are set from the double precision obs_cov
+    endog[[10, 500]] = np.nan
+    params = [0.5, 0.2, 1.0]
+    kwargs = {"order": (1, 0, 0), "measurement_error": True}
+    desired = sarimax.SARIMAX(endog, **kwargs).smooth(params)
+    mod = sarimax.SARIMAX(endog, single_precision=True, **kwargs)
+    res = mod.smooth(params)
+    cov = res.smoothed_measurement_disturbance_cov
+    assert_equal(cov.dtype, np.float32)
+    assert_allclose(cov[0, 0, [10, 500]], 0.2, rtol=1e-6)
+    assert_allclose(
+        cov, desired.smoothed_measurement_disturbance_cov, rtol=1e-4, atol=1e-5
+    )
+    mod.ssm.smoother_memory_cov_diagonal = True
+    res = mod.smooth(params)
+    var = res.filter_results.smoothed_measurement_disturbance_var
+    assert_equal(var.dtype, np.float32)
+    assert_allclose(var[0, [10, 500]], 0.2, rtol=1e-6)
+    res = mod.fit(disp=False)
+    assert_allclose(res.params, desired.model.fit(disp=False).params, rtol=1e-2)
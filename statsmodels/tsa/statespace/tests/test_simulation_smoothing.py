@@ -771,6 +771,61 @@ def test_simulation_smoothing_state_intercept_diffuse():
     assert_equal(sim.simulated_state[0], intercept)
 
 
+@pytest.mark.parametrize("missing", [False, True])
+@pytest.mark.parametrize("use_exact_diffuse", [False, True])
+def test_nsimulations(missing, use_exact_diffuse):
+    # Draws computed jointly must match those computed one at a time with the
+    # same variates, both when the factorizations are reused and when they
+    # are not (missing data and exact diffuse initialization)
+    dta = datasets.macrodata.load_pandas().data
+    endog = np.log(dta["realgdp"]).diff().iloc[1:].values * 100
+    if missing:
+        endog[10:15] = np.nan
+    mod = structural.UnobservedComponents(
+        endog, "llevel", autoregressive=1, seasonal=4,
+        use_exact_diffuse=use_exact_diffuse)
+    mod.update([1.0, 0.1, 0.2, 1.0, 0.5])
+    sim = mod.simulation_smoother()
+
+    n = 4
+    rs = np.random.RandomState(1234)
+    measurement_variates = rs.normal(size=(n, mod.nobs, mod.k_endog))
+    state_variates = rs.normal(size=(n, mod.nobs, mod.ssm.k_posdef))
+    initial_state_variates = rs.normal(size=(n, mod.k_states))
+    actual = sim.simulate(
+        measurement_disturbance_variates=measurement_variates,
+        state_disturbance_variates=state_variates,
+        initial_state_variates=initial_state_variates,
+        nsimulations=n)
+    assert_equal(actual.shape, (n, mod.nobs, mod.k_states))
+    assert sim.simulated_state is actual
+
+    for i in range(n):
+        sim.simulate(
+            measurement_disturbance_variates=measurement_variates[i],
+            state_disturbance_variates=state_variates[i],
+            initial_state_variates=initial_state_variates[i])
+        assert_allclose(actual[i], sim.simulated_state.T, atol=1e-10)
+
+
+def test_nsimulations_moments():
+    dta = datasets.macrodata.load_pandas().data
+    mod = sarimax.SARIMAX(np.log(dta["realgdp"]).values, order=(1, 1, 0))
+    mod.update([0.5, 1.0])
+    res = mod.ssm.smooth()
+    sim = mod.simulation_smoother(rng=np.random.default_rng(1234))
+    draws = sim.simulate(nsimulations=5000)
+
+    assert_allclose(draws.mean(axis=0).T, res.smoothed_state, atol=0.05)
+    assert_allclose(draws.var(axis=0).T,
+                    np.diagonal(res.smoothed_state_cov).T, rtol=0.1,
+                    atol=1e-4)
+
+    with pytest.raises(ValueError, match="Pretransformed"):
+        sim.simulate(nsimulations=2,
+                     pretransformed_state_disturbance_variates=True)
+
+
 def test_nan():
     """
     This is a very slow test to check that the distribution of simulated states
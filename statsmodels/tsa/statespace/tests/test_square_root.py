@@ -0,0 +1,176 @@
+"""
+Tests for the square-root Kalman filter
+
+License: Simplified-BSD
+"""
+
+import warnings
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.tsa.statespace import dynamic_factor, sarimax, structural, varmax
+from statsmodels.tsa.statespace.kalman_filter import (
+    FILTER_CHANDRASEKHAR,
+    FILTER_CONVENTIONAL,
+    FILTER_SQUARE_ROOT,
+    MEMORY_CONSERVE,
+    MEMORY_NO_LIKELIHOOD,
+    TIMING_INIT_FILTERED,
+)
+
+FILTER_ATTR = [
+    "forecasts",
+    "forecasts_error",
+    "forecasts_error_cov",
+    "predicted_state",
+    "predicted_state_cov",
+    "filtered_state",
+    "filtered_state_cov",
+    "kalman_gain",
+]
+SMOOTHER_ATTR = [
+    "smoothed_state",
+    "smoothed_state_cov",
+    "smoothed_state_disturbance",
+    "smoothed_state_disturbance_cov",
+    "smoothed_measurement_disturbance",
+    "smoothed_measurement_disturbance_cov",
+]
+
+
+def check_square_root(mod, params, smooth=True, atol=1e-8):
+    method = mod.smooth if smooth else mod.filter
+    mod.ssm.filter_square_root = False
+    desired = method(params)
+    mod.ssm.filter_square_root = True
+    actual = method(params)
+    assert actual.filter_results.filter_method & FILTER_SQUARE_ROOT
+    assert_allclose(actual.llf, desired.llf)
+
+    # The covariance matrices of the first periods of approximate diffuse
+    # models are subject to cancellation in the conventional filter, and
+    # those of the exact diffuse periods are not computed by the square-root
+    # filter
+    start = max(mod.loglikelihood_burn, actual.filter_results.nobs_diffuse) + 1
+    names = FILTER_ATTR + (SMOOTHER_ATTR if smooth else [])
+    for name in names:
+        value = getattr(actual.filter_results, name)
+        if value is None:
+            continue
+        assert_allclose(value[..., start:],
+                        getattr(desired.filter_results, name)[..., start:],
+                        atol=atol, err_msg=name)
+
+    # The state covariance matrices are symmetric by construction
+    for name in ["predicted_state_cov", "filtered_state_cov"]:
+        value = getattr(actual.filter_results, name)[..., start:]
+        assert_equal(value, value.transpose(1, 0, 2))
+    return actual
+
+
+@pytest.fixture(scope="module")
+def endog():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal((150, 2)), axis=0)
+    endog[:, 1] = 0.5 * endog[:, 0] + rs.standard_normal(150)
+    endog[20:25, 0] = np.nan
+    endog[40:43] = np.nan
+    return endog
+
+
+def test_sarimax(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(2, 1, 1))
+    check_square_root(mod, [0.5, 0.1, 0.2, 1.3])
+
+
+def test_sarimax_timing_init_filtered(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 1))
+    mod.ssm.filter_timing = TIMING_INIT_FILTERED
+    check_square_root(mod, [0.5, 0.2, 1.3])
+
+
+def test_structural_exact_diffuse(endog):
+    mod = structural.UnobservedComponents(
+        endog[:, 0], "local linear trend", seasonal=4, use_exact_diffuse=True
+    )
+    check_square_root(mod, [1.0, 0.5, 0.1, 0.2])
+
+
+def test_varmax_missing(endog):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        mod = varmax.VARMAX(np.diff(endog, axis=0), order=(1, 0),
+                            measurement_error=True)
+    check_square_root(mod, mod.start_params)
+
+
+def test_dynamic_factor_collapsed(endog):
+    endog = np.c_[endog, endog[:, 0] - endog[:, 1]]
+    results = []
+    for square_root in [False, True]:
+        mod = dynamic_factor.DynamicFactor(endog, k_factors=1, factor_order=1)
+        mod.ssm.filter_collapsed = True
+        mod.ssm.filter_square_root = square_root
+        results.append(mod.filter(mod.start_params))
+    desired, actual = results
+    assert_allclose(actual.llf, desired.llf)
+    assert_allclose(actual.filtered_state_cov[..., 1:],
+                    desired.filtered_state_cov[..., 1:], atol=1e-8)
+
+
+def test_conserve_memory(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 1, 1))
+    mod.ssm.set_conserve_memory(MEMORY_CONSERVE & ~MEMORY_NO_LIKELIHOOD)
+    desired = mod.filter([0.5, 0.2, 1.3])
+    mod.ssm.filter_square_root = True
+    actual = mod.filter([0.5, 0.2, 1.3])
+    assert_allclose(actual.llf_obs, desired.llf_obs)
+    assert_allclose(actual.filter_results.predicted_state_cov,
+                    desired.filter_results.predicted_state_cov, atol=1e-10)
+
+
+def test_float32():
+    # Single precision filtering is much more accurate with the square-root
+    # filter
+    rs = np.random.RandomState(1234)
+    mod = structural.UnobservedComponents(
+        np.cumsum(rs.standard_normal(150)), "local linear trend", seasonal=12
+    )
+    params = [1.0, 0.5, 0.1, 0.01]
+    desired = mod.filter(params)
+
+    ssm = mod.ssm
+    ssm._initialize_representation(prefix="s")
+    ssm._initialize_state(prefix="s")
+    kfilter = ssm.prefix_kalman_filter_map["s"](
+        ssm._statespaces["s"], FILTER_CONVENTIONAL | FILTER_SQUARE_ROOT,
+        ssm.inversion_method, ssm.stability_method, ssm.conserve_memory,
+        ssm.filter_timing, ssm.tolerance, ssm.loglikelihood_burn
+    )
+    kfilter()
+    burn = mod.loglikelihood_burn
+    assert_allclose(np.asarray(kfilter.loglikelihood)[burn:],
+                    desired.llf_obs[burn:], atol=5e-4)
+    assert_allclose(np.asarray(kfilter.filtered_state), desired.filtered_state,
+                    atol=2e-3)
+
+
+def test_singular_state_cov(endog):
+    # The trend has no disturbance, so that the predicted state covariance
+    # matrices become singular
+    mod = structural.UnobservedComponents(
+        endog[:, 0], "local linear deterministic trend", autoregressive=1
+    )
+    res = check_square_root(mod, [1.0, 0.1, 0.5, 0.3])
+    assert np.all(np.isfinite(res.filter_results.predicted_state_cov))
+
+
+def test_invalid(endog):
+    mod = sarimax.SARIMAX(endog[50:, 0], order=(1, 0, 0))
+    with pytest.raises(RuntimeError, match="square-root"):
+        mod.ssm.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_SQUARE_ROOT | FILTER_CHANDRASEKHAR
+        )
+        mod.filter([0.5, 1.0])
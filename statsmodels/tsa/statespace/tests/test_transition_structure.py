@@ -0,0 +1,194 @@
+"""
+Tests for exploiting the structure of the transition matrix
+
+License: Simplified-BSD
+"""
+
+import pickle
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.regression.recursive_ls import RecursiveLS
+from statsmodels.tsa.statespace import dynamic_factor, sarimax, structural
+
+ATTRIBUTES = [
+    "llf_obs",
+    "filtered_state",
+    "filtered_state_cov",
+    "predicted_state",
+    "predicted_state_cov",
+    "smoothed_state",
+    "smoothed_state_cov",
+    "smoothed_state_disturbance",
+    "smoothed_state_disturbance_cov",
+]
+
+
+def check_sparse_transition(mod, params, atol=1e-9):
+    mod.ssm.sparse_transition_min_states = 1
+    mod.ssm.sparse_transition = False
+    desired = mod.smooth(params)
+    assert not mod.ssm._statespaces["d"].sparse_transition
+
+    mod.ssm.sparse_transition = True
+    actual = mod.smooth(params)
+    assert mod.ssm._statespaces["d"].sparse_transition
+
+    for name in ATTRIBUTES:
+        assert_allclose(getattr(actual, name), getattr(desired, name),
+                        atol=atol, err_msg=name)
+
+
+@pytest.fixture(scope="module")
+def endog():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal((200, 3)), axis=0)
+    endog[:, 1:] += endog[:, :1]
+    endog[30:35, 0] = np.nan
+    endog[60:62] = np.nan
+    return endog
+
+
+@pytest.mark.parametrize("filter_univariate", [False, True])
+def test_seasonal(endog, filter_univariate):
+    mod = structural.UnobservedComponents(endog[:, 0], "llevel", seasonal=20)
+    mod.ssm.initialize_known(np.zeros(mod.k_states), np.eye(mod.k_states))
+    mod.ssm.filter_univariate = filter_univariate
+    check_sparse_transition(mod, [1.0, 0.5, 0.1])
+
+
+@pytest.mark.parametrize("filter_univariate", [False, True])
+def test_dynamic_factor(endog, filter_univariate):
+    mod = dynamic_factor.DynamicFactor(np.diff(endog, axis=0), k_factors=1,
+                                       factor_order=8)
+    mod.ssm.filter_univariate = filter_univariate
+    check_sparse_transition(mod, mod.start_params)
+
+
+def test_square_root(endog):
+    mod = sarimax.SARIMAX(endog[:, 0], order=(1, 1, 0),
+                          seasonal_order=(0, 0, 1, 12))
+    mod.ssm.filter_square_root = True
+    check_sparse_transition(mod, [0.5, 0.2, 1.0])
+
+
+def test_complex_step(endog):
+    mod = structural.UnobservedComponents(endog[:, 0], "llevel", seasonal=20)
+    mod.ssm.sparse_transition_min_states = 1
+    params = [1.0, 0.5, 0.1]
+    mod.ssm.sparse_transition = False
+    desired = mod.score(params, approx_complex_step=True)
+    mod.ssm.sparse_transition = True
+    actual = mod.score(params, approx_complex_step=True)
+    assert mod.ssm._statespaces["z"].sparse_transition
+    assert_allclose(actual, desired)
+
+
+def test_thresholds(endog):
+    mod = structural.UnobservedComponents(endog[:, 0], "llevel", seasonal=20)
+
+    # Too few states by default
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].sparse_transition
+
+    mod.ssm.sparse_transition_min_states = 1
+    mod.ssm._initialize_representation()
+    ss = mod.ssm._statespaces["d"]
+    assert ss.sparse_transition
+    transition = np.zeros((mod.k_states, mod.k_states))
+    for i in range(mod.k_states):
+        for k in range(ss.transition_indptr[i], ss.transition_indptr[i + 1]):
+            transition[i, ss.transition_indices[k]] = ss.transition_data[k]
+    assert_equal(transition, mod.ssm["transition"])
+
+    # Too dense
+    mod.ssm.sparse_transition_density = 0.01
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].sparse_transition
+
+    # Time-varying transition matrices are not stored in sparse format
+    mod.ssm.sparse_transition_density = 0.25
+    mod.ssm["transition"] = np.repeat(mod.ssm["transition"][..., None],
+                                      mod.nobs, axis=2)
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].sparse_transition
+
+
+def test_identity_transition(endog):
+    mod = structural.UnobservedComponents(endog[:, 0], "rwalk")
+    mod.ssm._initialize_representation()
+    assert mod.ssm._statespaces["d"].identity_transition
+
+    mod.ssm.sparse_transition = False
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].identity_transition
+
+    mod = structural.UnobservedComponents(endog[:, 0], "lltrend")
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].identity_transition
+
+
+def test_identity_transition_recursive_ls():
+    rs = np.random.RandomState(1234)
+    exog = np.c_[np.ones(100), rs.standard_normal((100, 2))]
+    endog = exog @ [1.0, 0.5, -0.5] + rs.standard_normal(100)
+    mod = RecursiveLS(endog, exog)
+    actual = mod.fit()
+    assert mod.ssm._statespaces["d"].identity_transition
+
+    mod.ssm.sparse_transition = False
+    desired = mod.fit()
+    assert_allclose(actual.llf, desired.llf)
+    assert_allclose(actual.smoothed_state, desired.smoothed_state)
+    assert_allclose(actual.smoothed_state_cov, desired.smoothed_state_cov,
+                    atol=1e-12)
+
+
+def test_pickle(endog):
+    mod = structural.UnobservedComponents(endog[:, 0], "llevel", seasonal=20)
+    mod.ssm.sparse_transition_min_states = 1
+    mod.ssm._initialize_representation()
+    ss = mod.ssm._statespaces["d"]
+    unpickled = pickle.loads(pickle.dumps(ss))
+    assert unpickled.sparse_transition
+    assert_equal(np.asarray(unpickled.transition_data),
+                 np.asarray(ss.transition_data))
+
+
+def test_transition_structure_cache(endog):
+    mod = structural.UnobservedComponents(endog[:, 0], "llevel", seasonal=20)
+    mod.ssm.sparse_transition_min_states = 1
+    mod.ssm._initialize_representation()
+    csr = mod.ssm._transition_structures["d"][2][1]
+    # Reused while the transition matrix is unchanged
+    mod.ssm._initialize_representation()
+    assert mod.ssm._transition_structures["d"][2][1] is csr
+
+    # Recomputed when it changes
+    transition = mod.ssm["transition"].copy()
+    transition[0, 0] = 0.5
+    mod.ssm["transition"] = transition
+    mod.ssm._initialize_representation()
+    ss = mod.ssm._statespaces["d"]
+    assert ss.sparse_transition
+    assert_equal(np.asarray(ss.transition_data)[0], 0.5)
+
+    # and when the options change
+    mod.ssm.sparse_transition_density = 0.01
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].sparse_transition
+
+
+def test_identity_transition_time_varying(endog):
+    mod = structural.UnobservedComponents(endog[:, 0], "rwalk")
+    mod.ssm["transition"] = np.ones((1, 1, mod.nobs))
+    mod.ssm._initialize_representation()
+    assert mod.ssm._statespaces["d"].identity_transition
+
+    transition = np.ones((1, 1, mod.nobs))
+    transition[0, 0, -1] = 0.5
+    mod.ssm["transition"] = transition
+    mod.ssm._initialize_representation()
+    assert not mod.ssm._statespaces["d"].identity_transition
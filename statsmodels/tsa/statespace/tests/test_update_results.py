@@ -0,0 +1,212 @@
+"""
+Tests for updating state space results in place with new observations
+
+License: Simplified-BSD
+"""
+
+import warnings
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+import pytest
+
+from statsmodels.tsa.statespace import (
+    dynamic_factor,
+    dynamic_factor_mq,
+    sarimax,
+    structural,
+    varmax,
+)
+
+FILTER_ATTR = [
+    "filtered_state",
+    "filtered_state_cov",
+    "predicted_state",
+    "predicted_state_cov",
+    "forecasts",
+    "forecasts_error",
+    "forecasts_error_cov",
+    "standardized_forecasts_error",
+    "llf_obs",
+]
+SMOOTHER_ATTR = [
+    "smoothed_state",
+    "smoothed_state_cov",
+    "smoothed_measurement_disturbance",
+    "smoothed_state_disturbance",
+    "smoothed_state_disturbance_cov",
+]
+
+
+@pytest.fixture(scope="module")
+def endog():
+    rs = np.random.RandomState(1234)
+    endog = np.cumsum(rs.standard_normal((120, 2)), axis=0)
+    endog[:, 1] = 0.5 * endog[:, 0] + rs.standard_normal(120)
+    endog[20:25, 0] = np.nan
+    endog[105:107, 1] = np.nan
+    endog[110] = np.nan
+    return endog
+
+
+def check_update(mod, full_mod, params, nobs, smooth=False, chunks=(1, 4, 15)):
+    method = "smooth" if smooth else "filter"
+    res = getattr(mod, method)(params)
+    desired = getattr(full_mod, method)(params)
+
+    endog = full_mod.data.orig_endog
+    start = nobs
+    for chunk in chunks:
+        res.update(endog[start : start + chunk])
+        start += chunk
+
+    assert_equal(res.nobs, desired.nobs)
+    assert_allclose(res.llf, desired.llf)
+    assert_allclose(res.fittedvalues, desired.fittedvalues)
+    for name in FILTER_ATTR:
+        assert_allclose(getattr(res, name), getattr(desired, name), atol=1e-8,
+                        err_msg=name)
+    if smooth:
+        # Only the smoother output for the final chunk conditions on the full
+        # dataset
+        for name in SMOOTHER_ATTR:
+            assert_allclose(getattr(res, name)[..., -chunks[-1]:],
+                            getattr(desired, name)[..., -chunks[-1]:],
+                            atol=1e-8, err_msg=name)
+    assert_allclose(res.forecast(5), desired.forecast(5))
+
+    # The original model is unchanged
+    assert res.model is not mod
+    assert_equal(mod.nobs, nobs)
+    assert_equal(mod.ssm.nobs, nobs)
+    return res
+
+
+@pytest.mark.parametrize("smooth", [False, True])
+def test_sarimax(endog, smooth):
+    mod = sarimax.SARIMAX(endog[:100, 0], order=(1, 1, 1))
+    full_mod = sarimax.SARIMAX(endog[:, 0], order=(1, 1, 1))
+    check_update(mod, full_mod, [0.5, 0.2, 1.3], 100, smooth=smooth)
+
+
+@pytest.mark.parametrize("smooth", [False, True])
+def test_varmax(endog, smooth):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        mod = varmax.VARMAX(np.diff(endog, axis=0)[:99], order=(1, 0))
+        full_mod = varmax.VARMAX(np.diff(endog, axis=0), order=(1, 0))
+    check_update(mod, full_mod, mod.start_params, 99, smooth=smooth,
+                 chunks=(1, 5, 14))
+
+
+@pytest.mark.parametrize("filter_univariate", [False, True])
+def test_dynamic_factor(endog, filter_univariate):
+    mod = dynamic_factor.DynamicFactor(endog[:100], k_factors=1,
+                                       factor_order=1)
+    full_mod = dynamic_factor.DynamicFactor(endog, k_factors=1,
+                                            factor_order=1)
+    mod.ssm.filter_univariate = filter_univariate
+    full_mod.ssm.filter_univariate = filter_univariate
+    check_update(mod, full_mod, mod.start_params, 100, smooth=True)
+
+
+def test_structural_exact_diffuse(endog):
+    kwargs = dict(level="local linear trend", use_exact_diffuse=True)
+    mod = structural.UnobservedComponents(endog[:100, 0], **kwargs)
+    full_mod = structural.UnobservedComponents(endog[:, 0], **kwargs)
+    res = check_update(mod, full_mod, [1.0, 0.5, 0.1], 100, smooth=True)
+    assert_equal(res.nobs_diffuse, 2)
+
+
+def test_pandas(endog):
+    ix = pd.period_range(start="2000-01", periods=120, freq="M")
+    endog = pd.Series(endog[:, 0], index=ix, name="y")
+    mod = sarimax.SARIMAX(endog.iloc[:100], order=(1, 1, 0))
+    full_mod = sarimax.SARIMAX(endog, order=(1, 1, 0))
+    res = check_update(mod, full_mod, [0.5, 1.3], 100, smooth=True)
+    desired = full_mod.smooth([0.5, 1.3])
+
+    assert res.fittedvalues.index.equals(ix)
+    assert res.forecast(2).index.equals(desired.forecast(2).index)
+    assert res.states.smoothed.index.equals(ix)
+    res.summary()
+
+    # New observations must directly follow the current data
+    with pytest.raises(ValueError, match="Given `endog` does not have an"):
+        res.update(endog.iloc[110:])
+
+
+@pytest.mark.parametrize("smoothing_lag", [0, 10, 200])
+def test_smoothing_lag(endog, smoothing_lag):
+    mod = sarimax.SARIMAX(endog[:100, 0], order=(1, 1, 1))
+    params = [0.5, 0.2, 1.3]
+    res = mod.smooth(params)
+    smoothed_state = res.smoothed_state.copy()
+    res.update(endog[100:, 0], smoothing_lag=smoothing_lag)
+
+    desired = sarimax.SARIMAX(endog[:, 0], order=(1, 1, 1)).smooth(params)
+    start = max(100 - smoothing_lag, 0)
+    assert_allclose(res.smoothed_state[:, start:],
+                    desired.smoothed_state[:, start:], atol=1e-8)
+    assert_allclose(res.smoothed_state_cov[..., start:],
+                    desired.smoothed_state_cov[..., start:], atol=1e-8)
+    # Smoother output for earlier periods is unchanged
+    assert_equal(res.smoothed_state[:, :start], smoothed_state[:, :start])
+
+
+def test_amortized_memory(endog):
+    mod = sarimax.SARIMAX(endog[:50, 0], order=(1, 0, 0))
+    res = mod.smooth([0.5, 1.3])
+    buffers = set()
+    for i in range(50, 120):
+        res.update(endog[i : i + 1, 0])
+        buffers.add(id(res.filter_results._output_buffers["filtered_state"]))
+        assert res.filtered_state.base is (
+            res.filter_results._output_buffers["filtered_state"])
+    # Capacity is doubled when exhausted
+    assert len(buffers) == 2
+    assert_equal(res.filtered_state.shape, (1, 120))
+    assert_equal(res.model.endog.shape, (120, 1))
+    desired = sarimax.SARIMAX(endog[:, 0], order=(1, 0, 0)).filter([0.5, 1.3])
+    assert_allclose(res.llf, desired.llf)
+    # The model attached to the results includes all of the observations
+    assert_allclose(res.model.filter([0.5, 1.3]).llf, desired.llf)
+
+
+def test_invalid(endog):
+    # Exogenous regressors
+    exog = np.arange(120.0)
+    mod = sarimax.SARIMAX(endog[:100, 0], order=(1, 0, 0), exog=exog[:100])
+    res = mod.filter([0.1, 0.5, 1.0])
+    with pytest.raises(NotImplementedError, match="exogenous"):
+        res.update(endog[100:, 0])
+
+    # Time-varying system matrices
+    mod = sarimax.SARIMAX(endog[:100, 0], order=(1, 0, 0), trend="t")
+    res = mod.filter([0.1, 0.5, 1.0])
+    with pytest.raises(NotImplementedError, match="time-invariant"):
+        res.update(endog[100:, 0])
+
+    # Concentrated scale
+    mod = sarimax.SARIMAX(endog[:100, 0], order=(1, 0, 0),
+                          concentrate_scale=True)
+    res = mod.filter([0.5])
+    with pytest.raises(NotImplementedError, match="concentrated"):
+        res.update(endog[100:, 0])
+
+    # Fixed-lag smoothing without smoother output
+    mod = sarimax.SARIMAX(endog[:100, 0], order=(1, 0, 0))
+    res = mod.filter([0.5, 1.0])
+    with pytest.raises(ValueError, match="smoother output"):
+        res.update(endog[100:, 0], smoothing_lag=5)
+    res = mod.smooth([0.5, 1.0])
+    with pytest.raises(ValueError, match="non-negative"):
+        res.update(endog[100:, 0], smoothing_lag=-1)
+
+    # Mixed frequency dynamic factor models
+    mod = dynamic_factor_mq.DynamicFactorMQ(np.nan_to_num(endog[:100]),
+                                            factors=1)
+    res = mod.smooth(mod.start_params)
+    with pytest.raises(NotImplementedError, match="mixed frequencies"):
+        res.update(endog[100:])
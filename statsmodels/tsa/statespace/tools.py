@@ -5,6 +5,8 @@ Author: Chad Fulton
 License: Simplified-BSD
 """
 
+import copy
+
 import numpy as np
 import pandas as pd
 from scipy.linalg import solve_sylvester
@@ -44,6 +46,10 @@ prefix_kalman_filter_map = {
     "c": _kalman_filter.cKalmanFilter,
     "z": _kalman_filter.zKalmanFilter
 }
+prefix_kalman_filter_score_map = {
+    "s": _kalman_filter.skalman_filter_score,
+    "d": _kalman_filter.dkalman_filter_score,
+}
 prefix_kalman_smoother_map = {
     "s": _kalman_smoother.sKalmanSmoother,
     "d": _kalman_smoother.dKalmanSmoother,
@@ -1486,6 +1492,23 @@ def unconstrain_stationary_multivariate(constrained, error_variance):
     return unconstrained, error_variance
 
 
+def _deepcopy_without_compiled(obj, memo, names):
+    """
+    Deep copy of an object whose compiled (Cython) objects are re-created
+
+    The compiled objects in the dictionaries given by `names` hold views of
+    arrays of `obj`, which a deep copy would not share with the copied
+    arrays. These dictionaries are left empty in the copy, so that the
+    compiled objects are re-created from the copied arrays when they are
+    next needed.
+    """
+    new = obj.__class__.__new__(obj.__class__)
+    memo[id(obj)] = new
+    for key, value in obj.__dict__.items():
+        new.__dict__[key] = {} if key in names else copy.deepcopy(value, memo)
+    return new
+
+
 def validate_matrix_shape(name, shape, nrows, ncols, nobs):
     """
     Validate the shape of a possibly time-varying matrix, or raise an exception
@@ -1,4 +1,11 @@
 __all__ = ["SVAR", "VAR"]
 
-from .svar_model import SVAR
-from .var_model import VAR
+from statsmodels import _lazy
+
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        ".svar_model": ["SVAR"],
+        ".var_model": ["VAR"],
+    },
+)
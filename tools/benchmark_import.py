@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Measure the time needed to import the statsmodels api modules
+
+Each module is imported in a fresh interpreter several times and the median
+wall time is reported, together with the number of modules loaded. The
+results are printed as JSON.
+
+usage
+
+python tools/benchmark_import.py
+python tools/benchmark_import.py --repeat 10 statsmodels.api statsmodels.tsa.api
+python tools/benchmark_import.py --max-time 0.25 statsmodels.api
+
+With ``--max-time`` the script exits with a non-zero status if the median
+import time of any module exceeds the limit, so that it can be used to guard
+against regressions in CI.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "statsmodels.api",
+    "statsmodels.formula.api",
+    "statsmodels.graphics.api",
+    "statsmodels.stats.api",
+    "statsmodels.tsa.api",
+]
+
+# Executed in a fresh interpreter, times only the import statement
+TIMER = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules))
+"""
+
+
+def time_import(module, repeat):
+    statement = f"import {module}" if module else "pass"
+    code = TIMER.format(statement=statement)
+    times = []
+    n_modules = 0
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        elapsed, n_modules = out.stdout.split()
+        times.append(float(elapsed))
+    return {
+        "module": module,
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "modules_loaded": int(n_modules),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=None,
+        help="Fail if the median import time of a module exceeds this (s)",
+    )
+    args = parser.parse_args(argv)
+
+    # import statsmodels once so that any build step of an editable install
+    # is not included in the timings
+    subprocess.run([sys.executable, "-c", "import statsmodels"], check=True)
+    results = [time_import(module, args.repeat) for module in args.modules]
+    print(json.dumps(results, indent=2))
+
+    if args.max_time is not None:
+        slow = [res["module"] for res in results if res["median"] > args.max_time]
+        if slow:
+            print(f"Import time exceeds {args.max_time}s: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())